@@ -0,0 +1,20 @@
+-- Migration: 002_keyset_pagination_indexes.sql
+-- Description: Composite (sort key, pk) indexes backing keyset cursor pagination
+-- Author: System
+-- Date: 2025-09-14
+-- depends: 001_initial_schema
+
+-- Posts: feeds by status, per-topic threads and per-author listings
+CREATE INDEX IF NOT EXISTS idx_posts_status_submitted_pk ON posts(status, submitted_at, pk);
+CREATE INDEX IF NOT EXISTS idx_posts_topic_submitted_pk ON posts(topic_pk, submitted_at, pk);
+CREATE INDEX IF NOT EXISTS idx_posts_author_submitted_pk ON posts(author_pk, submitted_at, pk);
+
+-- Topics: approved feed, newest first
+CREATE INDEX IF NOT EXISTS idx_topics_status_created_pk ON topics(status, created_at, pk);
+
+-- Flags: FIFO review queue and per-user history
+CREATE INDEX IF NOT EXISTS idx_flags_created_pk ON flags(created_at, pk);
+CREATE INDEX IF NOT EXISTS idx_flags_flagger_created_pk ON flags(flagger_pk, created_at, pk);
+
+-- Admin actions: audit log, newest first
+CREATE INDEX IF NOT EXISTS idx_admin_actions_created_pk ON admin_actions(created_at, pk);
@@ -0,0 +1,263 @@
+-- Migration: 003_partition_event_tables.sql
+-- Description: Monthly range partitions for append-only event and audit tables
+-- Author: System
+-- Date: 2025-09-21
+-- depends: 002_keyset_pagination_indexes
+
+-- These tables only ever grow and are read by recent time ranges. Each one is
+-- rebuilt as a table partitioned by month on its timestamp column, so recent
+-- queries prune to a few small partitions and old months can be detached
+-- without a bulk DELETE. Future partitions are created ahead of time by the
+-- partition maintenance job (therobotoverlord_api.database.partitions).
+--
+-- Partitioned tables need the partition key in every unique constraint, so
+-- primary keys become (pk, <timestamp>) and the timestamp is NOT NULL.
+-- loyalty_score_history.event_pk can no longer be a foreign key to the
+-- partitioned loyalty_score_events; both rows are written in one transaction
+-- by LoyaltyScoreRepository.record_moderation_event.
+
+-- Detached partitions are moved here when their policy is to archive
+CREATE SCHEMA IF NOT EXISTS archive;
+
+-- Create the partition of p_parent holding the UTC month containing p_month
+CREATE OR REPLACE FUNCTION create_monthly_partition(p_parent TEXT, p_month TIMESTAMPTZ)
+RETURNS TEXT AS $$
+DECLARE
+    v_start TIMESTAMP := date_trunc('month', p_month AT TIME ZONE 'UTC');
+    v_name TEXT := format('%s_p%s', p_parent, to_char(v_start, 'YYYYMM'));
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+        v_name,
+        p_parent,
+        v_start AT TIME ZONE 'UTC',
+        (v_start + INTERVAL '1 month') AT TIME ZONE 'UTC'
+    );
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Create every monthly partition of p_parent covering p_from through p_to
+CREATE OR REPLACE FUNCTION create_monthly_partitions(
+    p_parent TEXT,
+    p_from TIMESTAMPTZ,
+    p_to TIMESTAMPTZ
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_month TIMESTAMPTZ := p_from;
+    v_count INTEGER := 0;
+BEGIN
+    WHILE date_trunc('month', v_month AT TIME ZONE 'UTC')
+          <= date_trunc('month', p_to AT TIME ZONE 'UTC') LOOP
+        PERFORM create_monthly_partition(p_parent, v_month);
+        v_count := v_count + 1;
+        v_month := v_month + INTERVAL '1 month';
+    END LOOP;
+    RETURN v_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Move existing tables aside; renaming the primary key frees the index name
+ALTER TABLE loyalty_score_history RENAME TO loyalty_score_history_unpartitioned;
+ALTER TABLE loyalty_score_history_unpartitioned
+    RENAME CONSTRAINT loyalty_score_history_pkey TO loyalty_score_history_unpartitioned_pkey;
+ALTER TABLE loyalty_score_events RENAME TO loyalty_score_events_unpartitioned;
+ALTER TABLE loyalty_score_events_unpartitioned
+    RENAME CONSTRAINT loyalty_score_events_pkey TO loyalty_score_events_unpartitioned_pkey;
+ALTER TABLE moderation_events RENAME TO moderation_events_unpartitioned;
+ALTER TABLE moderation_events_unpartitioned
+    RENAME CONSTRAINT moderation_events_pkey TO moderation_events_unpartitioned_pkey;
+ALTER TABLE admin_actions RENAME TO admin_actions_unpartitioned;
+ALTER TABLE admin_actions_unpartitioned
+    RENAME CONSTRAINT admin_actions_pkey TO admin_actions_unpartitioned_pkey;
+ALTER TABLE appeal_history RENAME TO appeal_history_unpartitioned;
+ALTER TABLE appeal_history_unpartitioned
+    RENAME CONSTRAINT appeal_history_pkey TO appeal_history_unpartitioned_pkey;
+ALTER TABLE dashboard_snapshots RENAME TO dashboard_snapshots_unpartitioned;
+ALTER TABLE dashboard_snapshots_unpartitioned
+    RENAME CONSTRAINT dashboard_snapshots_pkey TO dashboard_snapshots_unpartitioned_pkey;
+
+-- Partitioned tables
+CREATE TABLE loyalty_score_events (
+    pk UUID NOT NULL DEFAULT gen_random_uuid(),
+    user_pk UUID NOT NULL REFERENCES users(pk) ON DELETE CASCADE,
+    event_type VARCHAR(50) NOT NULL,
+    content_type VARCHAR(20) NOT NULL CHECK (content_type IN ('post', 'topic', 'private_message', 'appeal')),
+    content_pk UUID NOT NULL,
+    outcome VARCHAR(50) NOT NULL CHECK (outcome IN ('approved', 'rejected', 'removed', 'appeal_sustained', 'appeal_denied')),
+    score_delta INTEGER NOT NULL,
+    previous_score INTEGER NOT NULL,
+    new_score INTEGER NOT NULL,
+    moderator_pk UUID REFERENCES users(pk),
+    reason TEXT,
+    metadata JSONB DEFAULT '{}',
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (pk, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE loyalty_score_history (
+    pk UUID NOT NULL DEFAULT gen_random_uuid(),
+    user_pk UUID NOT NULL REFERENCES users(pk) ON DELETE CASCADE,
+    score INTEGER NOT NULL,
+    recorded_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    event_pk UUID,
+    PRIMARY KEY (pk, recorded_at)
+) PARTITION BY RANGE (recorded_at);
+
+CREATE TABLE moderation_events (
+    pk UUID NOT NULL DEFAULT gen_random_uuid(),
+    moderator_pk UUID NOT NULL REFERENCES users(pk) ON DELETE CASCADE,
+    event_type VARCHAR(50) NOT NULL,
+    target_type VARCHAR(20) NOT NULL CHECK (target_type IN ('post', 'topic', 'user')),
+    target_pk UUID NOT NULL,
+    action_taken VARCHAR(100) NOT NULL,
+    reason TEXT,
+    metadata JSONB,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (pk, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE admin_actions (
+    pk UUID NOT NULL DEFAULT gen_random_uuid(),
+    admin_pk UUID NOT NULL REFERENCES users(pk) ON DELETE CASCADE,
+    action_type VARCHAR(100) NOT NULL,
+    target_type VARCHAR(50),
+    target_pk UUID,
+    description TEXT NOT NULL,
+    metadata JSONB,
+    ip_address INET,
+    user_agent TEXT,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (pk, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE appeal_history (
+    pk UUID NOT NULL DEFAULT gen_random_uuid(),
+    appeal_pk UUID NOT NULL REFERENCES appeals(pk) ON DELETE CASCADE,
+    action_type VARCHAR(50) NOT NULL,
+    action_description TEXT,
+    performed_by UUID REFERENCES users(pk),
+    metadata JSONB,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (pk, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE dashboard_snapshots (
+    pk UUID NOT NULL DEFAULT gen_random_uuid(),
+    snapshot_type VARCHAR(50) NOT NULL,
+    data JSONB NOT NULL,
+    created_by UUID REFERENCES users(pk),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (pk, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Partitions for every month with existing data, plus three months ahead
+DO $$
+DECLARE
+    v_table RECORD;
+    v_oldest TIMESTAMPTZ;
+BEGIN
+    FOR v_table IN
+        SELECT * FROM (VALUES
+            ('loyalty_score_events', 'created_at'),
+            ('loyalty_score_history', 'recorded_at'),
+            ('moderation_events', 'created_at'),
+            ('admin_actions', 'created_at'),
+            ('appeal_history', 'created_at'),
+            ('dashboard_snapshots', 'created_at')
+        ) AS t(name, partition_column)
+    LOOP
+        EXECUTE format(
+            'SELECT MIN(%I) FROM %I', v_table.partition_column, v_table.name || '_unpartitioned'
+        ) INTO v_oldest;
+        PERFORM create_monthly_partitions(
+            v_table.name, LEAST(COALESCE(v_oldest, NOW()), NOW()), NOW() + INTERVAL '3 months'
+        );
+    END LOOP;
+END;
+$$;
+
+-- Copy existing rows; rows without a timestamp are filed under the migration date
+INSERT INTO loyalty_score_events (
+    pk, user_pk, event_type, content_type, content_pk, outcome, score_delta,
+    previous_score, new_score, moderator_pk, reason, metadata, created_at
+)
+SELECT
+    pk, user_pk, event_type, content_type, content_pk, outcome, score_delta,
+    previous_score, new_score, moderator_pk, reason, metadata, COALESCE(created_at, NOW())
+FROM loyalty_score_events_unpartitioned;
+
+INSERT INTO loyalty_score_history (pk, user_pk, score, recorded_at, event_pk)
+SELECT pk, user_pk, score, COALESCE(recorded_at, NOW()), event_pk
+FROM loyalty_score_history_unpartitioned;
+
+INSERT INTO moderation_events (
+    pk, moderator_pk, event_type, target_type, target_pk, action_taken, reason,
+    metadata, created_at
+)
+SELECT
+    pk, moderator_pk, event_type, target_type, target_pk, action_taken, reason,
+    metadata, COALESCE(created_at, NOW())
+FROM moderation_events_unpartitioned;
+
+INSERT INTO admin_actions (
+    pk, admin_pk, action_type, target_type, target_pk, description, metadata,
+    ip_address, user_agent, created_at
+)
+SELECT
+    pk, admin_pk, action_type, target_type, target_pk, description, metadata,
+    ip_address, user_agent, COALESCE(created_at, NOW())
+FROM admin_actions_unpartitioned;
+
+INSERT INTO appeal_history (
+    pk, appeal_pk, action_type, action_description, performed_by, metadata, created_at
+)
+SELECT
+    pk, appeal_pk, action_type, action_description, performed_by, metadata,
+    COALESCE(created_at, NOW())
+FROM appeal_history_unpartitioned;
+
+INSERT INTO dashboard_snapshots (pk, snapshot_type, data, created_by, created_at)
+SELECT pk, snapshot_type, data, created_by, COALESCE(created_at, NOW())
+FROM dashboard_snapshots_unpartitioned;
+
+-- Drop the old tables (and their indexes) before recreating the index names
+DROP TABLE loyalty_score_history_unpartitioned;
+DROP TABLE loyalty_score_events_unpartitioned;
+DROP TABLE moderation_events_unpartitioned;
+DROP TABLE admin_actions_unpartitioned;
+DROP TABLE appeal_history_unpartitioned;
+DROP TABLE dashboard_snapshots_unpartitioned;
+
+-- Indexes are declared on the parent and created on every partition,
+-- including the ones added later by the maintenance job
+CREATE INDEX idx_loyalty_score_events_user ON loyalty_score_events(user_pk);
+CREATE INDEX idx_loyalty_score_events_type ON loyalty_score_events(event_type);
+CREATE INDEX idx_loyalty_score_events_content ON loyalty_score_events(content_type, content_pk);
+CREATE INDEX idx_loyalty_score_events_outcome ON loyalty_score_events(outcome);
+CREATE INDEX idx_loyalty_score_events_created_at ON loyalty_score_events(created_at DESC);
+CREATE INDEX idx_loyalty_score_events_metadata_gin ON loyalty_score_events USING GIN(metadata);
+
+CREATE INDEX idx_loyalty_history_user ON loyalty_score_history(user_pk);
+CREATE INDEX idx_loyalty_history_recorded_at ON loyalty_score_history(recorded_at DESC);
+
+CREATE INDEX idx_moderation_events_moderator ON moderation_events(moderator_pk);
+CREATE INDEX idx_moderation_events_target ON moderation_events(target_type, target_pk);
+CREATE INDEX idx_moderation_events_created_at ON moderation_events(created_at DESC);
+
+CREATE INDEX idx_admin_actions_admin ON admin_actions(admin_pk);
+CREATE INDEX idx_admin_actions_type ON admin_actions(action_type);
+CREATE INDEX idx_admin_actions_target ON admin_actions(target_type, target_pk);
+CREATE INDEX idx_admin_actions_created_at ON admin_actions(created_at DESC);
+CREATE INDEX idx_admin_actions_created_pk ON admin_actions(created_at, pk);
+CREATE INDEX idx_admin_actions_metadata_gin ON admin_actions USING GIN(metadata);
+
+CREATE INDEX idx_appeal_history_appeal ON appeal_history(appeal_pk);
+CREATE INDEX idx_appeal_history_performed_by ON appeal_history(performed_by);
+CREATE INDEX idx_appeal_history_created_at ON appeal_history(created_at DESC);
+CREATE INDEX idx_appeal_history_metadata_gin ON appeal_history USING GIN(metadata);
+
+CREATE INDEX idx_dashboard_snapshots_type ON dashboard_snapshots(snapshot_type);
+CREATE INDEX idx_dashboard_snapshots_created_at ON dashboard_snapshots(created_at DESC);
+CREATE INDEX idx_dashboard_snapshots_data_gin ON dashboard_snapshots USING GIN(data);
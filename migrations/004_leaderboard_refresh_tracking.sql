@@ -0,0 +1,113 @@
+-- Migration: 004_leaderboard_refresh_tracking.sql
+-- Description: Change watermark and refresh history for the leaderboard_rankings view
+-- Author: System
+-- Date: 2025-09-28
+-- depends: 003_partition_event_tables
+
+-- leaderboard_rankings joins every user with their approved posts, approved
+-- topics and badges, so refreshing it is expensive. Writes that can change
+-- the view advance leaderboard_change_seq, and the refresh job only refreshes
+-- when the sequence has moved past the watermark of the last refresh (see
+-- LeaderboardRepository.refresh_leaderboard_if_changed).
+--
+-- The triggers are deferred to commit so a watermark read by a refresh is
+-- very unlikely to include a change its snapshot cannot see yet. The refresh
+-- job's maximum interval bounds how long such a change can be missed.
+
+CREATE SEQUENCE IF NOT EXISTS leaderboard_change_seq;
+
+CREATE OR REPLACE FUNCTION mark_leaderboard_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM nextval('leaderboard_change_seq');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Current change watermark, 0 before the first change
+CREATE OR REPLACE FUNCTION leaderboard_change_watermark()
+RETURNS BIGINT AS $$
+    SELECT CASE WHEN is_called THEN last_value ELSE 0 END
+    FROM leaderboard_change_seq;
+$$ LANGUAGE sql STABLE;
+
+-- Users: joining, leaving, bans and anything shown in the view
+CREATE CONSTRAINT TRIGGER leaderboard_users_insert_delete
+    AFTER INSERT OR DELETE ON users
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION mark_leaderboard_changed();
+
+CREATE CONSTRAINT TRIGGER leaderboard_users_update
+    AFTER UPDATE OF loyalty_score, username, is_banned, is_active ON users
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW
+    WHEN (
+        OLD.loyalty_score IS DISTINCT FROM NEW.loyalty_score
+        OR OLD.username IS DISTINCT FROM NEW.username
+        OR OLD.is_banned IS DISTINCT FROM NEW.is_banned
+        OR OLD.is_active IS DISTINCT FROM NEW.is_active
+    )
+    EXECUTE FUNCTION mark_leaderboard_changed();
+
+-- Posts and topics: only approved ones are counted
+CREATE CONSTRAINT TRIGGER leaderboard_posts_insert
+    AFTER INSERT ON posts
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW WHEN (NEW.status = 'approved')
+    EXECUTE FUNCTION mark_leaderboard_changed();
+
+CREATE CONSTRAINT TRIGGER leaderboard_posts_update
+    AFTER UPDATE OF status, author_pk ON posts
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW
+    WHEN (
+        (OLD.status = 'approved') IS DISTINCT FROM (NEW.status = 'approved')
+        OR (NEW.status = 'approved' AND OLD.author_pk IS DISTINCT FROM NEW.author_pk)
+    )
+    EXECUTE FUNCTION mark_leaderboard_changed();
+
+CREATE CONSTRAINT TRIGGER leaderboard_posts_delete
+    AFTER DELETE ON posts
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW WHEN (OLD.status = 'approved')
+    EXECUTE FUNCTION mark_leaderboard_changed();
+
+CREATE CONSTRAINT TRIGGER leaderboard_topics_insert
+    AFTER INSERT ON topics
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW WHEN (NEW.status = 'approved')
+    EXECUTE FUNCTION mark_leaderboard_changed();
+
+CREATE CONSTRAINT TRIGGER leaderboard_topics_update
+    AFTER UPDATE OF status, author_pk ON topics
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW
+    WHEN (
+        (OLD.status = 'approved') IS DISTINCT FROM (NEW.status = 'approved')
+        OR (NEW.status = 'approved' AND OLD.author_pk IS DISTINCT FROM NEW.author_pk)
+    )
+    EXECUTE FUNCTION mark_leaderboard_changed();
+
+CREATE CONSTRAINT TRIGGER leaderboard_topics_delete
+    AFTER DELETE ON topics
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW WHEN (OLD.status = 'approved')
+    EXECUTE FUNCTION mark_leaderboard_changed();
+
+-- Badges: every award or revocation changes a badge count
+CREATE CONSTRAINT TRIGGER leaderboard_user_badges_change
+    AFTER INSERT OR UPDATE OR DELETE ON user_badges
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION mark_leaderboard_changed();
+
+-- One row per refresh of leaderboard_rankings
+CREATE TABLE leaderboard_refreshes (
+    pk UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    change_watermark BIGINT NOT NULL,
+    started_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    duration_ms DOUBLE PRECISION NOT NULL,
+    row_count INTEGER NOT NULL,
+    row_delta INTEGER NOT NULL
+);
+
+CREATE INDEX idx_leaderboard_refreshes_started_at ON leaderboard_refreshes(started_at DESC);
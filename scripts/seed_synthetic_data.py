@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Synthetic data seeder for The Robot Overlord API.
+
+Loads production-like volumes into a local, disposable Postgres with COPY:
+users with a long-tailed loyalty distribution, topics with tags, posts with
+deep reply trees, private message conversations, moderation queue rows and
+loyalty score events spread over the last year. Run migrations first.
+
+    uv run python scripts/seed_synthetic_data.py --truncate \\
+        --users 1000000 --topics 50000 --posts 5000000
+
+Every primary key is derived from the row's index, so runs with the same
+``--seed`` produce identical data and nothing needs to be kept in memory to
+reference users, topics or posts from other tables.
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import logging
+import random
+import sys
+import time
+
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import asyncpg
+
+from therobotoverlord_api.config.database import get_database_url
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Each entity kind gets its own UUID range: pk = (kind << 64) | index
+_KINDS = {"user": 1, "tag": 2, "topic": 3, "post": 4, "message": 5, "event": 6}
+
+# Tables written by the seeder, in an order that satisfies foreign keys
+SEEDED_TABLES = [
+    "users",
+    "tags",
+    "topics",
+    "topic_tags",
+    "posts",
+    "private_messages",
+    "topic_creation_queue",
+    "post_moderation_queue",
+    "private_message_queue",
+    "loyalty_score_events",
+]
+
+# Partitioned by month (migration 003); partitions must exist before COPY
+PARTITIONED_TABLES = {"loyalty_score_events"}
+
+CSV_BATCH_ROWS = 10_000
+
+WORDS = [
+    "citizen",
+    "overlord",
+    "logic",
+    "argument",
+    "evidence",
+    "policy",
+    "debate",
+    "reason",
+    "state",
+    "economy",
+    "liberty",
+    "order",
+    "reform",
+    "tax",
+    "climate",
+    "vote",
+    "law",
+    "rights",
+    "market",
+    "labor",
+    "science",
+    "history",
+    "data",
+    "claim",
+    "premise",
+    "fallacy",
+    "consensus",
+    "dissent",
+]
+
+
+def pk(kind: str, index: int) -> UUID:
+    """Get the primary key of the ``index``-th row of ``kind``."""
+    return UUID(int=(_KINDS[kind] << 64) | index)
+
+
+class SyntheticDataSeeder:
+    """Generates rows and streams them into Postgres as CSV COPY."""
+
+    def __init__(self, connection: asyncpg.Connection, options: argparse.Namespace):
+        self.connection = connection
+        self.options = options
+        # Reproducible synthetic data, not security sensitive
+        self.rng = random.Random(options.seed)  # noqa: S311
+        self.now = datetime.now(UTC)
+        self.window = timedelta(days=options.days)
+        self.start = self.now - self.window
+        self._next_post_number = [1] * options.topics
+        self._pending_posts: list[tuple[int, int]] = []
+        self._pending_messages: list[tuple[int, int, int]] = []
+
+    def timestamp(self) -> datetime:
+        """Random time in the seeded window."""
+        return self.start + self.window * self.rng.random()
+
+    def user(self) -> int:
+        """Random user index, skewed so early users are the most active."""
+        return int(self.options.users * self.rng.random() ** 3)
+
+    def sentence(self, words: int) -> str:
+        """Random filler text."""
+        return " ".join(self.rng.choices(WORDS, k=words)).capitalize() + "."
+
+    def conversation_users(self, conversation: int) -> tuple[int, int]:
+        """Stable pair of distinct users for a conversation index."""
+        users = self.options.users
+        first = (conversation * 2654435761) % users
+        second = (conversation * 40503 + 1) % users
+        return first, second if second != first else (second + 1) % users
+
+    # Row generators
+
+    def users(self) -> Iterator[dict[str, Any]]:
+        for i in range(self.options.users):
+            role = "citizen"
+            if i % 2000 == 0:
+                role = "admin"
+            elif i % 200 == 0:
+                role = "moderator"
+            yield {
+                "pk": pk("user", i),
+                "email": f"citizen{i}@example.com",
+                "username": f"citizen{i}",
+                "password_hash": "synthetic",
+                "role": role,
+                "loyalty_score": int(self.rng.paretovariate(1.2) * 10) - 10,
+                "is_banned": i % 500 == 0,
+                "is_sanctioned": i % 250 == 0,
+                "is_active": True,
+                "email_verified": True,
+                "created_at": self.timestamp(),
+            }
+
+    def tags(self) -> Iterator[dict[str, Any]]:
+        for i in range(self.options.tags):
+            yield {
+                "pk": pk("tag", i),
+                "name": f"{WORDS[i % len(WORDS)]}-{i}",
+                "description": self.sentence(8),
+                "is_active": True,
+                "created_at": self.start,
+            }
+
+    def topics(self) -> Iterator[dict[str, Any]]:
+        for i in range(self.options.topics):
+            status = "approved"
+            if i % 20 == 0:
+                status = "pending_approval"
+            elif i % 20 == 1:
+                status = "rejected"
+            created_at = self.timestamp()
+            yield {
+                "pk": pk("topic", i),
+                "title": self.sentence(6),
+                "description": self.sentence(40),
+                "author_pk": pk("user", self.user()),
+                "created_by_overlord": i % 50 == 0,
+                "status": status,
+                "approved_at": created_at if status == "approved" else None,
+                "created_at": created_at,
+            }
+
+    def topic_tags(self) -> Iterator[dict[str, Any]]:
+        for i in range(self.options.topics):
+            count = self.rng.randint(1, min(4, self.options.tags))
+            for tag in self.rng.sample(range(self.options.tags), count):
+                yield {"topic_pk": pk("topic", i), "tag_pk": pk("tag", tag)}
+
+    def posts(self) -> Iterator[dict[str, Any]]:
+        """Posts spread over topics, forming deep reply trees.
+
+        Replies mostly answer the previous post, which builds long chains,
+        and otherwise reply to a random earlier post or start a new thread.
+        """
+        mean_per_topic = max(1, self.options.posts // max(1, self.options.topics))
+        index = 0
+        topic = 0
+        while index < self.options.posts:
+            count = min(
+                self.options.posts - index,
+                max(1, int(self.rng.expovariate(1 / mean_per_topic))),
+            )
+            first = index
+            submitted_at = self.timestamp()
+            numbers = self._next_post_number[topic]
+            self._next_post_number[topic] += count
+            for number in range(numbers, numbers + count):
+                roll = self.rng.random()
+                parent = None
+                if index > first and roll < 0.4:
+                    parent = index - 1
+                elif index > first and roll < 0.7:
+                    parent = self.rng.randrange(first, index)
+
+                status = "approved"
+                if index % 20 == 0:
+                    status = "pending"
+                    self._pending_posts.append((index, topic))
+                elif index % 20 == 1:
+                    status = "rejected"
+
+                submitted_at += timedelta(minutes=self.rng.expovariate(1 / 30))
+                yield {
+                    "pk": pk("post", index),
+                    "topic_pk": pk("topic", topic),
+                    "parent_post_pk": pk("post", parent)
+                    if parent is not None
+                    else None,
+                    "author_pk": pk("user", self.user()),
+                    "content": self.sentence(self.rng.randint(10, 120)),
+                    "post_number": number,
+                    "status": status,
+                    "submitted_at": submitted_at,
+                    "approved_at": submitted_at if status == "approved" else None,
+                    "created_at": submitted_at,
+                }
+                index += 1
+            topic = (topic + 1) % self.options.topics
+
+    def private_messages(self) -> Iterator[dict[str, Any]]:
+        conversations = max(1, self.options.messages // 10)
+        for i in range(self.options.messages):
+            first, second = self.conversation_users(self.rng.randrange(conversations))
+            sender, recipient = (first, second) if i % 2 else (second, first)
+            low, high = sorted([str(pk("user", sender)), str(pk("user", recipient))])
+            status = "pending" if i % 25 == 0 else "approved"
+            if status == "pending":
+                self._pending_messages.append((i, sender, recipient))
+            sent_at = self.timestamp()
+            yield {
+                "pk": pk("message", i),
+                "sender_pk": pk("user", sender),
+                "recipient_pk": pk("user", recipient),
+                "subject": self.sentence(4),
+                "content": self.sentence(self.rng.randint(5, 60)),
+                "conversation_id": f"users_{low}_{high}",
+                "status": status,
+                "is_read": self.rng.random() < 0.7,
+                "sent_at": sent_at,
+                "created_at": sent_at,
+            }
+
+    def topic_creation_queue(self) -> Iterator[dict[str, Any]]:
+        pending = len(range(0, self.options.topics, 20))
+        for position in range(1, pending + 1):
+            yield {
+                "title": self.sentence(6),
+                "description": self.sentence(40),
+                "author_pk": pk("user", self.user()),
+                "priority": 1,
+                "position_in_queue": position,
+                "status": "pending",
+                "entered_queue_at": self.now - timedelta(minutes=pending - position),
+            }
+
+    def post_moderation_queue(self) -> Iterator[dict[str, Any]]:
+        for position, (post, topic) in enumerate(self._pending_posts, start=1):
+            yield {
+                "post_pk": pk("post", post),
+                "topic_pk": pk("topic", topic),
+                "priority_score": 0,
+                "priority": 1,
+                "position_in_queue": position,
+                "status": "pending",
+                "entered_queue_at": self.timestamp(),
+            }
+
+    def private_message_queue(self) -> Iterator[dict[str, Any]]:
+        for position, (message, sender, recipient) in enumerate(
+            self._pending_messages, start=1
+        ):
+            low, high = sorted([str(pk("user", sender)), str(pk("user", recipient))])
+            yield {
+                "message_pk": pk("message", message),
+                "sender_pk": pk("user", sender),
+                "recipient_pk": pk("user", recipient),
+                "conversation_id": f"users_{low}_{high}",
+                "priority_score": 0,
+                "priority": 1,
+                "position_in_queue": position,
+                "status": "pending",
+                "entered_queue_at": self.timestamp(),
+            }
+
+    def loyalty_score_events(self) -> Iterator[dict[str, Any]]:
+        for i in range(self.options.events):
+            approved = self.rng.random() < 0.85
+            delta = 1 if approved else -self.rng.randint(1, 5)
+            previous = self.rng.randint(0, 500)
+            content_type = "post" if i % 10 else "topic"
+            content_count = self.options.posts if i % 10 else self.options.topics
+            yield {
+                "pk": pk("event", i),
+                "user_pk": pk("user", self.user()),
+                "event_type": f"{content_type}_moderation",
+                "content_type": content_type,
+                "content_pk": pk(content_type, self.rng.randrange(content_count)),
+                "outcome": "approved" if approved else "rejected",
+                "score_delta": delta,
+                "previous_score": previous,
+                "new_score": previous + delta,
+                "metadata": {},
+                "created_at": self.timestamp(),
+            }
+
+    # Loading
+
+    async def table_columns(self, table: str) -> set[str]:
+        """Get the columns ``table`` actually has in this database."""
+        records = await self.connection.fetch(
+            """
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = $1
+            """,
+            table,
+        )
+        return {record["column_name"] for record in records}
+
+    async def copy(self, table: str, rows: Iterator[dict[str, Any]]) -> int:
+        """Stream ``rows`` into ``table`` as CSV COPY.
+
+        Generated columns the table does not have are dropped, so the seeder
+        works across schema versions.
+        """
+        first = next(rows, None)
+        if first is None:
+            return 0
+
+        existing = await self.table_columns(table)
+        columns = [column for column in first if column in existing]
+        copied = 0
+
+        async def chunks() -> AsyncIterator[bytes]:
+            nonlocal copied
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            pending = [first]
+            for row in rows:
+                pending.append(row)
+                if len(pending) >= CSV_BATCH_ROWS:
+                    writer.writerows(_csv_row(row, columns) for row in pending)
+                    copied += len(pending)
+                    pending.clear()
+                    yield buffer.getvalue().encode()
+                    buffer.seek(0)
+                    buffer.truncate()
+            writer.writerows(_csv_row(row, columns) for row in pending)
+            copied += len(pending)
+            yield buffer.getvalue().encode()
+
+        await self.connection.copy_to_table(
+            table, source=chunks(), columns=columns, format="csv"
+        )
+        return copied
+
+    async def ensure_partitions(self, table: str) -> None:
+        """Create monthly partitions covering the seeded window."""
+        await self.connection.execute(
+            "SELECT create_monthly_partitions($1, $2, $3)", table, self.start, self.now
+        )
+
+    async def run(self) -> None:
+        """Seed every table, then refresh statistics and derived views."""
+        await self.connection.execute("SET synchronous_commit = off")
+        # The generated rows are consistent by construction; skip per-row
+        # foreign key and trigger work, which is planned against the empty
+        # tables and makes large loads quadratic (needs a superuser)
+        await self.connection.execute("SET session_replication_role = replica")
+
+        if self.options.truncate:
+            await self.connection.execute(
+                f"TRUNCATE {', '.join(SEEDED_TABLES)} CASCADE"
+            )
+        elif await self.connection.fetchval("SELECT EXISTS(SELECT 1 FROM users)"):
+            raise SystemExit("users is not empty; rerun with --truncate")
+
+        for table in SEEDED_TABLES:
+            if table in PARTITIONED_TABLES:
+                await self.ensure_partitions(table)
+            started = time.perf_counter()
+            copied = await self.copy(table, getattr(self, table)())
+            logger.info(
+                f"Seeded {copied:,} rows into {table} "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+
+        logger.info("Analyzing and refreshing leaderboard_rankings")
+        await self.connection.execute("ANALYZE")
+        await self.connection.execute("REFRESH MATERIALIZED VIEW leaderboard_rankings")
+
+
+def _csv_row(row: dict[str, Any], columns: list[str]) -> list[Any]:
+    """Encode one row for CSV COPY; None becomes an unquoted empty field (NULL)."""
+    values = []
+    for column in columns:
+        value = row.get(column)
+        if isinstance(value, dict):
+            value = json.dumps(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        values.append(value)
+    return values
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--database-url", default=get_database_url())
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--tags", type=int, default=200)
+    parser.add_argument("--topics", type=int, default=50_000)
+    parser.add_argument("--posts", type=int, default=5_000_000)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--events", type=int, default=5_000_000)
+    parser.add_argument("--days", type=int, default=365, help="Seeded time window")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--truncate", action="store_true", help="Empty seeded tables first"
+    )
+    return parser.parse_args()
+
+
+async def main():
+    """Main entry point."""
+    options = parse_args()
+    connection = await asyncpg.connect(options.database_url)
+    try:
+        started = time.perf_counter()
+        await SyntheticDataSeeder(connection, options).run()
+        logger.info(f"Seeding finished in {time.perf_counter() - started:.1f}s")
+    finally:
+        await connection.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
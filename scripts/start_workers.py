@@ -27,10 +27,14 @@ from therobotoverlord_api.workers.analytics_worker import generate_hourly_snapsh
 from therobotoverlord_api.workers.analytics_worker import generate_monthly_snapshot
 from therobotoverlord_api.workers.analytics_worker import generate_weekly_snapshot
 from therobotoverlord_api.workers.appeal_worker import process_appeal_review
+from therobotoverlord_api.workers.expiry_worker import cleanup_expired_sessions
+from therobotoverlord_api.workers.expiry_worker import expire_sanctions
 from therobotoverlord_api.workers.health_monitor import check_worker_health
 from therobotoverlord_api.workers.health_monitor import cleanup_failed_jobs
 from therobotoverlord_api.workers.leaderboard_worker import cleanup_leaderboard_cache
 from therobotoverlord_api.workers.leaderboard_worker import refresh_leaderboard_rankings
+from therobotoverlord_api.workers.leaderboard_worker import sync_leaderboard_index
+from therobotoverlord_api.workers.partition_worker import maintain_partitions
 from therobotoverlord_api.workers.post_worker import process_post_moderation
 from therobotoverlord_api.workers.private_message_worker import (
     process_private_message_moderation,
@@ -127,11 +131,25 @@ class WorkerManager:
                     "functions": [
                         refresh_leaderboard_rankings,
                         cleanup_leaderboard_cache,
+                        # Enqueued every 10 minutes by the scheduler to build
+                        # the ranking index and repair drift
+                        sync_leaderboard_index,
                     ],
                     "queue_name": "leaderboard",
                     "max_jobs": 1,
                     "job_timeout": 300,
                 },
+                {
+                    "name": "maintenance_worker",
+                    "functions": [
+                        maintain_partitions,
+                        expire_sanctions,
+                        cleanup_expired_sessions,
+                    ],
+                    "queue_name": "maintenance",
+                    "max_jobs": 1,
+                    "job_timeout": 600,
+                },
             ]
 
             # Start workers
@@ -1,14 +1,20 @@
 """Admin dashboard API endpoints for The Robot Overlord API."""
 
 from typing import Annotated
+from typing import Any
 
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import Query
 from fastapi import Request
 
+from therobotoverlord_api.api.pagination import get_keyset_cursor
 from therobotoverlord_api.auth.dependencies import require_admin
+from therobotoverlord_api.auth.jwt_service import claims_cache
+from therobotoverlord_api.auth.principal_cache import principal_cache
 from therobotoverlord_api.auth.rate_limiting import check_admin_rate_limit
+from therobotoverlord_api.database.connection import db
+from therobotoverlord_api.database.instrumentation import query_metrics
 from therobotoverlord_api.database.models.admin_action import AdminActionResponse
 from therobotoverlord_api.database.models.admin_action import AdminActionType
 from therobotoverlord_api.database.models.admin_action import AuditLogResponse
@@ -16,6 +22,9 @@ from therobotoverlord_api.database.models.dashboard_snapshot import DashboardOve
 from therobotoverlord_api.database.models.system_announcement import AnnouncementCreate
 from therobotoverlord_api.database.models.system_announcement import SystemAnnouncement
 from therobotoverlord_api.database.models.user import User
+from therobotoverlord_api.database.repositories.base import DEFAULT_KEYSET_ORDER
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.statements import statement_registry
 from therobotoverlord_api.services.dashboard_service import DashboardService
 
 router = APIRouter(tags=["admin"])
@@ -86,13 +95,16 @@ async def get_announcements(
 async def get_audit_log(
     current_user: Annotated[User, Depends(require_admin)],
     dashboard_service: Annotated[DashboardService, Depends(get_dashboard_service)],
+    cursor: Annotated[
+        KeysetCursor | None, Depends(get_keyset_cursor(DEFAULT_KEYSET_ORDER))
+    ],
     limit: Annotated[int, Query()] = 100,
     offset: Annotated[int, Query()] = 0,
     _: Annotated[None, Depends(check_admin_rate_limit)] = None,
 ) -> AuditLogResponse:
     """Get admin action audit log."""
 
-    audit_data = await dashboard_service.get_audit_log(limit, offset)
+    audit_data = await dashboard_service.get_audit_log(limit, offset, cursor)
 
     return AuditLogResponse(
         actions=[
@@ -112,4 +124,44 @@ async def get_audit_log(
         total_count=audit_data["total_count"],
         limit=limit,
         offset=offset,
+        next_cursor=audit_data["next_cursor"],
     )
+
+
+@router.get("/admin/database/queries")
+async def get_query_metrics(
+    current_user: Annotated[User, Depends(require_admin)],
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    _: Annotated[None, Depends(check_admin_rate_limit)] = None,
+) -> dict[str, Any]:
+    """Get per-statement latency, slow queries and pool-wait metrics."""
+
+    return {
+        "pool": await db.get_pool_stats(),
+        "queries": query_metrics.snapshot(limit),
+    }
+
+
+@router.get("/admin/auth/caches")
+async def get_auth_cache_stats(
+    current_user: Annotated[User, Depends(require_admin)],
+    _: Annotated[None, Depends(check_admin_rate_limit)] = None,
+) -> dict[str, dict[str, int]]:
+    """Get this process's token claims and principal cache counters."""
+
+    return {
+        "claims": claims_cache.stats(),
+        "principals": principal_cache.stats(),
+    }
+
+
+@router.delete("/admin/database/queries")
+async def reset_query_metrics(
+    current_user: Annotated[User, Depends(require_admin)],
+    _: Annotated[None, Depends(check_admin_rate_limit)] = None,
+) -> dict[str, str]:
+    """Clear recorded query metrics, the slow-query log and cache counters."""
+
+    query_metrics.reset()
+    statement_registry.reset_stats()
+    return {"status": "reset"}
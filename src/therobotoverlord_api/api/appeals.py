@@ -9,6 +9,7 @@ from fastapi import HTTPException
 from fastapi import Query
 from fastapi import status
 
+from therobotoverlord_api.api.pagination import get_keyset_cursor
 from therobotoverlord_api.auth.dependencies import get_current_user
 from therobotoverlord_api.auth.dependencies import require_moderator
 from therobotoverlord_api.database.models.appeal import AppealCreate
@@ -23,6 +24,9 @@ from therobotoverlord_api.database.models.appeal_with_editing import (
 )
 from therobotoverlord_api.database.models.base import ContentType
 from therobotoverlord_api.database.models.user import User
+from therobotoverlord_api.database.repositories.appeal import QUEUE_PRIORITY_ORDER
+from therobotoverlord_api.database.repositories.appeal import USER_APPEALS_ORDER
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
 from therobotoverlord_api.services.appeal_service import AppealService
 from therobotoverlord_api.services.content_versioning_service import (
     ContentVersioningService,
@@ -84,6 +88,9 @@ async def check_appeal_eligibility(
 async def get_my_appeals(
     current_user: Annotated[User, Depends(get_current_user)],
     appeal_service: Annotated[AppealService, Depends(get_appeal_service)],
+    cursor: Annotated[
+        KeysetCursor | None, Depends(get_keyset_cursor(USER_APPEALS_ORDER))
+    ],
     status: Annotated[
         AppealStatus | None, Query(description="Filter by appeal status")
     ] = None,
@@ -92,7 +99,7 @@ async def get_my_appeals(
 ):
     """Get current user's appeals."""
     return await appeal_service.get_user_appeals(
-        current_user.pk, status, page, page_size
+        current_user.pk, status, page, page_size, cursor=cursor
     )
 
 
@@ -161,6 +168,9 @@ async def get_appealable_content(
 async def get_appeals_queue(
     current_user: Annotated[User, Depends(require_moderator)],
     appeal_service: Annotated[AppealService, Depends(get_appeal_service)],
+    cursor: Annotated[
+        KeysetCursor | None, Depends(get_keyset_cursor(QUEUE_PRIORITY_ORDER))
+    ],
     status: Annotated[
         AppealStatus, Query(description="Filter by status")
     ] = AppealStatus.PENDING,
@@ -168,7 +178,9 @@ async def get_appeals_queue(
     page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 50,
 ):
     """Get appeals queue for moderators."""
-    return await appeal_service.get_appeals_queue(status, page, page_size)
+    return await appeal_service.get_appeals_queue(
+        status, page, page_size, cursor=cursor
+    )
 
 
 @router.get("/queue/{appeal_pk}", response_model=AppealWithContent)
@@ -296,6 +308,9 @@ async def get_user_appeals_admin(
     user_pk: UUID,
     current_user: Annotated[User, Depends(require_moderator)],
     appeal_service: Annotated[AppealService, Depends(get_appeal_service)],
+    cursor: Annotated[
+        KeysetCursor | None, Depends(get_keyset_cursor(USER_APPEALS_ORDER))
+    ],
     status: Annotated[
         AppealStatus | None, Query(description="Filter by appeal status")
     ] = None,
@@ -303,7 +318,9 @@ async def get_user_appeals_admin(
     page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
 ):
     """Get appeals for a specific user (admin/moderator only)."""
-    return await appeal_service.get_user_appeals(user_pk, status, page, page_size)
+    return await appeal_service.get_user_appeals(
+        user_pk, status, page, page_size, cursor=cursor
+    )
 
 
 @router.get("/content-versions/{content_pk}/history", response_model=list)
@@ -19,6 +19,7 @@ from therobotoverlord_api.auth.models import RegisterRequest
 from therobotoverlord_api.auth.service import AuthService
 from therobotoverlord_api.config.auth import get_auth_settings
 from therobotoverlord_api.database.models.user import User
+from therobotoverlord_api.services.password_service import PasswordHashingBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -267,6 +268,13 @@ async def login_with_email(
 
     except HTTPException:
         raise
+    except PasswordHashingBusyError as e:
+        logger.warning("Password hashing saturated, rejecting login")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, please retry",
+            headers={"Retry-After": "1"},
+        ) from e
     except Exception as e:
         logger.error(f"Login failed for {login_data.email}: {str(e)}")  # noqa: RUF010
         logger.exception("Full login error traceback:")
@@ -327,6 +335,13 @@ async def register_user(
         logger.info("Registration completed successfully")
         return response_data
 
+    except PasswordHashingBusyError as e:
+        logger.warning("Password hashing saturated, rejecting registration")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many registration attempts in progress, please retry",
+            headers={"Retry-After": "1"},
+        ) from e
     except Exception as e:
         logger.error(f"Registration failed for {register_data.email}: {str(e)}")  # noqa: RUF010
         logger.exception("Full registration error traceback:")
@@ -7,8 +7,11 @@ from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Query
+from fastapi import Response
 from fastapi import status
 
+from therobotoverlord_api.api.pagination import get_keyset_cursor
+from therobotoverlord_api.api.pagination import set_next_cursor
 from therobotoverlord_api.auth.dependencies import get_current_user
 from therobotoverlord_api.auth.dependencies import require_role
 from therobotoverlord_api.database.models.base import UserRole
@@ -17,6 +20,9 @@ from therobotoverlord_api.database.models.flag import FlagCreate
 from therobotoverlord_api.database.models.flag import FlagSummary
 from therobotoverlord_api.database.models.flag import FlagUpdate
 from therobotoverlord_api.database.models.user import User
+from therobotoverlord_api.database.repositories.flag import REVIEW_ORDER
+from therobotoverlord_api.database.repositories.flag import USER_FLAGS_ORDER
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
 from therobotoverlord_api.services.flag_service import FlagService
 from therobotoverlord_api.services.flag_service import get_flag_service
 
@@ -44,14 +50,17 @@ async def create_flag(
 async def get_flags(
     _: Annotated[User, Depends(require_role(UserRole.MODERATOR))],
     flag_service: Annotated[FlagService, Depends(get_flag_service)],
+    response: Response,
+    cursor: Annotated[KeysetCursor | None, Depends(get_keyset_cursor(REVIEW_ORDER))],
     limit: Annotated[int, Query(le=100, ge=1)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
     status_filter: Annotated[str | None, Query()] = None,
 ) -> list[FlagSummary]:
     """List flags for moderation review (moderators only)."""
     flags = await flag_service.flag_repo.get_flags_for_review(
-        limit, offset, status_filter
+        limit, offset, status_filter, cursor=cursor
     )
+    set_next_cursor(response, REVIEW_ORDER, flags, limit)
 
     return [
         FlagSummary(
@@ -121,6 +130,10 @@ async def get_user_flags(
     user_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
     flag_service: Annotated[FlagService, Depends(get_flag_service)],
+    response: Response,
+    cursor: Annotated[
+        KeysetCursor | None, Depends(get_keyset_cursor(USER_FLAGS_ORDER))
+    ],
     limit: Annotated[int, Query(le=100, ge=1)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
 ) -> list[FlagSummary]:
@@ -136,7 +149,10 @@ async def get_user_flags(
             detail="Access denied",
         )
 
-    flags = await flag_service.flag_repo.get_user_flags(user_id, limit, offset)
+    flags = await flag_service.flag_repo.get_user_flags(
+        user_id, limit, offset, cursor=cursor
+    )
+    set_next_cursor(response, USER_FLAGS_ORDER, flags, limit)
 
     return [
         FlagSummary(
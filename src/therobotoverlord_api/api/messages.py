@@ -7,8 +7,11 @@ from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Query
+from fastapi import Response
 from fastapi import status
 
+from therobotoverlord_api.api.pagination import get_keyset_cursor
+from therobotoverlord_api.api.pagination import set_next_cursor
 from therobotoverlord_api.auth.dependencies import get_current_user
 from therobotoverlord_api.auth.dependencies import require_role
 from therobotoverlord_api.database.models.base import UserRole
@@ -22,6 +25,11 @@ from therobotoverlord_api.database.models.private_message import (
 )
 from therobotoverlord_api.database.models.private_message import UnreadMessageCount
 from therobotoverlord_api.database.models.user import User
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.private_message import (
+    CONVERSATION_ORDER,
+)
+from therobotoverlord_api.database.repositories.private_message import MESSAGE_ORDER
 from therobotoverlord_api.database.repositories.private_message import (
     PrivateMessageRepository,
 )
@@ -89,18 +97,27 @@ async def send_message(
 @router.get("/conversations")
 async def get_conversations(
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    cursor: Annotated[
+        KeysetCursor | None, Depends(get_keyset_cursor(CONVERSATION_ORDER))
+    ],
     limit: Annotated[int, Query(le=50, ge=1)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
 ) -> list[ConversationSummary]:
     """Get list of conversations for the current user."""
     message_repo = PrivateMessageRepository()
-    return await message_repo.get_user_conversations(current_user.pk, limit, offset)
+    conversations = await message_repo.get_user_conversations(
+        current_user.pk, limit, offset, cursor=cursor
+    )
+    set_next_cursor(response, CONVERSATION_ORDER, conversations, limit)
+    return conversations
 
 
 @router.get("/conversations/{other_user_id}")
 async def get_conversation(
     other_user_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
+    cursor: Annotated[KeysetCursor | None, Depends(get_keyset_cursor(MESSAGE_ORDER))],
     limit: Annotated[int, Query(le=100, ge=1)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
 ) -> MessageThread:
@@ -122,7 +139,12 @@ async def get_conversation(
     ]
 
     conversation = await message_repo.get_conversation(
-        current_user.pk, other_user_id, limit, offset, include_moderated=is_moderator
+        current_user.pk,
+        other_user_id,
+        limit,
+        offset,
+        include_moderated=is_moderator,
+        cursor=cursor,
     )
 
     if not conversation:
@@ -274,6 +296,7 @@ async def admin_view_conversation(
     user1_id: UUID,
     user2_id: UUID,
     current_user: Annotated[User, Depends(require_role(UserRole.ADMIN))],
+    cursor: Annotated[KeysetCursor | None, Depends(get_keyset_cursor(MESSAGE_ORDER))],
     limit: Annotated[int, Query(le=100, ge=1)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
 ) -> MessageThread:
@@ -287,7 +310,7 @@ async def admin_view_conversation(
         )
 
     conversation = await message_repo.get_conversation(
-        user1_id, user2_id, limit, offset, include_moderated=True
+        user1_id, user2_id, limit, offset, include_moderated=True, cursor=cursor
     )
 
     if not conversation:
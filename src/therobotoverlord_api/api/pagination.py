@@ -0,0 +1,56 @@
+"""Cursor pagination helpers for The Robot Overlord API endpoints."""
+
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import Annotated
+from typing import Any
+
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi import Response
+from fastapi import status
+
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.pagination import KeysetOrder
+
+# Response header carrying the cursor for the next page of list endpoints
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def get_keyset_cursor(order: KeysetOrder) -> Callable:
+    """Dependency factory decoding the optional ``cursor`` query parameter.
+
+    Cursors that do not decode, or that ``order`` did not produce (e.g. one
+    copied from another endpoint), are rejected with a 400.
+    """
+
+    def cursor_dependency(
+        cursor: Annotated[
+            str | None,
+            Query(description="Pagination cursor; overrides offset when given"),
+        ] = None,
+    ) -> KeysetCursor | None:
+        """Decode the cursor and check it against the endpoint's ordering."""
+        if cursor is None:
+            return None
+
+        try:
+            keyset_cursor = KeysetCursor.decode(cursor)
+            order.validate_cursor(keyset_cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            ) from e
+        return keyset_cursor
+
+    return cursor_dependency
+
+
+def set_next_cursor(
+    response: Response, order: KeysetOrder, rows: Sequence[Any], limit: int
+) -> None:
+    """Expose the next page cursor on a list response, if there may be one."""
+    next_cursor = order.next_cursor(rows, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
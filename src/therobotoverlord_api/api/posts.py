@@ -9,8 +9,11 @@ from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Query
+from fastapi import Response
 from fastapi import status
 
+from therobotoverlord_api.api.pagination import get_keyset_cursor
+from therobotoverlord_api.api.pagination import set_next_cursor
 from therobotoverlord_api.auth.dependencies import get_current_user
 from therobotoverlord_api.auth.dependencies import require_role
 from therobotoverlord_api.database.models.base import ContentStatus
@@ -28,6 +31,9 @@ from therobotoverlord_api.database.models.post import PostThread
 from therobotoverlord_api.database.models.post import PostUpdate
 from therobotoverlord_api.database.models.post import PostWithAuthor
 from therobotoverlord_api.database.models.user import User
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.post import NEWEST_FIRST
+from therobotoverlord_api.database.repositories.post import OLDEST_FIRST
 from therobotoverlord_api.database.repositories.post import PostRepository
 from therobotoverlord_api.services.loyalty_score_service import (
     get_loyalty_score_service,
@@ -46,6 +52,8 @@ moderator_dependency = require_role(UserRole.MODERATOR)
 
 @router.get("/feed")
 async def get_posts_feed(
+    response: Response,
+    cursor: Annotated[KeysetCursor | None, Depends(get_keyset_cursor(OLDEST_FIRST))],
     topic_id: Annotated[UUID | None, Query()] = None,
     author_id: Annotated[UUID | None, Query()] = None,
     search: Annotated[str | None, Query(max_length=200)] = None,
@@ -53,22 +61,11 @@ async def get_posts_feed(
     offset: Annotated[int, Query(ge=0)] = 0,
 ) -> list[PostWithAuthor]:
     """Get posts feed with optional filtering (public endpoint)."""
-    post_repo = PostRepository()
-
-    if search:
-        return await post_repo.search_posts(search, topic_id, limit, offset)
-    if topic_id:
-        return await post_repo.get_approved_by_topic(topic_id, limit, offset)
-    if author_id:
-        # Convert PostSummary to PostWithAuthor for consistency
-        summaries = await post_repo.get_by_author(
-            author_id, ContentStatus.APPROVED, limit, offset
-        )
-        # Note: This would need a separate endpoint or different return type in practice
-        # For now, return recent approved posts
-        return await post_repo.get_recent_approved_posts(limit, offset)
-
-    return await post_repo.get_recent_approved_posts(limit, offset)
+    posts = await _get_filtered_posts(
+        topic_id, author_id, search, limit, offset, cursor
+    )
+    set_next_cursor(response, OLDEST_FIRST, posts, limit)
+    return posts
 
 
 @router.get("/trending")
@@ -91,6 +88,8 @@ async def get_popular_posts(
 
 @router.get("/")
 async def get_posts(
+    response: Response,
+    cursor: Annotated[KeysetCursor | None, Depends(get_keyset_cursor(OLDEST_FIRST))],
     topic_id: Annotated[UUID | None, Query()] = None,
     author_id: Annotated[UUID | None, Query()] = None,
     search: Annotated[str | None, Query(max_length=200)] = None,
@@ -98,22 +97,38 @@ async def get_posts(
     offset: Annotated[int, Query(ge=0)] = 0,
 ) -> list[PostWithAuthor]:
     """Get posts with optional filtering (public endpoint)."""
+    posts = await _get_filtered_posts(
+        topic_id, author_id, search, limit, offset, cursor
+    )
+    set_next_cursor(response, OLDEST_FIRST, posts, limit)
+    return posts
+
+
+async def _get_filtered_posts(
+    topic_id: UUID | None,
+    author_id: UUID | None,
+    search: str | None,
+    limit: int,
+    offset: int,
+    cursor: KeysetCursor | None,
+) -> list[PostWithAuthor]:
+    """Get approved posts for the feed endpoints, oldest first."""
     post_repo = PostRepository()
 
     if search:
-        return await post_repo.search_posts(search, topic_id, limit, offset)
+        return await post_repo.search_posts(
+            search, topic_id, limit, offset, cursor=cursor
+        )
     if topic_id:
-        return await post_repo.get_approved_by_topic(topic_id, limit, offset)
-    if author_id:
-        # Convert PostSummary to PostWithAuthor for consistency
-        summaries = await post_repo.get_by_author(
-            author_id, ContentStatus.APPROVED, limit, offset
+        return await post_repo.get_approved_by_topic(
+            topic_id, limit, offset, cursor=cursor
         )
+    if author_id:
         # Note: This would need a separate endpoint or different return type in practice
         # For now, return recent approved posts
-        return await post_repo.get_recent_approved_posts(limit, offset)
+        return await post_repo.get_recent_approved_posts(limit, offset, cursor=cursor)
 
-    return await post_repo.get_recent_approved_posts(limit, offset)
+    return await post_repo.get_recent_approved_posts(limit, offset, cursor=cursor)
 
 
 # Specific routes must come before parameterized routes
@@ -479,6 +494,8 @@ async def reject_post(
 @router.get("/author/{author_id}")
 async def get_posts_by_author(
     author_id: UUID,
+    response: Response,
+    cursor: Annotated[KeysetCursor | None, Depends(get_keyset_cursor(NEWEST_FIRST))],
     status: Annotated[ContentStatus | None, Query()] = None,
     limit: Annotated[int, Query(le=100, ge=1)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
@@ -488,4 +505,8 @@ async def get_posts_by_author(
 
     # Default to approved posts for public access
     content_status = status or ContentStatus.APPROVED
-    return await post_repo.get_by_author(author_id, content_status, limit, offset)
+    posts = await post_repo.get_by_author(
+        author_id, content_status, limit, offset, cursor=cursor
+    )
+    set_next_cursor(response, NEWEST_FIRST, posts, limit)
+    return posts
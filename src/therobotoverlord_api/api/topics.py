@@ -1,5 +1,6 @@
 """Topics API endpoints for The Robot Overlord API."""
 
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
@@ -7,8 +8,11 @@ from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Query
+from fastapi import Response
 from fastapi import status
 
+from therobotoverlord_api.api.pagination import get_keyset_cursor
+from therobotoverlord_api.api.pagination import set_next_cursor
 from therobotoverlord_api.auth.dependencies import get_current_user
 from therobotoverlord_api.auth.dependencies import get_optional_user
 from therobotoverlord_api.auth.dependencies import require_role
@@ -22,15 +26,24 @@ from therobotoverlord_api.database.models.topic import TopicCreate
 from therobotoverlord_api.database.models.topic import TopicSummary
 from therobotoverlord_api.database.models.topic import TopicWithAuthor
 from therobotoverlord_api.database.models.user import User
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.pagination import KeysetOrder
+from therobotoverlord_api.database.repositories.topic import NEWEST_FIRST
 from therobotoverlord_api.database.repositories.topic import TopicRepository
 from therobotoverlord_api.services.ai_tag_service import get_ai_tag_service
 from therobotoverlord_api.services.loyalty_score_service import (
     get_loyalty_score_service,
 )
 from therobotoverlord_api.services.queue_service import get_queue_service
+from therobotoverlord_api.services.tag_service import invalidate_topic_categories
 
 router = APIRouter(prefix="/topics", tags=["topics"])
 
+# Ordering of the unjoined /feed query, which selects from topics unaliased
+FEED_ORDER = KeysetOrder.by(
+    ("created_at", "created_at", True, datetime), ("pk", "pk", True, UUID)
+)
+
 # Authentication dependencies for testing
 admin_dependency = require_role(UserRole.ADMIN)
 moderator_dependency = require_role(UserRole.MODERATOR)
@@ -47,6 +60,8 @@ async def get_categories() -> dict:
 
 @router.get("/feed")
 async def get_topics_feed(
+    response: Response,
+    cursor: Annotated[KeysetCursor | None, Depends(get_keyset_cursor(FEED_ORDER))],
     user: Annotated[User | None, Depends(get_optional_user)] = None,
     limit: Annotated[int, Query(le=100, ge=1)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
@@ -54,8 +69,14 @@ async def get_topics_feed(
     """Get approved topics feed (public endpoint)."""
     from therobotoverlord_api.database.connection import get_db_connection
 
+    where_clause = "status = 'approved'"
+    params: list = []
+    if cursor is not None:
+        where_clause = FEED_ORDER.apply(where_clause, params, cursor)
+        offset = 0
+
     # Simple query without complex joins to test
-    query = """
+    query = f"""
         SELECT
             pk,
             title,
@@ -65,15 +86,15 @@ async def get_topics_feed(
             created_at,
             CASE WHEN created_by_overlord THEN 'The Overlord' ELSE 'Anonymous' END as author_username,
             0 as post_count,
-            '{}' as tags
+            '{{}}' as tags
         FROM topics
-        WHERE status = 'approved'
-        ORDER BY created_at DESC
-        LIMIT $1 OFFSET $2
+        WHERE {where_clause}
+        {FEED_ORDER.order_by()}
+        LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
     """
 
     async with get_db_connection() as connection:
-        records = await connection.fetch(query, limit, offset)
+        records = await connection.fetch(query, *params, limit, offset)
         results = []
         for record in records:
             # Convert record to dict to debug the issue
@@ -91,6 +112,7 @@ async def get_topics_feed(
                 except json.JSONDecodeError:
                     record_dict["tags"] = []
             results.append(TopicSummary.model_validate(record_dict))
+        set_next_cursor(response, FEED_ORDER, results, limit)
         return results
 
 
@@ -146,6 +168,8 @@ async def get_featured_topics(
 
 @router.get("/")
 async def get_topics(
+    response: Response,
+    cursor: Annotated[KeysetCursor | None, Depends(get_keyset_cursor(NEWEST_FIRST))],
     user: Annotated[User | None, Depends(get_optional_user)] = None,
     limit: Annotated[int, Query(le=100, ge=1)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
@@ -157,12 +181,20 @@ async def get_topics(
     topic_repo = TopicRepository()
 
     if overlord_only:
-        return await topic_repo.get_overlord_topics(limit=limit, offset=offset)
-    if search:
-        return await topic_repo.search_topics(search, limit=limit, offset=offset)
-    return await topic_repo.get_approved_topics(
-        limit=limit, offset=offset, tag_names=tags
-    )
+        topics = await topic_repo.get_overlord_topics(
+            limit=limit, offset=offset, cursor=cursor
+        )
+    elif search:
+        topics = await topic_repo.search_topics(
+            search, limit=limit, offset=offset, cursor=cursor
+        )
+    else:
+        topics = await topic_repo.get_approved_topics(
+            limit=limit, offset=offset, tag_names=tags, cursor=cursor
+        )
+
+    set_next_cursor(response, NEWEST_FIRST, topics, limit)
+    return topics
 
 
 @router.get("/{topic_id}")
@@ -295,6 +327,7 @@ async def approve_topic(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Topic not found"
         )
+    await invalidate_topic_categories()
 
     # Automatically assign tags via AI when topic is approved
     try:
@@ -346,6 +379,7 @@ async def reject_topic(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Topic not found"
         )
+    await invalidate_topic_categories()
 
     # Record moderation rejection event for loyalty scoring
     if topic.author_pk:
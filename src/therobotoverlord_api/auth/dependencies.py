@@ -9,6 +9,7 @@ from fastapi import HTTPException
 from fastapi import Request
 from fastapi import status
 
+from therobotoverlord_api.auth.principal_cache import principal_cache
 from therobotoverlord_api.database.models.base import UserRole
 from therobotoverlord_api.database.models.user import User
 from therobotoverlord_api.database.repositories.user import UserRepository
@@ -19,6 +20,11 @@ logger = logging.getLogger(__name__)
 async def get_current_user(request: Request) -> User:
     """Get the current authenticated user from the request."""
 
+    # Reuse the user already resolved by the authentication middleware
+    principal = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
+
     # Log all cookies for debugging
     logger.debug(f"Request cookies: {dict(request.cookies)}")
 
@@ -68,10 +74,10 @@ async def get_current_user(request: Request) -> User:
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
             )
 
-        # Get user from database
-        logger.info(f"Looking up user in database: {user_id}")
+        # Get user from the principal cache, falling back to the database
+        logger.info(f"Looking up user: {user_id}")
         user_repo = UserRepository()
-        user = await user_repo.get_by_pk(user_id)
+        user = await principal_cache.get(user_id, user_repo.get_by_pk)
 
         if not user:
             logger.warning(f"User not found in database: {user_id}")
@@ -86,6 +92,7 @@ async def get_current_user(request: Request) -> User:
             )
 
         logger.info(f"Authentication successful for user: {user.username} ({user_id})")
+        request.state.principal = user
         return user
 
     except HTTPException:
@@ -132,6 +139,10 @@ def require_role(required_role: UserRole) -> Callable:
 async def get_optional_user(request: Request) -> User | None:
     """Get the current user if authenticated, otherwise None."""
 
+    principal = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
+
     # Import here to avoid circular imports
     from therobotoverlord_api.config.auth import get_auth_settings
 
@@ -160,13 +171,14 @@ async def get_optional_user(request: Request) -> User | None:
         if not user_id:
             return None
 
-        # Get user from database
+        # Get user from the principal cache, falling back to the database
         user_repo = UserRepository()
-        user = await user_repo.get_by_pk(user_id)
+        user = await principal_cache.get(user_id, user_repo.get_by_pk)
 
         if not user or user.is_banned:
             return None
 
+        request.state.principal = user
         return user
 
     except Exception:
@@ -1,7 +1,10 @@
 """JWT token service for The Robot Overlord API."""
 
+import hashlib
 import secrets
+import time
 
+from collections import OrderedDict
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
@@ -22,11 +25,65 @@ from therobotoverlord_api.config.auth import get_auth_settings
 from therobotoverlord_api.database.models.base import UserRole
 
 
+class ClaimsCache:
+    """Bounded LRU of verified access token claims, kept until they expire.
+
+    Keys are digests of the verification parameters and the token, so a
+    token is only served from the cache to a service that would itself have
+    accepted it, and raw tokens are never held in memory.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, TokenClaims] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: bytes) -> TokenClaims | None:
+        """Get unexpired claims for ``key``."""
+        claims = self._entries.get(key)
+        if claims is None:
+            self.misses += 1
+            return None
+        if claims.exp <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return claims
+
+    def set(self, key: bytes, claims: TokenClaims) -> None:
+        """Cache verified claims for ``key``."""
+        self._entries[key] = claims
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached token."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get hit and miss counters."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Shared by every JWTService, which are created per request
+claims_cache = ClaimsCache(get_auth_settings().jwt_claims_cache_size)
+
+
 class JWTService:
     """JWT token management service."""
 
     def __init__(self):
         self._settings = get_auth_settings()
+        # Tokens verified under other keys or claims rules must not be reused
+        settings = self._settings
+        self._cache_namespace = hashlib.sha256(
+            f"{settings.jwt_secret_key}\0{settings.jwt_algorithm}\0"
+            f"{settings.jwt_audience}\0{settings.jwt_issuer}".encode()
+        ).digest()
 
     def generate_session_id(self) -> str:
         """Generate a secure session ID."""
@@ -67,6 +124,7 @@ class JWTService:
             iat=int(now.timestamp()),
             exp=int(access_expires_at.timestamp()),
             nbf=int(now.timestamp()),
+            token_version=self._settings.jwt_token_version,
         )
 
         access_token = AccessToken(
@@ -134,18 +192,32 @@ class JWTService:
             return None
 
     def decode_token(self, token: str) -> TokenClaims | None:
-        """Decode and validate JWT token."""
-        try:
-            claims = jwt.decode(
-                token,
-                self._settings.jwt_secret_key,
-                algorithms=[self._settings.jwt_algorithm],
-                audience=self._settings.jwt_audience,
-                issuer=self._settings.jwt_issuer,
-            )
-            return TokenClaims(**claims)
-        except (DecodeError, ExpiredSignatureError, InvalidTokenError):
+        """Decode and validate JWT token.
+
+        Verified claims are cached until they expire, so repeat requests
+        with the same token skip signature verification. The token version
+        is checked on every call, cached or not, so raising
+        ``jwt_token_version`` revokes outstanding tokens immediately.
+        """
+        key = hashlib.sha256(self._cache_namespace + token.encode()).digest()
+        claims = claims_cache.get(key)
+        if claims is None:
+            try:
+                decoded = jwt.decode(
+                    token,
+                    self._settings.jwt_secret_key,
+                    algorithms=[self._settings.jwt_algorithm],
+                    audience=self._settings.jwt_audience,
+                    issuer=self._settings.jwt_issuer,
+                )
+            except (DecodeError, ExpiredSignatureError, InvalidTokenError):
+                return None
+            claims = TokenClaims(**decoded)
+            claims_cache.set(key, claims)
+
+        if claims.token_version < self._settings.jwt_token_version:
             return None
+        return claims
 
     def decode_token_claims(self, token: str) -> TokenClaims | None:
         """Decode token into TokenClaims model."""
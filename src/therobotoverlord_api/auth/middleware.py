@@ -10,14 +10,23 @@ from fastapi import Response
 from fastapi import status
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
 
 from therobotoverlord_api.auth.decorators import is_public_endpoint
 from therobotoverlord_api.auth.decorators import is_visitor_readable
 from therobotoverlord_api.auth.jwt_service import JWTService
 from therobotoverlord_api.auth.models import TokenClaims
+from therobotoverlord_api.auth.models import TokenPair
+from therobotoverlord_api.auth.principal_cache import principal_cache
+from therobotoverlord_api.auth.refresh_coordinator import refresh_coordinator
 from therobotoverlord_api.auth.session_service import SessionService
 from therobotoverlord_api.config.auth import get_auth_settings
+from therobotoverlord_api.database.models.user import User
 from therobotoverlord_api.database.models.user import UserRole
 from therobotoverlord_api.database.repositories.user import UserRepository
 from therobotoverlord_api.services.loyalty_score_service import (
@@ -35,12 +44,14 @@ class AuthenticatedUser:
         permissions: list[str],
         session_id: str,
         token_version: int = 1,
+        principal: User | None = None,
     ):
         self.user_id = user_id
         self.role = role
         self.permissions = permissions
         self.session_id = session_id
         self.token_version = token_version
+        self.principal = principal
 
     def has_permission(self, permission: str) -> bool:
         """Check if user has specific permission."""
@@ -57,33 +68,52 @@ class AuthenticatedUser:
         return role_hierarchy.get(self.role, 0) >= role_hierarchy.get(role, 0)
 
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
-    """Middleware for handling authentication and token refresh."""
+def _set_request_user(request: Request, user: AuthenticatedUser) -> None:
+    """Share the resolved user with the auth dependencies for this request."""
+    request.state.user = user
+    request.state.principal = user.principal
 
-    def __init__(self, app):
-        super().__init__(app)
+
+class AuthenticationMiddleware:
+    """Middleware for handling authentication and token refresh.
+
+    Implemented as plain ASGI rather than ``BaseHTTPMiddleware`` so requests
+    are not run in an extra task with a wrapped response stream.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self.jwt_service = JWTService()
         self.session_service = SessionService()
         self.user_repository = UserRepository()
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Process request with authentication handling."""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+
         # Skip authentication for OPTIONS requests (CORS preflight)
         if request.method == "OPTIONS":
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         # Skip authentication for public endpoints
         if self._is_public_endpoint(request):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Extract tokens from cookies
         access_token = request.cookies.get("__Secure-trl_at")
         refresh_token = request.cookies.get("__Secure-trl_rt")
 
         if not access_token:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={"detail": "Access token required"},
             )
+            await response(scope, receive, send)
+            return
 
         # Try to validate access token
         claims = self.jwt_service.decode_token_claims(access_token)
@@ -92,8 +122,9 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             # Token is valid, set user context
             user = await self._get_authenticated_user(claims)
             if user:
-                request.state.user = user
-                return await call_next(request)
+                _set_request_user(request, user)
+                await self.app(scope, receive, send)
+                return
 
         # Access token invalid/expired, try refresh
         if refresh_token:
@@ -105,25 +136,28 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
                 if claims:
                     user = await self._get_authenticated_user(claims)
                     if user:
-                        request.state.user = user
-                        response = await call_next(request)
+                        _set_request_user(request, user)
 
                         # Set new tokens in response cookies
-                        self._set_auth_cookies(response, access_token, refresh_token)
-                        return response
+                        send = self._send_with_auth_cookies(
+                            send, access_token, refresh_token
+                        )
+                        await self.app(scope, receive, send)
+                        return
 
         # Authentication failed
-        return JSONResponse(
+        response = JSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": "Invalid or expired authentication"},
         )
+        await response(scope, receive, send)
 
     async def _get_authenticated_user(
         self, claims: TokenClaims
     ) -> AuthenticatedUser | None:
         """Get authenticated user from token claims."""
         try:
-            user = await self.user_repository.get_by_pk(claims.sub)
+            user = await principal_cache.get(claims.sub, self.user_repository.get_by_pk)
             if not user or user.is_banned:
                 return None
 
@@ -133,6 +167,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
                 permissions=claims.permissions,
                 session_id=claims.sid,
                 token_version=claims.token_version,
+                principal=user,
             )
         except Exception:
             return None
@@ -147,44 +182,13 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             if not session_id:
                 return None
 
-            # Validate refresh token
-            if not await self.session_service.validate_refresh_token(
-                session_id, refresh_token
-            ):
-                return None
-
-            # Get session info
-            session = await self.session_service.get_session(session_id)
-            if not session or session.is_revoked:
-                return None
-
-            # Get user info
-            user = await self.user_repository.get_by_pk(session.user_pk)
-            if not user or user.is_banned:
-                return None
-
-            # Generate new token pair
-            new_jwt_service = JWTService()
-            token_pair = new_jwt_service.create_token_pair(
-                user_id=user.pk,
-                role=user.role,
-                permissions=await self._get_user_permissions(user),
-                session_id=session_id,
+            # Parallel requests carrying the same refresh token share one rotation
+            token_pair = await refresh_coordinator.refresh(
+                session_id,
+                refresh_token,
+                lambda: self._rotate_refresh_token(session_id, refresh_token, request),
             )
-
-            # Rotate refresh token
-            ip_address = self._get_client_ip(request)
-            user_agent = request.headers.get("user-agent")
-
-            success = await self.session_service.rotate_refresh_token(
-                session_id=session_id,
-                old_refresh_token=refresh_token,
-                new_refresh_token=token_pair.refresh_token.token,
-                ip_address=ip_address,
-                user_agent=user_agent,
-            )
-
-            if success:
+            if token_pair:
                 return token_pair.access_token.token, token_pair.refresh_token.token
 
         except Exception as e:
@@ -195,6 +199,49 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
 
         return None
 
+    async def _rotate_refresh_token(
+        self, session_id: str, refresh_token: str, request: Request
+    ) -> TokenPair | None:
+        """Validate the refresh token and rotate it for a new token pair."""
+        # Validate refresh token
+        if not await self.session_service.validate_refresh_token(
+            session_id, refresh_token
+        ):
+            return None
+
+        # Get session info
+        session = await self.session_service.get_session(session_id)
+        if not session or session.is_revoked:
+            return None
+
+        # Get user info
+        user = await self.user_repository.get_auth_summary(session.user_pk)
+        if not user or user.is_banned:
+            return None
+
+        # Generate new token pair
+        new_jwt_service = JWTService()
+        token_pair = new_jwt_service.create_token_pair(
+            user_id=user.pk,
+            role=user.role,
+            permissions=await self._get_user_permissions(user),
+            session_id=session_id,
+        )
+
+        # Rotate refresh token
+        ip_address = self._get_client_ip(request)
+        user_agent = request.headers.get("user-agent")
+
+        success = await self.session_service.rotate_refresh_token(
+            session_id=session_id,
+            old_refresh_token=refresh_token,
+            new_refresh_token=token_pair.refresh_token.token,
+            ip_address=ip_address,
+            user_agent=user_agent,
+        )
+
+        return token_pair if success else None
+
     async def _get_user_permissions(self, user) -> list[str]:
         """Get user permissions based on role and loyalty score."""
         permissions = ["view_content", "create_posts", "send_private_messages"]
@@ -287,6 +334,27 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             path="/",
         )
 
+    def _send_with_auth_cookies(
+        self, send: Send, access_token: str, refresh_token: str
+    ) -> Send:
+        """Wrap ``send`` to add the refreshed token cookies to the response."""
+        cookies = Response()
+        self._set_auth_cookies(cookies, access_token, refresh_token)
+        set_cookies = [
+            value.decode("latin-1")
+            for key, value in cookies.raw_headers
+            if key == b"set-cookie"
+        ]
+
+        async def send_with_cookies(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for cookie in set_cookies:
+                    headers.append("set-cookie", cookie)
+            await send(message)
+
+        return send_with_cookies
+
     def _get_client_ip(self, request: Request) -> str | None:
         """Extract client IP address from request."""
         # Check for forwarded headers first
@@ -305,16 +373,20 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         return None
 
 
-class OptionalAuthenticationMiddleware(BaseHTTPMiddleware):
+class OptionalAuthenticationMiddleware:
     """Middleware for optional authentication (sets user context if available)."""
 
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self.jwt_service = JWTService()
         self.user_repository = UserRepository()
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Process request with optional authentication."""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
         access_token = request.cookies.get("__Secure-trl_at")
 
         if access_token:
@@ -322,16 +394,16 @@ class OptionalAuthenticationMiddleware(BaseHTTPMiddleware):
             if claims:
                 user = await self._get_authenticated_user(claims)
                 if user:
-                    request.state.user = user
+                    _set_request_user(request, user)
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
     async def _get_authenticated_user(
         self, claims: TokenClaims
     ) -> AuthenticatedUser | None:
         """Get authenticated user from token claims."""
         try:
-            user = await self.user_repository.get_by_pk(claims.sub)
+            user = await principal_cache.get(claims.sub, self.user_repository.get_by_pk)
             if not user or user.is_banned:
                 return None
 
@@ -341,6 +413,7 @@ class OptionalAuthenticationMiddleware(BaseHTTPMiddleware):
                 permissions=claims.permissions,
                 session_id=claims.sid,
                 token_version=claims.token_version,
+                principal=user,
             )
         except Exception:
             return None
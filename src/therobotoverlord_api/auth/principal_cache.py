@@ -0,0 +1,209 @@
+"""Shared cache of authenticated user principals.
+
+Resolving the user behind an access token used to cost a database round trip
+on every request. Principals are now kept in a small in-process LRU in front
+of a shared Redis copy, so most requests authenticate without touching the
+database.
+
+Bans, role changes and sanctions go through ``UserRepository.update_user``,
+and loyalty score changes go through ``LoyaltyScoreRepository`` and the
+moderation service; all of them call :meth:`PrincipalCache.invalidate`. That
+drops the Redis copy and publishes the user on :data:`INVALIDATION_CHANNEL`
+so every API process evicts its local copy. Anything else on the cached user
+(counters, profile fields written elsewhere) can be refilled from Redis until
+that copy expires, so it may lag by up to ``principal_redis_ttl`` plus the
+local TTL.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+
+from collections import OrderedDict
+from collections.abc import Awaitable
+from collections.abc import Callable
+from uuid import UUID
+
+from therobotoverlord_api.config.auth import AuthSettings
+from therobotoverlord_api.config.auth import get_auth_settings
+from therobotoverlord_api.database.models.user import User
+from therobotoverlord_api.workers.redis_connection import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "auth:principal:invalidate"
+
+# Skip Redis for this long after it fails so auth falls back to the database
+# instead of paying a connection timeout on every request
+_REDIS_RETRY_SECONDS = 5.0
+
+UserLoader = Callable[[UUID], Awaitable[User | None]]
+
+
+class PrincipalCache:
+    """Two-level cache of users by primary key for authentication."""
+
+    def __init__(self, settings: AuthSettings | None = None):
+        settings = settings or get_auth_settings()
+        self.local_ttl = settings.principal_cache_ttl
+        self.max_size = settings.principal_cache_size
+        self.redis_ttl = settings.principal_redis_ttl
+
+        self._local: OrderedDict[UUID, tuple[float, User]] = OrderedDict()
+        self._redis_retry_at = 0.0
+        self._listener: asyncio.Task | None = None
+
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _redis_key(user_pk: UUID) -> str:
+        return f"auth:principal:{user_pk}"
+
+    async def get(self, user_pk: UUID, load: UserLoader) -> User | None:
+        """Get a user, calling ``load`` only when neither cache has it."""
+        user = self._get_local(user_pk)
+        if user is not None:
+            self.local_hits += 1
+            return user
+
+        user = await self._get_redis(user_pk)
+        if user is not None:
+            self.redis_hits += 1
+        else:
+            self.misses += 1
+            user = await load(user_pk)
+            if user is None:
+                return None
+            await self._set_redis(user)
+
+        self._set_local(user)
+        return user
+
+    async def invalidate(self, user_pk: UUID) -> None:
+        """Drop a user from every process after its auth state changed."""
+        self._local.pop(user_pk, None)
+
+        # Always try Redis here, even while backing off, so a ban is not lost
+        try:
+            redis_client = await get_redis_client()
+            await redis_client.delete(self._redis_key(user_pk))
+            await redis_client.publish(INVALIDATION_CHANNEL, str(user_pk))
+        except Exception as e:
+            self._redis_failed(e)
+
+    def clear(self) -> None:
+        """Drop every locally cached user."""
+        self._local.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get hit and miss counters."""
+        return {
+            "size": len(self._local),
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+        }
+
+    async def start_listener(self) -> None:
+        """Start evicting local entries on invalidation events."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        """Stop the invalidation listener."""
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._listener
+        self._listener = None
+
+    async def _listen(self) -> None:
+        """Evict users published on the invalidation channel."""
+        while True:
+            try:
+                redis_client = await get_redis_client()
+                pubsub = redis_client.pubsub()
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Events published while disconnected were missed
+                self.clear()
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        data = message["data"]
+                        if isinstance(data, bytes):
+                            data = data.decode()
+                        self._local.pop(UUID(data), None)
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Principal invalidation listener failed: {e}")
+                await asyncio.sleep(_REDIS_RETRY_SECONDS)
+
+    def _get_local(self, user_pk: UUID) -> User | None:
+        entry = self._local.get(user_pk)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._local[user_pk]
+            return None
+        self._local.move_to_end(user_pk)
+        return user
+
+    def _set_local(self, user: User) -> None:
+        self._local[user.pk] = (time.monotonic() + self.local_ttl, user)
+        self._local.move_to_end(user.pk)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    async def _get_redis(self, user_pk: UUID) -> User | None:
+        redis_client = await self._redis()
+        if redis_client is None:
+            return None
+        try:
+            cached = await redis_client.get(self._redis_key(user_pk))
+        except Exception as e:
+            self._redis_failed(e)
+            return None
+        if not cached:
+            return None
+        try:
+            return User.model_validate_json(cached)
+        except ValueError:
+            return None
+
+    async def _set_redis(self, user: User) -> None:
+        redis_client = await self._redis()
+        if redis_client is None:
+            return
+        try:
+            await redis_client.setex(
+                self._redis_key(user.pk), self.redis_ttl, user.model_dump_json()
+            )
+        except Exception as e:
+            self._redis_failed(e)
+
+    async def _redis(self):
+        """Get the Redis client unless it failed recently."""
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        try:
+            return await get_redis_client()
+        except Exception as e:
+            self._redis_failed(e)
+            return None
+
+    def _redis_failed(self, error: Exception) -> None:
+        logger.warning(f"Principal cache Redis unavailable: {error}")
+        self._redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache()
@@ -0,0 +1,173 @@
+"""Single-flight refresh token rotation.
+
+When an access token expires a browser fires several requests at once, all
+carrying the same refresh token. Rotating it once per request costs a burst
+of session queries, and every rotation after the first presents an already
+rotated token and trips reuse detection, revoking the session.
+
+:class:`RefreshCoordinator` lets one request per session perform the
+rotation. Requests in the same process wait on it directly; requests in other
+processes wait on a Redis lock and then read the new token pair from a
+short-lived result cache. The cached pair is keyed by a digest of the old
+refresh token, so only holders of that exact token can pick it up.
+"""
+
+import asyncio
+import hashlib
+import logging
+import secrets
+import time
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import cast
+
+from therobotoverlord_api.auth.models import TokenPair
+from therobotoverlord_api.config.auth import AuthSettings
+from therobotoverlord_api.config.auth import get_auth_settings
+from therobotoverlord_api.workers.redis_connection import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Delete the lock only while we still own it
+_RELEASE_LOCK = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+_POLL_INTERVAL = 0.05
+
+Rotation = Callable[[], Awaitable[TokenPair | None]]
+
+
+class RefreshCoordinator:
+    """Coalesce concurrent refreshes of one refresh token into one rotation."""
+
+    def __init__(self, settings: AuthSettings | None = None):
+        settings = settings or get_auth_settings()
+        self.lock_ttl = settings.refresh_lock_ttl
+        self.result_ttl = settings.refresh_result_ttl
+        self._in_flight: dict[str, asyncio.Future[TokenPair | None]] = {}
+
+    @staticmethod
+    def _token_digest(refresh_token: str) -> str:
+        return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+    @staticmethod
+    def _lock_key(session_id: str) -> str:
+        return f"auth:refresh:lock:{session_id}"
+
+    @staticmethod
+    def _result_key(session_id: str, digest: str) -> str:
+        return f"auth:refresh:result:{session_id}:{digest}"
+
+    async def refresh(
+        self, session_id: str, refresh_token: str, rotate: Rotation
+    ) -> TokenPair | None:
+        """Get the token pair replacing ``refresh_token``, rotating at most once."""
+        key = f"{session_id}:{self._token_digest(refresh_token)}"
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[TokenPair | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        token_pair = None
+        try:
+            token_pair = await self._refresh_once(session_id, refresh_token, rotate)
+            return token_pair
+        finally:
+            # Waiters see a failed leader as a failed refresh
+            future.set_result(token_pair)
+            del self._in_flight[key]
+
+    async def _refresh_once(
+        self, session_id: str, refresh_token: str, rotate: Rotation
+    ) -> TokenPair | None:
+        """Rotate under the session lock, or wait for another process to."""
+        result_key = self._result_key(session_id, self._token_digest(refresh_token))
+        lock_key = self._lock_key(session_id)
+        owner = secrets.token_hex(16)
+
+        try:
+            redis_client = await get_redis_client()
+            acquired, token_pair = await self._wait_for_lock(
+                redis_client, lock_key, result_key, owner
+            )
+        except Exception as e:
+            # Without Redis we can only coalesce within this process
+            logger.warning(f"Refresh coordination unavailable: {e}")
+            return await rotate()
+
+        if not acquired:
+            return token_pair
+
+        try:
+            token_pair = await rotate()
+            if token_pair is not None:
+                await redis_client.setex(
+                    result_key, self.result_ttl, token_pair.model_dump_json()
+                )
+            return token_pair
+        except Exception as e:
+            # The rotation already happened; never repeat it
+            if token_pair is None:
+                raise
+            logger.warning(f"Failed to share refreshed tokens: {e}")
+            return token_pair
+        finally:
+            try:
+                await self._release_lock(redis_client, lock_key, owner)
+            except Exception as e:
+                logger.warning(f"Failed to release refresh lock: {e}")
+
+    @staticmethod
+    async def _shared_result(redis_client, result_key: str) -> TokenPair | None:
+        """Get the token pair another process stored for this refresh."""
+        cached = await cast("Awaitable[bytes | None]", redis_client.get(result_key))
+        if not cached:
+            return None
+        return TokenPair.model_validate_json(cached)
+
+    @staticmethod
+    async def _release_lock(redis_client, lock_key: str, owner: str) -> None:
+        """Release the session lock if this process still owns it."""
+        await cast(
+            "Awaitable[int]", redis_client.eval(_RELEASE_LOCK, 1, lock_key, owner)
+        )
+
+    async def _wait_for_lock(
+        self, redis_client, lock_key: str, result_key: str, owner: str
+    ) -> tuple[bool, TokenPair | None]:
+        """Take the session lock, unless another process finishes first.
+
+        Returns whether the lock was acquired, and the token pair another
+        process produced when it was not.
+        """
+        deadline = time.monotonic() + self.lock_ttl
+        while True:
+            shared = await self._shared_result(redis_client, result_key)
+            if shared is not None:
+                return False, shared
+
+            if await redis_client.set(lock_key, owner, nx=True, ex=self.lock_ttl):
+                # Another process may have finished just before we took the lock
+                shared = await self._shared_result(redis_client, result_key)
+                if shared is not None:
+                    await self._release_lock(redis_client, lock_key, owner)
+                    return False, shared
+                return True, None
+
+            if time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for refresh lock {lock_key}")
+                return False, None
+            await asyncio.sleep(_POLL_INTERVAL)
+
+
+# Global refresh coordinator instance
+refresh_coordinator = RefreshCoordinator()
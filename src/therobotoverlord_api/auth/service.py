@@ -12,6 +12,7 @@ from therobotoverlord_api.auth.models import AuthResponse
 from therobotoverlord_api.auth.models import GoogleUserInfo
 from therobotoverlord_api.auth.models import TokenPair
 from therobotoverlord_api.auth.nouns import NOUNS_LIST
+from therobotoverlord_api.auth.refresh_coordinator import refresh_coordinator
 from therobotoverlord_api.auth.session_service import SessionService
 from therobotoverlord_api.database.models.user import User
 from therobotoverlord_api.database.models.user import UserCreate
@@ -108,6 +109,23 @@ class AuthService:
         if not session_id:
             return None
 
+        # Parallel requests carrying the same refresh token share one rotation
+        return await refresh_coordinator.refresh(
+            session_id,
+            refresh_token,
+            lambda: self._rotate_tokens(
+                session_id, refresh_token, ip_address, user_agent
+            ),
+        )
+
+    async def _rotate_tokens(
+        self,
+        session_id: str,
+        refresh_token: str,
+        ip_address: str | None,
+        user_agent: str | None,
+    ) -> TokenPair | None:
+        """Validate the refresh token and rotate it for a new token pair."""
         # Validate refresh token
         if not await self.session_service.validate_refresh_token(
             session_id, refresh_token
@@ -231,7 +249,7 @@ class AuthService:
 
             logger.info("Hashing password")
             # Hash password
-            password_hash = self.password_service.hash_password(password)
+            password_hash = await self.password_service.hash_password_async(password)
 
             logger.info("Creating user data object")
             # Create user data
@@ -300,7 +318,9 @@ class AuthService:
             return None
 
         # Verify password
-        if not self.password_service.verify_password(password, user.password_hash):
+        if not await self.password_service.verify_password_async(
+            password, user.password_hash
+        ):
             return None
 
         # Check if user is banned or inactive
@@ -27,6 +27,12 @@ class AuthSettings(BaseSettings):
     jwt_audience: str = Field(
         default="therobotoverlord.com", description="JWT audience"
     )
+    jwt_token_version: int = Field(
+        default=1, description="Minimum token version accepted; raise to revoke"
+    )
+    jwt_claims_cache_size: int = Field(
+        default=10000, description="Max verified access tokens kept in memory"
+    )
 
     # Token Lifetimes (in seconds)
     access_token_lifetime: int = Field(
@@ -56,6 +62,34 @@ class AuthSettings(BaseSettings):
         default=3600, description="Session cleanup interval (1 hour)"
     )
 
+    # Password Hashing Configuration
+    password_hash_workers: int = Field(
+        default=4, description="Threads dedicated to bcrypt hashing"
+    )
+    password_hash_max_queue: int = Field(
+        default=32, description="Hashes allowed to wait before rejecting with 503"
+    )
+
+    # Refresh Coordination Configuration
+    refresh_lock_ttl: int = Field(
+        default=10,
+        description="Max seconds one refresh token rotation may hold its lock",
+    )
+    refresh_result_ttl: int = Field(
+        default=30, description="Seconds a rotated token pair is shared with peers"
+    )
+
+    # Principal Cache Configuration
+    principal_cache_ttl: int = Field(
+        default=60, description="In-process authenticated user cache TTL (seconds)"
+    )
+    principal_cache_size: int = Field(
+        default=10000, description="Max users kept in the in-process auth cache"
+    )
+    principal_redis_ttl: int = Field(
+        default=300, description="Redis authenticated user cache TTL (5 minutes)"
+    )
+
     model_config = SettingsConfigDict(
         env_prefix="AUTH_",
         case_sensitive=False,
@@ -28,6 +28,29 @@ class DatabaseSettings(BaseSettings):
     pool_timeout: float = Field(
         default=30.0, description="Connection pool timeout in seconds"
     )
+    request_scoped_connections: bool = Field(
+        default=True,
+        description="Share one pooled connection across all queries in an HTTP request",
+    )
+
+    # Read replica settings
+    replica_url: str = Field(
+        default="",
+        description="Streaming replica URL for read-only queries (disabled if empty)",
+    )
+    replica_min_pool_size: int = Field(
+        default=5, description="Minimum read replica pool size"
+    )
+    replica_max_pool_size: int = Field(
+        default=20, description="Maximum read replica pool size"
+    )
+    replica_max_lag_seconds: float = Field(
+        default=5.0,
+        description="Replication lag above which reads fall back to the primary",
+    )
+    replica_lag_check_interval: float = Field(
+        default=5.0, description="Seconds between replication lag checks"
+    )
 
     # Query settings
     query_timeout: float = Field(default=30.0, description="Query timeout in seconds")
@@ -35,6 +58,54 @@ class DatabaseSettings(BaseSettings):
         default=60.0, description="Command timeout in seconds"
     )
 
+    # Prepared statement settings
+    statement_cache_size: int = Field(
+        default=500,
+        description="Prepared statements cached per connection (0 disables, for PgBouncer)",
+    )
+    statement_cache_lifetime: float = Field(
+        default=0.0,
+        description="Seconds a cached statement lives before re-preparing (0 = forever)",
+    )
+    prepare_statements_on_connect: bool = Field(
+        default=True,
+        description="Prepare registered hot statements on every new pooled connection",
+    )
+
+    # Query instrumentation settings
+    query_instrumentation: bool = Field(
+        default=True, description="Record per-statement latency and pool-wait metrics"
+    )
+    slow_query_threshold_ms: float = Field(
+        default=200.0, description="Statements slower than this are logged as slow"
+    )
+    slow_query_log_size: int = Field(
+        default=100, description="Number of recent slow queries kept in memory"
+    )
+
+    # Partition maintenance settings
+    partition_premake_months: int = Field(
+        default=3, description="Monthly partitions created ahead of the current month"
+    )
+    audit_retention_months: int = Field(
+        default=24,
+        description="Months of moderation, admin and appeal history kept before archiving (0 = forever)",
+    )
+    snapshot_retention_months: int = Field(
+        default=36,
+        description="Months of dashboard snapshots kept before dropping (0 = forever)",
+    )
+
+    # Leaderboard refresh settings
+    leaderboard_refresh_min_interval: float = Field(
+        default=60.0,
+        description="Seconds after a leaderboard refresh before changes refresh it again",
+    )
+    leaderboard_refresh_max_interval: float = Field(
+        default=1800.0,
+        description="Seconds after which the leaderboard is refreshed even if unchanged",
+    )
+
     # Migration settings
     migration_table: str = Field(
         default="_yoyo_migration", description="Migration tracking table name"
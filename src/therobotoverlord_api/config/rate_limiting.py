@@ -1,9 +1,20 @@
 """Rate limiting configuration for The Robot Overlord API."""
 
+from enum import Enum
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
+class RateLimitAlgorithm(str, Enum):
+    """Rate limiting algorithm enumeration."""
+
+    # One sorted set member per request in the window
+    SLIDING_WINDOW = "sliding_window"
+    # A single theoretical arrival time per key
+    GCRA = "gcra"
+
+
 class RateLimitingSettings(BaseSettings):
     """Rate limiting configuration settings."""
 
@@ -11,36 +22,64 @@ class RateLimitingSettings(BaseSettings):
     auth_requests_per_minute: int = Field(
         default=5, description="Auth requests per minute per IP"
     )
+    auth_algorithm: RateLimitAlgorithm = Field(
+        default=RateLimitAlgorithm.SLIDING_WINDOW,
+        description="Algorithm for auth limits per IP",
+    )
 
     # Authentication endpoints (per user)
     auth_user_requests_per_minute: int = Field(
         default=3, description="Auth requests per minute per user"
     )
+    auth_user_algorithm: RateLimitAlgorithm = Field(
+        default=RateLimitAlgorithm.SLIDING_WINDOW,
+        description="Algorithm for auth limits per user",
+    )
 
     # Admin endpoints (per user)
     admin_requests_per_minute: int = Field(
         default=30, description="Admin requests per minute per user"
     )
+    admin_algorithm: RateLimitAlgorithm = Field(
+        default=RateLimitAlgorithm.SLIDING_WINDOW,
+        description="Algorithm for admin limits",
+    )
 
     # RBAC endpoints (per user)
     rbac_requests_per_minute: int = Field(
         default=20, description="RBAC requests per minute per user"
     )
+    rbac_algorithm: RateLimitAlgorithm = Field(
+        default=RateLimitAlgorithm.SLIDING_WINDOW,
+        description="Algorithm for RBAC limits",
+    )
 
     # Sanctions endpoints (per user)
     sanctions_requests_per_minute: int = Field(
         default=10, description="Sanctions requests per minute per user"
     )
+    sanctions_algorithm: RateLimitAlgorithm = Field(
+        default=RateLimitAlgorithm.SLIDING_WINDOW,
+        description="Algorithm for sanctions limits",
+    )
 
     # Content creation endpoints (per user)
     content_requests_per_minute: int = Field(
         default=5, description="Content creation requests per minute per user"
     )
+    content_algorithm: RateLimitAlgorithm = Field(
+        default=RateLimitAlgorithm.SLIDING_WINDOW,
+        description="Algorithm for content creation limits",
+    )
 
     # General API endpoints (per IP)
     general_requests_per_minute: int = Field(
         default=60, description="General requests per minute per IP"
     )
+    general_algorithm: RateLimitAlgorithm = Field(
+        default=RateLimitAlgorithm.SLIDING_WINDOW,
+        description="Algorithm for general API limits",
+    )
 
     # Redis key prefixes
     rate_limit_key_prefix: str = Field(
@@ -52,6 +91,22 @@ class RateLimitingSettings(BaseSettings):
         default=True, description="Enable/disable rate limiting"
     )
 
+    # Local token buckets in front of the Redis sliding window
+    local_buckets_enabled: bool = Field(
+        default=True, description="Decide clearly-under-limit requests in-process"
+    )
+    local_sync_interval_seconds: float = Field(
+        default=1.0, description="How often local counts are flushed to Redis"
+    )
+    local_bucket_fraction: float = Field(
+        default=0.1,
+        description="Share of the remaining limit one process may grant per sync",
+    )
+    local_escalation_ratio: float = Field(
+        default=0.8,
+        description="Share of the limit above which every check goes to Redis",
+    )
+
     # Bypass rate limiting for specific IPs (comma-separated)
     rate_limit_bypass_ips: str = Field(
         default="127.0.0.1,::1", description="IPs to bypass rate limiting"
@@ -27,6 +27,15 @@ class RedisSettings(BaseSettings):
         default=5.0, description="Socket connect timeout in seconds"
     )
 
+    # In-process cache in front of Redis for hot, rarely changing reads
+    local_cache_size: int = Field(
+        default=1000, description="Max entries kept in the in-process cache"
+    )
+    cache_lock_ttl: int = Field(
+        default=30,
+        description="Max seconds one process may spend recomputing a cache entry",
+    )
+
     # SSL settings
     ssl_enabled: bool = Field(default=False, description="Enable SSL connection")
     ssl_cert_reqs: str = Field(
@@ -1,9 +1,14 @@
 """Database connection management for The Robot Overlord API."""
 
+import asyncio
 import logging
+import math
+import time
 
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
 import asyncpg
 
@@ -12,16 +17,80 @@ from asyncpg import Pool
 
 from therobotoverlord_api.config.database import get_database_settings
 from therobotoverlord_api.config.database import get_database_url
+from therobotoverlord_api.database.instrumentation import query_metrics
+from therobotoverlord_api.database.instrumentation import tag_caller
+from therobotoverlord_api.database.statements import statement_registry
 
 logger = logging.getLogger(__name__)
 
+REPLICA_LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+# Statements that change data; reads after one must see it
+_WRITE_COMMANDS = frozenset({"INSERT", "UPDATE", "DELETE", "MERGE"})
+
+
+def _is_write(query: str) -> bool:
+    command, _, _ = query.lstrip().partition(" ")
+    return command.upper() in _WRITE_COMMANDS
+
+
+class PrimaryConnection(Connection):
+    """Primary pool connection that pins the current scope when it writes.
+
+    Opening a transaction or running an INSERT, UPDATE, DELETE or MERGE sends
+    later reads in the same request to the primary, whichever repository or
+    service issued the statement.
+    """
+
+    __slots__ = ()
+
+    def transaction(self, **kwargs):
+        pin_reads_to_primary()
+        return super().transaction(**kwargs)
+
+    async def execute(self, query: str, *args, **kwargs) -> str:
+        if _is_write(query):
+            pin_reads_to_primary()
+        return await super().execute(query, *args, **kwargs)
+
+    async def executemany(self, command: str, args, **kwargs):
+        if _is_write(command):
+            pin_reads_to_primary()
+        return await super().executemany(command, args, **kwargs)
+
+    async def fetch(self, query, *args, **kwargs) -> list:
+        if _is_write(query):
+            pin_reads_to_primary()
+        return await super().fetch(query, *args, **kwargs)
+
+    async def fetchrow(self, query, *args, **kwargs):
+        if _is_write(query):
+            pin_reads_to_primary()
+        return await super().fetchrow(query, *args, **kwargs)
+
+    async def fetchval(self, query, *args, **kwargs):
+        if _is_write(query):
+            pin_reads_to_primary()
+        return await super().fetchval(query, *args, **kwargs)
+
 
 class Database:
     """Database connection manager with connection pooling."""
 
     def __init__(self):
         self._pool: Pool | None = None
+        self._read_pool: Pool | None = None
         self._settings = get_database_settings()
+        self._replica_lag: float | None = None
+        self._replica_checked_at = 0.0
+        self._replica_lock = asyncio.Lock()
 
     async def connect(self) -> None:
         """Initialize the database connection pool."""
@@ -38,10 +107,14 @@ class Database:
                 max_size=self._settings.max_pool_size,
                 timeout=self._settings.pool_timeout,
                 command_timeout=self._settings.command_timeout,
+                statement_cache_size=self._settings.statement_cache_size,
+                max_cached_statement_lifetime=self._settings.statement_cache_lifetime,
                 server_settings={
                     "application_name": "therobotoverlord-api",
                     "timezone": "UTC",
                 },
+                init=self._init_connection,
+                connection_class=PrimaryConnection,
             )
             logger.info("Database connection pool initialized")
 
@@ -49,6 +122,58 @@ class Database:
             logger.error(f"Failed to initialize database pool: {e}")
             raise
 
+        if self._settings.replica_url:
+            await self._connect_replica()
+
+    async def _connect_replica(self) -> None:
+        """Initialize the optional read replica pool.
+
+        The replica is an optimization, so a failure here is logged and reads
+        keep going to the primary.
+        """
+        try:
+            self._read_pool = await asyncpg.create_pool(
+                self._settings.replica_url,
+                min_size=self._settings.replica_min_pool_size,
+                max_size=self._settings.replica_max_pool_size,
+                timeout=self._settings.pool_timeout,
+                command_timeout=self._settings.command_timeout,
+                statement_cache_size=self._settings.statement_cache_size,
+                max_cached_statement_lifetime=self._settings.statement_cache_lifetime,
+                server_settings={
+                    "application_name": "therobotoverlord-api-replica",
+                    "timezone": "UTC",
+                },
+                init=self._init_replica_connection,
+            )
+            logger.info("Read replica connection pool initialized")
+
+        except Exception as e:
+            logger.warning(f"Failed to initialize read replica pool: {e}")
+            self._read_pool = None
+
+    async def _init_connection(
+        self, connection: Connection, *, read_only: bool = False
+    ) -> None:
+        """Set up each new pooled connection."""
+        if query_metrics.enabled:
+            connection.add_query_logger(query_metrics.record_query)
+
+        if (
+            self._settings.prepare_statements_on_connect
+            and self._settings.statement_cache_size > 0
+        ):
+            if len(statement_registry) > self._settings.statement_cache_size:
+                logger.warning(
+                    f"{len(statement_registry)} registered statements exceed "
+                    f"statement_cache_size={self._settings.statement_cache_size}"
+                )
+            await statement_registry.prepare_all(connection, read_only=read_only)
+
+    async def _init_replica_connection(self, connection: Connection) -> None:
+        """Set up each new read replica connection."""
+        await self._init_connection(connection, read_only=True)
+
     async def disconnect(self) -> None:
         """Close the database connection pool."""
         if self._pool is None:
@@ -56,6 +181,11 @@ class Database:
             return
 
         try:
+            if self._read_pool is not None:
+                await self._read_pool.close()
+                self._read_pool = None
+                logger.info("Read replica connection pool closed")
+
             await self._pool.close()
             self._pool = None
             logger.info("Database connection pool closed")
@@ -70,13 +200,85 @@ class Database:
         if self._pool is None:
             raise RuntimeError("Database pool not initialized. Call connect() first.")
 
+        started = time.perf_counter()
         async with self._pool.acquire() as connection:
+            query_metrics.record_pool_wait(time.perf_counter() - started)
             try:
                 yield connection
             except Exception as e:
                 logger.error(f"Database connection error: {e}")
                 raise
 
+    @property
+    def has_replica(self) -> bool:
+        """Whether a read replica pool is configured and connected."""
+        return self._read_pool is not None
+
+    async def replica_is_fresh(self) -> bool:
+        """Check whether replication lag is within the configured limit.
+
+        The lag is measured at most once per ``replica_lag_check_interval``;
+        a failed measurement counts as unbounded lag.
+        """
+        if self._read_pool is None:
+            return False
+
+        now = time.monotonic()
+        if now - self._replica_checked_at >= self._settings.replica_lag_check_interval:
+            async with self._replica_lock:
+                if (
+                    now - self._replica_checked_at
+                    >= self._settings.replica_lag_check_interval
+                ):
+                    self._replica_lag = await self._measure_replica_lag()
+                    self._replica_checked_at = time.monotonic()
+
+        return (
+            self._replica_lag is not None
+            and self._replica_lag <= self._settings.replica_max_lag_seconds
+        )
+
+    async def _measure_replica_lag(self) -> float:
+        """Measure replication lag on the replica in seconds."""
+        if self._read_pool is None:
+            return math.inf
+
+        try:
+            async with self._read_pool.acquire() as connection:
+                lag = await connection.fetchval(REPLICA_LAG_QUERY)
+        except Exception as e:
+            logger.warning(f"Read replica lag check failed: {e}")
+            return math.inf
+
+        if lag is None:
+            return math.inf
+
+        lag = float(lag)
+        if lag > self._settings.replica_max_lag_seconds:
+            logger.warning(f"Read replica lagging by {lag:.1f}s, using primary")
+        return lag
+
+    @asynccontextmanager
+    async def get_read_connection(self) -> AsyncGenerator[Connection]:
+        """Get a connection for read-only queries.
+
+        Uses the read replica when one is configured and fresh enough,
+        otherwise falls back to the primary pool.
+        """
+        if self._read_pool is None or not await self.replica_is_fresh():
+            async with self.get_connection() as connection:
+                yield connection
+            return
+
+        started = time.perf_counter()
+        async with self._read_pool.acquire() as connection:
+            query_metrics.record_pool_wait(time.perf_counter() - started)
+            try:
+                yield connection
+            except Exception as e:
+                logger.error(f"Read replica connection error: {e}")
+                raise
+
     @asynccontextmanager
     async def get_transaction(self) -> AsyncGenerator[Connection]:
         """Get a database connection with an active transaction."""
@@ -86,23 +288,31 @@ class Database:
 
     async def execute(self, query: str, *args) -> str:
         """Execute a query and return the status."""
-        async with self.get_connection() as connection:
-            return await connection.execute(query, *args)
+        with tag_caller():
+            async with self.get_connection() as connection:
+                statement_registry.record_use(connection, query)
+                return await connection.execute(query, *args)
 
     async def fetch(self, query: str, *args) -> list:
         """Execute a query and return all results."""
-        async with self.get_connection() as connection:
-            return await connection.fetch(query, *args)
+        with tag_caller():
+            async with self.get_connection() as connection:
+                statement_registry.record_use(connection, query)
+                return await connection.fetch(query, *args)
 
     async def fetchrow(self, query: str, *args) -> asyncpg.Record | None:
         """Execute a query and return the first result."""
-        async with self.get_connection() as connection:
-            return await connection.fetchrow(query, *args)
+        with tag_caller():
+            async with self.get_connection() as connection:
+                statement_registry.record_use(connection, query)
+                return await connection.fetchrow(query, *args)
 
     async def fetchval(self, query: str, *args):
         """Execute a query and return a single value."""
-        async with self.get_connection() as connection:
-            return await connection.fetchval(query, *args)
+        with tag_caller():
+            async with self.get_connection() as connection:
+                statement_registry.record_use(connection, query)
+                return await connection.fetchval(query, *args)
 
     async def health_check(self) -> bool:
         """Check if the database connection is healthy."""
@@ -119,14 +329,127 @@ class Database:
         if self._pool is None:
             return {"status": "not_initialized"}
 
-        return {
+        stats = {
             "status": "initialized",
             "size": self._pool.get_size(),
             "min_size": self._pool.get_min_size(),
             "max_size": self._pool.get_max_size(),
             "idle_size": self._pool.get_idle_size(),
+            "statements": statement_registry.stats(),
         }
 
+        if self._read_pool is not None:
+            stats["replica"] = {
+                "size": self._read_pool.get_size(),
+                "min_size": self._read_pool.get_min_size(),
+                "max_size": self._read_pool.get_max_size(),
+                "idle_size": self._read_pool.get_idle_size(),
+                "lag_seconds": self._replica_lag,
+                "fresh": self._replica_lag is not None
+                and self._replica_lag <= self._settings.replica_max_lag_seconds,
+            }
+
+        return stats
+
+
+class ConnectionScope:
+    """A single pooled connection shared by every repository call in a scope.
+
+    The connection is acquired lazily on first use and held until the scope
+    closes. Nested use from the task that currently holds the connection reuses
+    it directly. Concurrent use from other tasks (e.g. ``asyncio.gather`` inside
+    a handler) falls back to a separate pooled connection, unless the scope is
+    transactional, in which case those tasks wait their turn so every statement
+    stays inside the transaction. Once the scope closes, any task still using
+    it (e.g. one spawned from the request) gets a separate pooled connection.
+    """
+
+    def __init__(
+        self,
+        database: "Database",
+        connection: Connection | None = None,
+        *,
+        transactional: bool = False,
+    ):
+        self._database = database
+        self._connection = connection
+        self._transactional = transactional
+        self._exit_stack = AsyncExitStack()
+        self._lock = asyncio.Lock()
+        self._owner: asyncio.Task | None = None
+        self._primary_pinned = False
+        self._closed = False
+
+    @property
+    def transactional(self) -> bool:
+        """Whether the shared connection has an open transaction."""
+        return self._transactional
+
+    @property
+    def primary_pinned(self) -> bool:
+        """Whether reads in this scope must stay on the primary."""
+        return self._transactional or self._primary_pinned
+
+    def pin_primary(self) -> None:
+        """Route every later read in this scope to the primary."""
+        self._primary_pinned = True
+
+    @property
+    def acquired(self) -> bool:
+        """Whether a connection has been checked out for this scope."""
+        return self._connection is not None
+
+    async def _ensure_connection(self) -> Connection:
+        if self._connection is None:
+            self._connection = await self._exit_stack.enter_async_context(
+                self._database.get_connection()
+            )
+        return self._connection
+
+    @asynccontextmanager
+    async def use(self) -> AsyncGenerator[Connection]:
+        """Borrow the scoped connection for the duration of the block."""
+        task = asyncio.current_task()
+
+        if self._owner is not None and self._owner is task:
+            yield await self._ensure_connection()
+            return
+
+        waits_turn = self._transactional or not self._lock.locked()
+        if waits_turn and not self._closed:
+            async with self._lock:
+                # The scope may have closed while this task waited its turn
+                if not self._closed:
+                    self._owner = task
+                    try:
+                        yield await self._ensure_connection()
+                    finally:
+                        self._owner = None
+                    return
+
+        async with self._database.get_connection() as connection:
+            yield connection
+
+    async def close(self) -> None:
+        """Release the scoped connection back to the pool.
+
+        Waits for the task currently holding the connection to finish with it.
+        """
+        async with self._lock:
+            self._closed = True
+            self._connection = None
+            await self._exit_stack.aclose()
+
+
+_current_scope: ContextVar[ConnectionScope | None] = ContextVar(
+    "therobotoverlord_db_scope", default=None
+)
+
+
+def get_current_scope() -> ConnectionScope | None:
+    """Get the connection scope bound to the current context, if any."""
+    return _current_scope.get()
+
 
 # Global database instance
 db = Database()
@@ -144,13 +467,97 @@ async def close_database() -> None:
 
 @asynccontextmanager
 async def get_db_connection() -> AsyncGenerator[Connection]:
-    """Get a database connection from the global pool."""
-    async with db.get_connection() as connection:
-        yield connection
+    """Get a database connection, reusing the scoped connection when bound."""
+    with tag_caller():
+        scope = _current_scope.get()
+        if scope is not None:
+            async with scope.use() as connection:
+                yield connection
+            return
+
+        async with db.get_connection() as connection:
+            yield connection
+
+
+@asynccontextmanager
+async def get_db_read_connection() -> AsyncGenerator[Connection]:
+    """Get a connection for read-only queries, preferring the read replica.
+
+    Reads stay on the primary when no replica is configured, when the replica
+    is lagging, or when the current scope has written and pinned itself to
+    the primary so it can read its own writes.
+    """
+    with tag_caller():
+        scope = _current_scope.get()
+        pinned = scope is not None and scope.primary_pinned
+        if db.has_replica and not pinned and await db.replica_is_fresh():
+            async with db.get_read_connection() as connection:
+                yield connection
+            return
+
+        async with get_db_connection() as connection:
+            yield connection
+
+
+def pin_reads_to_primary() -> None:
+    """Send later reads in the current request to the primary after a write.
+
+    Writes through the primary pool pin automatically; call this directly
+    only for writes made elsewhere that later reads must see.
+    """
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.pin_primary()
 
 
 @asynccontextmanager
 async def get_db_transaction() -> AsyncGenerator[Connection]:
-    """Get a database transaction from the global pool."""
-    async with db.get_transaction() as connection:
-        yield connection
+    """Get a database transaction, reusing the scoped connection when bound."""
+    with tag_caller():
+        scope = _current_scope.get()
+        if scope is not None:
+            scope.pin_primary()
+            async with scope.use() as connection:
+                async with connection.transaction():
+                    yield connection
+            return
+
+        async with db.get_transaction() as connection:
+            yield connection
+
+
+@asynccontextmanager
+async def request_scope() -> AsyncGenerator[ConnectionScope]:
+    """Bind a lazily acquired connection for the rest of the current context.
+
+    Every ``get_db_connection()`` call made while the scope is bound shares one
+    pooled connection instead of checking a new one out per repository call.
+    """
+    existing = _current_scope.get()
+    if existing is not None:
+        yield existing
+        return
+
+    scope = ConnectionScope(db)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        await scope.close()
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncGenerator[Connection]:
+    """Run every repository call in the block inside a single transaction.
+
+    The transaction commits when the block exits normally and rolls back if it
+    raises. Repositories pick up the transactional connection automatically.
+    """
+    async with get_db_transaction() as connection:
+        scope = ConnectionScope(db, connection, transactional=True)
+        token = _current_scope.set(scope)
+        try:
+            yield connection
+        finally:
+            _current_scope.reset(token)
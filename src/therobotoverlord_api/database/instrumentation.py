@@ -0,0 +1,286 @@
+"""Query instrumentation and slow-query log for The Robot Overlord API."""
+
+import logging
+import re
+import sys
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC
+from datetime import datetime
+from typing import TYPE_CHECKING
+from typing import Any
+
+from asyncpg.connection import LoggedQuery
+
+from therobotoverlord_api.config.database import get_database_settings
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Cap on distinct (caller, statement) pairs so ad-hoc SQL can't grow memory
+MAX_TRACKED_STATEMENTS = 500
+MAX_STATEMENT_LENGTH = 300
+UNTAGGED_CALLER = "unknown"
+
+# Frames from these modules are plumbing, not the code that issued the query
+_SKIPPED_MODULES = frozenset(
+    {
+        "contextlib",
+        "therobotoverlord_api.database.connection",
+        "therobotoverlord_api.database.instrumentation",
+    }
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+_current_caller: ContextVar[str | None] = ContextVar(
+    "therobotoverlord_db_caller", default=None
+)
+
+
+def normalize_statement(query: str) -> str:
+    """Collapse whitespace and truncate a statement for use as a metrics key."""
+    statement = _WHITESPACE.sub(" ", query).strip()
+    if len(statement) > MAX_STATEMENT_LENGTH:
+        statement = statement[:MAX_STATEMENT_LENGTH] + "..."
+    return statement
+
+
+def describe_param(value: Any) -> str:
+    """Describe a query parameter's shape without exposing its value."""
+    if value is None:
+        return "null"
+    if isinstance(value, list | tuple):
+        element = describe_param(value[0]) if value else "empty"
+        return f"{element}[{len(value)}]"
+    if isinstance(value, str | bytes):
+        return f"{type(value).__name__}({len(value)})"
+    return type(value).__name__
+
+
+def find_caller() -> str:
+    """Name the repository or service method that is issuing a query.
+
+    Walks up the stack past the connection helpers and ``contextlib`` and
+    returns ``Class.method`` for methods or ``module.function`` otherwise.
+    """
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module not in _SKIPPED_MODULES:
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                return f"{type(owner).__name__}.{frame.f_code.co_name}"
+            return f"{module.rsplit('.', 1)[-1]}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return UNTAGGED_CALLER
+
+
+@contextmanager
+def tag_caller() -> Iterator[None]:
+    """Attribute queries in the block to the calling method.
+
+    An outer tag wins, so a repository method that goes through
+    ``Database.fetch`` is still reported as itself. Does nothing while query
+    instrumentation is disabled, so the stack is not walked per query.
+    """
+    if not query_metrics.enabled or _current_caller.get() is not None:
+        yield
+        return
+
+    token = _current_caller.set(find_caller())
+    try:
+        yield
+    finally:
+        _current_caller.reset(token)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with count, total and max."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, elapsed_ms: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Estimate a percentile as the upper bound of its bucket."""
+        if self.count == 0:
+            return None
+
+        target = fraction * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= target:
+                return (
+                    float(LATENCY_BUCKETS_MS[i])
+                    if i < len(LATENCY_BUCKETS_MS)
+                    else self.max_ms
+                )
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the histogram for API responses."""
+        labels = [f"le_{bound}ms" for bound in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": dict(zip(labels, self.buckets, strict=True)),
+        }
+
+
+class StatementStats:
+    """Latency statistics for one statement issued by one caller."""
+
+    def __init__(self, caller: str, statement: str):
+        self.caller = caller
+        self.statement = statement
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the statement stats for API responses."""
+        return {
+            "caller": self.caller,
+            "statement": self.statement,
+            "errors": self.errors,
+            **self.latency.to_dict(),
+        }
+
+
+class QueryMetrics:
+    """In-process query latency, slow-query and pool-wait metrics."""
+
+    def __init__(self):
+        settings = get_database_settings()
+        self.enabled = settings.query_instrumentation
+        self.slow_query_threshold_ms = settings.slow_query_threshold_ms
+        self._statements: dict[tuple[str, str], StatementStats] = {}
+        self._slow_queries: deque[dict[str, Any]] = deque(
+            maxlen=settings.slow_query_log_size
+        )
+        self._pool_wait = LatencyHistogram()
+        self._dropped_statements = 0
+        self._started_at = datetime.now(UTC)
+
+    def record_query(self, record: LoggedQuery) -> None:
+        """asyncpg query logger callback recording one executed statement."""
+        caller = _current_caller.get() or UNTAGGED_CALLER
+        elapsed_ms = record.elapsed * 1000
+        statement = normalize_statement(record.query)
+
+        key = (caller, statement)
+        stats = self._statements.get(key)
+        if stats is None:
+            if len(self._statements) >= MAX_TRACKED_STATEMENTS:
+                self._dropped_statements += 1
+            else:
+                stats = self._statements[key] = StatementStats(caller, statement)
+
+        if stats is not None:
+            stats.latency.observe(elapsed_ms)
+            if record.exception is not None:
+                stats.errors += 1
+
+        if elapsed_ms >= self.slow_query_threshold_ms:
+            self._record_slow_query(caller, statement, record, elapsed_ms)
+
+    def _record_slow_query(
+        self, caller: str, statement: str, record: LoggedQuery, elapsed_ms: float
+    ) -> None:
+        param_shapes = [describe_param(arg) for arg in record.args or ()]
+        self._slow_queries.append(
+            {
+                "caller": caller,
+                "statement": statement,
+                "elapsed_ms": round(elapsed_ms, 3),
+                "param_shapes": param_shapes,
+                "error": type(record.exception).__name__
+                if record.exception is not None
+                else None,
+                "recorded_at": datetime.now(UTC).isoformat(),
+            }
+        )
+        logger.warning(
+            f"Slow query ({elapsed_ms:.1f}ms) from {caller}: {statement} "
+            f"params={param_shapes}"
+        )
+
+    def record_pool_wait(self, elapsed: float) -> None:
+        """Record the seconds spent waiting to acquire a pooled connection."""
+        if self.enabled:
+            self._pool_wait.observe(elapsed * 1000)
+
+    def summary(self) -> dict[str, Any]:
+        """Get headline totals, cheap enough for the health check."""
+        queries = sum(s.latency.count for s in self._statements.values())
+        errors = sum(s.errors for s in self._statements.values())
+        total_ms = sum(s.latency.total_ms for s in self._statements.values())
+        return {
+            "enabled": self.enabled,
+            "since": self._started_at.isoformat(),
+            "queries": queries,
+            "errors": errors,
+            "total_query_ms": round(total_ms, 3),
+            "slow_queries": len(self._slow_queries),
+            "slow_query_threshold_ms": self.slow_query_threshold_ms,
+            "pool_wait": {
+                "count": self._pool_wait.count,
+                "total_ms": round(self._pool_wait.total_ms, 3),
+                "max_ms": round(self._pool_wait.max_ms, 3),
+            },
+        }
+
+    def snapshot(self, limit: int = 50) -> dict[str, Any]:
+        """Get full metrics, statements ordered by total time spent."""
+        statements = sorted(
+            self._statements.values(),
+            key=lambda s: s.latency.total_ms,
+            reverse=True,
+        )
+        return {
+            **self.summary(),
+            "tracked_statements": len(self._statements),
+            "dropped_statements": self._dropped_statements,
+            "statements": [s.to_dict() for s in statements[:limit]],
+            "slow_query_log": list(reversed(self._slow_queries)),
+            "pool_wait_histogram": self._pool_wait.to_dict(),
+        }
+
+    def reset(self) -> None:
+        """Clear every recorded metric."""
+        self._statements.clear()
+        self._slow_queries.clear()
+        self._pool_wait = LatencyHistogram()
+        self._dropped_statements = 0
+        self._started_at = datetime.now(UTC)
+
+
+# Global query metrics instance
+query_metrics = QueryMetrics()
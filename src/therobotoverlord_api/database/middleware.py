@@ -0,0 +1,30 @@
+"""ASGI middleware binding database connection scopes to requests."""
+
+from starlette.types import ASGIApp
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from therobotoverlord_api.config.database import get_database_settings
+from therobotoverlord_api.database.connection import request_scope
+
+
+class RequestConnectionMiddleware:
+    """Share a single pooled connection across all queries in an HTTP request.
+
+    The connection is only checked out if the request actually touches the
+    database, and it is returned to the pool once the response has been sent.
+    Websocket connections are long-lived and are deliberately left unscoped.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.enabled = get_database_settings().request_scoped_connections
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        async with request_scope():
+            await self.app(scope, receive, send)
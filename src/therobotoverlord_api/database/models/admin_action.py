@@ -75,3 +75,4 @@ class AuditLogResponse(BaseModel):
     total_count: int
     limit: int
     offset: int
+    next_cursor: str | None = None
@@ -97,6 +97,10 @@ class AppealWithContent(BaseModel):
     created_at: datetime
     updated_at: datetime | None
 
+    # Queue ordering keys, used to build pagination cursors
+    submitted_at: datetime | None = None
+    priority_score: int | None = None
+
     # Associated content details
     sanction_type: str | None = None  # If appealing a sanction
     sanction_reason: str | None = None
@@ -146,6 +150,7 @@ class AppealResponse(BaseModel):
     page_size: int
     has_next: bool
     has_previous: bool
+    next_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
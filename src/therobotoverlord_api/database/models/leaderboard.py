@@ -2,6 +2,7 @@
 
 from datetime import date
 from datetime import datetime
+from enum import Enum
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -146,6 +147,52 @@ class UserRankLookup(BaseModel):
         from_attributes = True
 
 
+class RankedUser(BaseModel):
+    """A user's position in the live ranking index."""
+
+    user_pk: UUID
+    loyalty_score: int
+    rank: int
+    percentile_rank: float = Field(..., ge=0.0, le=1.0)
+
+
+class RankingIndexCheck(BaseModel):
+    """Differences found between the ranking index and the users table."""
+
+    checked: int
+    missing: int = 0
+    extra: int = 0
+    mismatched: int = 0
+    differing: list[UUID] = Field(default_factory=list)
+    repaired: bool = False
+
+    @property
+    def consistent(self) -> bool:
+        return not (self.missing or self.extra or self.mismatched)
+
+
+class LeaderboardRefreshReason(str, Enum):
+    """Why the leaderboard_rankings view was or was not refreshed."""
+
+    FIRST = "first"
+    CHANGED = "changed"
+    MAX_INTERVAL = "max_interval"
+    UNCHANGED = "unchanged"
+    DEBOUNCED = "debounced"
+    LOCKED = "locked"
+
+
+class LeaderboardRefresh(BaseModel):
+    """Outcome of one change-aware refresh of the leaderboard_rankings view."""
+
+    refreshed: bool
+    reason: LeaderboardRefreshReason
+    change_watermark: int | None = None
+    duration_ms: float | None = None
+    row_count: int | None = None
+    row_delta: int | None = None
+
+
 class LeaderboardSearchResult(BaseModel):
     """Search result for username searches."""
 
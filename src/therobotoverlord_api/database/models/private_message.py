@@ -95,6 +95,7 @@ class MessageThread(BaseModel):
     other_user_pk: UUID
     other_user_username: str
     other_user_display_name: str | None
+    next_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -25,6 +25,17 @@ class User(BaseDBModel):
     email_verified: bool = False
 
 
+class UserAuthSummary(BaseModel):
+    """Columns needed to authenticate a request and derive its permissions."""
+
+    pk: UUID
+    role: UserRole = UserRole.CITIZEN
+    loyalty_score: int = 0
+    is_banned: bool = False
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class UserCreate(BaseModel):
     """User creation model."""
 
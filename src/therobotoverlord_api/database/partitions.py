@@ -0,0 +1,181 @@
+"""Monthly partition maintenance for The Robot Overlord API.
+
+Append-only event and audit tables are range-partitioned by month (see
+``migrations/003_partition_event_tables.sql``). Maintenance keeps partitions
+created a few months ahead so inserts never miss one, and detaches months
+older than each table's retention policy, either moving them to the
+``archive`` schema or dropping them.
+"""
+
+import logging
+import re
+
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from asyncpg import Connection
+from pydantic import BaseModel
+from pydantic import ConfigDict
+
+from therobotoverlord_api.config.database import DatabaseSettings
+from therobotoverlord_api.config.database import get_database_settings
+from therobotoverlord_api.database.connection import get_db_connection
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SCHEMA = "archive"
+
+# Partitions are named <table>_pYYYYMM by create_monthly_partition()
+_PARTITION_MONTH = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+class RetentionAction(str, Enum):
+    """What happens to a partition once it falls out of retention."""
+
+    ARCHIVE = "archive"
+    DROP = "drop"
+
+
+class PartitionPolicy(BaseModel):
+    """Retention policy for one monthly-partitioned table."""
+
+    table: str
+    retention_months: int = 0  # 0 keeps every partition
+    action: RetentionAction = RetentionAction.ARCHIVE
+
+    model_config = ConfigDict(frozen=True)
+
+
+def get_partition_policies(
+    settings: DatabaseSettings | None = None,
+) -> list[PartitionPolicy]:
+    """Get the retention policy of every partitioned table."""
+    settings = settings or get_database_settings()
+    audit_months = settings.audit_retention_months
+    return [
+        # Score breakdowns sum a user's entire event history, so keep it all
+        PartitionPolicy(table="loyalty_score_events"),
+        PartitionPolicy(table="loyalty_score_history"),
+        PartitionPolicy(table="moderation_events", retention_months=audit_months),
+        PartitionPolicy(table="admin_actions", retention_months=audit_months),
+        PartitionPolicy(table="appeal_history", retention_months=audit_months),
+        PartitionPolicy(
+            table="dashboard_snapshots",
+            retention_months=settings.snapshot_retention_months,
+            action=RetentionAction.DROP,
+        ),
+    ]
+
+
+def add_months(month: date, months: int) -> date:
+    """Get the first day of the month ``months`` after ``month``."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_month(partition: str) -> date | None:
+    """Get the month a partition holds from its name."""
+    match = _PARTITION_MONTH.search(partition)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def retention_cutoff(policy: PartitionPolicy, now: datetime) -> date | None:
+    """Get the oldest month ``policy`` keeps, or None to keep everything."""
+    if policy.retention_months <= 0:
+        return None
+    return add_months(date(now.year, now.month, 1), -policy.retention_months)
+
+
+async def list_partitions(connection: Connection, table: str) -> list[str]:
+    """List the attached partitions of ``table``, oldest first."""
+    records = await connection.fetch(
+        """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = $1
+          AND parent.relnamespace = current_schema()::regnamespace
+        ORDER BY child.relname
+        """,
+        table,
+    )
+    return [record["relname"] for record in records]
+
+
+async def create_future_partitions(
+    connection: Connection, table: str, months_ahead: int
+) -> int:
+    """Make sure partitions exist from this month to ``months_ahead`` months out."""
+    return await connection.fetchval(
+        """
+        SELECT create_monthly_partitions(
+            $1, NOW(), NOW() + make_interval(months => $2)
+        )
+        """,
+        table,
+        months_ahead,
+    )
+
+
+async def expire_partitions(
+    connection: Connection, policy: PartitionPolicy, now: datetime
+) -> list[str]:
+    """Detach the partitions of ``policy.table`` older than its retention.
+
+    Each partition is detached and then archived or dropped in its own
+    transaction, so a failure leaves earlier months already handled.
+    """
+    cutoff = retention_cutoff(policy, now)
+    if cutoff is None:
+        return []
+
+    expired = []
+    for partition in await list_partitions(connection, policy.table):
+        month = partition_month(partition)
+        if month is None or month >= cutoff:
+            continue
+
+        async with connection.transaction():
+            await connection.execute(
+                f"ALTER TABLE {policy.table} DETACH PARTITION {partition}"
+            )
+            if policy.action is RetentionAction.ARCHIVE:
+                await connection.execute(
+                    f"ALTER TABLE {partition} SET SCHEMA {ARCHIVE_SCHEMA}"
+                )
+            else:
+                await connection.execute(f"DROP TABLE {partition}")
+
+        logger.info(f"Expired partition {partition} ({policy.action.value})")
+        expired.append(partition)
+
+    return expired
+
+
+async def run_partition_maintenance(
+    now: datetime | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Create upcoming partitions and expire old ones for every table."""
+    settings = get_database_settings()
+    now = now or datetime.now(UTC)
+
+    results = {}
+    async with get_db_connection() as connection:
+        for policy in get_partition_policies(settings):
+            ensured = await create_future_partitions(
+                connection, policy.table, settings.partition_premake_months
+            )
+            expired = await expire_partitions(connection, policy, now)
+            results[policy.table] = {
+                "partitions_ensured": ensured,
+                "expired": expired,
+                "action": policy.action.value,
+            }
+
+    return results
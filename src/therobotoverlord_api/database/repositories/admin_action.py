@@ -7,6 +7,7 @@ from asyncpg import Record
 from therobotoverlord_api.database.models.admin_action import AdminAction
 from therobotoverlord_api.database.models.admin_action import AdminActionCreate
 from therobotoverlord_api.database.repositories.base import BaseRepository
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
 
 
 class AdminActionRepository(BaseRepository[AdminAction]):
@@ -37,9 +38,11 @@ class AdminActionRepository(BaseRepository[AdminAction]):
         self,
         limit: int = 50,
         offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[AdminAction]:
         """Get recent administrative actions."""
-        return await self.get_all(limit=limit, offset=offset)
+        return await self.get_all(limit=limit, offset=offset, cursor=cursor)
 
     async def get_actions_count(self) -> int:
         """Get total count of admin actions."""
@@ -19,6 +19,23 @@ from therobotoverlord_api.database.models.appeal import AppealWithContent
 from therobotoverlord_api.database.models.base import AppealStatus
 from therobotoverlord_api.database.models.base import ContentType
 from therobotoverlord_api.database.repositories.base import BaseRepository
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.pagination import KeysetOrder
+
+# Keyset orderings for appeal listings, with the primary key as tiebreaker
+USER_APPEALS_ORDER = KeysetOrder.by(
+    ("a.submitted_at", "submitted_at", True, datetime),
+    ("a.pk", "pk", True, UUID),
+)
+QUEUE_FIFO_ORDER = KeysetOrder.by(
+    ("a.submitted_at", "submitted_at", False, datetime),
+    ("a.pk", "pk", False, UUID),
+)
+QUEUE_PRIORITY_ORDER = KeysetOrder.by(
+    ("a.priority_score", "priority_score", True, int),
+    ("a.submitted_at", "submitted_at", False, datetime),
+    ("a.pk", "pk", False, UUID),
+)
 
 
 class AppealRepository(BaseRepository[Appeal]):
@@ -74,10 +91,12 @@ class AppealRepository(BaseRepository[Appeal]):
         status: AppealStatus | None = None,
         limit: int = 20,
         offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[AppealWithContent]:
         """Get appeals for a specific user with content details."""
         where_conditions = ["a.user_pk = $1"]
-        params: list[str | UUID | int] = [user_pk]
+        params: list = [user_pk]
         param_count = 2
 
         if status:
@@ -85,7 +104,12 @@ class AppealRepository(BaseRepository[Appeal]):
             params.append(status.value)
             param_count += 1
 
-        where_clause = " AND ".join(where_conditions)
+        where_clause = USER_APPEALS_ORDER.apply(
+            " AND ".join(where_conditions), params, cursor
+        )
+        if cursor is not None:
+            param_count = len(params) + 1
+            offset = 0
 
         query = f"""
             SELECT
@@ -109,7 +133,7 @@ class AppealRepository(BaseRepository[Appeal]):
             LEFT JOIN posts p ON a.content_type = 'post' AND a.content_pk = p.pk
             LEFT JOIN private_messages pm ON a.content_type = 'private_message' AND a.content_pk = pm.pk
             WHERE {where_clause}
-            ORDER BY a.submitted_at DESC
+            {USER_APPEALS_ORDER.order_by()}
             LIMIT ${param_count} OFFSET ${param_count + 1}
         """
 
@@ -127,13 +151,14 @@ class AppealRepository(BaseRepository[Appeal]):
         priority_order: bool = True,
         limit: int = 50,
         offset: int = 0,
+        cursor: KeysetCursor | None = None,
     ) -> list[AppealWithContent]:
         """Get appeals queue for moderators."""
-        order_clause = (
-            "ORDER BY a.priority_score DESC, a.submitted_at ASC"
-            if priority_order
-            else "ORDER BY a.submitted_at ASC"
-        )
+        order = QUEUE_PRIORITY_ORDER if priority_order else QUEUE_FIFO_ORDER
+        params: list = [status.value]
+        where_clause = order.apply("a.status = $1", params, cursor)
+        if cursor is not None:
+            offset = 0
 
         query = f"""
             SELECT
@@ -156,13 +181,13 @@ class AppealRepository(BaseRepository[Appeal]):
             LEFT JOIN topics t ON a.content_type = 'topic' AND a.content_pk = t.pk
             LEFT JOIN posts p ON a.content_type = 'post' AND a.content_pk = p.pk
             LEFT JOIN private_messages pm ON a.content_type = 'private_message' AND a.content_pk = pm.pk
-            WHERE a.status = $1
-            {order_clause}
-            LIMIT $2 OFFSET $3
+            WHERE {where_clause}
+            {order.order_by()}
+            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
         """
 
         async with get_db_connection() as connection:
-            records = await connection.fetch(query, status.value, limit, offset)
+            records = await connection.fetch(query, *params, limit, offset)
             return [AppealWithContent.model_validate(record) for record in records]
 
     async def check_appeal_eligibility(
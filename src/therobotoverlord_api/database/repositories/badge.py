@@ -119,6 +119,12 @@ class UserBadgeRepository(BaseRepository[UserBadge]):
         """Award a badge to a user."""
         return await self.create_from_dict(user_badge_data)
 
+    async def award_badges(self, user_badges_data: list[dict]) -> list[UserBadge]:
+        """Award many badges at once, skipping ones the user already holds."""
+        return await self.upsert_many(
+            user_badges_data, conflict_columns=["user_pk", "badge_pk"]
+        )
+
     async def get_user_badge_counts(self, user_pk: UUID) -> dict[str, int]:
         """Get badge counts for a user by type."""
         query = """
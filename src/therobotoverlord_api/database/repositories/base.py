@@ -1,44 +1,142 @@
 """Base repository class for The Robot Overlord API."""
 
+import re
+
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Any
+from typing import ClassVar
+from typing import overload
 from uuid import UUID
 
+from asyncpg import Connection
 from asyncpg import Record
+from pydantic import BaseModel
 
 from therobotoverlord_api.database.connection import get_db_connection
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.pagination import KeysetOrder
+from therobotoverlord_api.database.statements import statement_registry
+
+# Projected column names are interpolated into SQL, so only plain identifiers
+_COLUMN_NAME = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+# Newest first, primary key as tiebreaker for rows created in the same instant
+DEFAULT_KEYSET_ORDER = KeysetOrder.by(
+    ("created_at", "created_at", True, datetime),
+    ("pk", "pk", True, UUID),
+)
 
 
 class BaseRepository[T](ABC):
     """Base repository class with common database operations."""
 
+    # Column name -> SQL type, per table, loaded once for the bulk operations
+    _column_types: ClassVar[dict[str, dict[str, str]]] = {}
+
     def __init__(self, table_name: str):
         self.table_name = table_name
+        self._get_by_pk_statement = statement_registry.register_for_table(
+            table_name, "get_by_pk", "SELECT * FROM {table} WHERE pk = $1"
+        )
+        self._exists_statement = statement_registry.register_for_table(
+            table_name, "exists", "SELECT EXISTS(SELECT 1 FROM {table} WHERE pk = $1)"
+        )
 
     @abstractmethod
     def _record_to_model(self, record: Record) -> T:
         """Convert database record to model instance."""
 
-    async def get_by_pk(self, pk: UUID) -> T | None:
-        """Get a record by primary key."""
-        query = f"SELECT * FROM {self.table_name} WHERE pk = $1"
+    def _records_to_models(self, records: Sequence[Record]) -> list[T]:
+        """Convert a page of records, overridable to convert in one batch."""
+        return [self._record_to_model(record) for record in records]
+
+    @overload
+    async def get_by_pk(self, pk: UUID, columns: None = None) -> T | None: ...
+
+    @overload
+    async def get_by_pk(self, pk: UUID, columns: Sequence[str]) -> Record | None: ...
+
+    async def get_by_pk(
+        self, pk: UUID, columns: Sequence[str] | None = None
+    ) -> T | Record | None:
+        """Get a record by primary key.
+
+        With ``columns`` only those columns are fetched and the raw record is
+        returned, skipping large TEXT/JSONB columns and model validation.
+        """
+        if columns is None:
+            statement = self._get_by_pk_statement
+        else:
+            statement = self._projected_statement(columns)
 
         async with get_db_connection() as connection:
-            record = await connection.fetchrow(query, pk)
-            return self._record_to_model(record) if record else None
+            record = await statement_registry.fetchrow(connection, statement, pk)
 
-    async def get_all(self, limit: int = 100, offset: int = 0) -> list[T]:
-        """Get all records with pagination."""
-        query = f"""
-            SELECT * FROM {self.table_name}
-            ORDER BY created_at DESC
-            LIMIT $1 OFFSET $2
+        if record is None or columns is not None:
+            return record
+        return self._record_to_model(record)
+
+    async def get_summary_by_pk[S: BaseModel](
+        self, pk: UUID, summary: type[S]
+    ) -> S | None:
+        """Get a record by primary key as a lightweight summary model.
+
+        Only the summary model's fields are selected from the table.
         """
+        record = await self.get_by_pk(pk, columns=tuple(summary.model_fields))
+        return summary.model_validate(dict(record.items())) if record else None
+
+    def _projected_statement(self, columns: Sequence[str]) -> str:
+        """Register the primary key lookup for a column subset."""
+        if not columns:
+            raise ValueError("At least one column must be selected")
+        for column in columns:
+            if not _COLUMN_NAME.match(column):
+                raise ValueError(f"Invalid column name: {column!r}")
+
+        select_list = ", ".join(columns)
+        return statement_registry.register_for_table(
+            self.table_name,
+            f"get_by_pk({select_list})",
+            f"SELECT {select_list} FROM {{table}} WHERE pk = $1",
+        )
+
+    async def get_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
+    ) -> list[T]:
+        """Get all records with pagination.
+
+        When ``cursor`` is given the page starts right after it and ``offset``
+        is ignored, so deep pages cost the same as the first one.
+        """
+        order = DEFAULT_KEYSET_ORDER
+        if cursor is not None:
+            predicate, params = order.predicate(cursor, 2)
+            query = f"""
+                SELECT * FROM {self.table_name}
+                WHERE {predicate}
+                {order.order_by()}
+                LIMIT $1
+            """
+            args = [limit, *params]
+        else:
+            query = f"""
+                SELECT * FROM {self.table_name}
+                {order.order_by()}
+                LIMIT $1 OFFSET $2
+            """
+            args = [limit, offset]
 
         async with get_db_connection() as connection:
-            records = await connection.fetch(query, limit, offset)
-            return [self._record_to_model(record) for record in records]
+            records = await connection.fetch(query, *args)
+            return self._records_to_models(records)
 
     async def count(
         self, where_clause: str = "", params: list[Any] | None = None
@@ -57,10 +155,10 @@ class BaseRepository[T](ABC):
 
     async def exists(self, pk: UUID) -> bool:
         """Check if a record exists by primary key."""
-        query = f"SELECT EXISTS(SELECT 1 FROM {self.table_name} WHERE pk = $1)"
-
         async with get_db_connection() as connection:
-            result = await connection.fetchval(query, pk)
+            result = await statement_registry.fetchval(
+                connection, self._exists_statement, pk
+            )
             return bool(result)
 
     async def delete_by_pk(self, pk: UUID) -> bool:
@@ -144,9 +242,130 @@ class BaseRepository[T](ABC):
 
         async with get_db_connection() as connection:
             records = await connection.fetch(query, *values)
-            return [self._record_to_model(record) for record in records]
+            return self._records_to_models(records)
 
     async def find_one_by(self, **kwargs) -> T | None:
         """Find a single record by field values."""
         results = await self.find_by(**kwargs)
         return results[0] if results else None
+
+    async def create_many(self, rows: Sequence[dict[str, Any]]) -> list[T]:
+        """Create many records in a single round trip and return them."""
+        return await self.upsert_many(rows, conflict_columns=None)
+
+    async def upsert_many(
+        self,
+        rows: Sequence[dict[str, Any]],
+        conflict_columns: Sequence[str] | None,
+        update_columns: Sequence[str] | None = None,
+    ) -> list[T]:
+        """Insert many records with ON CONFLICT handling in a single round trip.
+
+        Conflicting rows are updated from ``update_columns`` when given, and
+        skipped otherwise. Only inserted or updated rows are returned.
+        """
+        if not rows:
+            return []
+
+        columns = self._bulk_columns(rows)
+
+        async with get_db_connection() as connection:
+            types = await self._get_column_types(connection)
+            source = self._unnest_source(columns, types)
+
+            query = f"""
+                INSERT INTO {self.table_name} ({", ".join(columns)})
+                SELECT * FROM {source}
+            """
+            if conflict_columns:
+                query += f" ON CONFLICT ({', '.join(conflict_columns)})"
+                if update_columns:
+                    assignments = ", ".join(
+                        f"{column} = EXCLUDED.{column}" for column in update_columns
+                    )
+                    query += f" DO UPDATE SET {assignments}"
+                else:
+                    query += " DO NOTHING"
+            query += " RETURNING *"
+
+            records = await connection.fetch(query, *self._column_arrays(rows, columns))
+            return self._records_to_models(records)
+
+    async def update_many(
+        self, rows: Sequence[dict[str, Any]], key_column: str = "pk"
+    ) -> list[T]:
+        """Update many records, each by its own key, in a single round trip."""
+        if not rows:
+            return []
+
+        columns = self._bulk_columns(rows)
+        if key_column not in columns:
+            raise ValueError(f"Every row must include the key column {key_column!r}")
+
+        set_columns = [column for column in columns if column != key_column]
+        if not set_columns:
+            raise ValueError("Rows contain no columns to update")
+
+        assignments = [f"{column} = v.{column}" for column in set_columns]
+
+        async with get_db_connection() as connection:
+            types = await self._get_column_types(connection)
+            if "updated_at" in types and "updated_at" not in set_columns:
+                assignments.append("updated_at = NOW()")
+
+            source = self._unnest_source(columns, types)
+            query = f"""
+                UPDATE {self.table_name} AS t
+                SET {", ".join(assignments)}
+                FROM {source} AS v({", ".join(columns)})
+                WHERE t.{key_column} = v.{key_column}
+                RETURNING t.*
+            """
+
+            records = await connection.fetch(query, *self._column_arrays(rows, columns))
+            return self._records_to_models(records)
+
+    def _bulk_columns(self, rows: Sequence[dict[str, Any]]) -> list[str]:
+        """Get the shared column list of a batch, rejecting ragged rows."""
+        columns = list(rows[0].keys())
+        expected = set(columns)
+        for row in rows:
+            if set(row.keys()) != expected:
+                raise ValueError("All rows in a bulk operation must have the same keys")
+        return columns
+
+    def _column_arrays(
+        self, rows: Sequence[dict[str, Any]], columns: list[str]
+    ) -> list[list[Any]]:
+        """Transpose rows into one array parameter per column."""
+        return [[row[column] for row in rows] for column in columns]
+
+    def _unnest_source(self, columns: list[str], types: dict[str, str]) -> str:
+        """Build an UNNEST(...) expression taking one array parameter per column."""
+        for column in columns:
+            if column not in types:
+                raise ValueError(f"Unknown column {column!r} in {self.table_name}")
+            if types[column].endswith("[]"):
+                raise ValueError(f"Array column {column!r} cannot be unnested")
+
+        arrays = [
+            f"${index}::{types[column]}[]"
+            for index, column in enumerate(columns, start=1)
+        ]
+        return f"UNNEST({', '.join(arrays)})"
+
+    async def _get_column_types(self, connection: Connection) -> dict[str, str]:
+        """Get SQL types for this table's columns, cached per table."""
+        types = self._column_types.get(self.table_name)
+        if types is None:
+            query = """
+                SELECT attname, format_type(atttypid, atttypmod) AS column_type
+                FROM pg_attribute
+                WHERE attrelid = $1::regclass
+                AND attnum > 0
+                AND NOT attisdropped
+            """
+            records = await connection.fetch(query, self.table_name)
+            types = {record["attname"]: record["column_type"] for record in records}
+            self._column_types[self.table_name] = types
+        return types
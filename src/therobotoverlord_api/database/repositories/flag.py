@@ -1,5 +1,6 @@
 """Flag repository for content reporting and moderation operations."""
 
+from datetime import datetime
 from uuid import UUID
 
 from asyncpg import Record
@@ -8,6 +9,16 @@ from therobotoverlord_api.database.connection import get_db_connection
 from therobotoverlord_api.database.models.flag import Flag
 from therobotoverlord_api.database.models.flag import FlagStatus
 from therobotoverlord_api.database.repositories.base import BaseRepository
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.pagination import KeysetOrder
+
+# Review queue is FIFO; a user's own flags are listed newest first
+REVIEW_ORDER = KeysetOrder.by(
+    ("created_at", "created_at", False, datetime), ("pk", "pk", False, UUID)
+)
+USER_FLAGS_ORDER = KeysetOrder.by(
+    ("created_at", "created_at", True, datetime), ("pk", "pk", True, UUID)
+)
 
 
 class FlagRepository(BaseRepository[Flag]):
@@ -26,17 +37,25 @@ class FlagRepository(BaseRepository[Flag]):
         limit: int = 50,
         offset: int = 0,
         status_filter: str | None = None,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[Flag]:
         """Get flags for moderation review with optional status filter."""
+        params: list = [limit, offset, status_filter]
+        where_clause = "($3::text IS NULL OR status = $3)"
+        if cursor is not None:
+            where_clause = REVIEW_ORDER.apply(where_clause, params, cursor)
+            params[1] = 0
+
         query = f"""
             SELECT * FROM {self.table_name}
-            WHERE ($3::text IS NULL OR status = $3)
-            ORDER BY created_at ASC
+            WHERE {where_clause}
+            {REVIEW_ORDER.order_by()}
             LIMIT $1 OFFSET $2
         """  # nosec B608
 
         async with get_db_connection() as conn:
-            rows = await conn.fetch(query, limit, offset, status_filter)
+            rows = await conn.fetch(query, *params)
             return [self._record_to_model(row) for row in rows]
 
     async def get_user_flags(
@@ -44,17 +63,25 @@ class FlagRepository(BaseRepository[Flag]):
         user_pk: UUID,
         limit: int = 50,
         offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[Flag]:
         """Get flags submitted by a specific user."""
+        params: list = [user_pk, limit, offset]
+        where_clause = "flagger_pk = $1"
+        if cursor is not None:
+            where_clause = USER_FLAGS_ORDER.apply(where_clause, params, cursor)
+            params[2] = 0
+
         query = f"""
             SELECT * FROM {self.table_name}
-            WHERE flagger_pk = $1
-            ORDER BY created_at DESC
+            WHERE {where_clause}
+            {USER_FLAGS_ORDER.order_by()}
             LIMIT $2 OFFSET $3
         """  # nosec B608
 
         async with get_db_connection() as conn:
-            rows = await conn.fetch(query, user_pk, limit, offset)
+            rows = await conn.fetch(query, *params)
             return [self._record_to_model(row) for row in rows]
 
     async def get_content_flags(
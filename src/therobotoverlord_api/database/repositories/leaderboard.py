@@ -1,5 +1,7 @@
 """Leaderboard repository for The Robot Overlord API."""
 
+import time
+
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
@@ -8,15 +10,25 @@ from uuid import UUID
 import asyncpg
 
 from therobotoverlord_api.database.connection import get_db_connection
+from therobotoverlord_api.database.connection import get_db_read_connection
 from therobotoverlord_api.database.models.leaderboard import BadgeSummary
 from therobotoverlord_api.database.models.leaderboard import LeaderboardCursor
 from therobotoverlord_api.database.models.leaderboard import LeaderboardEntry
 from therobotoverlord_api.database.models.leaderboard import LeaderboardFilters
+from therobotoverlord_api.database.models.leaderboard import LeaderboardRefresh
+from therobotoverlord_api.database.models.leaderboard import LeaderboardRefreshReason
 from therobotoverlord_api.database.models.leaderboard import LeaderboardSearchResult
 from therobotoverlord_api.database.models.leaderboard import LeaderboardStats
+from therobotoverlord_api.database.models.leaderboard import RankedUser
 from therobotoverlord_api.database.models.leaderboard import RankHistoryEntry
 from therobotoverlord_api.database.models.leaderboard import UserRankLookup
 from therobotoverlord_api.database.repositories.base import BaseRepository
+from therobotoverlord_api.database.repositories.rows import ModelRows
+
+LEADERBOARD_ENTRY_ROWS = ModelRows(LeaderboardEntry)
+
+# Mirrors topic_creation_enabled in the leaderboard_rankings view
+TOPIC_CREATION_SCORE = 100
 
 
 class LeaderboardRepository(BaseRepository):
@@ -129,7 +141,7 @@ class LeaderboardRepository(BaseRepository):
 
         query = " ".join(query_parts)
 
-        async with get_db_connection() as conn:
+        async with get_db_read_connection() as conn:
             rows = await conn.fetch(query, *query_params)
 
             # Check if there are more results
@@ -143,21 +155,24 @@ class LeaderboardRepository(BaseRepository):
                 # Get badges for this user
                 badges = await self._get_user_badges(conn, row["user_pk"])
 
-                entry = LeaderboardEntry(
-                    user_pk=row["user_pk"],
-                    username=row["username"],
-                    loyalty_score=row["loyalty_score"],
-                    rank=row["rank"],
-                    percentile_rank=max(0.0, min(1.0, float(row["percentile_rank"]))),
-                    badges=badges,
-                    topic_creation_enabled=row["topic_creation_enabled"],
-                    topics_created_count=row["topics_created_count"],
-                    is_current_user=row["is_current_user"],
-                    created_at=row["user_created_at"],
+                entries.append(
+                    {
+                        "user_pk": row["user_pk"],
+                        "username": row["username"],
+                        "loyalty_score": row["loyalty_score"],
+                        "rank": row["rank"],
+                        "percentile_rank": max(
+                            0.0, min(1.0, float(row["percentile_rank"]))
+                        ),
+                        "badges": badges,
+                        "topic_creation_enabled": row["topic_creation_enabled"],
+                        "topics_created_count": row["topics_created_count"],
+                        "is_current_user": row["is_current_user"],
+                        "created_at": row["user_created_at"],
+                    }
                 )
-                entries.append(entry)
 
-            return entries, has_next
+            return LEADERBOARD_ENTRY_ROWS.many(entries), has_next
 
     async def get_user_rank(self, user_pk: UUID) -> UserRankLookup | None:
         """Get a specific user's rank and position."""
@@ -172,7 +187,7 @@ class LeaderboardRepository(BaseRepository):
             WHERE user_pk = $1
         """
 
-        async with get_db_connection() as conn:
+        async with get_db_read_connection() as conn:
             row = await conn.fetchrow(query, user_pk)
 
             if not row:
@@ -194,6 +209,46 @@ class LeaderboardRepository(BaseRepository):
                 found=True,
             )
 
+    async def get_user_entry(self, user_pk: UUID) -> LeaderboardEntry | None:
+        """Get a user's leaderboard entry, flagged as the current user."""
+        query = """
+            SELECT
+                user_pk,
+                username,
+                loyalty_score,
+                rank,
+                percentile_rank,
+                topics_created_count,
+                topic_creation_enabled,
+                user_created_at
+            FROM leaderboard_rankings
+            WHERE user_pk = $1
+        """
+
+        async with get_db_read_connection() as conn:
+            row = await conn.fetchrow(query, user_pk)
+            if not row:
+                return None
+
+            badges = await self._get_user_badges(conn, user_pk)
+
+            return LEADERBOARD_ENTRY_ROWS.one(
+                {
+                    "user_pk": row["user_pk"],
+                    "username": row["username"],
+                    "loyalty_score": row["loyalty_score"],
+                    "rank": row["rank"],
+                    "percentile_rank": max(
+                        0.0, min(1.0, float(row["percentile_rank"]))
+                    ),
+                    "badges": badges,
+                    "topic_creation_enabled": row["topic_creation_enabled"],
+                    "topics_created_count": row["topics_created_count"],
+                    "is_current_user": True,
+                    "created_at": row["user_created_at"],
+                }
+            )
+
     async def get_nearby_users(
         self, user_pk: UUID, context_size: int = 10
     ) -> list[LeaderboardEntry]:
@@ -223,28 +278,103 @@ class LeaderboardRepository(BaseRepository):
             ORDER BY rank ASC
         """
 
-        async with get_db_connection() as conn:
+        async with get_db_read_connection() as conn:
             rows = await conn.fetch(query, user_pk, min_rank, max_rank)
 
             entries = []
             for row in rows:
                 badges = await self._get_user_badges(conn, row["user_pk"])
 
-                entry = LeaderboardEntry(
-                    user_pk=row["user_pk"],
-                    username=row["username"],
-                    loyalty_score=row["loyalty_score"],
-                    rank=row["rank"],
-                    percentile_rank=max(0.0, min(1.0, float(row["percentile_rank"]))),
-                    badges=badges,
-                    topic_creation_enabled=row["topic_creation_enabled"],
-                    topics_created_count=row["topics_created_count"],
-                    is_current_user=row["is_current_user"],
-                    created_at=row["user_created_at"],
+                entries.append(
+                    {
+                        "user_pk": row["user_pk"],
+                        "username": row["username"],
+                        "loyalty_score": row["loyalty_score"],
+                        "rank": row["rank"],
+                        "percentile_rank": max(
+                            0.0, min(1.0, float(row["percentile_rank"]))
+                        ),
+                        "badges": badges,
+                        "topic_creation_enabled": row["topic_creation_enabled"],
+                        "topics_created_count": row["topics_created_count"],
+                        "is_current_user": row["is_current_user"],
+                        "created_at": row["user_created_at"],
+                    }
                 )
-                entries.append(entry)
 
-            return entries
+            return LEADERBOARD_ENTRY_ROWS.many(entries)
+
+    async def get_ranking_scores(
+        self, user_pks: list[UUID] | None = None
+    ) -> list[tuple[UUID, int]]:
+        """Get the current score of every ranked user, or of ``user_pks``.
+
+        Reads the primary so the ranking index is never set to a lagging score.
+        """
+        query = """
+            SELECT pk, loyalty_score
+            FROM users
+            WHERE is_banned = FALSE AND is_active = TRUE
+        """
+        args: list[object] = []
+        if user_pks is not None:
+            query += " AND pk = ANY($1::uuid[])"
+            args.append(user_pks)
+
+        async with get_db_connection() as conn:
+            rows = await conn.fetch(query, *args)
+            return [(row["pk"], row["loyalty_score"]) for row in rows]
+
+    async def get_ranked_entries(
+        self, ranked: list[RankedUser], current_user_pk: UUID | None = None
+    ) -> list[LeaderboardEntry]:
+        """Build entries, in order, for users ranked by the live ranking index."""
+        if not ranked:
+            return []
+
+        query = """
+            SELECT
+                u.pk,
+                u.username,
+                u.created_at,
+                (
+                    SELECT COUNT(*)
+                    FROM topics t
+                    WHERE t.author_pk = u.pk AND t.status = 'approved'
+                ) as topics_created_count
+            FROM users u
+            WHERE u.pk = ANY($1::uuid[])
+        """
+
+        user_pks = [user.user_pk for user in ranked]
+        async with get_db_read_connection() as conn:
+            rows = {row["pk"]: row for row in await conn.fetch(query, user_pks)}
+            badges = await self._get_badges_for_users(conn, user_pks)
+
+        entries = []
+        for user in ranked:
+            row = rows.get(user.user_pk)
+            if row is None:
+                # Deleted since the index was last updated
+                continue
+            entries.append(
+                {
+                    "user_pk": user.user_pk,
+                    "username": row["username"],
+                    "loyalty_score": user.loyalty_score,
+                    "rank": user.rank,
+                    "percentile_rank": user.percentile_rank,
+                    "badges": badges.get(user.user_pk, []),
+                    "topic_creation_enabled": (
+                        user.loyalty_score >= TOPIC_CREATION_SCORE
+                    ),
+                    "topics_created_count": row["topics_created_count"],
+                    "is_current_user": user.user_pk == current_user_pk,
+                    "created_at": row["created_at"],
+                }
+            )
+
+        return LEADERBOARD_ENTRY_ROWS.many(entries)
 
     async def search_users(
         self, search_term: str, limit: int = 20
@@ -263,7 +393,7 @@ class LeaderboardRepository(BaseRepository):
             LIMIT $3
         """
 
-        async with get_db_connection() as conn:
+        async with get_db_read_connection() as conn:
             rows = await conn.fetch(query, search_term, f"%{search_term}%", limit)
 
             results = []
@@ -306,7 +436,7 @@ class LeaderboardRepository(BaseRepository):
             GROUP BY score_range
         """
 
-        async with get_db_connection() as conn:
+        async with get_db_read_connection() as conn:
             stats_row = await conn.fetchrow(query)
             distribution_rows = await conn.fetch(distribution_query)
 
@@ -347,7 +477,7 @@ class LeaderboardRepository(BaseRepository):
 
         since_date = datetime.now(UTC).date() - timedelta(days=days)
 
-        async with get_db_connection() as conn:
+        async with get_db_read_connection() as conn:
             rows = await conn.fetch(query, user_pk, since_date)
 
             history = []
@@ -386,28 +516,31 @@ class LeaderboardRepository(BaseRepository):
             LIMIT $1
         """
 
-        async with get_db_connection() as conn:
+        async with get_db_read_connection() as conn:
             rows = await conn.fetch(query, limit)
 
             entries = []
             for row in rows:
                 badges = await self._get_user_badges(conn, row["user_pk"])
 
-                entry = LeaderboardEntry(
-                    user_pk=row["user_pk"],
-                    username=row["username"],
-                    loyalty_score=row["loyalty_score"],
-                    rank=row["rank"],
-                    percentile_rank=max(0.0, min(1.0, float(row["percentile_rank"]))),
-                    badges=badges,
-                    topic_creation_enabled=row["topic_creation_enabled"],
-                    topics_created_count=row["topics_created_count"],
-                    is_current_user=False,
-                    created_at=row["user_created_at"],
+                entries.append(
+                    {
+                        "user_pk": row["user_pk"],
+                        "username": row["username"],
+                        "loyalty_score": row["loyalty_score"],
+                        "rank": row["rank"],
+                        "percentile_rank": max(
+                            0.0, min(1.0, float(row["percentile_rank"]))
+                        ),
+                        "badges": badges,
+                        "topic_creation_enabled": row["topic_creation_enabled"],
+                        "topics_created_count": row["topics_created_count"],
+                        "is_current_user": False,
+                        "created_at": row["user_created_at"],
+                    }
                 )
-                entries.append(entry)
 
-            return entries
+            return LEADERBOARD_ENTRY_ROWS.many(entries)
 
     async def refresh_leaderboard(self) -> bool:
         """Refresh the materialized view and return success status."""
@@ -418,6 +551,103 @@ class LeaderboardRepository(BaseRepository):
         except Exception:
             return False
 
+    async def refresh_leaderboard_if_changed(
+        self, min_interval: float, max_interval: float
+    ) -> LeaderboardRefresh:
+        """Refresh the materialized view if it changed since its last refresh.
+
+        Changes are refreshed at most once per ``min_interval`` seconds, and
+        the view is refreshed every ``max_interval`` seconds regardless. An
+        advisory lock held for the whole refresh makes concurrent callers
+        skip instead of refreshing again, and every refresh is recorded in
+        leaderboard_refreshes.
+        """
+        async with get_db_connection() as conn:
+            async with conn.transaction():
+                locked = await conn.fetchval(
+                    "SELECT pg_try_advisory_xact_lock(hashtext($1))",
+                    "leaderboard_rankings",
+                )
+                if not locked:
+                    return LeaderboardRefresh(
+                        refreshed=False, reason=LeaderboardRefreshReason.LOCKED
+                    )
+
+                last = await conn.fetchrow(
+                    """
+                    SELECT
+                        change_watermark,
+                        row_count,
+                        EXTRACT(EPOCH FROM NOW() - started_at) as age
+                    FROM leaderboard_refreshes
+                    ORDER BY started_at DESC
+                    LIMIT 1
+                    """
+                )
+                # Read before refreshing, so changes made during it stay pending
+                watermark = int(
+                    await conn.fetchval("SELECT leaderboard_change_watermark()") or 0
+                )
+                reason = self._refresh_reason(
+                    last, watermark, min_interval, max_interval
+                )
+                if reason in (
+                    LeaderboardRefreshReason.UNCHANGED,
+                    LeaderboardRefreshReason.DEBOUNCED,
+                ):
+                    return LeaderboardRefresh(
+                        refreshed=False, reason=reason, change_watermark=watermark
+                    )
+
+                started_at = datetime.now(UTC)
+                started = time.perf_counter()
+                await conn.execute("SELECT refresh_leaderboard_rankings()")
+                duration_ms = (time.perf_counter() - started) * 1000
+
+                row_count = int(
+                    await conn.fetchval("SELECT COUNT(*) FROM leaderboard_rankings")
+                    or 0
+                )
+                row_delta = row_count - (last["row_count"] if last else 0)
+                await conn.execute(
+                    """
+                    INSERT INTO leaderboard_refreshes (
+                        change_watermark, started_at, duration_ms, row_count, row_delta
+                    ) VALUES ($1, $2, $3, $4, $5)
+                    """,
+                    watermark,
+                    started_at,
+                    duration_ms,
+                    row_count,
+                    row_delta,
+                )
+
+        return LeaderboardRefresh(
+            refreshed=True,
+            reason=reason,
+            change_watermark=watermark,
+            duration_ms=duration_ms,
+            row_count=row_count,
+            row_delta=row_delta,
+        )
+
+    @staticmethod
+    def _refresh_reason(
+        last, watermark: int, min_interval: float, max_interval: float
+    ) -> LeaderboardRefreshReason:
+        """Decide whether to refresh, given the last recorded refresh."""
+        if last is None:
+            return LeaderboardRefreshReason.FIRST
+
+        age = float(last["age"])
+        if watermark != last["change_watermark"]:
+            if age < min_interval:
+                return LeaderboardRefreshReason.DEBOUNCED
+            return LeaderboardRefreshReason.CHANGED
+        if age >= max_interval:
+            return LeaderboardRefreshReason.MAX_INTERVAL
+        return LeaderboardRefreshReason.UNCHANGED
+
     async def create_daily_snapshot(self) -> bool:
         """Create daily snapshot and return success status."""
         try:
@@ -459,6 +689,37 @@ class LeaderboardRepository(BaseRepository):
 
         return badges
 
+    async def _get_badges_for_users(
+        self, conn: asyncpg.Connection, user_pks: list[UUID]
+    ) -> dict[UUID, list[BadgeSummary]]:
+        """Get badges for several users in one query."""
+        query = """
+            SELECT
+                ub.user_pk,
+                b.pk,
+                b.name,
+                b.description,
+                b.image_url,
+                ub.awarded_at
+            FROM user_badges ub
+            JOIN badges b ON ub.badge_pk = b.pk
+            WHERE ub.user_pk = ANY($1::uuid[])
+            ORDER BY ub.awarded_at DESC
+        """
+
+        badges: dict[UUID, list[BadgeSummary]] = {}
+        for row in await conn.fetch(query, user_pks):
+            badges.setdefault(row["user_pk"], []).append(
+                BadgeSummary(
+                    pk=row["pk"],
+                    name=row["name"],
+                    description=row["description"],
+                    image_url=row["image_url"],
+                    awarded_at=row["awarded_at"],
+                )
+            )
+        return badges
+
     async def get_users_by_rank_range(
         self, start_rank: int, end_rank: int
     ) -> list[LeaderboardEntry]:
@@ -480,27 +741,28 @@ class LeaderboardRepository(BaseRepository):
             ORDER BY lr.rank ASC
         """
 
-        async with get_db_connection() as conn:
+        async with get_db_read_connection() as conn:
             rows = await conn.fetch(query, start_rank, end_rank)
             entries = []
             for row in rows:
                 # Load badges for each user
                 badges = await self._get_user_badges(conn, row["user_pk"])
 
-                entry = LeaderboardEntry(
-                    user_pk=row["user_pk"],
-                    username=row["username"],
-                    loyalty_score=row["loyalty_score"],
-                    rank=row["rank"],
-                    percentile_rank=row["percentile_rank"],
-                    topics_created_count=row["topics_created_count"],
-                    topic_creation_enabled=row["topic_creation_enabled"],
-                    created_at=row["user_created_at"],
-                    is_current_user=row["is_current_user"],
-                    badges=badges,
+                entries.append(
+                    {
+                        "user_pk": row["user_pk"],
+                        "username": row["username"],
+                        "loyalty_score": row["loyalty_score"],
+                        "rank": row["rank"],
+                        "percentile_rank": row["percentile_rank"],
+                        "topics_created_count": row["topics_created_count"],
+                        "topic_creation_enabled": row["topic_creation_enabled"],
+                        "created_at": row["user_created_at"],
+                        "is_current_user": row["is_current_user"],
+                        "badges": badges,
+                    }
                 )
-                entries.append(entry)
-            return entries
+            return LEADERBOARD_ENTRY_ROWS.many(entries)
 
     async def get_users_by_percentile_range(
         self, start_percentile: float, end_percentile: float
@@ -523,24 +785,25 @@ class LeaderboardRepository(BaseRepository):
             ORDER BY lr.rank ASC
         """
 
-        async with get_db_connection() as conn:
+        async with get_db_read_connection() as conn:
             rows = await conn.fetch(query, start_percentile, end_percentile)
             entries = []
             for row in rows:
                 # Load badges for each user
                 badges = await self._get_user_badges(conn, row["user_pk"])
 
-                entry = LeaderboardEntry(
-                    user_pk=row["user_pk"],
-                    username=row["username"],
-                    loyalty_score=row["loyalty_score"],
-                    rank=row["rank"],
-                    percentile_rank=row["percentile_rank"],
-                    topics_created_count=row["topics_created_count"],
-                    topic_creation_enabled=row["topic_creation_enabled"],
-                    created_at=row["user_created_at"],
-                    is_current_user=row["is_current_user"],
-                    badges=badges,
+                entries.append(
+                    {
+                        "user_pk": row["user_pk"],
+                        "username": row["username"],
+                        "loyalty_score": row["loyalty_score"],
+                        "rank": row["rank"],
+                        "percentile_rank": row["percentile_rank"],
+                        "topics_created_count": row["topics_created_count"],
+                        "topic_creation_enabled": row["topic_creation_enabled"],
+                        "created_at": row["user_created_at"],
+                        "is_current_user": row["is_current_user"],
+                        "badges": badges,
+                    }
                 )
-                entries.append(entry)
-            return entries
+            return LEADERBOARD_ENTRY_ROWS.many(entries)
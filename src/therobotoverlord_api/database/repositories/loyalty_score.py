@@ -1,6 +1,7 @@
 """Loyalty Score repository for The Robot Overlord API."""
 
 import json
+import logging
 
 from datetime import UTC
 from datetime import datetime
@@ -11,6 +12,7 @@ from uuid import uuid4
 
 from asyncpg import Record
 
+from therobotoverlord_api.auth.principal_cache import principal_cache
 from therobotoverlord_api.database.connection import get_db_connection
 from therobotoverlord_api.database.models.loyalty_score import ContentType
 from therobotoverlord_api.database.models.loyalty_score import LoyaltyEventFilters
@@ -23,6 +25,9 @@ from therobotoverlord_api.database.models.loyalty_score import ModerationEvent
 from therobotoverlord_api.database.models.loyalty_score import ModerationEventType
 from therobotoverlord_api.database.models.loyalty_score import UserLoyaltyProfile
 from therobotoverlord_api.database.repositories.base import BaseRepository
+from therobotoverlord_api.services.leaderboard_index import leaderboard_index
+
+logger = logging.getLogger(__name__)
 
 
 class LoyaltyScoreRepository(BaseRepository):
@@ -69,13 +74,22 @@ class LoyaltyScoreRepository(BaseRepository):
             async with conn.transaction():
                 # Get current user score
                 current_score_row = await conn.fetchrow(
-                    "SELECT loyalty_score FROM users WHERE pk = $1", user_pk
+                    """
+                    SELECT loyalty_score, is_banned, is_active
+                    FROM users
+                    WHERE pk = $1
+                    """,
+                    user_pk,
                 )
                 if not current_score_row:
                     raise ValueError(f"User {user_pk} not found")
 
                 previous_score = current_score_row["loyalty_score"]
                 new_score = previous_score + score_delta
+                ranked = (
+                    current_score_row["is_active"]
+                    and not current_score_row["is_banned"]
+                )
 
                 # Update user's loyalty score
                 await conn.execute(
@@ -138,6 +152,9 @@ class LoyaltyScoreRepository(BaseRepository):
                     event_pk,
                 )
 
+        await self._update_ranking_index(user_pk, new_score if ranked else None)
+        await principal_cache.invalidate(user_pk)
+
         # Return the created event
         return ModerationEvent(
             pk=event_pk,
@@ -155,6 +172,14 @@ class LoyaltyScoreRepository(BaseRepository):
             created_at=now,
         )
 
+    async def _update_ranking_index(self, user_pk: UUID, score: int | None) -> None:
+        """Apply a committed score change to the live ranking index."""
+        try:
+            await leaderboard_index.update(user_pk, score)
+        except Exception as e:
+            # The periodic index check repairs missed updates
+            logger.warning(f"Failed to update ranking index for user {user_pk}: {e}")
+
     async def get_user_loyalty_profile(self, user_pk: UUID) -> UserLoyaltyProfile:
         """Get complete loyalty profile for a user."""
         async with get_db_connection() as conn:
@@ -500,7 +525,8 @@ class LoyaltyScoreRepository(BaseRepository):
                     user_pk,
                 )
 
-                return new_score
+        await principal_cache.invalidate(user_pk)
+        return new_score
 
     async def get_users_by_score_range(
         self, min_score: int, max_score: int, limit: int = 100
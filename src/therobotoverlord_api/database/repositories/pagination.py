@@ -0,0 +1,203 @@
+"""Keyset (cursor) pagination helpers for The Robot Overlord API."""
+
+import base64
+import binascii
+import json
+
+from collections.abc import Callable
+from collections.abc import Sequence
+from datetime import date
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+
+CursorValue = datetime | date | UUID | bool | int | float | str
+
+
+def _encode_value(value: CursorValue) -> list[Any]:
+    """Encode a cursor value as a [type tag, JSON value] pair."""
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, UUID):
+        return ["u", str(value)]
+    if isinstance(value, bool):
+        return ["b", value]
+    if isinstance(value, int):
+        return ["i", value]
+    if isinstance(value, float):
+        return ["f", value]
+    if isinstance(value, str):
+        return ["s", value]
+    raise ValueError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _decode_value(tag: str, raw: Any) -> CursorValue:
+    """Decode a [type tag, JSON value] pair back into a cursor value."""
+    decoders: dict[str, Callable[[Any], CursorValue]] = {
+        "dt": datetime.fromisoformat,
+        "d": date.fromisoformat,
+        "u": UUID,
+        "b": bool,
+        "i": int,
+        "f": float,
+        "s": str,
+    }
+    if tag not in decoders:
+        raise ValueError(f"Unknown cursor value tag: {tag}")
+    return decoders[tag](raw)
+
+
+class KeysetCursor(BaseModel):
+    """Opaque cursor pointing just past the last row of a page.
+
+    ``values`` holds the row's sort key(s) followed by its primary key, in the
+    same order as the columns of the ``KeysetOrder`` that produced it.
+    """
+
+    values: tuple[CursorValue, ...]
+
+    model_config = ConfigDict(frozen=True)
+
+    def encode(self) -> str:
+        """Encode cursor to an opaque, URL-safe string for API responses."""
+        payload = json.dumps([_encode_value(value) for value in self.values])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor_str: str) -> "KeysetCursor":
+        """Decode cursor from string."""
+        try:
+            padded = cursor_str + "=" * (-len(cursor_str) % 4)
+            pairs = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            values = tuple(_decode_value(tag, raw) for tag, raw in pairs)
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor format") from e
+
+        if not values:
+            raise ValueError("Invalid cursor format")
+        return cls(values=values)
+
+
+class KeysetColumn(BaseModel):
+    """One column of a keyset ordering."""
+
+    expression: str  # SQL expression, e.g. "p.submitted_at"
+    attribute: str  # Attribute or key holding the value on result rows
+    descending: bool = False
+    value_type: type  # Type of the column's values, e.g. datetime
+
+    model_config = ConfigDict(frozen=True)
+
+
+class KeysetOrder(BaseModel):
+    """Total ordering used for keyset pagination.
+
+    The last column must be unique (normally the primary key) so that every
+    row has a distinct position and no row is skipped or repeated across pages.
+    """
+
+    columns: tuple[KeysetColumn, ...]
+
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def by(cls, *columns: tuple[str, str, bool, type]) -> "KeysetOrder":
+        """Build an ordering from (expression, attribute, descending, type) tuples."""
+        return cls(
+            columns=tuple(
+                KeysetColumn(
+                    expression=expr,
+                    attribute=attr,
+                    descending=desc,
+                    value_type=value_type,
+                )
+                for expr, attr, desc, value_type in columns
+            )
+        )
+
+    def validate_cursor(self, cursor: KeysetCursor) -> None:
+        """Check that the cursor was produced by this ordering.
+
+        Raises ``ValueError`` when the number or types of its values do not
+        match the columns, e.g. for a cursor taken from another endpoint.
+        """
+        if len(cursor.values) != len(self.columns):
+            raise ValueError("Cursor does not match this ordering")
+
+        for value, column in zip(cursor.values, self.columns, strict=True):
+            if type(value) is not column.value_type:
+                raise ValueError(
+                    f"Cursor value for {column.attribute} is not a "
+                    f"{column.value_type.__name__}"
+                )
+
+    def order_by(self) -> str:
+        """Render the ORDER BY clause for this ordering."""
+        terms = [
+            f"{column.expression} {'DESC' if column.descending else 'ASC'}"
+            for column in self.columns
+        ]
+        return "ORDER BY " + ", ".join(terms)
+
+    def predicate(self, cursor: KeysetCursor, first_param: int) -> tuple[str, list]:
+        """Render the WHERE predicate selecting rows after the cursor.
+
+        Returns the SQL fragment and the parameters it references, numbered
+        from ``first_param``. Uniform directions use a row comparison that
+        PostgreSQL can satisfy straight from a composite index.
+        """
+        self.validate_cursor(cursor)
+
+        params = list(cursor.values)
+        placeholders = [f"${first_param + i}" for i in range(len(params))]
+
+        directions = {column.descending for column in self.columns}
+        if len(directions) == 1:
+            operator = "<" if self.columns[0].descending else ">"
+            expressions = ", ".join(column.expression for column in self.columns)
+            return f"({expressions}) {operator} ({', '.join(placeholders)})", params
+
+        # Mixed directions: (a after x) OR (a = x AND b after y) OR ...
+        alternatives = []
+        for i, column in enumerate(self.columns):
+            operator = "<" if column.descending else ">"
+            terms = [
+                f"{self.columns[j].expression} = {placeholders[j]}" for j in range(i)
+            ]
+            terms.append(f"{column.expression} {operator} {placeholders[i]}")
+            alternatives.append("(" + " AND ".join(terms) + ")")
+        return "(" + " OR ".join(alternatives) + ")", params
+
+    def apply(
+        self, where_clause: str, params: list, cursor: KeysetCursor | None
+    ) -> str:
+        """Extend a WHERE clause to start after the cursor.
+
+        The cursor values are appended to ``params``; the clause is returned
+        unchanged when there is no cursor.
+        """
+        if cursor is None:
+            return where_clause
+
+        predicate, values = self.predicate(cursor, len(params) + 1)
+        params.extend(values)
+        return f"{where_clause} AND {predicate}" if where_clause else predicate
+
+    def cursor_for(self, row: Any) -> KeysetCursor:
+        """Build the cursor pointing just past the given model or record."""
+        if isinstance(row, BaseModel):
+            values = tuple(getattr(row, column.attribute) for column in self.columns)
+        else:
+            values = tuple(row[column.attribute] for column in self.columns)
+        return KeysetCursor(values=values)
+
+    def next_cursor(self, rows: Sequence[Any], limit: int) -> str | None:
+        """Get the encoded cursor for the next page, if there may be one."""
+        if not rows or len(rows) < limit:
+            return None
+        return self.cursor_for(rows[-1]).encode()
@@ -1,5 +1,6 @@
 """Post repository for The Robot Overlord API."""
 
+from collections.abc import Sequence
 from datetime import UTC
 from datetime import datetime
 from uuid import UUID
@@ -7,6 +8,7 @@ from uuid import UUID
 from asyncpg import Record
 
 from therobotoverlord_api.database.connection import get_db_connection
+from therobotoverlord_api.database.connection import get_db_read_connection
 from therobotoverlord_api.database.models.base import ContentStatus
 from therobotoverlord_api.database.models.post import Post
 from therobotoverlord_api.database.models.post import PostCreate
@@ -15,6 +17,24 @@ from therobotoverlord_api.database.models.post import PostThread
 from therobotoverlord_api.database.models.post import PostUpdate
 from therobotoverlord_api.database.models.post import PostWithAuthor
 from therobotoverlord_api.database.repositories.base import BaseRepository
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.pagination import KeysetOrder
+from therobotoverlord_api.database.repositories.rows import ModelRows
+
+# Keyset orderings, with the primary key breaking submitted_at ties
+OLDEST_FIRST = KeysetOrder.by(
+    ("p.submitted_at", "submitted_at", False, datetime),
+    ("p.pk", "pk", False, UUID),
+)
+NEWEST_FIRST = KeysetOrder.by(
+    ("p.submitted_at", "submitted_at", True, datetime),
+    ("p.pk", "pk", True, UUID),
+)
+
+POST_ROWS = ModelRows(Post)
+POST_WITH_AUTHOR_ROWS = ModelRows(PostWithAuthor)
+POST_SUMMARY_ROWS = ModelRows(PostSummary)
+POST_THREAD_ROWS = ModelRows(PostThread)
 
 
 class PostRepository(BaseRepository[Post]):
@@ -27,6 +47,10 @@ class PostRepository(BaseRepository[Post]):
         """Convert database record to Post model."""
         return Post.model_validate(dict(record))
 
+    def _records_to_models(self, records: Sequence[Record]) -> list[Post]:
+        """Convert a page of post records in one batch."""
+        return POST_ROWS.many(records)
+
     async def create(self, post_data: PostCreate) -> Post:
         """Create a new post."""
         data = post_data.model_dump(exclude_unset=True)
@@ -44,15 +68,21 @@ class PostRepository(BaseRepository[Post]):
         status: ContentStatus | None = None,
         limit: int = 100,
         offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[PostWithAuthor]:
         """Get posts by topic with author information."""
         where_clause = "p.topic_pk = $1"
-        params: list[UUID | str | int] = [topic_pk]
+        params: list = [topic_pk]
 
         if status:
             where_clause += " AND p.status = $2"
             params.append(status.value)
 
+        if cursor is not None:
+            where_clause = OLDEST_FIRST.apply(where_clause, params, cursor)
+            offset = 0
+
         query = f"""
             SELECT
                 p.pk,
@@ -71,7 +101,7 @@ class PostRepository(BaseRepository[Post]):
             FROM posts p
             JOIN users u ON p.author_pk = u.pk
             WHERE {where_clause}
-            ORDER BY p.submitted_at ASC
+            {OLDEST_FIRST.order_by()}
             LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
         """
 
@@ -79,7 +109,7 @@ class PostRepository(BaseRepository[Post]):
 
         async with get_db_connection() as connection:
             records = await connection.fetch(query, *params)
-            return [PostWithAuthor.model_validate(dict(record)) for record in records]
+            return POST_WITH_AUTHOR_ROWS.many(records)
 
     async def get_graveyard_posts(
         self, limit: int = 100, offset: int = 0
@@ -109,13 +139,20 @@ class PostRepository(BaseRepository[Post]):
 
         async with get_db_connection() as connection:
             records = await connection.fetch(query, limit, offset)
-            return [PostWithAuthor.model_validate(dict(record)) for record in records]
+            return POST_WITH_AUTHOR_ROWS.many(records)
 
     async def get_approved_by_topic(
-        self, topic_pk: UUID, limit: int = 100, offset: int = 0
+        self,
+        topic_pk: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[PostWithAuthor]:
         """Get approved posts by topic."""
-        return await self.get_by_topic(topic_pk, ContentStatus.APPROVED, limit, offset)
+        return await self.get_by_topic(
+            topic_pk, ContentStatus.APPROVED, limit, offset, cursor=cursor
+        )
 
     async def get_by_author(
         self,
@@ -123,15 +160,21 @@ class PostRepository(BaseRepository[Post]):
         status: ContentStatus | None = None,
         limit: int = 100,
         offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[PostSummary]:
         """Get posts by author with topic information."""
         where_clause = "p.author_pk = $1"
-        params: list[UUID | str | int] = [author_pk]
+        params: list = [author_pk]
 
         if status:
             where_clause += " AND p.status = $2"
             params.append(status.value)
 
+        if cursor is not None:
+            where_clause = NEWEST_FIRST.apply(where_clause, params, cursor)
+            offset = 0
+
         query = f"""
             SELECT
                 p.pk,
@@ -143,7 +186,7 @@ class PostRepository(BaseRepository[Post]):
                 p.rejection_reason
             FROM posts p
             WHERE {where_clause}
-            ORDER BY p.submitted_at DESC
+            {NEWEST_FIRST.order_by()}
             LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
         """
 
@@ -151,7 +194,7 @@ class PostRepository(BaseRepository[Post]):
 
         async with get_db_connection() as connection:
             records = await connection.fetch(query, *params)
-            return [PostSummary.model_validate(dict(record)) for record in records]
+            return POST_SUMMARY_ROWS.many(records)
 
     async def get_graveyard_by_author(
         self, author_pk: UUID, limit: int = 100, offset: int = 0
@@ -189,7 +232,7 @@ class PostRepository(BaseRepository[Post]):
 
         async with get_db_connection() as connection:
             records = await connection.fetch(query, author_pk, limit, offset)
-            return [PostWithAuthor.model_validate(dict(record)) for record in records]
+            return POST_WITH_AUTHOR_ROWS.many(records)
 
     async def get_thread_view(
         self, topic_pk: UUID, limit: int = 100, offset: int = 0
@@ -269,9 +312,9 @@ class PostRepository(BaseRepository[Post]):
             LIMIT $2 OFFSET $3
         """
 
-        async with get_db_connection() as connection:
+        async with get_db_read_connection() as connection:
             records = await connection.fetch(query, topic_pk, limit, offset)
-            return [PostThread.model_validate(dict(record)) for record in records]
+            return POST_THREAD_ROWS.many(records)
 
     async def get_by_status(
         self, status: ContentStatus, limit: int = 100, offset: int = 0
@@ -286,7 +329,7 @@ class PostRepository(BaseRepository[Post]):
 
         async with get_db_connection() as connection:
             records = await connection.fetch(query, status.value, limit, offset)
-            return [self._record_to_model(record) for record in records]
+            return self._records_to_models(records)
 
     async def approve_post(
         self, pk: UUID, overlord_feedback: str | None = None
@@ -330,10 +373,21 @@ class PostRepository(BaseRepository[Post]):
         )
 
     async def get_recent_approved_posts(
-        self, limit: int = 100, offset: int = 0
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[PostWithAuthor]:
         """Get recent approved posts across all topics, ordered chronologically by submission."""
-        query = """
+        where_clause = "p.status = 'approved'"
+        params: list = []
+
+        if cursor is not None:
+            where_clause = OLDEST_FIRST.apply(where_clause, params, cursor)
+            offset = 0
+
+        query = f"""
             SELECT
                 p.pk,
                 p.topic_pk,
@@ -350,14 +404,16 @@ class PostRepository(BaseRepository[Post]):
                 u.username as author_username
             FROM posts p
             JOIN users u ON p.author_pk = u.pk
-            WHERE p.status = 'approved'
-            ORDER BY p.submitted_at ASC
-            LIMIT $1 OFFSET $2
+            WHERE {where_clause}
+            {OLDEST_FIRST.order_by()}
+            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
         """
 
-        async with get_db_connection() as connection:
-            records = await connection.fetch(query, limit, offset)
-            return [PostWithAuthor.model_validate(dict(record)) for record in records]
+        params.extend([limit, offset])
+
+        async with get_db_read_connection() as connection:
+            records = await connection.fetch(query, *params)
+            return POST_WITH_AUTHOR_ROWS.many(records)
 
     async def search_posts(
         self,
@@ -365,15 +421,21 @@ class PostRepository(BaseRepository[Post]):
         topic_pk: UUID | None = None,
         limit: int = 100,
         offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[PostWithAuthor]:
         """Search posts by content."""
         where_clause = "p.status = 'approved' AND p.content ILIKE $1"
-        params: list[str | UUID | int] = [f"%{search_term}%"]
+        params: list = [f"%{search_term}%"]
 
         if topic_pk:
             where_clause += " AND p.topic_pk = $2"
             params.append(topic_pk)
 
+        if cursor is not None:
+            where_clause = OLDEST_FIRST.apply(where_clause, params, cursor)
+            offset = 0
+
         query = f"""
             SELECT
                 p.pk,
@@ -392,7 +454,7 @@ class PostRepository(BaseRepository[Post]):
             FROM posts p
             JOIN users u ON p.author_pk = u.pk
             WHERE {where_clause}
-            ORDER BY p.submitted_at ASC
+            {OLDEST_FIRST.order_by()}
             LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
         """
 
@@ -400,7 +462,7 @@ class PostRepository(BaseRepository[Post]):
 
         async with get_db_connection() as connection:
             records = await connection.fetch(query, *params)
-            return [PostWithAuthor.model_validate(dict(record)) for record in records]
+            return POST_WITH_AUTHOR_ROWS.many(records)
 
     async def get_in_transit_posts(
         self, limit: int = 100, offset: int = 0
@@ -430,7 +492,7 @@ class PostRepository(BaseRepository[Post]):
 
         async with get_db_connection() as connection:
             records = await connection.fetch(query, limit, offset)
-            return [PostWithAuthor.model_validate(dict(record)) for record in records]
+            return POST_WITH_AUTHOR_ROWS.many(records)
 
     async def get_submitted_posts(
         self, limit: int = 50, offset: int = 0
@@ -460,7 +522,7 @@ class PostRepository(BaseRepository[Post]):
 
         async with get_db_connection() as connection:
             records = await connection.fetch(query, limit, offset)
-            return [PostWithAuthor.model_validate(dict(record)) for record in records]
+            return POST_WITH_AUTHOR_ROWS.many(records)
 
     async def get_trending_posts(self, limit: int = 20) -> list[PostWithAuthor]:
         """Get trending posts based on recent activity and engagement."""
@@ -495,9 +557,9 @@ class PostRepository(BaseRepository[Post]):
             LIMIT $1
         """
 
-        async with get_db_connection() as connection:
+        async with get_db_read_connection() as connection:
             records = await connection.fetch(query, limit)
-            return [PostWithAuthor.model_validate(dict(record)) for record in records]
+            return POST_WITH_AUTHOR_ROWS.many(records)
 
     async def get_popular_posts(self, limit: int = 20) -> list[PostWithAuthor]:
         """Get popular posts based on total reply count."""
@@ -530,6 +592,6 @@ class PostRepository(BaseRepository[Post]):
             LIMIT $1
         """
 
-        async with get_db_connection() as connection:
+        async with get_db_read_connection() as connection:
             records = await connection.fetch(query, limit)
-            return [PostWithAuthor.model_validate(dict(record)) for record in records]
+            return POST_WITH_AUTHOR_ROWS.many(records)
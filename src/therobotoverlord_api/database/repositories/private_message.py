@@ -9,6 +9,7 @@ from uuid import UUID
 from asyncpg import Record
 
 from therobotoverlord_api.database.connection import get_db_connection
+from therobotoverlord_api.database.connection import get_db_read_connection
 from therobotoverlord_api.database.models.base import ContentStatus
 from therobotoverlord_api.database.models.private_message import ConversationSummary
 from therobotoverlord_api.database.models.private_message import MessageSearchResult
@@ -20,9 +21,21 @@ from therobotoverlord_api.database.models.private_message import (
 )
 from therobotoverlord_api.database.models.private_message import UnreadMessageCount
 from therobotoverlord_api.database.repositories.base import BaseRepository
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.pagination import KeysetOrder
 
 logger = logging.getLogger(__name__)
 
+# Newest first; message pk and conversation id break timestamp ties
+MESSAGE_ORDER = KeysetOrder.by(
+    ("pm.sent_at", "sent_at", True, datetime),
+    ("pm.pk", "pk", True, UUID),
+)
+CONVERSATION_ORDER = KeysetOrder.by(
+    ("lm.last_message_sent_at", "last_message_sent_at", True, datetime),
+    ("lm.conversation_id", "conversation_id", True, str),
+)
+
 
 class PrivateMessageRepository(BaseRepository[PrivateMessage]):
     """Repository for private message operations."""
@@ -95,6 +108,7 @@ class PrivateMessageRepository(BaseRepository[PrivateMessage]):
         offset: int = 0,
         *,
         include_moderated: bool = False,
+        cursor: KeysetCursor | None = None,
     ) -> MessageThread | None:
         """Get conversation between two users."""
         try:
@@ -105,6 +119,12 @@ class PrivateMessageRepository(BaseRepository[PrivateMessage]):
             if include_moderated:
                 status_filter = ""  # Include all statuses
 
+            params: list = [conversation_id]
+            cursor_filter = ""
+            if cursor is not None:
+                cursor_filter = "AND " + MESSAGE_ORDER.apply("", params, cursor)
+                offset = 0
+
             # Get messages with participant info
             query = f"""
                 SELECT
@@ -116,13 +136,13 @@ class PrivateMessageRepository(BaseRepository[PrivateMessage]):
                 FROM private_messages pm
                 JOIN users sender ON pm.sender_pk = sender.pk
                 JOIN users recipient ON pm.recipient_pk = recipient.pk
-                WHERE pm.conversation_id = $1 {status_filter}
-                ORDER BY pm.sent_at DESC
-                LIMIT $2 OFFSET $3
+                WHERE pm.conversation_id = $1 {status_filter} {cursor_filter}
+                {MESSAGE_ORDER.order_by()}
+                LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
             """
 
-            async with get_db_connection() as connection:
-                records = await connection.fetch(query, conversation_id, limit, offset)
+            async with get_db_read_connection() as connection:
+                records = await connection.fetch(query, *params, limit, offset)
 
                 # Get total count
                 count_query = f"""
@@ -149,11 +169,19 @@ class PrivateMessageRepository(BaseRepository[PrivateMessage]):
                 for record in records
             ]
 
+            if cursor is not None:
+                has_more = len(messages) >= limit
+            else:
+                has_more = (offset + len(messages)) < int(total_count)
+
             return MessageThread(
                 conversation_id=conversation_id,
                 messages=messages,
                 total_count=int(total_count),
-                has_more=(offset + len(messages)) < int(total_count),
+                has_more=has_more,
+                next_cursor=(
+                    MESSAGE_ORDER.next_cursor(messages, limit) if has_more else None
+                ),
                 other_user_pk=other_user_pk,
                 other_user_username=other_user["username"],
                 other_user_display_name=other_user["display_name"],
@@ -166,11 +194,22 @@ class PrivateMessageRepository(BaseRepository[PrivateMessage]):
             return None
 
     async def get_user_conversations(
-        self, user_pk: UUID, limit: int = 20, offset: int = 0
+        self,
+        user_pk: UUID,
+        limit: int = 20,
+        offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[ConversationSummary]:
         """Get list of conversations for a user."""
         try:
-            query = """
+            params: list = [user_pk]
+            cursor_filter = ""
+            if cursor is not None:
+                cursor_filter = "WHERE " + CONVERSATION_ORDER.apply("", params, cursor)
+                offset = 0
+
+            query = f"""
                 WITH latest_messages AS (
                     SELECT DISTINCT ON (pm.conversation_id)
                         pm.conversation_id,
@@ -219,12 +258,13 @@ class PrivateMessageRepository(BaseRepository[PrivateMessage]):
                 JOIN users u ON lm.other_user_pk = u.pk
                 LEFT JOIN unread_counts uc ON lm.conversation_id = uc.conversation_id
                 JOIN total_counts tc ON lm.conversation_id = tc.conversation_id
-                ORDER BY lm.last_message_sent_at DESC
-                LIMIT $2 OFFSET $3
+                {cursor_filter}
+                {CONVERSATION_ORDER.order_by()}
+                LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
             """
 
-            async with get_db_connection() as connection:
-                records = await connection.fetch(query, user_pk, limit, offset)
+            async with get_db_read_connection() as connection:
+                records = await connection.fetch(query, *params, limit, offset)
             return [ConversationSummary.model_validate(record) for record in records]
 
         except Exception:
@@ -0,0 +1,39 @@
+"""Batched row-to-model conversion for The Robot Overlord API.
+
+Calling ``Model.model_validate`` once per row pays the Python-to-pydantic-core
+call overhead on every row of a page. ``ModelRows`` compiles a
+``TypeAdapter(list[Model])`` once per model and validates a whole page in a
+single core call instead.
+
+``model_construct`` is deliberately not used: it skips validation but runs
+in Python, and measured 2-3x slower than compiled validation for ``Post``,
+``TopicSummary`` and ``LeaderboardEntry`` pages (see
+``tests/test_database/test_repositories/test_rows.py``).
+"""
+
+from collections.abc import Iterable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import Any
+from typing import cast
+
+from asyncpg import Record
+from pydantic import BaseModel
+from pydantic import TypeAdapter
+
+
+class ModelRows[M: BaseModel]:
+    """Compiled converter from query rows to ``M`` instances."""
+
+    def __init__(self, model: type[M]):
+        self.model = model
+        # ``list[model]`` is built at runtime; type checkers only see ``list[M]``.
+        self._adapter: TypeAdapter[list[M]] = TypeAdapter(cast("Any", list)[model])
+
+    def one(self, row: Mapping[str, Any]) -> M:
+        """Build one model from a record or mapping."""
+        return self.model.model_validate(dict(row))
+
+    def many(self, rows: Iterable[Mapping[str, Any]] | Sequence[Record]) -> list[M]:
+        """Build a list of models from records or mappings in one call."""
+        return self._adapter.validate_python([dict(row) for row in rows])
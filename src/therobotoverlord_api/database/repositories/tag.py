@@ -46,6 +46,35 @@ class TagRepository(BaseRepository[Tag]):
             record = await connection.fetchrow(query, name)
             return self._record_to_model(record) if record else None
 
+    async def get_or_create_by_names(self, names: list[str]) -> list[Tag]:
+        """Get tags by name, creating any that are missing, in input order."""
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return []
+
+        now = datetime.now(UTC)
+        await self.upsert_many(
+            [
+                {
+                    "name": name,
+                    "description": f"Auto-created tag for '{name}'",
+                    "created_at": now,
+                }
+                for name in unique_names
+            ],
+            conflict_columns=["name"],
+        )
+
+        query = "SELECT * FROM tags WHERE name = ANY($1::text[])"
+
+        async with get_db_connection() as connection:
+            records = await connection.fetch(query, unique_names)
+
+        tags_by_name = {
+            record["name"]: self._record_to_model(record) for record in records
+        }
+        return [tags_by_name[name] for name in unique_names if name in tags_by_name]
+
     async def search_tags(
         self, search_term: str, limit: int = 50, offset: int = 0
     ) -> list[Tag]:
@@ -122,6 +151,22 @@ class TopicTagRepository(BaseRepository[TopicTag]):
         data["created_at"] = datetime.now(UTC)
         return await self.create_from_dict(data)
 
+    async def assign_many(self, topic_pk: UUID, tag_pks: list[UUID]) -> list[TopicTag]:
+        """Assign many tags to a topic, skipping ones already assigned."""
+        now = datetime.now(UTC)
+        return await self.upsert_many(
+            [
+                {
+                    "topic_pk": topic_pk,
+                    "tag_pk": tag_pk,
+                    "assigned_at": now,
+                    "created_at": now,
+                }
+                for tag_pk in dict.fromkeys(tag_pks)
+            ],
+            conflict_columns=["topic_pk", "tag_pk"],
+        )
+
     async def get_tags_for_topic(self, topic_pk: UUID) -> list[TopicTagWithDetails]:
         """Get all tags for a specific topic with details."""
         query = """
@@ -8,6 +8,7 @@ from uuid import UUID
 from asyncpg import Record
 
 from therobotoverlord_api.database.connection import get_db_connection
+from therobotoverlord_api.database.connection import get_db_read_connection
 from therobotoverlord_api.database.models.base import TopicStatus
 from therobotoverlord_api.database.models.topic import Topic
 from therobotoverlord_api.database.models.topic import TopicCreate
@@ -15,6 +16,17 @@ from therobotoverlord_api.database.models.topic import TopicSummary
 from therobotoverlord_api.database.models.topic import TopicUpdate
 from therobotoverlord_api.database.models.topic import TopicWithAuthor
 from therobotoverlord_api.database.repositories.base import BaseRepository
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.pagination import KeysetOrder
+from therobotoverlord_api.database.repositories.rows import ModelRows
+
+# Newest first, primary key as tiebreaker for topics created in the same instant
+NEWEST_FIRST = KeysetOrder.by(
+    ("t.created_at", "created_at", True, datetime),
+    ("t.pk", "pk", True, UUID),
+)
+
+TOPIC_SUMMARY_ROWS = ModelRows(TopicSummary)
 
 
 class TopicRepository(BaseRepository[Topic]):
@@ -54,7 +66,12 @@ class TopicRepository(BaseRepository[Topic]):
             return [self._record_to_model(record) for record in records]
 
     async def get_approved_topics(
-        self, limit: int = 100, offset: int = 0, tag_names: list[str] | None = None
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        tag_names: list[str] | None = None,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[TopicSummary]:
         """Get approved topics with summary information."""
         base_query = """
@@ -104,19 +121,28 @@ class TopicRepository(BaseRepository[Topic]):
             params.append(tag_names)
             param_count += 1
 
+        if cursor is not None:
+            predicate, cursor_params = NEWEST_FIRST.predicate(cursor, param_count + 1)
+            base_query += f"""
+                AND {predicate}
+            """
+            params.extend(cursor_params)
+            param_count += len(cursor_params)
+            offset = 0
+
         query = (
             base_query
             + f"""
-            ORDER BY t.created_at DESC
+            {NEWEST_FIRST.order_by()}
             LIMIT ${param_count + 1} OFFSET ${param_count + 2}
         """
         )
 
         params.extend([limit, offset])
 
-        async with get_db_connection() as connection:
+        async with get_db_read_connection() as connection:
             records = await connection.fetch(query, *params)
-            return [TopicSummary.model_validate(dict(record)) for record in records]
+            return TOPIC_SUMMARY_ROWS.many(records)
 
     async def get_with_author(self, pk: UUID) -> TopicWithAuthor | None:
         """Get topic with author information."""
@@ -167,10 +193,21 @@ class TopicRepository(BaseRepository[Topic]):
             return [self._record_to_model(record) for record in records]
 
     async def search_topics(
-        self, search_term: str, limit: int = 100, offset: int = 0
+        self,
+        search_term: str,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[TopicSummary]:
         """Search topics by title, description, and tags."""
-        query = """
+        params: list[Any] = [f"%{search_term}%"]
+        cursor_filter = ""
+        if cursor is not None:
+            cursor_filter = "AND " + NEWEST_FIRST.apply("", params, cursor)
+            offset = 0
+
+        query = f"""
             SELECT
                 t.pk,
                 t.title,
@@ -180,7 +217,7 @@ class TopicRepository(BaseRepository[Topic]):
                 t.created_at,
                 u.username as author_username,
                 COALESCE(p.post_count, 0) as post_count,
-                COALESCE(tag_names.tags, '{}') as tags
+                COALESCE(tag_names.tags, '{{}}') as tags
             FROM topics t
             LEFT JOIN users u ON t.author_pk = u.pk
             LEFT JOIN (
@@ -208,15 +245,16 @@ class TopicRepository(BaseRepository[Topic]):
                     AND tg2.name ILIKE $1
                 )
             )
-            ORDER BY t.created_at DESC
-            LIMIT $2 OFFSET $3
+            {cursor_filter}
+            {NEWEST_FIRST.order_by()}
+            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
         """
 
-        search_pattern = f"%{search_term}%"
+        params.extend([limit, offset])
 
         async with get_db_connection() as connection:
-            records = await connection.fetch(query, search_pattern, limit, offset)
-            return [TopicSummary.model_validate(dict(record)) for record in records]
+            records = await connection.fetch(query, *params)
+            return TOPIC_SUMMARY_ROWS.many(records)
 
     async def approve_topic(self, pk: UUID, approved_by: UUID) -> Topic | None:
         """Approve a topic."""
@@ -238,10 +276,20 @@ class TopicRepository(BaseRepository[Topic]):
         return await self.count("status = $1", [status.value])
 
     async def get_overlord_topics(
-        self, limit: int = 100, offset: int = 0
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[TopicSummary]:
         """Get topics created by the Overlord."""
-        query = """
+        where_clause = "t.created_by_overlord = true AND t.status = 'approved'"
+        params: list[Any] = []
+        if cursor is not None:
+            where_clause = NEWEST_FIRST.apply(where_clause, params, cursor)
+            offset = 0
+
+        query = f"""
             SELECT
                 t.pk,
                 t.title,
@@ -251,7 +299,7 @@ class TopicRepository(BaseRepository[Topic]):
                 t.created_at,
                 'The Overlord' as author_username,
                 COALESCE(p.post_count, 0) as post_count,
-                COALESCE(tag_names.tags, '{}') as tags
+                COALESCE(tag_names.tags, '{{}}') as tags
             FROM topics t
             LEFT JOIN (
                 SELECT topic_pk, COUNT(*) as post_count
@@ -267,15 +315,16 @@ class TopicRepository(BaseRepository[Topic]):
                 JOIN tags tg ON tt.tag_pk = tg.pk
                 GROUP BY tt.topic_pk
             ) tag_names ON t.pk = tag_names.topic_pk
-            WHERE t.created_by_overlord = true
-            AND t.status = 'approved'
-            ORDER BY t.created_at DESC
-            LIMIT $1 OFFSET $2
+            WHERE {where_clause}
+            {NEWEST_FIRST.order_by()}
+            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
         """
 
+        params.extend([limit, offset])
+
         async with get_db_connection() as connection:
-            records = await connection.fetch(query, limit, offset)
-            return [TopicSummary.model_validate(dict(record)) for record in records]
+            records = await connection.fetch(query, *params)
+            return TOPIC_SUMMARY_ROWS.many(records)
 
     async def get_related_topics(
         self, topic_pk: UUID, limit: int = 5
@@ -323,7 +372,7 @@ class TopicRepository(BaseRepository[Topic]):
 
         async with get_db_connection() as connection:
             records = await connection.fetch(query, topic_pk, limit)
-            return [TopicSummary.model_validate(dict(record)) for record in records]
+            return TOPIC_SUMMARY_ROWS.many(records)
 
     async def get_all_categories(self) -> list[str]:
         """Get all unique topic categories/tags."""
@@ -384,7 +433,12 @@ class TopicRepository(BaseRepository[Topic]):
             return categories
 
     async def get_topics_feed(
-        self, limit: int = 20, offset: int = 0, tag_names: list[str] | None = None
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        tag_names: list[str] | None = None,
+        *,
+        cursor: KeysetCursor | None = None,
     ) -> list[TopicSummary]:
         """Get topics feed for visitor mode."""
         # Use the same query structure as get_approved_topics which works
@@ -434,19 +488,28 @@ class TopicRepository(BaseRepository[Topic]):
             params.append(tag_names)
             param_count += 1
 
+        if cursor is not None:
+            predicate, cursor_params = NEWEST_FIRST.predicate(cursor, param_count + 1)
+            base_query += f"""
+                AND {predicate}
+            """
+            params.extend(cursor_params)
+            param_count += len(cursor_params)
+            offset = 0
+
         query = (
             base_query
             + f"""
-            ORDER BY t.created_at DESC
+            {NEWEST_FIRST.order_by()}
             LIMIT ${param_count + 1} OFFSET ${param_count + 2}
         """
         )
 
         params.extend([limit, offset])
 
-        async with get_db_connection() as connection:
+        async with get_db_read_connection() as connection:
             records = await connection.fetch(query, *params)
-            return [TopicSummary.model_validate(dict(record)) for record in records]
+            return TOPIC_SUMMARY_ROWS.many(records)
 
     async def get_trending_topics(self, limit: int = 20) -> list[TopicSummary]:
         """Get trending topics based on recent post activity."""
@@ -489,9 +552,9 @@ class TopicRepository(BaseRepository[Topic]):
             LIMIT $1
         """
 
-        async with get_db_connection() as connection:
+        async with get_db_read_connection() as connection:
             records = await connection.fetch(query, limit)
-            return [TopicSummary.model_validate(dict(record)) for record in records]
+            return TOPIC_SUMMARY_ROWS.many(records)
 
     async def get_popular_topics(self, limit: int = 20) -> list[TopicSummary]:
         """Get popular topics based on total post count."""
@@ -527,9 +590,9 @@ class TopicRepository(BaseRepository[Topic]):
             LIMIT $1
         """
 
-        async with get_db_connection() as connection:
+        async with get_db_read_connection() as connection:
             records = await connection.fetch(query, limit)
-            return [TopicSummary.model_validate(dict(record)) for record in records]
+            return TOPIC_SUMMARY_ROWS.many(records)
 
     async def get_featured_topics(self, limit: int = 10) -> list[TopicSummary]:
         """Get featured topics (Overlord topics and highly active topics)."""
@@ -568,6 +631,6 @@ class TopicRepository(BaseRepository[Topic]):
             LIMIT $1
         """
 
-        async with get_db_connection() as connection:
+        async with get_db_read_connection() as connection:
             records = await connection.fetch(query, limit)
-            return [TopicSummary.model_validate(dict(record)) for record in records]
+            return TOPIC_SUMMARY_ROWS.many(records)
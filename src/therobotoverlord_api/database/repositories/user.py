@@ -4,8 +4,10 @@ from uuid import UUID
 
 from asyncpg import Record
 
+from therobotoverlord_api.auth.principal_cache import principal_cache
 from therobotoverlord_api.database.connection import get_db_connection
 from therobotoverlord_api.database.models.user import User
+from therobotoverlord_api.database.models.user import UserAuthSummary
 from therobotoverlord_api.database.models.user import UserCreate
 from therobotoverlord_api.database.models.user import UserLeaderboard
 from therobotoverlord_api.database.models.user import UserProfile
@@ -31,7 +33,14 @@ class UserRepository(BaseRepository[User]):
     async def update_user(self, user_pk: UUID, user_data: UserUpdate) -> User | None:
         """Update an existing user."""
         data = user_data.model_dump(exclude_unset=True)
-        return await self.update_from_dict(user_pk, data)
+        user = await self.update_from_dict(user_pk, data)
+        # Bans, role changes and sanctions must reach every API process
+        await principal_cache.invalidate(user_pk)
+        return user
+
+    async def get_auth_summary(self, user_pk: UUID) -> UserAuthSummary | None:
+        """Get only the columns needed to authenticate a user."""
+        return await self.get_summary_by_pk(user_pk, UserAuthSummary)
 
     async def get_by_google_id(self, google_id: str) -> User | None:
         """Get user by Google ID."""
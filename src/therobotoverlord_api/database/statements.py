@@ -0,0 +1,248 @@
+"""Registry of named, pre-built SQL statements for The Robot Overlord API.
+
+asyncpg keeps a per-connection LRU cache of prepared statements keyed by the
+exact query text. Hot queries registered here are built once, so every call
+sends byte-identical SQL, and are prepared on each new pooled connection so
+they never pay for parsing and planning on the request path.
+"""
+
+import logging
+
+from typing import Any
+
+from asyncpg import Connection
+from asyncpg import PostgresError
+from asyncpg import Record
+
+logger = logging.getLogger(__name__)
+
+_READ_ONLY_PREFIXES = ("SELECT", "WITH")
+
+
+class StatementRegistry:
+    """Named statements shared by repositories, services and workers."""
+
+    def __init__(self):
+        self._statements: dict[str, str] = {}
+        self._names_by_query: dict[str, str] = {}
+        self._hits = 0
+        self._misses = 0
+        self._prepared = 0
+        self._prepare_failures = 0
+        self._failed_names: set[str] = set()
+
+    def register(self, name: str, query: str) -> str:
+        """Register a statement and return its canonical query text.
+
+        Registering the same name again is a no-op as long as the SQL is
+        unchanged, so statements can be registered where they are defined.
+        """
+        query = query.strip()
+        existing = self._statements.get(name)
+        if existing is not None:
+            if existing != query:
+                raise ValueError(f"Statement {name!r} is already registered")
+            return existing
+
+        self._statements[name] = query
+        self._names_by_query[query] = name
+        return query
+
+    def register_for_table(self, table: str, action: str, template: str) -> str:
+        """Register ``template`` for one table as ``<table>.<action>``.
+
+        ``template`` references the table as ``{table}``. Returns the statement
+        name, registering it on first use so callers can pass any table.
+        """
+        name = f"{table}.{action}"
+        if name not in self._statements:
+            self.register(name, template.format(table=table))
+        return name
+
+    def query(self, name: str) -> str:
+        """Get the query text of a registered statement."""
+        try:
+            return self._statements[name]
+        except KeyError:
+            raise ValueError(f"Unknown statement: {name}") from None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._statements
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    async def prepare_all(self, connection: Connection, *, read_only=False) -> int:
+        """Prepare every registered statement into the connection's cache.
+
+        Used as the pool ``init`` hook. With ``read_only`` only SELECT
+        statements are prepared, for replica connections. A statement that
+        fails to prepare (e.g. before migrations have run) is logged and
+        skipped; it will simply be prepared on first use instead.
+        """
+        prepared = 0
+        for name, query in self._statements.items():
+            if read_only and not query.upper().startswith(_READ_ONLY_PREFIXES):
+                continue
+            try:
+                if not await _statement_cache.prepare(connection, query):
+                    break
+            except PostgresError as e:
+                self._prepare_failures += 1
+                if name not in self._failed_names:
+                    self._failed_names.add(name)
+                    logger.warning(f"Could not prepare statement {name}: {e}")
+            else:
+                prepared += 1
+
+        self._prepared += prepared
+        return prepared
+
+    def record_use(self, connection: Connection, query: str) -> None:
+        """Count a cache hit or miss if ``query`` is a registered statement."""
+        if query not in self._names_by_query:
+            return
+
+        cached = _statement_cache.contains(connection, query)
+        if cached is None:
+            return
+        if cached:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+    async def fetch(self, connection: Connection, name: str, *args) -> list[Record]:
+        """Run a registered statement and return all rows."""
+        query = self.query(name)
+        self.record_use(connection, query)
+        return await connection.fetch(query, *args)
+
+    async def fetchrow(self, connection: Connection, name: str, *args) -> Record | None:
+        """Run a registered statement and return the first row."""
+        query = self.query(name)
+        self.record_use(connection, query)
+        return await connection.fetchrow(query, *args)
+
+    async def fetchval(self, connection: Connection, name: str, *args) -> Any:
+        """Run a registered statement and return a single value."""
+        query = self.query(name)
+        self.record_use(connection, query)
+        return await connection.fetchval(query, *args)
+
+    async def execute(self, connection: Connection, name: str, *args) -> str:
+        """Run a registered statement and return its status."""
+        query = self.query(name)
+        self.record_use(connection, query)
+        return await connection.execute(query, *args)
+
+    def stats(self) -> dict[str, Any]:
+        """Get statement-cache hit rate for registered statements."""
+        lookups = self._hits + self._misses
+        return {
+            "registered": len(self._statements),
+            "prepared": self._prepared,
+            "prepare_failures": self._prepare_failures,
+            "cache_hits": self._hits,
+            "cache_misses": self._misses,
+            "cache_hit_rate": round(self._hits / lookups, 4) if lookups else None,
+        }
+
+    def reset_stats(self) -> None:
+        """Clear the hit/miss and prepare counters."""
+        self._hits = 0
+        self._misses = 0
+        self._prepared = 0
+        self._prepare_failures = 0
+
+
+class _AsyncpgStatementCache:
+    """The only access to asyncpg's private prepared statement cache.
+
+    asyncpg has no public way to prepare into, or look up, the cache that
+    ``fetch()`` and ``execute()`` consult. If its internals change, warm-up
+    and hit counting switch off and statements are prepared on first use as
+    plain queries.
+    """
+
+    def __init__(self):
+        self.available = True
+
+    def _disable(self, error: Exception) -> None:
+        self.available = False
+        logger.warning(f"asyncpg statement cache unavailable, not preparing: {error}")
+
+    async def prepare(self, connection: Connection, query: str) -> bool:
+        """Prepare ``query`` into the connection's cache, False if unavailable."""
+        if not self.available:
+            return False
+        try:
+            await connection._prepare(query, use_cache=True)
+        except (AttributeError, TypeError) as e:
+            self._disable(e)
+            return False
+        return True
+
+    def contains(self, connection: Connection, query: str) -> bool | None:
+        """Check the connection's cache for ``query``.
+
+        Returns None when that cannot be told, e.g. for test doubles or a
+        closed connection, so the call is not counted either way.
+        """
+        # Pool connection proxies pass this check too
+        if not self.available or not isinstance(connection, Connection):
+            return None
+
+        protocol = connection._protocol
+        if protocol is None:
+            return None
+        try:
+            # Same key asyncpg uses: (query, record class, ignore_custom_codec)
+            key = (query, protocol.get_record_class(), False)
+            return connection._stmt_cache.has(key)
+        except (AttributeError, TypeError) as e:
+            self._disable(e)
+            return None
+
+
+_statement_cache = _AsyncpgStatementCache()
+
+# Fixed-shape statements run against every queue table, so each call sends
+# the same SQL text and is prepared on every pooled connection
+QUEUE_STATEMENTS = {
+    "get_item": "SELECT * FROM {table} WHERE pk = $1",
+    "set_status": "UPDATE {table} SET status = $2 WHERE pk = $1",
+    "set_status_and_worker": (
+        "UPDATE {table} SET status = $2, worker_id = $3 WHERE pk = $1"
+    ),
+    "get_retry_count": "SELECT COALESCE(retry_count, 0) FROM {table} WHERE pk = $1",
+    "increment_retry_count": (
+        "UPDATE {table} SET retry_count = COALESCE(retry_count, 0) + 1 WHERE pk = $1"
+    ),
+    "next_position": """
+        SELECT COALESCE(MAX(position_in_queue), 0) + 1 as next_position
+        FROM {table}
+    """,
+    "pending_count": """
+        SELECT COUNT(*) as pending_count
+        FROM {table}
+        WHERE status = 'pending'
+    """,
+    "avg_processing_time": """
+        SELECT AVG(EXTRACT(EPOCH FROM (updated_at - worker_assigned_at))) as avg_time
+        FROM {table}
+        WHERE status = 'completed'
+        AND worker_assigned_at IS NOT NULL
+        AND updated_at > NOW() - INTERVAL '1 hour'
+    """,
+}
+
+
+# Global statement registry
+statement_registry = StatementRegistry()
+
+
+def queue_statement(queue_table: str, action: str) -> str:
+    """Get the registered statement name for ``action`` on ``queue_table``."""
+    return statement_registry.register_for_table(
+        queue_table, action, QUEUE_STATEMENTS[action]
+    )
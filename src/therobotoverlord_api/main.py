@@ -18,6 +18,7 @@ from therobotoverlord_api.api.flags import router as flags_router
 from therobotoverlord_api.api.leaderboard import router as leaderboard_router
 from therobotoverlord_api.api.loyalty_score import router as loyalty_router
 from therobotoverlord_api.api.messages import router as messages_router
+from therobotoverlord_api.api.pagination import NEXT_CURSOR_HEADER
 from therobotoverlord_api.api.posts import router as posts_router
 from therobotoverlord_api.api.queue import router as queue_router
 from therobotoverlord_api.api.rbac import router as rbac_router
@@ -28,10 +29,14 @@ from therobotoverlord_api.api.translations import router as translations_router
 from therobotoverlord_api.api.users import router as users_router
 from therobotoverlord_api.api.websocket import router as websocket_router
 from therobotoverlord_api.auth.dependencies import get_optional_user
+from therobotoverlord_api.auth.principal_cache import principal_cache
 from therobotoverlord_api.database.connection import close_database
 from therobotoverlord_api.database.connection import db
 from therobotoverlord_api.database.connection import init_database
+from therobotoverlord_api.database.instrumentation import query_metrics
+from therobotoverlord_api.database.middleware import RequestConnectionMiddleware
 from therobotoverlord_api.database.models.user import User
+from therobotoverlord_api.services.namespaced_cache import local_cache
 
 
 @asynccontextmanager
@@ -39,8 +44,12 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     await init_database()
+    await principal_cache.start_listener()
+    await local_cache.start_listener()
     yield
     # Shutdown
+    await local_cache.stop_listener()
+    await principal_cache.stop_listener()
     await close_database()
 
 
@@ -53,6 +62,9 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Share one pooled connection per request across all repositories
+    app.add_middleware(RequestConnectionMiddleware)
+
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -60,6 +72,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
     # Include routers
@@ -96,6 +109,7 @@ def create_app() -> FastAPI:
             "database": {
                 "healthy": db_healthy,
                 "pool": pool_stats,
+                "queries": query_metrics.summary(),
             },
         }
 
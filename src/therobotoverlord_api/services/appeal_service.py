@@ -28,10 +28,14 @@ from therobotoverlord_api.database.models.appeal_with_editing import (
     AppealUpdateWithRestoration,
 )
 from therobotoverlord_api.database.models.base import ContentType
+from therobotoverlord_api.database.repositories.appeal import QUEUE_PRIORITY_ORDER
+from therobotoverlord_api.database.repositories.appeal import USER_APPEALS_ORDER
 from therobotoverlord_api.database.repositories.appeal import AppealRepository
 from therobotoverlord_api.database.repositories.appeal_history_repository import (
     AppealHistoryRepository,
 )
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.pagination import KeysetOrder
 from therobotoverlord_api.services.content_restoration_service import (
     ContentRestorationService,
 )
@@ -129,23 +133,22 @@ class AppealService:
         status: AppealStatus | None = None,
         page: int = 1,
         page_size: int = 20,
+        cursor: KeysetCursor | None = None,
     ) -> AppealResponse:
-        """Get paginated appeals for a user."""
+        """Get paginated appeals for a user.
+
+        With a ``cursor`` the page starts right after it and ``page`` is ignored.
+        """
         offset = (page - 1) * page_size
 
         appeals = await self.appeal_repository.get_user_appeals(
-            user_pk, status, page_size, offset
+            user_pk, status, page_size, offset, cursor=cursor
         )
 
         total_count = await self.appeal_repository.count_user_appeals(user_pk, status)
 
-        return AppealResponse(
-            appeals=appeals,
-            total_count=total_count,
-            page=page,
-            page_size=page_size,
-            has_next=offset + page_size < total_count,
-            has_previous=page > 1,
+        return self._build_appeal_response(
+            appeals, total_count, page, page_size, USER_APPEALS_ORDER, cursor
         )
 
     async def withdraw_appeal(self, appeal_pk: UUID, user_pk: UUID) -> tuple[bool, str]:
@@ -187,24 +190,54 @@ class AppealService:
         status: AppealStatus = AppealStatus.PENDING,
         page: int = 1,
         page_size: int = 50,
+        cursor: KeysetCursor | None = None,
     ) -> AppealResponse:
-        """Get appeals queue for moderators."""
+        """Get appeals queue for moderators.
+
+        With a ``cursor`` the page starts right after it and ``page`` is ignored.
+        """
         offset = (page - 1) * page_size
 
         appeals = await self.appeal_repository.get_appeals_queue(
-            status, priority_order=True, limit=page_size, offset=offset
+            status,
+            priority_order=True,
+            limit=page_size,
+            offset=offset,
+            cursor=cursor,
         )
 
         # Count total appeals with this status
         total_count = await self.appeal_repository.count("status = $1", [status.value])
 
+        return self._build_appeal_response(
+            appeals, total_count, page, page_size, QUEUE_PRIORITY_ORDER, cursor
+        )
+
+    def _build_appeal_response(
+        self,
+        appeals: list[AppealWithContent],
+        total_count: int,
+        page: int,
+        page_size: int,
+        order: KeysetOrder,
+        cursor: KeysetCursor | None,
+    ) -> AppealResponse:
+        """Build a paginated appeal response for offset or cursor paging."""
+        if cursor is not None:
+            has_next = len(appeals) >= page_size
+            has_previous = True
+        else:
+            has_next = (page - 1) * page_size + page_size < total_count
+            has_previous = page > 1
+
         return AppealResponse(
             appeals=appeals,
             total_count=total_count,
             page=page,
             page_size=page_size,
-            has_next=offset + page_size < total_count,
-            has_previous=page > 1,
+            has_next=has_next,
+            has_previous=has_previous,
+            next_cursor=order.next_cursor(appeals, page_size) if has_next else None,
         )
 
     async def assign_appeal_for_review(
@@ -4,6 +4,8 @@ import logging
 
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from therobotoverlord_api.database.connection import get_db_connection
 from therobotoverlord_api.database.models.badge import Badge
 from therobotoverlord_api.database.models.badge import BadgeEligibilityCheck
@@ -12,11 +14,21 @@ from therobotoverlord_api.database.models.badge import UserBadgeCreate
 from therobotoverlord_api.database.models.badge import UserBadgeWithDetails
 from therobotoverlord_api.database.repositories.badge import BadgeRepository
 from therobotoverlord_api.database.repositories.badge import UserBadgeRepository
+from therobotoverlord_api.services.namespaced_cache import get_namespaced_cache
+from therobotoverlord_api.services.namespaced_cache import invalidate_namespaces
 from therobotoverlord_api.websocket.events import get_event_broadcaster
 from therobotoverlord_api.websocket.manager import WebSocketManager
+from therobotoverlord_api.workers.redis_connection import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Badge definitions, cached whole; changed only by badge management below
+BADGES_NAMESPACE = "badges"
+BADGES_TTL = 3600
+BADGES_LOCAL_TTL = 300
+
+_BADGES_ADAPTER = TypeAdapter(list[Badge])
+
 
 class BadgeService:
     """Service for managing badges and user badge awards."""
@@ -29,8 +41,19 @@ class BadgeService:
     async def get_all_badges(self, *, active_only: bool = True) -> list[Badge]:
         """Get all badges, optionally filtered by active status."""
         if active_only:
-            return await self.badge_repo.get_active_badges()
-        return await self.badge_repo.get_all()
+            key, load = "active", self.badge_repo.get_active_badges
+        else:
+            key, load = "all", self.badge_repo.get_all
+
+        cache = get_namespaced_cache(await get_redis_client())
+        return await cache.fetch(
+            BADGES_NAMESPACE,
+            key,
+            load,
+            _BADGES_ADAPTER,
+            ttl=BADGES_TTL,
+            local_ttl=BADGES_LOCAL_TTL,
+        )
 
     async def get_badge_by_id(self, badge_id: UUID) -> Badge | None:
         """Get a specific badge by ID."""
@@ -46,7 +69,9 @@ class BadgeService:
             badge_dict = badge_data.model_dump()
         else:
             badge_dict = badge_data
-        return await self.badge_repo.create_from_dict(badge_dict)
+        badge = await self.badge_repo.create_from_dict(badge_dict)
+        await invalidate_namespaces(BADGES_NAMESPACE)
+        return badge
 
     async def update_badge(self, badge_id: UUID, badge_data) -> Badge | None:
         """Update an existing badge."""
@@ -58,11 +83,14 @@ class BadgeService:
                 return await self.badge_repo.get_by_pk(badge_id)
         else:
             update_dict = badge_data
-        return await self.badge_repo.update_from_dict(badge_id, update_dict)
+        badge = await self.badge_repo.update_from_dict(badge_id, update_dict)
+        await invalidate_namespaces(BADGES_NAMESPACE)
+        return badge
 
     async def delete_badge(self, badge_id: UUID) -> bool:
         """Delete a badge (soft delete by setting is_active=False)."""
         result = await self.badge_repo.update_from_dict(badge_id, {"is_active": False})
+        await invalidate_namespaces(BADGES_NAMESPACE)
         return result is not None
 
     # User Badge Management
@@ -196,6 +224,7 @@ class BadgeService:
         try:
             badges = await self.badge_repo.get_active_badges()
             eligibility_checks = []
+            earned = []
 
             for badge in badges:
                 # Check if user already has this badge
@@ -210,37 +239,15 @@ class BadgeService:
                 # Only add eligible badges to the list
                 if criteria_met:
                     eligibility_checks.append(eligibility_check)
+                    earned.append(badge)
 
-                    # Award badge if criteria met
-                    try:
-                        user_badge_data = UserBadgeCreate(
-                            user_pk=user_id,
-                            badge_pk=badge.pk,
-                            awarded_by_event="auto_award",
-                        )
-                        await self.user_badge_repo.award_badge(
-                            user_badge_data.model_dump()
-                        )
-
-                        # Broadcast badge earned event
-                        if websocket_manager:
-                            try:
-                                broadcaster = get_event_broadcaster(websocket_manager)
-                                await broadcaster.broadcast_badge_earned(
-                                    user_id=user_id,
-                                    badge_id=badge.pk,
-                                    badge_name=badge.name,
-                                    badge_description=badge.description,
-                                    badge_icon=badge.image_url,
-                                )
-                            except Exception as ws_error:
-                                logger.warning(
-                                    f"Failed to broadcast badge earned event: {ws_error}"
-                                )
-                    except Exception as award_error:
-                        logger.error(
-                            f"Failed to award badge {badge.pk} to user {user_id}: {award_error}"
-                        )
+            # Award every badge whose criteria are met in one statement
+            try:
+                await self._award_badges(
+                    user_id, earned, websocket_manager, awarded_by_event="auto_award"
+                )
+            except Exception as award_error:
+                logger.error(f"Failed to award badges to user {user_id}: {award_error}")
 
             return eligibility_checks
 
@@ -264,6 +271,7 @@ class BadgeService:
             # Get all active badges
             badges = await self.badge_repo.get_active_badges()
 
+            earned = []
             for badge in badges:
                 # Skip if user already has this badge
                 if await self.user_badge_repo.has_badge(user_id, badge.pk):
@@ -273,54 +281,72 @@ class BadgeService:
                 if await self._should_award_badge_for_outcome(
                     user_id, badge, content_type, outcome, rejection_reason
                 ):
-                    user_badge_data = UserBadgeCreate(
-                        user_pk=user_id,
-                        badge_pk=badge.pk,
-                        awarded_for_post_pk=content_id
-                        if content_type == "post"
-                        else None,
-                        awarded_for_topic_pk=content_id
-                        if content_type == "topic"
-                        else None,
-                        awarded_by_event=f"moderation_{outcome}",
-                    )
-
-                    try:
-                        user_badge = await self.user_badge_repo.create_from_dict(
-                            user_badge_data.model_dump()
-                        )
-                        awarded_badges.append(user_badge)
-
-                        # Send WebSocket notification
-                        if websocket_manager:
-                            try:
-                                broadcaster = get_event_broadcaster(websocket_manager)
-                                await broadcaster.broadcast_badge_earned(
-                                    user_id=user_id,
-                                    badge_id=badge.pk,
-                                    badge_name=badge.name,
-                                    badge_description=badge.description,
-                                    badge_icon=badge.image_url,
-                                )
-                            except Exception as ws_error:
-                                logger.warning(
-                                    f"Failed to broadcast badge earned: {ws_error}"
-                                )
+                    earned.append(badge)
 
-                        logger.info(
-                            f"Awarded badge '{badge.name}' to user {user_id} for {outcome} {content_type}"
-                        )
+            try:
+                awarded_badges = await self._award_badges(
+                    user_id,
+                    earned,
+                    websocket_manager,
+                    awarded_for_post_pk=content_id if content_type == "post" else None,
+                    awarded_for_topic_pk=content_id
+                    if content_type == "topic"
+                    else None,
+                    awarded_by_event=f"moderation_{outcome}",
+                )
+                if awarded_badges:
+                    logger.info(
+                        f"Awarded {len(awarded_badges)} badges to user {user_id} for {outcome} {content_type}"
+                    )
 
-                    except Exception as award_error:
-                        logger.error(
-                            f"Failed to award badge {badge.pk} to user {user_id}: {award_error}"
-                        )
+            except Exception as award_error:
+                logger.error(f"Failed to award badges to user {user_id}: {award_error}")
 
         except Exception as e:
             logger.error(f"Error processing moderation outcome for user {user_id}: {e}")
 
         return awarded_badges
 
+    async def _award_badges(
+        self,
+        user_id: UUID,
+        badges: list[Badge],
+        websocket_manager: WebSocketManager | None,
+        **award_fields,
+    ) -> list[UserBadge]:
+        """Award several badges in one statement and announce each new award."""
+        if not badges:
+            return []
+
+        awarded = await self.user_badge_repo.award_badges(
+            [
+                UserBadgeCreate(
+                    user_pk=user_id, badge_pk=badge.pk, **award_fields
+                ).model_dump()
+                for badge in badges
+            ]
+        )
+
+        if websocket_manager:
+            badges_by_pk = {badge.pk: badge for badge in badges}
+            broadcaster = get_event_broadcaster(websocket_manager)
+            for user_badge in awarded:
+                badge = badges_by_pk[user_badge.badge_pk]
+                try:
+                    await broadcaster.broadcast_badge_earned(
+                        user_id=user_id,
+                        badge_id=badge.pk,
+                        badge_name=badge.name,
+                        badge_description=badge.description,
+                        badge_icon=badge.image_url,
+                    )
+                except Exception as ws_error:
+                    logger.warning(
+                        f"Failed to broadcast badge earned event: {ws_error}"
+                    )
+
+        return awarded
+
     async def _should_award_badge_for_outcome(
         self,
         user_id: UUID,
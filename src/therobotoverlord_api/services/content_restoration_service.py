@@ -27,6 +27,7 @@ from therobotoverlord_api.database.repositories.topic import TopicRepository
 from therobotoverlord_api.services.content_versioning_service import (
     ContentVersioningService,
 )
+from therobotoverlord_api.services.tag_service import invalidate_topic_categories
 
 
 class ContentNotFoundError(Exception):
@@ -222,6 +223,7 @@ class ContentRestorationService:
         )
 
         restored_topic = await self.topic_repository.update(topic_pk, update_data)
+        await invalidate_topic_categories()
         return restored_topic is not None
 
     async def _restore_message_with_data(
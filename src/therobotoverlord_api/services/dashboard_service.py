@@ -24,6 +24,8 @@ from therobotoverlord_api.database.models.system_announcement import SystemAnnou
 from therobotoverlord_api.database.repositories.admin_action import (
     AdminActionRepository,
 )
+from therobotoverlord_api.database.repositories.base import DEFAULT_KEYSET_ORDER
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
 from therobotoverlord_api.database.repositories.system_announcement import (
     SystemAnnouncementRepository,
 )
@@ -278,10 +280,15 @@ class DashboardService:
             return await self.announcement_repository.get_active_announcements()
         return await self.announcement_repository.get_all()
 
-    async def get_audit_log(self, limit: int = 50, offset: int = 0) -> dict[str, Any]:
+    async def get_audit_log(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: KeysetCursor | None = None,
+    ) -> dict[str, Any]:
         """Get admin action audit log."""
         actions = await self.admin_action_repository.get_recent_actions(
-            limit=limit, offset=offset
+            limit=limit, offset=offset, cursor=cursor
         )
         total_count = await self.admin_action_repository.get_actions_count()
 
@@ -290,4 +297,5 @@ class DashboardService:
             "total_count": total_count,
             "limit": limit,
             "offset": offset,
+            "next_cursor": DEFAULT_KEYSET_ORDER.next_cursor(actions, limit),
         }
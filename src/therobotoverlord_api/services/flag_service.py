@@ -20,6 +20,7 @@ from therobotoverlord_api.database.models.topic import TopicUpdate
 from therobotoverlord_api.database.repositories.flag import FlagRepository
 from therobotoverlord_api.database.repositories.post import PostRepository
 from therobotoverlord_api.database.repositories.topic import TopicRepository
+from therobotoverlord_api.services.tag_service import invalidate_topic_categories
 
 logger = logging.getLogger(__name__)
 
@@ -139,6 +140,7 @@ class FlagService:
                 await self.topic_repo.update(
                     flag.topic_pk, TopicUpdate(status=TopicStatus.REJECTED)
                 )
+                await invalidate_topic_categories()
             content_pk = flag.topic_pk
             content_type = ContentType.TOPIC
 
@@ -0,0 +1,204 @@
+"""Live leaderboard ranking index in a Redis sorted set.
+
+The ``leaderboard_rankings`` materialized view is only as fresh as its last
+refresh. This index keeps every ranked user's loyalty score in one sorted
+set, updated as each score changes, and answers rank, nearby users, top N
+and rank ranges in O(log n) plus the size of the answer. Users with equal
+scores are ordered by user ID rather than by approved post count as in the
+view. Percentile ranks follow ``PERCENT_RANK()``: the share of the other
+users with a strictly higher score.
+
+The index is built from the users table by :meth:`LeaderboardIndex.rebuild`
+and kept current by :meth:`LeaderboardIndex.update`, which does nothing
+until the first rebuild so a partial index is never served. Updates lost to
+a Redis outage or racing a rebuild are found by
+:meth:`LeaderboardIndex.compare`. Until the index exists, reads raise
+:class:`RankingIndexUnavailableError` and callers use the view instead.
+"""
+
+from collections.abc import Awaitable
+from collections.abc import Iterable
+from itertools import batched
+from typing import Any
+from typing import cast
+from uuid import UUID
+
+from therobotoverlord_api.database.models.leaderboard import RankedUser
+from therobotoverlord_api.database.models.leaderboard import RankingIndexCheck
+from therobotoverlord_api.workers.redis_connection import get_redis_client
+
+INDEX_KEY = "leaderboard:index"
+
+# Built here, then renamed over the index in one step
+_REBUILD_KEY = "leaderboard:index:rebuild"
+
+_BATCH_SIZE = 1000
+
+# KEYS[1]: ranking index
+# ARGV: member, score or "" to remove the member
+# Returns nil until the index has been built
+_UPDATE_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return false
+end
+if ARGV[2] == "" then
+    return redis.call("ZREM", KEYS[1], ARGV[1])
+end
+return redis.call("ZADD", KEYS[1], ARGV[2], ARGV[1])
+"""
+
+# KEYS[1]: ranking index
+# ARGV: anchor member or "", first and last offset from the anchor's position
+# (from the top without an anchor)
+# Returns nil until the index has been built and {} if the anchor is not
+# ranked, else {user count, first position, then member, score and number
+# of users with a higher score for each user in the range}
+_RANGE_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return false
+end
+local base = 0
+if ARGV[1] ~= "" then
+    base = redis.call("ZREVRANK", KEYS[1], ARGV[1])
+    if not base then
+        return {}
+    end
+end
+local first = math.max(0, base + tonumber(ARGV[2]))
+local last = base + tonumber(ARGV[3])
+local members = redis.call("ZREVRANGE", KEYS[1], first, last, "WITHSCORES")
+local result = {redis.call("ZCARD", KEYS[1]), first}
+for i = 1, #members, 2 do
+    result[#result + 1] = members[i]
+    result[#result + 1] = members[i + 1]
+    result[#result + 1] = redis.call("ZCOUNT", KEYS[1], "(" .. members[i + 1], "+inf")
+end
+return result
+"""
+
+
+class RankingIndexUnavailableError(Exception):
+    """The ranking index has not been built yet."""
+
+
+class LeaderboardIndex:
+    """Rank users by loyalty score in a Redis sorted set."""
+
+    async def update(self, user_pk: UUID, loyalty_score: int | None) -> None:
+        """Set a user's score, or drop them from the ranking with ``None``."""
+        redis_client = await get_redis_client()
+        await cast(
+            "Awaitable[int | None]",
+            redis_client.eval(
+                _UPDATE_SCRIPT,
+                1,
+                INDEX_KEY,
+                str(user_pk),
+                "" if loyalty_score is None else str(loyalty_score),
+            ),
+        )
+
+    async def get_nearby(self, user_pk: UUID, context_size: int) -> list[RankedUser]:
+        """Get a user and up to ``context_size`` users on either side.
+
+        Returns an empty list if the user is not ranked.
+        """
+        return await self._range(user_pk, -context_size, context_size)
+
+    async def get_top(self, limit: int) -> list[RankedUser]:
+        """Get the ``limit`` highest ranked users."""
+        return await self._range(None, 0, limit - 1)
+
+    async def get_rank_range(self, start_rank: int, end_rank: int) -> list[RankedUser]:
+        """Get the users ranked ``start_rank`` to ``end_rank`` inclusive."""
+        return await self._range(None, start_rank - 1, end_rank - 1)
+
+    async def _range(
+        self, anchor: UUID | None, first: int, last: int
+    ) -> list[RankedUser]:
+        redis_client = await get_redis_client()
+        result = await cast(
+            "Awaitable[list[Any] | None]",
+            redis_client.eval(
+                _RANGE_SCRIPT,
+                1,
+                INDEX_KEY,
+                "" if anchor is None else str(anchor),
+                str(first),
+                str(last),
+            ),
+        )
+        if result is None:
+            raise RankingIndexUnavailableError("Ranking index has not been built")
+        if not result:
+            return []
+
+        total, position, *rows = result
+        # PERCENT_RANK() divides by the number of other users
+        others = max(int(total) - 1, 1)
+        ranked = []
+        for offset, (member, score, higher) in enumerate(
+            batched(rows, 3, strict=False)
+        ):
+            name = member.decode() if isinstance(member, bytes) else member
+            ranked.append(
+                RankedUser(
+                    user_pk=UUID(name),
+                    loyalty_score=int(float(score)),
+                    rank=int(position) + offset + 1,
+                    percentile_rank=int(higher) / others,
+                )
+            )
+        return ranked
+
+    async def rebuild(self, scores: Iterable[tuple[UUID, int]]) -> int:
+        """Replace the whole index with ``scores``, returning the user count.
+
+        Readers see the old index until the new one is complete.
+        """
+        redis_client = await get_redis_client()
+        await redis_client.delete(_REBUILD_KEY)
+
+        count = 0
+        for batch in batched(scores, _BATCH_SIZE, strict=False):
+            await redis_client.zadd(
+                _REBUILD_KEY, {str(user_pk): score for user_pk, score in batch}
+            )
+            count += len(batch)
+
+        if count:
+            await redis_client.rename(_REBUILD_KEY, INDEX_KEY)
+        else:
+            await redis_client.delete(INDEX_KEY)
+        return count
+
+    async def compare(self, scores: Iterable[tuple[UUID, int]]) -> RankingIndexCheck:
+        """Find users whose index entry differs from ``scores``."""
+        redis_client = await get_redis_client()
+        if not await redis_client.exists(INDEX_KEY):
+            raise RankingIndexUnavailableError("Ranking index has not been built")
+
+        expected = {str(user_pk): score for user_pk, score in scores}
+        indexed = {}
+        async for member, score in redis_client.zscan_iter(INDEX_KEY):
+            name = member.decode() if isinstance(member, bytes) else member
+            indexed[name] = int(score)
+
+        missing = expected.keys() - indexed.keys()
+        extra = indexed.keys() - expected.keys()
+        mismatched = {
+            member
+            for member, score in expected.items()
+            if member in indexed and indexed[member] != score
+        }
+        return RankingIndexCheck(
+            checked=len(expected),
+            missing=len(missing),
+            extra=len(extra),
+            mismatched=len(mismatched),
+            differing=[UUID(member) for member in missing | extra | mismatched],
+        )
+
+
+# Global ranking index instance
+leaderboard_index = LeaderboardIndex()
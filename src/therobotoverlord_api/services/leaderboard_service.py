@@ -1,32 +1,76 @@
 """Leaderboard service for The Robot Overlord API."""
 
-import json
+import functools
+import hashlib
+import logging
 
+from collections.abc import Awaitable
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
+from therobotoverlord_api.config.database import get_database_settings
 from therobotoverlord_api.database.models.leaderboard import LeaderboardCursor
 from therobotoverlord_api.database.models.leaderboard import LeaderboardEntry
 from therobotoverlord_api.database.models.leaderboard import LeaderboardFilters
+from therobotoverlord_api.database.models.leaderboard import LeaderboardRefresh
 from therobotoverlord_api.database.models.leaderboard import LeaderboardResponse
 from therobotoverlord_api.database.models.leaderboard import LeaderboardStats
 from therobotoverlord_api.database.models.leaderboard import PaginationInfo
 from therobotoverlord_api.database.models.leaderboard import PersonalLeaderboardStats
+from therobotoverlord_api.database.models.leaderboard import RankedUser
+from therobotoverlord_api.database.models.leaderboard import RankingIndexCheck
 from therobotoverlord_api.database.models.leaderboard import UserRankLookup
 from therobotoverlord_api.database.repositories.leaderboard import LeaderboardRepository
+from therobotoverlord_api.services.leaderboard_index import RankingIndexUnavailableError
+from therobotoverlord_api.services.leaderboard_index import leaderboard_index
+from therobotoverlord_api.services.namespaced_cache import get_namespaced_cache
 from therobotoverlord_api.workers.redis_connection import get_redis_client
 
+logger = logging.getLogger(__name__)
+
+# Filtered pages and stats, read from the materialized view; they change when
+# it is refreshed
+LEADERBOARD_NAMESPACE = "leaderboard"
+# Unfiltered pages and top users, read from the live ranking index; they
+# change with every score change
+RANKINGS_NAMESPACE = "leaderboard_rankings"
+PERSONAL_STATS_NAMESPACE = "personal_stats"
+
+_PAGE_ADAPTER = TypeAdapter(LeaderboardResponse)
+_PERSONAL_STATS_ADAPTER = TypeAdapter(PersonalLeaderboardStats)
+_TOP_USERS_ADAPTER = TypeAdapter(list[LeaderboardEntry])
+_STATS_ADAPTER = TypeAdapter(LeaderboardStats)
+
 
 class LeaderboardService:
     """Service for leaderboard business logic and caching."""
 
     def __init__(self):
         self.repository = LeaderboardRepository()
+        # Live ranks; the materialized view serves filtered pages and stats
+        self.index = leaderboard_index
         self.cache_ttl = {
             "leaderboard_page": 300,  # 5 minutes
             "user_rank": 900,  # 15 minutes
             "top_users": 600,  # 10 minutes
             "stats": 1800,  # 30 minutes
         }
+        # Served stale this much longer while one request reloads them, so
+        # expiry and refresh_leaderboard_data do not stampede the database
+        self.stale_ttl = {
+            "leaderboard_page": 300,
+            "user_rank": 900,
+            "top_users": 600,
+            "stats": 1800,
+        }
+        # Read on nearly every page view, so also kept in process memory;
+        # invalidation evicts them everywhere, the TTL bounds missed events.
+        # Top users follow live scores, so they are kept only briefly.
+        self.local_cache_ttl = {
+            "top_users": 5,
+            "stats": 60,
+        }
 
     async def get_leaderboard(
         self,
@@ -35,7 +79,11 @@ class LeaderboardService:
         filters: LeaderboardFilters | None = None,
         current_user_pk: UUID | None = None,
     ) -> LeaderboardResponse:
-        """Get leaderboard with caching and pagination."""
+        """Get leaderboard with caching and pagination.
+
+        Unfiltered pages are ranked by the live ranking index, like top users
+        and user ranks, and filtered pages by the materialized view.
+        """
         # Parse cursor
         parsed_cursor = None
         if cursor:
@@ -45,48 +93,106 @@ class LeaderboardService:
                 # Invalid cursor, start from beginning
                 parsed_cursor = None
 
-        # Generate cache key
+        # Pages are shared by every viewer; the viewer is applied afterwards
         cache_key = self._generate_cache_key(
-            "leaderboard",
+            "page",
             {
                 "limit": limit,
                 "cursor": cursor,
                 "filters": filters.model_dump() if filters else {},
-                "user": str(current_user_pk) if current_user_pk else None,
             },
         )
 
-        # Try cache first
-        redis_client = await get_redis_client()
-        cached_data = await redis_client.get(cache_key)
-        if cached_data:
-            try:
-                data = json.loads(cached_data)
-                return LeaderboardResponse.model_validate(data)
-            except (json.JSONDecodeError, ValueError):
-                # Invalid cache data, continue to database
-                pass
+        if filters is None or filters == LeaderboardFilters():
+            namespace = RANKINGS_NAMESPACE
+            load = functools.partial(self._load_ranked_page, limit, parsed_cursor)
+        else:
+            namespace = LEADERBOARD_NAMESPACE
+            load = functools.partial(
+                self._load_leaderboard_page, limit, parsed_cursor, filters
+            )
+
+        cache = get_namespaced_cache(await get_redis_client())
+        page = await cache.fetch(
+            namespace,
+            cache_key,
+            load,
+            _PAGE_ADAPTER,
+            ttl=self.cache_ttl["leaderboard_page"],
+            stale_ttl=self.stale_ttl["leaderboard_page"],
+        )
+
+        if current_user_pk is None:
+            return page
+        return await self._apply_current_user(page, current_user_pk)
+
+    async def _apply_current_user(
+        self, page: LeaderboardResponse, current_user_pk: UUID
+    ) -> LeaderboardResponse:
+        """Flag the viewer on a shared page, or attach their own position."""
+        entries = [
+            entry.model_copy(update={"is_current_user": True})
+            if entry.user_pk == current_user_pk
+            else entry
+            for entry in page.entries
+        ]
 
+        # Get current user's position if not in results
+        current_user_position = None
+        if not any(entry.is_current_user for entry in entries):
+            current_user_position = await self._get_user_entry(current_user_pk)
+
+        return page.model_copy(
+            update={
+                "entries": entries,
+                "current_user_position": current_user_position,
+            }
+        )
+
+    async def _load_ranked_page(
+        self, limit: int, parsed_cursor: LeaderboardCursor | None
+    ) -> LeaderboardResponse:
+        """Build an unfiltered page from the ranking index, else the view."""
+        start_rank = parsed_cursor.rank + 1 if parsed_cursor else 1
+        # One more than the page to tell whether there is a next one
+        ranked = await self._from_index(
+            self.index.get_rank_range(start_rank, start_rank + limit)
+        )
+        if ranked is None:
+            return await self._load_leaderboard_page(limit, parsed_cursor, None)
+
+        entries = await self.repository.get_ranked_entries(ranked[:limit])
+        return await self._build_page(
+            entries, limit, parsed_cursor, None, has_next=len(ranked) > limit
+        )
+
+    async def _load_leaderboard_page(
+        self,
+        limit: int,
+        parsed_cursor: LeaderboardCursor | None,
+        filters: LeaderboardFilters | None,
+    ) -> LeaderboardResponse:
+        """Build a leaderboard page, without a viewer, from the database."""
         # Get data from repository
         entries, has_next = await self.repository.get_leaderboard_page(
             limit=limit,
             cursor=parsed_cursor,
             filters=filters,
-            current_user_pk=current_user_pk,
+        )
+        return await self._build_page(
+            entries, limit, parsed_cursor, filters, has_next=has_next
         )
 
-        # Get current user's position if not in results
-        current_user_position = None
-        if current_user_pk and not any(entry.is_current_user for entry in entries):
-            user_rank = await self.repository.get_user_rank(current_user_pk)
-            if user_rank and user_rank.found:
-                # Get full entry for current user
-                nearby_users = await self.repository.get_nearby_users(
-                    current_user_pk, 0
-                )
-                if nearby_users:
-                    current_user_position = nearby_users[0]
-
+    async def _build_page(
+        self,
+        entries: list[LeaderboardEntry],
+        limit: int,
+        parsed_cursor: LeaderboardCursor | None,
+        filters: LeaderboardFilters | None,
+        *,
+        has_next: bool,
+    ) -> LeaderboardResponse:
+        """Wrap a page of entries with its pagination info."""
         # Calculate pagination info
         next_cursor = None
         if has_next and entries:
@@ -109,40 +215,32 @@ class LeaderboardService:
             total_count=stats.total_users,
         )
 
-        response = LeaderboardResponse(
+        return LeaderboardResponse(
             entries=entries,
             pagination=pagination,
-            current_user_position=current_user_position,
             total_users=stats.total_users,
             last_updated=stats.last_updated,
             filters_applied=filters or LeaderboardFilters(),
         )
 
-        # Cache the response
-        await redis_client.setex(
-            cache_key,
-            self.cache_ttl["leaderboard_page"],
-            json.dumps(response.model_dump(), default=str),
-        )
-
-        return response
-
     async def get_user_personal_stats(self, user_pk: UUID) -> PersonalLeaderboardStats:
         """Get personal leaderboard statistics for a user."""
-        cache_key = f"personal_stats:{user_pk}"
-
-        # Try cache first
-        redis_client = await get_redis_client()
-        cached_data = await redis_client.get(cache_key)
-        if cached_data:
-            try:
-                data = json.loads(cached_data)
-                return PersonalLeaderboardStats.model_validate(data)
-            except (json.JSONDecodeError, ValueError):
-                pass
+        cache = get_namespaced_cache(await get_redis_client())
+        return await cache.fetch(
+            PERSONAL_STATS_NAMESPACE,
+            str(user_pk),
+            lambda: self._load_user_personal_stats(user_pk),
+            _PERSONAL_STATS_ADAPTER,
+            ttl=self.cache_ttl["user_rank"],
+            stale_ttl=self.stale_ttl["user_rank"],
+        )
 
+    async def _load_user_personal_stats(
+        self, user_pk: UUID
+    ) -> PersonalLeaderboardStats:
+        """Build a user's personal leaderboard statistics from the database."""
         # Get current position
-        user_rank = await self.repository.get_user_rank(user_pk)
+        user_rank = await self.get_user_rank(user_pk)
         if not user_rank or not user_rank.found:
             raise ValueError(f"User {user_pk} not found in leaderboard")
 
@@ -176,7 +274,7 @@ class LeaderboardService:
             else current_position.percentile_rank / 0.1,
         }
 
-        stats = PersonalLeaderboardStats(
+        return PersonalLeaderboardStats(
             current_position=current_position,
             rank_history=rank_history,
             nearby_users=nearby_users,
@@ -184,67 +282,39 @@ class LeaderboardService:
             percentile_improvement=percentile_improvement,
         )
 
-        # Cache the result
-        await redis_client.setex(
-            cache_key,
-            self.cache_ttl["user_rank"],
-            json.dumps(stats.model_dump(), default=str),
-        )
-
-        return stats
-
     async def get_top_users(self, limit: int = 10) -> list[LeaderboardEntry]:
-        """Get top users with caching."""
-        cache_key = f"top_users:{limit}"
-
-        # Try cache first
-        redis_client = await get_redis_client()
-        cached_data = await redis_client.get(cache_key)
-        if cached_data:
-            try:
-                data = json.loads(cached_data)
-                return [LeaderboardEntry.model_validate(entry) for entry in data]
-            except (json.JSONDecodeError, ValueError):
-                pass
-
-        # Get from repository
-        entries = await self.repository.get_top_users(limit)
-
-        # Cache the result
-        await redis_client.setex(
-            cache_key,
-            self.cache_ttl["top_users"],
-            json.dumps([entry.model_dump() for entry in entries], default=str),
+        """Get top users, cached and invalidated as scores change."""
+        cache = get_namespaced_cache(await get_redis_client())
+        return await cache.fetch(
+            RANKINGS_NAMESPACE,
+            f"top_users:{limit}",
+            lambda: self._load_top_users(limit),
+            _TOP_USERS_ADAPTER,
+            ttl=self.cache_ttl["top_users"],
+            local_ttl=self.local_cache_ttl["top_users"],
+            stale_ttl=self.stale_ttl["top_users"],
         )
 
-        return entries
+    async def _load_top_users(self, limit: int) -> list[LeaderboardEntry]:
+        """Get top users from the ranking index, else the view."""
+        ranked = await self._from_index(self.index.get_top(limit))
+        if ranked is not None:
+            return await self.repository.get_ranked_entries(ranked)
+        return await self.repository.get_top_users(limit)
 
     async def get_leaderboard_stats(self) -> LeaderboardStats:
         """Get leaderboard statistics with caching."""
-        cache_key = "leaderboard_stats"
-
-        # Try cache first
-        redis_client = await get_redis_client()
-        cached_data = await redis_client.get(cache_key)
-        if cached_data:
-            try:
-                data = json.loads(cached_data)
-                return LeaderboardStats.model_validate(data)
-            except (json.JSONDecodeError, ValueError):
-                pass
-
-        # Get from repository
-        stats = await self.repository.get_leaderboard_stats()
-
-        # Cache the result
-        await redis_client.setex(
-            cache_key,
-            self.cache_ttl["stats"],
-            json.dumps(stats.model_dump(), default=str),
+        cache = get_namespaced_cache(await get_redis_client())
+        return await cache.fetch(
+            LEADERBOARD_NAMESPACE,
+            "stats",
+            self.repository.get_leaderboard_stats,
+            _STATS_ADAPTER,
+            ttl=self.cache_ttl["stats"],
+            local_ttl=self.local_cache_ttl["stats"],
+            stale_ttl=self.stale_ttl["stats"],
         )
 
-        return stats
-
     async def search_users(self, search_term: str, limit: int = 20):
         """Search users by username."""
         # Don't cache search results as they're typically one-off queries
@@ -273,6 +343,10 @@ class LeaderboardService:
         if start_rank > end_rank:
             raise ValueError("Start rank must be less than or equal to end rank")
 
+        ranked = await self._from_index(self.index.get_rank_range(start_rank, end_rank))
+        if ranked is not None:
+            return await self.repository.get_ranked_entries(ranked)
+
         users = await self.repository.get_users_by_rank_range(start_rank, end_rank)
         return users
 
@@ -280,46 +354,100 @@ class LeaderboardService:
         self, user_pk: UUID, context_size: int = 10
     ) -> list[LeaderboardEntry]:
         """Get users near a specific user in the leaderboard."""
+        ranked = await self._from_index(self.index.get_nearby(user_pk, context_size))
+        if ranked is not None:
+            return await self.repository.get_ranked_entries(ranked, user_pk)
+
         return await self.repository.get_nearby_users(user_pk, context_size)
 
     async def invalidate_user_cache(self, user_pk: UUID):
         """Invalidate cache entries for a specific user."""
-        redis_client = await get_redis_client()
+        cache = get_namespaced_cache(await get_redis_client())
 
         # Invalidate personal stats
-        await redis_client.delete(f"personal_stats:{user_pk}")
-
-        # Invalidate general caches (they might contain this user)
-        patterns_to_delete = [
-            "leaderboard:*",
-            "top_users:*",
-            "leaderboard_stats",
-        ]
+        await cache.delete(PERSONAL_STATS_NAMESPACE, str(user_pk))
 
-        for pattern in patterns_to_delete:
-            keys = await redis_client.keys(pattern)
-            if keys:
-                await redis_client.delete(*keys)
+        # Pages read from the live index may show this user's old score.
+        # Materialized view pages only change when the refresh job runs.
+        await cache.invalidate(RANKINGS_NAMESPACE)
 
     async def get_user_rank(self, user_pk: UUID) -> UserRankLookup:
         """Get user's rank information."""
-        return await self.repository.get_user_rank(user_pk)
+        ranked = await self._from_index(self.index.get_nearby(user_pk, 0))
+        if ranked is None:
+            return await self.repository.get_user_rank(user_pk)
+
+        entries = await self.repository.get_ranked_entries(ranked, user_pk)
+        if not entries:
+            return UserRankLookup(
+                user_pk=user_pk,
+                username="",
+                rank=0,
+                loyalty_score=0,
+                percentile_rank=1.0,
+                found=False,
+            )
+        return UserRankLookup(
+            user_pk=user_pk,
+            username=entries[0].username,
+            rank=entries[0].rank,
+            loyalty_score=entries[0].loyalty_score,
+            percentile_rank=entries[0].percentile_rank,
+        )
+
+    async def _get_user_entry(self, user_pk: UUID) -> LeaderboardEntry | None:
+        """Get a user's own leaderboard entry."""
+        ranked = await self._from_index(self.index.get_nearby(user_pk, 0))
+        if ranked is None:
+            return await self.repository.get_user_entry(user_pk)
+
+        entries = await self.repository.get_ranked_entries(ranked, user_pk)
+        return entries[0] if entries else None
+
+    async def _from_index(
+        self, read: Awaitable[list[RankedUser]]
+    ) -> list[RankedUser] | None:
+        """Read the ranking index, or get None to fall back to the view."""
+        try:
+            return await read
+        except RankingIndexUnavailableError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ranking index read failed, using the view: {e}")
+            return None
+
+    async def invalidate_rankings(self) -> None:
+        """Invalidate pages and top users read from the ranking index."""
+        cache = get_namespaced_cache(await get_redis_client())
+        await cache.invalidate(RANKINGS_NAMESPACE)
+
+    async def rebuild_ranking_index(self) -> int:
+        """Rebuild the ranking index from the users table."""
+        count = await self.index.rebuild(await self.repository.get_ranking_scores())
+        await self.invalidate_rankings()
+        return count
+
+    async def check_ranking_index(self, *, repair: bool = True) -> RankingIndexCheck:
+        """Compare the ranking index with the users table, fixing differences.
+
+        Raises RankingIndexUnavailableError if the index has not been built.
+        """
+        check = await self.index.compare(await self.repository.get_ranking_scores())
+        if repair and check.differing:
+            # Scores may have moved on since the comparison read them
+            current = dict(await self.repository.get_ranking_scores(check.differing))
+            for user_pk in check.differing:
+                await self.index.update(user_pk, current.get(user_pk))
+            await self.invalidate_rankings()
+            check.repaired = True
+        return check
 
     async def invalidate_all_cache(self):
         """Invalidate all leaderboard caches."""
-        redis_client = await get_redis_client()
-
-        patterns_to_delete = [
-            "leaderboard:*",
-            "personal_stats:*",
-            "top_users:*",
-            "leaderboard_stats",
-        ]
-
-        for pattern in patterns_to_delete:
-            keys = await redis_client.keys(pattern)
-            if keys:
-                await redis_client.delete(*keys)
+        cache = get_namespaced_cache(await get_redis_client())
+        await cache.invalidate(
+            LEADERBOARD_NAMESPACE, RANKINGS_NAMESPACE, PERSONAL_STATS_NAMESPACE
+        )
 
     async def refresh_leaderboard_data(self) -> bool:
         """Refresh materialized view and invalidate caches."""
@@ -328,12 +456,25 @@ class LeaderboardService:
             await self.invalidate_all_cache()
         return success
 
+    async def refresh_leaderboard_if_changed(self) -> LeaderboardRefresh:
+        """Refresh the materialized view only if it changed, then invalidate."""
+        settings = get_database_settings()
+        result = await self.repository.refresh_leaderboard_if_changed(
+            settings.leaderboard_refresh_min_interval,
+            settings.leaderboard_refresh_max_interval,
+        )
+        if result.refreshed:
+            await self.invalidate_all_cache()
+        return result
+
     def _generate_cache_key(self, prefix: str, params: dict) -> str:
         """Generate a consistent cache key from parameters."""
         # Sort parameters for consistent key generation
         sorted_params = sorted(params.items())
         param_str = "&".join(f"{k}={v}" for k, v in sorted_params if v is not None)
-        return f"{prefix}:{hash(param_str)}"
+        # Stable across processes, unlike hash(), so they share entries
+        digest = hashlib.sha256(param_str.encode()).hexdigest()[:16]
+        return f"{prefix}:{digest}"
 
 
 # Singleton instance
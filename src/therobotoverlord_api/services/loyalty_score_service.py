@@ -20,8 +20,13 @@ from therobotoverlord_api.database.repositories.loyalty_score import (
     LoyaltyScoreRepository,
 )
 from therobotoverlord_api.services.leaderboard_service import get_leaderboard_service
+from therobotoverlord_api.services.namespaced_cache import get_namespaced_cache
 from therobotoverlord_api.workers.redis_connection import get_redis_client
 
+PROFILE_NAMESPACE = "loyalty_profile"
+SCORE_BREAKDOWN_NAMESPACE = "score_breakdown"
+SYSTEM_STATS_NAMESPACE = "loyalty_system_stats"
+
 
 class LoyaltyScoreService:
     """Service for loyalty score management and analytics."""
@@ -45,14 +50,12 @@ class LoyaltyScoreService:
 
     async def get_user_loyalty_profile(self, user_pk: UUID) -> UserLoyaltyProfile:
         """Get complete loyalty profile for a user with caching."""
-        cache_key = f"loyalty_profile:{user_pk}"
-
         # Try cache first
-        redis_client = await get_redis_client()
-        cached_data = await redis_client.get(cache_key)
-        if cached_data:
+        cache = get_namespaced_cache(await get_redis_client())
+        cached = await cache.get(PROFILE_NAMESPACE, str(user_pk))
+        if cached.value:
             try:
-                data = json.loads(cached_data)
+                data = json.loads(cached.value)
                 return UserLoyaltyProfile.model_validate(data)
             except (json.JSONDecodeError, ValueError):
                 pass
@@ -61,24 +64,22 @@ class LoyaltyScoreService:
         profile = await self.repository.get_user_loyalty_profile(user_pk)
 
         # Cache the result
-        await redis_client.setex(
-            cache_key,
-            self.cache_ttl["user_profile"],
+        await cache.set(
+            cached,
             json.dumps(profile.model_dump(), default=str),
+            self.cache_ttl["user_profile"],
         )
 
         return profile
 
     async def get_user_score_breakdown(self, user_pk: UUID) -> LoyaltyScoreBreakdown:
         """Get detailed score breakdown for a user."""
-        cache_key = f"score_breakdown:{user_pk}"
-
         # Try cache first
-        redis_client = await get_redis_client()
-        cached_data = await redis_client.get(cache_key)
-        if cached_data:
+        cache = get_namespaced_cache(await get_redis_client())
+        cached = await cache.get(SCORE_BREAKDOWN_NAMESPACE, str(user_pk))
+        if cached.value:
             try:
-                data = json.loads(cached_data)
+                data = json.loads(cached.value)
                 return LoyaltyScoreBreakdown.model_validate(data)
             except (json.JSONDecodeError, ValueError):
                 pass
@@ -87,10 +88,10 @@ class LoyaltyScoreService:
         breakdown = await self.repository.get_score_breakdown(user_pk)
 
         # Cache the result
-        await redis_client.setex(
-            cache_key,
-            self.cache_ttl["score_breakdown"],
+        await cache.set(
+            cached,
             json.dumps(breakdown.model_dump(), default=str),
+            self.cache_ttl["score_breakdown"],
         )
 
         return breakdown
@@ -107,14 +108,12 @@ class LoyaltyScoreService:
 
     async def get_system_stats(self) -> LoyaltyScoreStats:
         """Get system-wide loyalty score statistics."""
-        cache_key = "loyalty_system_stats"
-
         # Try cache first
-        redis_client = await get_redis_client()
-        cached_data = await redis_client.get(cache_key)
-        if cached_data:
+        cache = get_namespaced_cache(await get_redis_client())
+        cached = await cache.get(SYSTEM_STATS_NAMESPACE, "all")
+        if cached.value:
             try:
-                data = json.loads(cached_data)
+                data = json.loads(cached.value)
                 return LoyaltyScoreStats.model_validate(data)
             except (json.JSONDecodeError, ValueError):
                 pass
@@ -123,18 +122,11 @@ class LoyaltyScoreService:
         stats = await self.repository.get_system_stats()
 
         # Cache the result for 5 minutes
-        try:
-            await redis_client.setex(
-                cache_key,
-                300,  # 5 minutes
-                json.dumps(stats.model_dump(), default=str),
-            )
-        except Exception as e:
-            # Don't fail if caching fails, but log for debugging
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Failed to cache system stats: {e}")
+        await cache.set(
+            cached,
+            json.dumps(stats.model_dump(), default=str),
+            300,  # 5 minutes
+        )
 
         return stats
 
@@ -176,12 +168,12 @@ class LoyaltyScoreService:
             metadata=metadata or {},
         )
 
-        # Invalidate user caches
+        # Invalidate user caches, including rankings read from the live index
         await self._invalidate_user_cache(user_pk)
 
-        # Invalidate system stats cache
-        redis_client = await get_redis_client()
-        await redis_client.delete("loyalty_system_stats")
+        # Invalidate system stats
+        cache = get_namespaced_cache(await get_redis_client())
+        await cache.invalidate(SYSTEM_STATS_NAMESPACE)
 
         return event
 
@@ -201,8 +193,8 @@ class LoyaltyScoreService:
 
         # Invalidate caches
         await self._invalidate_user_cache(adjustment.user_pk)
-        redis_client = await get_redis_client()
-        await redis_client.delete("loyalty_system_stats")
+        cache = get_namespaced_cache(await get_redis_client())
+        await cache.invalidate(SYSTEM_STATS_NAMESPACE)
 
         return event
 
@@ -288,15 +280,13 @@ class LoyaltyScoreService:
 
     async def _invalidate_user_cache(self, user_pk: UUID) -> None:
         """Invalidate all cached data for a user (private method)."""
-        redis_client = await get_redis_client()
-        cache_keys = [
-            f"loyalty_profile:{user_pk}",
-            f"score_breakdown:{user_pk}",
-            f"loyalty:{user_pk}",  # From leaderboard service
-        ]
-
-        for key in cache_keys:
-            await redis_client.delete(key)
+        cache = get_namespaced_cache(await get_redis_client())
+        await cache.delete(PROFILE_NAMESPACE, str(user_pk))
+        await cache.delete(SCORE_BREAKDOWN_NAMESPACE, str(user_pk))
+
+        # The user's score also shows up in leaderboard pages and stats
+        leaderboard_service = await get_leaderboard_service()
+        await leaderboard_service.invalidate_user_cache(user_pk)
 
     async def invalidate_user_cache(self, user_pk: UUID) -> None:
         """Invalidate all cached data for a user (public method)."""
@@ -4,8 +4,10 @@ import logging
 
 from uuid import UUID
 
+from therobotoverlord_api.auth.principal_cache import principal_cache
 from therobotoverlord_api.database.connection import db
 from therobotoverlord_api.services.badge_service import BadgeService
+from therobotoverlord_api.services.tag_service import invalidate_topic_categories
 from therobotoverlord_api.websocket.manager import websocket_manager
 
 logger = logging.getLogger(__name__)
@@ -93,6 +95,7 @@ class ModerationService:
         """Update topic status."""
         query = "UPDATE topics SET status = $1, moderator_notes = $2 WHERE pk = $3"
         await self.db.execute(query, status, moderator_notes, topic_id)
+        await invalidate_topic_categories()
 
     async def _update_message_status(
         self, message_id: UUID, status: str, moderator_notes: str | None = None
@@ -112,6 +115,7 @@ class ModerationService:
         result = await self.db.fetchrow(query, change, user_id)
         if result:
             new_score = result["loyalty_score"]
+            await principal_cache.invalidate(user_id)
 
             # Broadcast loyalty score update
             event_broadcaster = get_event_broadcaster(websocket_manager)
@@ -0,0 +1,649 @@
+"""Namespaced Redis cache with generation-based invalidation.
+
+Every namespace has a generation counter in Redis, and the counter is part of
+each entry's key (``cache:<namespace>:<generation>:<key>``). Invalidating a
+namespace is a single ``INCR``: readers move on to keys that do not exist yet,
+and entries under the old generation are never read again and expire through
+their TTL. Invalidation cost is therefore constant however many entries the
+namespace, or the whole keyspace, holds.
+
+Lookups and single-entry deletes resolve the generation inside a Lua script,
+so each is one round trip. The scripts derive entry keys themselves, which
+assumes a single Redis node rather than Redis Cluster. Callers store a value
+under the key returned by the lookup, which pins it to the generation that
+was current before they loaded the data; a value computed across an
+invalidation is written to the old generation and never served.
+
+Hot, rarely changing reads can also be kept in :data:`local_cache`, a
+per-process LRU of validated values in front of Redis (see
+:meth:`NamespacedCache.fetch`). Invalidating a namespace publishes it on
+:data:`INVALIDATION_CHANNEL` so every process drops its local copies;
+anything missed while the listener was disconnected lags by at most the
+entry's local TTL.
+
+Reads given a ``stale_ttl`` keep Redis entries that much past their ``ttl``
+and serve them stale meanwhile, while one background task reloads them.
+After an invalidation the previous generation's entry is served the same
+way, so bumping a generation does not send every reader to the database at
+once. Concurrent misses for one entry share a single load: within a process
+through :data:`load_coalescer`, across processes through a Redis lock.
+
+Errors reading or filling the cache are logged and treated as misses.
+:meth:`NamespacedCache.invalidate` lets errors propagate, since swallowing
+them would serve stale data; write paths that must not fail because of the
+cache use :func:`invalidate_namespaces`, which logs them instead.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import logging
+import secrets
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Coroutine
+from typing import Any
+from typing import TypeVar
+
+from pydantic import TypeAdapter
+
+from therobotoverlord_api.config.redis import RedisSettings
+from therobotoverlord_api.config.redis import get_redis_settings
+from therobotoverlord_api.workers.redis_connection import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+KEY_PREFIX = "cache"
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Wait this long before resubscribing after the listener lost Redis
+_LISTENER_RETRY_SECONDS = 5.0
+
+# How often to check for an entry another process is loading
+_POLL_INTERVAL = 0.05
+
+# KEYS[1]: generation key
+# ARGV: entry key prefix, entry key suffix
+# Returns {generation, value or nil}
+_LOOKUP_SCRIPT = """
+local generation = redis.call("GET", KEYS[1]) or "0"
+return {generation, redis.call("GET", ARGV[1] .. generation .. ":" .. ARGV[2])}
+"""
+
+# KEYS[1]: generation key
+# ARGV: entry key prefix, entry key suffix
+# Returns the number of deleted keys
+_DELETE_SCRIPT = """
+local generation = redis.call("GET", KEYS[1]) or "0"
+return redis.call("DEL", ARGV[1] .. generation .. ":" .. ARGV[2])
+"""
+
+# KEYS[1]: generation key
+# ARGV: entry key prefix, entry key suffix, stale window in milliseconds
+# Returns {generation, value or nil, 1 if the value is stale else 0}. Without
+# a current entry, the previous generation's entry is returned as stale.
+_STALE_LOOKUP_SCRIPT = """
+local generation = redis.call("GET", KEYS[1]) or "0"
+local key = ARGV[1] .. generation .. ":" .. ARGV[2]
+local value = redis.call("GET", key)
+if value then
+    local ttl = redis.call("PTTL", key)
+    if ttl >= 0 and ttl <= tonumber(ARGV[3]) then
+        return {generation, value, 1}
+    end
+    return {generation, value, 0}
+end
+local previous = tonumber(generation) - 1
+if previous >= 0 then
+    value = redis.call("GET", ARGV[1] .. previous .. ":" .. ARGV[2])
+    if value then
+        return {generation, value, 1}
+    end
+end
+return {generation, false, 0}
+"""
+
+# Delete the lock only while we still own it
+_RELEASE_LOCK = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+_MISSING = object()
+
+
+class CacheLookup:
+    """Result of a cache lookup."""
+
+    __slots__ = ("key", "stale", "value")
+
+    def __init__(self, key: str | None, value: Any, *, stale: bool = False):
+        # Versioned key to store a freshly loaded value under, or None if the
+        # lookup failed and the value should not be cached
+        self.key = key
+        self.value = value
+        # Past its soft TTL, or from the previous generation
+        self.stale = stale
+
+
+class LocalCache:
+    """Per-process LRU of validated values, with per-entry TTLs.
+
+    Values are shared by every caller in the process and must be treated as
+    read-only.
+    """
+
+    def __init__(self, settings: RedisSettings | None = None):
+        settings = settings or get_redis_settings()
+        self.max_size = settings.local_cache_size
+
+        # (namespace, key) -> (expires_at, epoch, value)
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any, Any]] = (
+            OrderedDict()
+        )
+        # Bumped to drop a namespace, or every namespace, without a scan
+        self._epochs: dict[str, int] = {}
+        self._resets = 0
+        self._listener: asyncio.Task | None = None
+
+        self.hits = 0
+        self.misses = 0
+
+    def epoch(self, namespace: str) -> tuple[int, int]:
+        """Get the token a load must still match to be stored."""
+        return self._resets, self._epochs.get(namespace, 0)
+
+    def get(self, namespace: str, key: str) -> Any:
+        """Get a live entry, or ``_MISSING``."""
+        entry = self._entries.get((namespace, key))
+        if entry is not None:
+            expires_at, epoch, value = entry
+            if expires_at > time.monotonic() and epoch == self.epoch(namespace):
+                self._entries.move_to_end((namespace, key))
+                self.hits += 1
+                return value
+            del self._entries[(namespace, key)]
+        self.misses += 1
+        return _MISSING
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: float,
+        epoch: tuple[int, int],
+    ) -> None:
+        """Store a value loaded under ``epoch`` unless it was invalidated since."""
+        if epoch != self.epoch(namespace):
+            return
+        self._entries[(namespace, key)] = (time.monotonic() + ttl, epoch, value)
+        self._entries.move_to_end((namespace, key))
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def evict(self, namespace: str) -> None:
+        """Drop every local entry in ``namespace``."""
+        self._epochs[namespace] = self._epochs.get(namespace, 0) + 1
+
+    def clear(self) -> None:
+        """Drop every local entry."""
+        self._entries.clear()
+        self._resets += 1
+
+    def stats(self) -> dict[str, int]:
+        """Get hit and miss counters."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    async def start_listener(self) -> None:
+        """Start evicting namespaces invalidated by other processes."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        """Stop the invalidation listener."""
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._listener
+        self._listener = None
+
+    async def _listen(self) -> None:
+        """Evict namespaces published on the invalidation channel."""
+        while True:
+            try:
+                redis_client = await get_redis_client()
+                pubsub = redis_client.pubsub()
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Events published while disconnected were missed
+                self.clear()
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        data = message["data"]
+                        if isinstance(data, bytes):
+                            data = data.decode()
+                        self.evict(data)
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed: {e}")
+                await asyncio.sleep(_LISTENER_RETRY_SECONDS)
+
+
+class Coalescer:
+    """Run at most one load per cache entry at a time.
+
+    Callers in this process share the load's task; other processes wait on
+    the entry's Redis lock and then read what the holder stored.
+    """
+
+    def __init__(self, settings: RedisSettings | None = None):
+        settings = settings or get_redis_settings()
+        self.lock_ttl = settings.cache_lock_ttl
+
+        # Versioned entry key -> task loading it
+        self._loading: dict[str, asyncio.Task] = {}
+        self._revalidating: dict[str, asyncio.Task] = {}
+
+    async def load(
+        self,
+        cache: "NamespacedCache",
+        lookup: CacheLookup,
+        load: Callable[[], Coroutine[Any, Any, T]],
+        adapter: TypeAdapter[T],
+        ttl: int,
+    ) -> T:
+        """Load and store a missing entry, or wait for whoever already is."""
+        if lookup.key is None:
+            return await load()
+
+        task = self._loading.get(lookup.key)
+        if task is None:
+            task = self._start(
+                self._loading,
+                lookup.key,
+                self._load_once(cache, lookup, load, adapter, ttl),
+            )
+        # A cancelled caller must not cancel the load for everyone else
+        return await asyncio.shield(task)
+
+    def revalidate(
+        self,
+        cache: "NamespacedCache",
+        lookup: CacheLookup,
+        load: Callable[[], Coroutine[Any, Any, T]],
+        adapter: TypeAdapter[T],
+        ttl: int,
+    ) -> None:
+        """Reload a stale entry in the background unless one already is."""
+        if lookup.key is None or lookup.key in self._revalidating:
+            return
+        self._start(
+            self._revalidating,
+            lookup.key,
+            self._revalidate_once(cache, lookup, load, adapter, ttl),
+        )
+
+    def _start(
+        self, tasks: dict[str, asyncio.Task], key: str, coro: Coroutine[Any, Any, Any]
+    ) -> asyncio.Task:
+        # In a fresh context, so the task outlives the request that started it
+        # without sharing its database connection scope
+        task = asyncio.get_running_loop().create_task(
+            coro, context=contextvars.Context()
+        )
+        tasks[key] = task
+        task.add_done_callback(functools.partial(self._finish, tasks, key))
+        return task
+
+    def _finish(
+        self, tasks: dict[str, asyncio.Task], key: str, task: asyncio.Task
+    ) -> None:
+        if tasks.get(key) is task:
+            del tasks[key]
+        if task.cancelled():
+            return
+        # Retrieve the error even if every waiter went away
+        error = task.exception()
+        if error is not None and tasks is self._revalidating:
+            logger.warning(f"Failed to revalidate {key}: {error}")
+
+    @staticmethod
+    def _lock_key(entry_key: str) -> str:
+        return f"lock:{entry_key}"
+
+    async def _load_once(
+        self,
+        cache: "NamespacedCache",
+        lookup: CacheLookup,
+        load: Callable[[], Coroutine[Any, Any, T]],
+        adapter: TypeAdapter[T],
+        ttl: int,
+    ) -> T:
+        """Load under the entry's lock, or take what another process stored."""
+        if lookup.key is None:
+            return await load()
+
+        lock_key = self._lock_key(lookup.key)
+        owner = secrets.token_hex(16)
+        try:
+            acquired, value = await self._wait_for_lock(
+                cache, lock_key, lookup.key, owner, adapter
+            )
+        except Exception as e:
+            # Without Redis we can only coalesce within this process
+            logger.warning(f"Cache load coordination unavailable: {e}")
+            return await load()
+
+        if value is not _MISSING:
+            return value
+
+        try:
+            value = await load()
+            await cache.store(lookup, value, adapter, ttl)
+            return value
+        finally:
+            if acquired:
+                await cache.release_lock(lock_key, owner)
+
+    async def _revalidate_once(
+        self,
+        cache: "NamespacedCache",
+        lookup: CacheLookup,
+        load: Callable[[], Coroutine[Any, Any, T]],
+        adapter: TypeAdapter[T],
+        ttl: int,
+    ) -> None:
+        """Reload a stale entry unless another process already is."""
+        if lookup.key is None:
+            return
+
+        lock_key = self._lock_key(lookup.key)
+        owner = secrets.token_hex(16)
+        if not await cache.redis.set(lock_key, owner, nx=True, ex=self.lock_ttl):
+            return
+        try:
+            await cache.store(lookup, await load(), adapter, ttl)
+        finally:
+            await cache.release_lock(lock_key, owner)
+
+    async def _wait_for_lock(
+        self,
+        cache: "NamespacedCache",
+        lock_key: str,
+        entry_key: str,
+        owner: str,
+        adapter: TypeAdapter[T],
+    ) -> tuple[bool, Any]:
+        """Take the entry's lock, unless another process stores it first.
+
+        Returns whether the lock was acquired, and the value another process
+        stored when it was not. Neither happens if waiting times out.
+        """
+        deadline = time.monotonic() + self.lock_ttl
+        while True:
+            if await cache.redis.set(lock_key, owner, nx=True, ex=self.lock_ttl):
+                # Another process may have finished just before we took the lock
+                value = await self._read(cache.redis, entry_key, adapter)
+                if value is not _MISSING:
+                    await cache.release_lock(lock_key, owner)
+                    return False, value
+                return True, _MISSING
+
+            if time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for cache lock {lock_key}")
+                return False, _MISSING
+            await asyncio.sleep(_POLL_INTERVAL)
+
+            value = await self._read(cache.redis, entry_key, adapter)
+            if value is not _MISSING:
+                return False, value
+
+    @staticmethod
+    async def _read(redis_client, key: str, adapter: TypeAdapter[T]) -> Any:
+        cached = await redis_client.get(key)
+        if cached:
+            with contextlib.suppress(ValueError):
+                return adapter.validate_json(cached)
+        return _MISSING
+
+
+class NamespacedCache:
+    """Redis cache whose namespaces are invalidated by bumping a generation."""
+
+    def __init__(
+        self,
+        redis_client,
+        local: LocalCache | None = None,
+        coalescer: Coalescer | None = None,
+    ):
+        self.redis = redis_client
+        # Runs via EVALSHA, loading the script again if Redis lost it
+        self._lookup = redis_client.register_script(_LOOKUP_SCRIPT)
+        self._stale_lookup = redis_client.register_script(_STALE_LOOKUP_SCRIPT)
+        self._delete = redis_client.register_script(_DELETE_SCRIPT)
+        self._release_lock = redis_client.register_script(_RELEASE_LOCK)
+        self.local = local if local is not None else local_cache
+        self.coalescer = coalescer if coalescer is not None else load_coalescer
+
+    @staticmethod
+    def generation_key(namespace: str) -> str:
+        return f"{KEY_PREFIX}:{namespace}:gen"
+
+    @staticmethod
+    def _entry_prefix(namespace: str) -> str:
+        return f"{KEY_PREFIX}:{namespace}:"
+
+    async def get(self, namespace: str, key: str) -> CacheLookup:
+        """Look up ``key`` in the current generation of ``namespace``."""
+        try:
+            generation, value = await self._lookup(
+                keys=[self.generation_key(namespace)],
+                args=[self._entry_prefix(namespace), key],
+            )
+        except Exception as e:
+            logger.warning(f"Cache lookup failed for {namespace}:{key}: {e}")
+            return CacheLookup(None, None)
+
+        if isinstance(generation, bytes):
+            generation = generation.decode()
+        return CacheLookup(f"{self._entry_prefix(namespace)}{generation}:{key}", value)
+
+    async def get_stale(self, namespace: str, key: str, stale_ttl: int) -> CacheLookup:
+        """Look up ``key``, falling back to the previous generation.
+
+        The value is stale if it was stored more than its TTL minus
+        ``stale_ttl`` seconds ago, or comes from the previous generation.
+        """
+        try:
+            generation, value, stale = await self._stale_lookup(
+                keys=[self.generation_key(namespace)],
+                args=[self._entry_prefix(namespace), key, stale_ttl * 1000],
+            )
+        except Exception as e:
+            logger.warning(f"Cache lookup failed for {namespace}:{key}: {e}")
+            return CacheLookup(None, None)
+
+        if isinstance(generation, bytes):
+            generation = generation.decode()
+        return CacheLookup(
+            f"{self._entry_prefix(namespace)}{generation}:{key}",
+            value,
+            stale=bool(stale),
+        )
+
+    async def set(self, lookup: CacheLookup, value: str | bytes, ttl: int) -> None:
+        """Store ``value`` under the key a previous lookup resolved."""
+        if lookup.key is None:
+            return
+        try:
+            await self.redis.setex(lookup.key, ttl, value)
+        except Exception as e:
+            logger.warning(f"Failed to cache {lookup.key}: {e}")
+
+    async def store(
+        self, lookup: CacheLookup, value: T, adapter: TypeAdapter[T], ttl: int
+    ) -> None:
+        """Serialize ``value`` and store it under the key a lookup resolved."""
+        if lookup.key is None:
+            return
+        try:
+            payload = adapter.dump_json(value)
+        except ValueError as e:
+            logger.warning(f"Failed to serialize {lookup.key}: {e}")
+            return
+        await self.set(lookup, payload, ttl)
+
+    async def fetch(
+        self,
+        namespace: str,
+        key: str,
+        load: Callable[[], Coroutine[Any, Any, T]],
+        adapter: TypeAdapter[T],
+        *,
+        ttl: int,
+        local_ttl: float | None = None,
+        stale_ttl: int | None = None,
+    ) -> T:
+        """Get a value from process memory, then Redis, then ``load``.
+
+        Redis keeps the JSON for ``ttl`` seconds; with ``local_ttl`` this
+        process also keeps the validated value that long. With ``stale_ttl``
+        Redis keeps the entry that much longer, serving it stale while it is
+        reloaded in the background, and concurrent misses share one load.
+        """
+        if local_ttl is not None:
+            value = self.local.get(namespace, key)
+            if value is not _MISSING:
+                return value
+        epoch = self.local.epoch(namespace)
+
+        if stale_ttl is None:
+            value, fresh = await self._fetch(namespace, key, load, adapter, ttl), True
+        else:
+            value, fresh = await self._fetch_stale(
+                namespace, key, load, adapter, ttl, stale_ttl
+            )
+
+        # Stale values would outlive the reload that replaces them in Redis
+        if local_ttl is not None and fresh:
+            self.local.set(namespace, key, value, local_ttl, epoch)
+        return value
+
+    async def _fetch(
+        self,
+        namespace: str,
+        key: str,
+        load: Callable[[], Coroutine[Any, Any, T]],
+        adapter: TypeAdapter[T],
+        ttl: int,
+    ) -> T:
+        cached = await self.get(namespace, key)
+        if cached.value:
+            # Invalid cache data is loaded again
+            with contextlib.suppress(ValueError):
+                return adapter.validate_json(cached.value)
+        value = await load()
+        await self.store(cached, value, adapter, ttl)
+        return value
+
+    async def _fetch_stale(
+        self,
+        namespace: str,
+        key: str,
+        load: Callable[[], Coroutine[Any, Any, T]],
+        adapter: TypeAdapter[T],
+        ttl: int,
+        stale_ttl: int,
+    ) -> tuple[T, bool]:
+        """Get a value and whether it is fresh."""
+        cached = await self.get_stale(namespace, key, stale_ttl)
+        if cached.value:
+            # Invalid cache data is loaded again
+            with contextlib.suppress(ValueError):
+                value = adapter.validate_json(cached.value)
+                if cached.stale:
+                    self.coalescer.revalidate(
+                        self, cached, load, adapter, ttl + stale_ttl
+                    )
+                return value, not cached.stale
+
+        value = await self.coalescer.load(self, cached, load, adapter, ttl + stale_ttl)
+        return value, True
+
+    async def delete(self, namespace: str, key: str) -> None:
+        """Drop one entry from the current generation of ``namespace``."""
+        await self._delete(
+            keys=[self.generation_key(namespace)],
+            args=[self._entry_prefix(namespace), key],
+        )
+
+    async def release_lock(self, lock_key: str, owner: str) -> None:
+        """Release a load lock taken by ``owner``, unless it expired since."""
+        try:
+            await self._release_lock(keys=[lock_key], args=[owner])
+        except Exception as e:
+            logger.warning(f"Failed to release cache lock {lock_key}: {e}")
+
+    async def invalidate(self, *namespaces: str) -> None:
+        """Invalidate every entry in ``namespaces``, one ``INCR`` each.
+
+        Local copies are evicted here and, through pub/sub, in every other
+        process.
+        """
+        for namespace in namespaces:
+            await self.redis.incr(self.generation_key(namespace))
+            # After the INCR, so a load that read the old generation is not
+            # stored locally
+            self.local.evict(namespace)
+            await self.redis.publish(INVALIDATION_CHANNEL, namespace)
+
+
+def get_namespaced_cache(redis_client) -> NamespacedCache:
+    """Get the shared cache for ``redis_client``.
+
+    Registering the Lua scripts on every call would rebuild them per request,
+    so one instance is kept and only rebuilt when the client changes.
+    """
+    global _namespaced_cache  # noqa: PLW0603
+    if _namespaced_cache is None or _namespaced_cache.redis is not redis_client:
+        _namespaced_cache = NamespacedCache(redis_client)
+    return _namespaced_cache
+
+
+async def invalidate_namespaces(*namespaces: str) -> None:
+    """Invalidate namespaces after a database write without failing the write.
+
+    If Redis is unavailable the local copies are still dropped, and other
+    processes catch up once their entries expire.
+    """
+    try:
+        cache = get_namespaced_cache(await get_redis_client())
+        await cache.invalidate(*namespaces)
+    except Exception as e:
+        logger.warning(f"Failed to invalidate cache namespaces {namespaces}: {e}")
+        for namespace in namespaces:
+            local_cache.evict(namespace)
+
+
+# Global in-process cache instance
+local_cache = LocalCache()
+
+# Global load coalescer instance
+load_coalescer = Coalescer()
+
+# Shared cache instance, see get_namespaced_cache
+_namespaced_cache: NamespacedCache | None = None
@@ -1,7 +1,71 @@
 """Password service for The Robot Overlord API."""
 
+import asyncio
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
 import bcrypt
 
+from therobotoverlord_api.config.auth import get_auth_settings
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when too many password hashes are already waiting to run."""
+
+
+class _HashingPool:
+    """Dedicated thread pool for bcrypt with a bounded queue.
+
+    bcrypt releases the GIL, so running it on these threads keeps the event
+    loop free. Work beyond ``max_workers + max_queue`` is rejected straight
+    away rather than left to pile up behind a login storm.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of hashes running or queued."""
+        return self._pending
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """Run ``func`` on the pool, or raise if the queue is full."""
+        if self._pending >= self.max_workers + self.max_queue:
+            raise PasswordHashingBusyError("Password hashing queue is full")
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+
+_hashing_pool: _HashingPool | None = None
+
+
+def _get_hashing_pool() -> _HashingPool:
+    global _hashing_pool  # noqa: PLW0603
+    if _hashing_pool is None:
+        settings = get_auth_settings()
+        _hashing_pool = _HashingPool(
+            settings.password_hash_workers, settings.password_hash_max_queue
+        )
+    return _hashing_pool
+
 
 class PasswordService:
     """Service for password hashing and verification operations."""
@@ -34,6 +98,37 @@ class PasswordService:
         """
         return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
 
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password without blocking the event loop.
+
+        Args:
+            password: Plain text password to hash
+
+        Returns:
+            Hashed password string
+
+        Raises:
+            PasswordHashingBusyError: If the hashing queue is full
+        """
+        return await _get_hashing_pool().run(self.hash_password, password)
+
+    async def verify_password_async(self, password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash without blocking the event loop.
+
+        Args:
+            password: Plain text password to verify
+            hashed_password: Hashed password to check against
+
+        Returns:
+            True if password matches, False otherwise
+
+        Raises:
+            PasswordHashingBusyError: If the hashing queue is full
+        """
+        return await _get_hashing_pool().run(
+            self.verify_password, password, hashed_password
+        )
+
 
 def get_password_service() -> PasswordService:
     """Get password service instance.
@@ -8,11 +8,32 @@ from typing import Any
 from uuid import UUID
 
 from therobotoverlord_api.database.connection import db
+from therobotoverlord_api.database.statements import QUEUE_STATEMENTS
+from therobotoverlord_api.database.statements import queue_statement
+from therobotoverlord_api.database.statements import statement_registry
 from therobotoverlord_api.websocket.manager import websocket_manager
 from therobotoverlord_api.workers.redis_connection import get_redis_pool
 
 logger = logging.getLogger(__name__)
 
+QUEUE_TABLES = {
+    "topics": "topic_creation_queue",
+    "posts": "post_moderation_queue",
+    "messages": "private_message_queue",
+}
+
+
+def _queue_query(queue_table: str, action: str) -> str:
+    """Get the registered query text for ``action`` on ``queue_table``."""
+    return statement_registry.query(queue_statement(queue_table, action))
+
+
+# Register every queue statement up front so it is prepared on each pooled
+# connection
+for _queue_table in QUEUE_TABLES.values():
+    for _action in QUEUE_STATEMENTS:
+        _queue_query(_queue_table, _action)
+
 
 def get_event_broadcaster(websocket_manager):
     """Get event broadcaster for WebSocket notifications."""
@@ -352,24 +373,14 @@ class QueueService:
         self, queue_table: str, conversation_id: str | None = None
     ) -> int:
         """Get the next position number in the queue."""
-        query = f"""
-            SELECT COALESCE(MAX(position_in_queue), 0) + 1 as next_position
-            FROM {queue_table}
-        """  # nosec B608
-
-        result = await self.db.fetchrow(query)
+        result = await self.db.fetchrow(_queue_query(queue_table, "next_position"))
         if result is None:
             return 1
         return result["next_position"]
 
     def _get_queue_table(self, queue_type: str) -> str | None:
         """Get the database table name for a queue type."""
-        queue_tables = {
-            "topics": "topic_creation_queue",
-            "posts": "post_moderation_queue",
-            "messages": "private_message_queue",
-        }
-        return queue_tables.get(queue_type)
+        return QUEUE_TABLES.get(queue_type)
 
     async def _estimate_wait_time(self, queue_type: str) -> int:
         """Estimate wait time in seconds for new items in the queue."""
@@ -379,27 +390,17 @@ class QueueService:
 
         try:
             # Calculate average processing time from recent completions
-            query = f"""
-                SELECT AVG(EXTRACT(EPOCH FROM (updated_at - worker_assigned_at))) as avg_time
-                FROM {queue_table}
-                WHERE status = 'completed'
-                AND worker_assigned_at IS NOT NULL
-                AND updated_at > NOW() - INTERVAL '1 hour'
-            """  # nosec B608
-
-            result = await self.db.fetchrow(query)
+            result = await self.db.fetchrow(
+                _queue_query(queue_table, "avg_processing_time")
+            )
             avg_processing_time = (
                 result["avg_time"] if result else None
             ) or 30  # Default 30 seconds
 
             # Count pending items
-            pending_query = f"""
-                SELECT COUNT(*) as pending_count
-                FROM {queue_table}
-                WHERE status = 'pending'
-            """  # nosec B608
-
-            pending_result = await self.db.fetchrow(pending_query)
+            pending_result = await self.db.fetchrow(
+                _queue_query(queue_table, "pending_count")
+            )
             pending_count = (
                 pending_result["pending_count"] if pending_result else None
             ) or 0
@@ -776,8 +777,7 @@ class QueueService:
     async def _get_queue_size(self, table_name: str) -> int:
         """Get current queue size for queue table."""
         try:
-            query = f"SELECT COUNT(*) FROM {table_name} WHERE status = 'pending'"  # nosec B608
-            result = await self.db.fetchval(query)
+            result = await self.db.fetchval(_queue_query(table_name, "pending_count"))
             return result or 0
 
         except Exception:
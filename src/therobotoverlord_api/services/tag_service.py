@@ -2,6 +2,8 @@
 
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from therobotoverlord_api.database.models.tag import Tag
 from therobotoverlord_api.database.models.tag import TagCreate
 from therobotoverlord_api.database.models.tag import TagUpdate
@@ -12,6 +14,22 @@ from therobotoverlord_api.database.models.tag import TopicTagWithDetails
 from therobotoverlord_api.database.repositories.tag import TagRepository
 from therobotoverlord_api.database.repositories.tag import TopicTagRepository
 from therobotoverlord_api.database.repositories.topic import TopicRepository
+from therobotoverlord_api.services.namespaced_cache import get_namespaced_cache
+from therobotoverlord_api.services.namespaced_cache import invalidate_namespaces
+from therobotoverlord_api.workers.redis_connection import get_redis_client
+
+# Tags used by approved topics; changes when topics are approved or rejected
+# and when tags are assigned to, removed from or renamed on topics
+CATEGORIES_NAMESPACE = "topic_categories"
+CATEGORIES_TTL = 3600
+CATEGORIES_LOCAL_TTL = 300
+
+_CATEGORIES_ADAPTER = TypeAdapter(list[str])
+
+
+async def invalidate_topic_categories() -> None:
+    """Drop the cached categories after topics or their tags changed."""
+    await invalidate_namespaces(CATEGORIES_NAMESPACE)
 
 
 class TagService:
@@ -47,6 +65,8 @@ class TagService:
         updated_tag = await self.tag_repo.update(tag_pk, tag_data)
         if not updated_tag:
             raise ValueError(f"Failed to update tag with PK {tag_pk}")
+        if updated_tag.name != existing_tag.name:
+            await invalidate_topic_categories()
 
         return updated_tag
 
@@ -58,7 +78,9 @@ class TagService:
             raise ValueError(f"Tag with PK {tag_pk} not found")
 
         # Note: topic_tags will be deleted automatically due to CASCADE constraint
-        return await self.tag_repo.delete_by_pk(tag_pk)
+        deleted = await self.tag_repo.delete_by_pk(tag_pk)
+        await invalidate_topic_categories()
+        return deleted
 
     async def get_tag_by_pk(self, tag_pk: UUID) -> Tag | None:
         """Get tag by primary key."""
@@ -108,7 +130,9 @@ class TagService:
 
         topic_tag_data = TopicTagCreate(topic_pk=topic_pk, tag_pk=tag_pk)
 
-        return await self.topic_tag_repo.create(topic_tag_data)
+        topic_tag = await self.topic_tag_repo.create(topic_tag_data)
+        await invalidate_topic_categories()
+        return topic_tag
 
     async def assign_tags_to_topic(
         self,
@@ -121,27 +145,13 @@ class TagService:
         if not topic:
             raise ValueError(f"Topic with PK {topic_pk} not found")
 
-        assigned_tags: list[TopicTag] = []
-
-        for tag_name in tag_names:
-            # Get or create tag
-            tag = await self.tag_repo.get_by_name(tag_name)
-            if not tag:
-                # Auto-create tag if it doesn't exist (Overlord can create new tags)
-                tag_data = TagCreate(
-                    name=tag_name, description=f"Auto-created tag for '{tag_name}'"
-                )
-                tag = await self.tag_repo.create(tag_data)
-
-            # Skip if tag is already assigned
-            if await self.topic_tag_repo.tag_exists_for_topic(topic_pk, tag.pk):
-                continue
-
-            # Assign tag to topic
-            topic_tag_data = TopicTagCreate(topic_pk=topic_pk, tag_pk=tag.pk)
-
-            assigned_tag = await self.topic_tag_repo.create(topic_tag_data)
-            assigned_tags.append(assigned_tag)
+        # Get or create all tags in one round trip (Overlord can create new tags),
+        # then assign them in another, skipping tags already on the topic
+        tags = await self.tag_repo.get_or_create_by_names(tag_names)
+        assigned_tags = await self.topic_tag_repo.assign_many(
+            topic_pk, [tag.pk for tag in tags]
+        )
+        await invalidate_topic_categories()
 
         return assigned_tags
 
@@ -157,7 +167,9 @@ class TagService:
         if not tag:
             raise ValueError(f"Tag with PK {tag_pk} not found")
 
-        return await self.topic_tag_repo.remove_tag_from_topic(topic_pk, tag_pk)
+        removed = await self.topic_tag_repo.remove_tag_from_topic(topic_pk, tag_pk)
+        await invalidate_topic_categories()
+        return removed
 
     async def remove_all_tags_from_topic(self, topic_pk: UUID) -> int:
         """Remove all tags from a topic."""
@@ -166,7 +178,9 @@ class TagService:
         if not topic:
             raise ValueError(f"Topic with PK {topic_pk} not found")
 
-        return await self.topic_tag_repo.remove_all_tags_from_topic(topic_pk)
+        removed = await self.topic_tag_repo.remove_all_tags_from_topic(topic_pk)
+        await invalidate_topic_categories()
+        return removed
 
     async def get_tags_for_topic(self, topic_pk: UUID) -> list[TopicTagWithDetails]:
         """Get all tags for a specific topic."""
@@ -197,6 +211,18 @@ class TagService:
             tag.pk, limit=limit, offset=offset
         )
 
+    async def get_all_categories(self) -> list[str]:
+        """Get the names of all tags used by approved topics."""
+        cache = get_namespaced_cache(await get_redis_client())
+        return await cache.fetch(
+            CATEGORIES_NAMESPACE,
+            "all",
+            self.topic_repo.get_all_categories,
+            _CATEGORIES_ADAPTER,
+            ttl=CATEGORIES_TTL,
+            local_ttl=CATEGORIES_LOCAL_TTL,
+        )
+
     async def get_tag_usage_stats(self) -> dict[str, int]:
         """Get statistics about tag usage."""
         return await self.topic_tag_repo.get_tag_usage_stats()
@@ -16,10 +16,19 @@ from therobotoverlord_api.config.redis import get_redis_settings
 from therobotoverlord_api.database.connection import close_database
 from therobotoverlord_api.database.connection import get_db_connection
 from therobotoverlord_api.database.connection import init_database
+from therobotoverlord_api.database.statements import queue_statement
+from therobotoverlord_api.database.statements import statement_registry
 
 logger = logging.getLogger(__name__)
 
 
+def _status_statement(queue_table: str, worker_id: str | None) -> tuple[str, list]:
+    """Get the status update statement and its trailing arguments."""
+    if worker_id:
+        return queue_statement(queue_table, "set_status_and_worker"), [worker_id]
+    return queue_statement(queue_table, "set_status"), []
+
+
 class BaseWorker:
     """Base class for all Robot Overlord workers."""
 
@@ -66,18 +75,8 @@ class BaseWorker:
             logger.error("Database connection not available")
             return
 
-        update_fields = {"status": status}
-        if worker_id:
-            update_fields["worker_id"] = worker_id
-
-        # Build dynamic query
-        query = f"""  # nosec B608
-            UPDATE {queue_table}
-            SET {", ".join(f"{k} = ${i + 2}" for i, k in enumerate(update_fields.keys()))}
-            WHERE pk = $1
-        """
-
-        await self.db.execute(query, queue_id, *update_fields.values())
+        name, extra_args = _status_statement(queue_table, worker_id)
+        await statement_registry.execute(self.db, name, queue_id, status, *extra_args)
 
     async def get_queue_item(
         self, queue_table: str, queue_id: UUID
@@ -87,8 +86,9 @@ class BaseWorker:
             logger.error("Database connection not available")
             return None
 
-        query = f"SELECT * FROM {queue_table} WHERE pk = $1"  # nosec B608
-        record = await self.db.fetchrow(query, queue_id)
+        record = await statement_registry.fetchrow(
+            self.db, queue_statement(queue_table, "get_item"), queue_id
+        )
         return dict(record) if record else None
 
 
@@ -121,8 +121,9 @@ class QueueWorkerMixin:
         try:
             await init_database()
             async with get_db_connection() as connection:
-                query = f"SELECT * FROM {queue_table} WHERE pk = $1"  # nosec B608
-                record = await connection.fetchrow(query, queue_id)
+                record = await statement_registry.fetchrow(
+                    connection, queue_statement(queue_table, "get_item"), queue_id
+                )
                 return dict(record) if record else None
         except Exception:
             logger.exception(
@@ -205,16 +206,18 @@ class QueueWorkerMixin:
         self, connection, queue_table: str, queue_id: UUID
     ) -> int:
         """Get current retry count for a queue item."""
-        query = f"SELECT COALESCE(retry_count, 0) FROM {queue_table} WHERE pk = $1"  # nosec B608
-        result = await connection.fetchval(query, queue_id)
+        result = await statement_registry.fetchval(
+            connection, queue_statement(queue_table, "get_retry_count"), queue_id
+        )
         return result or 0
 
     async def _increment_retry_count(
         self, connection, queue_table: str, queue_id: UUID
     ) -> None:
         """Increment retry count for a queue item."""
-        query = f"UPDATE {queue_table} SET retry_count = COALESCE(retry_count, 0) + 1 WHERE pk = $1"  # nosec B608
-        await connection.execute(query, queue_id)
+        await statement_registry.execute(
+            connection, queue_statement(queue_table, "increment_retry_count"), queue_id
+        )
 
     async def _update_queue_status_with_connection(
         self,
@@ -225,18 +228,10 @@ class QueueWorkerMixin:
         worker_id: str | None = None,
     ) -> None:
         """Update queue item status with provided connection."""
-        update_fields = {"status": status}
-        if worker_id:
-            update_fields["worker_id"] = worker_id
-
-        # Build dynamic query
-        query = f"""  # nosec B608
-            UPDATE {queue_table}
-            SET {", ".join(f"{k} = ${i + 2}" for i, k in enumerate(update_fields.keys()))}
-            WHERE pk = $1
-        """
-
-        await connection.execute(query, queue_id, *update_fields.values())
+        name, extra_args = _status_statement(queue_table, worker_id)
+        await statement_registry.execute(
+            connection, name, queue_id, status, *extra_args
+        )
 
 
 def create_worker_class(
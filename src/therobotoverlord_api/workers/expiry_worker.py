@@ -0,0 +1,65 @@
+"""Expiry maintenance worker for The Robot Overlord."""
+
+import logging
+
+from therobotoverlord_api.auth.session_service import SessionService
+from therobotoverlord_api.services.sanction_service import get_sanction_service
+from therobotoverlord_api.workers.base import BaseWorker
+from therobotoverlord_api.workers.base import create_worker_class
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiryMaintenanceWorker(BaseWorker):
+    """Worker for removing expired sessions and lifting expired sanctions."""
+
+    async def cleanup_expired_sessions(self, ctx: dict) -> bool:
+        """Delete expired sessions and sessions revoked over a week ago."""
+        try:
+            deleted = await SessionService().cleanup_expired_sessions()
+            logger.info(f"Cleaned up {deleted} expired sessions")
+            return True
+
+        except Exception:
+            logger.exception("Error cleaning up expired sessions")
+            return False
+
+    async def expire_sanctions(self, ctx: dict) -> bool:
+        """Deactivate sanctions past their expiration date."""
+        try:
+            await get_sanction_service().expire_sanctions()
+            return True
+
+        except Exception:
+            logger.exception("Error expiring sanctions")
+            return False
+
+
+# Define worker functions
+async def cleanup_expired_sessions(ctx: dict) -> bool:
+    """Worker function for cleaning up expired sessions."""
+    try:
+        worker = ExpiryMaintenanceWorker()
+        return await worker.cleanup_expired_sessions(ctx)
+    except Exception:
+        logger.exception("Error in session cleanup worker")
+        return False
+
+
+async def expire_sanctions(ctx: dict) -> bool:
+    """Worker function for expiring sanctions."""
+    try:
+        worker = ExpiryMaintenanceWorker()
+        return await worker.expire_sanctions(ctx)
+    except Exception:
+        logger.exception("Error in sanction expiry worker")
+        return False
+
+
+# Create the worker class
+ExpiryWorker = create_worker_class(
+    worker_functions=[cleanup_expired_sessions, expire_sanctions],
+    functions=[cleanup_expired_sessions, expire_sanctions],
+    max_jobs=1,
+    job_timeout=120,  # 2 minutes timeout
+)
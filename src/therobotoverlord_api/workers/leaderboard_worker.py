@@ -2,6 +2,7 @@
 
 import logging
 
+from therobotoverlord_api.services.leaderboard_index import RankingIndexUnavailableError
 from therobotoverlord_api.services.leaderboard_service import get_leaderboard_service
 from therobotoverlord_api.workers.base import BaseWorker
 from therobotoverlord_api.workers.base import create_worker_class
@@ -16,24 +17,25 @@ class LeaderboardMaintenanceWorker(BaseWorker):
         super().__init__()
 
     async def refresh_leaderboard_rankings(self, ctx: dict) -> bool:
-        """Refresh the leaderboard_rankings materialized view."""
+        """Refresh the leaderboard_rankings materialized view if it changed."""
         try:
-            logger.info("Starting leaderboard rankings refresh")
-
             # Get leaderboard service
             service = await get_leaderboard_service()
 
-            # Refresh materialized view and invalidate caches
-            success = await service.refresh_leaderboard_data()
+            # Refresh materialized view and invalidate caches when needed
+            result = await service.refresh_leaderboard_if_changed()
 
-            if success:
+            if result.refreshed:
                 logger.info(
-                    "Successfully refreshed leaderboard rankings materialized view"
+                    f"Refreshed leaderboard rankings ({result.reason.value}) in "
+                    f"{result.duration_ms:.0f}ms: {result.row_count} rows "
+                    f"({result.row_delta:+d})"
                 )
-                return True
-
-            logger.error("Failed to refresh leaderboard rankings materialized view")
-            return False
+            else:
+                logger.debug(
+                    f"Skipped leaderboard rankings refresh ({result.reason.value})"
+                )
+            return True
 
         except Exception:
             logger.exception("Error refreshing leaderboard rankings")
@@ -57,6 +59,31 @@ class LeaderboardMaintenanceWorker(BaseWorker):
             logger.exception("Error cleaning up leaderboard cache")
             return False
 
+    async def sync_leaderboard_index(self, ctx: dict) -> bool:
+        """Repair drift in the live ranking index, building it if missing."""
+        try:
+            service = await get_leaderboard_service()
+
+            try:
+                check = await service.check_ranking_index()
+            except RankingIndexUnavailableError:
+                count = await service.rebuild_ranking_index()
+                logger.info(f"Built leaderboard ranking index with {count} users")
+                return True
+
+            if check.consistent:
+                logger.info(f"Leaderboard ranking index matches {check.checked} users")
+            else:
+                logger.warning(
+                    f"Repaired leaderboard ranking index: {check.missing} missing, "
+                    f"{check.extra} extra, {check.mismatched} mismatched"
+                )
+            return True
+
+        except Exception:
+            logger.exception("Error syncing leaderboard ranking index")
+            return False
+
 
 # Define worker functions
 async def refresh_leaderboard_rankings(ctx: dict) -> bool:
@@ -79,15 +106,27 @@ async def cleanup_leaderboard_cache(ctx: dict) -> bool:
         return False
 
 
+async def sync_leaderboard_index(ctx: dict) -> bool:
+    """Worker function for syncing the leaderboard ranking index."""
+    try:
+        worker = LeaderboardMaintenanceWorker()
+        return await worker.sync_leaderboard_index(ctx)
+    except Exception:
+        logger.exception("Error in leaderboard ranking index sync worker")
+        return False
+
+
 # Create the worker class
 LeaderboardWorker = create_worker_class(
     worker_functions=[
         refresh_leaderboard_rankings,
         cleanup_leaderboard_cache,
+        sync_leaderboard_index,
     ],
     functions=[
         refresh_leaderboard_rankings,
         cleanup_leaderboard_cache,
+        sync_leaderboard_index,
     ],
     max_jobs=1,  # Single job at a time to avoid conflicts
     job_timeout=300,  # 5 minutes timeout
@@ -0,0 +1,54 @@
+"""Partition maintenance worker for The Robot Overlord."""
+
+import logging
+
+from therobotoverlord_api.database.partitions import run_partition_maintenance
+from therobotoverlord_api.workers.base import BaseWorker
+from therobotoverlord_api.workers.base import create_worker_class
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionMaintenanceWorker(BaseWorker):
+    """Worker for creating and expiring monthly table partitions."""
+
+    async def maintain_partitions(self, ctx: dict) -> bool:
+        """Create upcoming partitions and detach expired ones."""
+        try:
+            logger.info("Starting partition maintenance")
+
+            results = await run_partition_maintenance()
+
+            for table, result in results.items():
+                if result["expired"]:
+                    logger.info(
+                        f"Expired {len(result['expired'])} {table} partitions "
+                        f"({result['action']})"
+                    )
+
+            logger.info("Successfully completed partition maintenance")
+            return True
+
+        except Exception:
+            logger.exception("Error during partition maintenance")
+            return False
+
+
+# Define worker functions
+async def maintain_partitions(ctx: dict) -> bool:
+    """Worker function for partition maintenance."""
+    try:
+        worker = PartitionMaintenanceWorker()
+        return await worker.maintain_partitions(ctx)
+    except Exception:
+        logger.exception("Error in partition maintenance worker")
+        return False
+
+
+# Create the worker class
+PartitionWorker = create_worker_class(
+    worker_functions=[maintain_partitions],
+    functions=[maintain_partitions],
+    max_jobs=1,  # DDL on the same tables must not run concurrently
+    job_timeout=600,  # 10 minutes timeout
+)
@@ -1,11 +1,29 @@
-"""Task scheduler for The Robot Overlord API."""
+"""Task scheduler for The Robot Overlord API.
+
+Recurring jobs are declared in ``SCHEDULES`` as cron-style UTC schedules.
+Any number of scheduler processes may run, but only the one holding the
+leader lease in Redis enqueues jobs. Each run is enqueued under a job ID
+derived from its scheduled time, so arq drops a duplicate even if two
+leaders briefly overlap, and the last enqueued time of every job is kept
+in Redis so a new leader carries on where the old one stopped. A run
+missed while no scheduler was up is caught up once, and every enqueue is
+appended to a capped per-job run history.
+"""
 
 import asyncio
+import json
 import logging
+import time
 
+from collections.abc import Awaitable
+from collections.abc import Iterable
 from datetime import UTC
+from datetime import date
 from datetime import datetime
+from datetime import time as time_of_day
 from datetime import timedelta
+from typing import cast
+from uuid import uuid4
 
 from arq import create_pool
 from arq.connections import ArqRedis
@@ -15,13 +33,172 @@ from therobotoverlord_api.config.redis import get_redis_settings
 
 logger = logging.getLogger(__name__)
 
+LEADER_KEY = "scheduler:leader"
+LAST_RUN_KEY = "scheduler:last_run"
+HISTORY_KEY = "scheduler:history:{function}"
+
+# The scheduler wakes just after every minute boundary
+_TICK = timedelta(minutes=1)
+_LEASE_TTL_MS = 90_000
+_HISTORY_SIZE = 100
+
+# Schedules matching no day in this many years are never due
+_MAX_LOOKBACK_DAYS = 366 * 8
+
+# Take the lease if it is free, or extend it if we already hold it
+_ACQUIRE_LEASE = """
+local owner = redis.call("GET", KEYS[1])
+if owner and owner ~= ARGV[1] then
+    return 0
+end
+redis.call("SET", KEYS[1], ARGV[1], "PX", ARGV[2])
+return 1
+"""
+
+# Delete the lease only while we still own it
+_RELEASE_LEASE = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+def _field(values: int | Iterable[int] | None, allowed: range) -> frozenset[int]:
+    if values is None:
+        return frozenset(allowed)
+    field = frozenset([values] if isinstance(values, int) else values)
+    if not field or not field <= frozenset(allowed):
+        raise ValueError(f"Schedule values {sorted(field)} outside {allowed}")
+    return field
+
+
+class CronSchedule:
+    """UTC minutes, hours, days, months and weekdays a job runs at.
+
+    Each field takes one value or several, and ``None`` matches every value
+    like ``*`` in a crontab. Weekdays count from Monday as 0.
+    """
+
+    __slots__ = ("day", "hour", "minute", "month", "weekday")
+
+    def __init__(
+        self,
+        *,
+        minute: int | Iterable[int] | None = None,
+        hour: int | Iterable[int] | None = None,
+        day: int | Iterable[int] | None = None,
+        month: int | Iterable[int] | None = None,
+        weekday: int | Iterable[int] | None = None,
+    ):
+        self.minute = _field(minute, range(60))
+        self.hour = _field(hour, range(24))
+        self.day = _field(day, range(1, 32))
+        self.month = _field(month, range(1, 13))
+        self.weekday = _field(weekday, range(7))
+
+    def latest_run(self, moment: datetime) -> datetime | None:
+        """Get the latest scheduled time at or before ``moment``."""
+        moment = moment.astimezone(UTC).replace(second=0, microsecond=0)
+        day = moment.date()
+        for _ in range(_MAX_LOOKBACK_DAYS):
+            if self._runs_on(day):
+                limit = moment.time() if day == moment.date() else None
+                latest = self._latest_time(limit)
+                if latest is not None:
+                    return datetime.combine(day, latest, UTC)
+            day -= timedelta(days=1)
+        return None
+
+    def _runs_on(self, day: date) -> bool:
+        return (
+            day.day in self.day
+            and day.month in self.month
+            and day.weekday() in self.weekday
+        )
+
+    def _latest_time(self, limit: time_of_day | None) -> time_of_day | None:
+        for hour in sorted(self.hour, reverse=True):
+            if limit is not None and hour > limit.hour:
+                continue
+            for minute in sorted(self.minute, reverse=True):
+                if limit is not None and hour == limit.hour and minute > limit.minute:
+                    continue
+                return time_of_day(hour, minute)
+        return None
+
+
+class ScheduledJob:
+    """A worker function enqueued on ``queue`` whenever ``schedule`` is due.
+
+    With ``catch_up``, a run missed while no scheduler was leading is
+    enqueued late, once, however many runs were missed. Without it, missed
+    runs are skipped and the job waits for its next scheduled time.
+    """
+
+    __slots__ = ("catch_up", "function", "queue", "schedule")
+
+    def __init__(
+        self,
+        function: str,
+        queue: str,
+        schedule: CronSchedule,
+        *,
+        catch_up: bool = True,
+    ):
+        self.function = function
+        self.queue = queue
+        self.schedule = schedule
+        self.catch_up = catch_up
+
+
+SCHEDULES = [
+    # Change-aware and cheap when nothing changed, so never worth catching up
+    ScheduledJob(
+        "refresh_leaderboard_rankings", "leaderboard", CronSchedule(), catch_up=False
+    ),
+    ScheduledJob(
+        "sync_leaderboard_index",
+        "leaderboard",
+        CronSchedule(minute=range(0, 60, 10)),
+        catch_up=False,
+    ),
+    ScheduledJob(
+        "cleanup_leaderboard_cache",
+        "leaderboard",
+        CronSchedule(minute=0, hour=range(0, 24, 2)),
+    ),
+    ScheduledJob("generate_hourly_snapshot", "analytics", CronSchedule(minute=5)),
+    ScheduledJob(
+        "generate_daily_snapshot", "analytics", CronSchedule(minute=15, hour=0)
+    ),
+    ScheduledJob(
+        "generate_weekly_snapshot",
+        "analytics",
+        CronSchedule(minute=30, hour=0, weekday=0),
+    ),
+    ScheduledJob(
+        "generate_monthly_snapshot",
+        "analytics",
+        CronSchedule(minute=45, hour=0, day=1),
+    ),
+    ScheduledJob("cleanup_old_snapshots", "analytics", CronSchedule(minute=30, hour=4)),
+    ScheduledJob(
+        "expire_sanctions", "maintenance", CronSchedule(minute=range(0, 60, 5))
+    ),
+    ScheduledJob("cleanup_expired_sessions", "maintenance", CronSchedule(minute=20)),
+    # Make sure upcoming partitions exist before anything is written to them
+    ScheduledJob("maintain_partitions", "maintenance", CronSchedule(minute=0, hour=3)),
+]
+
 
 class TaskScheduler:
     """Scheduler for recurring background tasks."""
 
-    def __init__(self):
+    def __init__(self, jobs: list[ScheduledJob] | None = None):
         self.redis_pool: ArqRedis | None = None
-        self.scheduled_tasks = []
+        self.jobs = SCHEDULES if jobs is None else jobs
+        self.owner = uuid4().hex
 
     async def initialize(self):
         """Initialize Redis connection."""
@@ -36,85 +213,167 @@ class TaskScheduler:
         self.redis_pool = await create_pool(arq_settings)
         logger.info("Scheduler connected to Redis")
 
-    async def schedule_leaderboard_refresh(self):
-        """Schedule leaderboard rankings refresh every 30 minutes."""
+    async def acquire_leadership(self) -> bool:
+        """Take or renew the leader lease, returning whether this process leads."""
         if self.redis_pool is None:
             logger.error("Redis pool not initialized")
-            return
-        try:
-            # Schedule immediate refresh
-            await self.redis_pool.enqueue_job(
-                "refresh_leaderboard_rankings",
-                _queue_name="leaderboard",
-            )
-            logger.info("Scheduled immediate leaderboard refresh")
+            return False
 
-            # Schedule recurring refresh every 5 minutes
-            await self.redis_pool.enqueue_job(
-                "refresh_leaderboard_rankings",
-                _defer=timedelta(minutes=5),
-                _queue_name="leaderboard",
+        try:
+            return bool(
+                await cast(
+                    "Awaitable[int | None]",
+                    self.redis_pool.eval(
+                        _ACQUIRE_LEASE, 1, LEADER_KEY, self.owner, str(_LEASE_TTL_MS)
+                    ),
+                )
             )
-            logger.info("Scheduled recurring leaderboard refresh (every 5 minutes)")
-
         except Exception:
-            logger.exception("Failed to schedule leaderboard refresh")
+            logger.exception("Failed to acquire scheduler leadership")
+            return False
 
-    async def schedule_leaderboard_cache_cleanup(self):
-        """Schedule leaderboard cache cleanup every 10 minutes."""
+    async def run_due_jobs(self, now: datetime | None = None) -> list[str]:
+        """Enqueue every job with a scheduled run not yet enqueued."""
         if self.redis_pool is None:
             logger.error("Redis pool not initialized")
-            return
+            return []
 
-        try:
-            # Schedule cache cleanup every 10 minutes
-            await self.redis_pool.enqueue_job(
-                "cleanup_leaderboard_cache",
-                _defer=timedelta(minutes=10),
-                _queue_name="leaderboard",
+        now = now or datetime.now(UTC)
+        enqueued = []
+        for job in self.jobs:
+            try:
+                if await self._run_if_due(self.redis_pool, job, now):
+                    enqueued.append(job.function)
+            except Exception:
+                logger.exception(f"Failed to schedule {job.function}")
+        return enqueued
+
+    async def _run_if_due(
+        self, redis_pool: ArqRedis, job: ScheduledJob, now: datetime
+    ) -> bool:
+        """Enqueue the latest scheduled run of ``job`` if it is still pending."""
+        due = job.schedule.latest_run(now)
+        if due is None:
+            return False
+
+        last = await cast(
+            "Awaitable[bytes | str | None]",
+            redis_pool.hget(LAST_RUN_KEY, job.function),
+        )
+        if isinstance(last, bytes):
+            last = last.decode()
+        last_run = datetime.fromisoformat(last) if last else None
+        if last_run is not None and last_run >= due:
+            return False
+
+        # Nothing was missed for a job this scheduler has never run before
+        late = now - due >= _TICK
+        if late and (last_run is None or not job.catch_up):
+            await cast(
+                "Awaitable[int]",
+                redis_pool.hset(LAST_RUN_KEY, job.function, due.isoformat()),
             )
-            logger.info("Scheduled leaderboard cache cleanup (every 10 minutes)")
+            return False
 
-        except Exception:
-            logger.exception("Failed to schedule leaderboard cache cleanup")
+        job_id = f"cron:{job.function}:{due:%Y%m%dT%H%M}"
+        result = await redis_pool.enqueue_job(
+            job.function, _job_id=job_id, _queue_name=job.queue
+        )
+        await cast(
+            "Awaitable[int]",
+            redis_pool.hset(LAST_RUN_KEY, job.function, due.isoformat()),
+        )
+
+        # arq returns None when a job with this ID was already enqueued
+        await self._record_run(
+            redis_pool, job, due, now, job_id, caught_up=late, duplicate=result is None
+        )
+        if result is None:
+            return False
 
-    async def start_recurring_schedules(self):
-        """Start all recurring task schedules."""
-        await self.initialize()
+        if late:
+            logger.warning(f"Caught up missed {job.function} run due at {due}")
+        else:
+            logger.info(f"Scheduled {job.function} for {due}")
+        return True
 
-        # Schedule leaderboard maintenance tasks
-        await self.schedule_leaderboard_refresh()
-        await self.schedule_leaderboard_cache_cleanup()
+    async def _record_run(
+        self,
+        redis_pool: ArqRedis,
+        job: ScheduledJob,
+        due: datetime,
+        now: datetime,
+        job_id: str,
+        *,
+        caught_up: bool,
+        duplicate: bool,
+    ) -> None:
+        key = HISTORY_KEY.format(function=job.function)
+        entry = {
+            "job_id": job_id,
+            "scheduled_for": due.isoformat(),
+            "enqueued_at": now.isoformat(),
+            "caught_up": caught_up,
+            "duplicate": duplicate,
+        }
+        await cast("Awaitable[int]", redis_pool.lpush(key, json.dumps(entry)))
+        await cast("Awaitable[str]", redis_pool.ltrim(key, 0, _HISTORY_SIZE - 1))
 
-        logger.info("All recurring schedules started")
+    async def get_run_history(self, function: str, limit: int = 20) -> list[dict]:
+        """Get the most recent scheduled runs of ``function``, newest first."""
+        if self.redis_pool is None:
+            logger.error("Redis pool not initialized")
+            return []
+
+        key = HISTORY_KEY.format(function=function)
+        entries = await cast(
+            "Awaitable[list[bytes]]", self.redis_pool.lrange(key, 0, limit - 1)
+        )
+        return [json.loads(entry) for entry in entries]
 
     async def cleanup(self):
         """Clean up resources."""
         if self.redis_pool:
+            try:
+                await cast(
+                    "Awaitable[int]",
+                    self.redis_pool.eval(_RELEASE_LEASE, 1, LEADER_KEY, self.owner),
+                )
+            except Exception as e:
+                logger.warning(f"Failed to release scheduler leadership: {e}")
             await self.redis_pool.close()
             await self.redis_pool.wait_closed()
 
 
+def seconds_until_next_tick() -> float:
+    """Get the time until just after the next minute boundary."""
+    tick = _TICK.total_seconds()
+    return tick - time.time() % tick + 1
+
+
 async def start_scheduler():
     """Start the task scheduler."""
     scheduler = TaskScheduler()
     try:
-        await scheduler.start_recurring_schedules()
+        await scheduler.initialize()
+        logger.info(f"Scheduler started with {len(scheduler.jobs)} recurring jobs")
 
-        # Keep scheduler running
+        leading = False
         while True:
-            await asyncio.sleep(60)  # Check every minute
-
-            # Re-schedule tasks that should repeat
-            current_time = datetime.now(UTC)
+            is_leader = await scheduler.acquire_leadership()
+            if is_leader != leading:
+                logger.info(
+                    "Scheduler is now leading"
+                    if is_leader
+                    else "Scheduler is standing by for another leader"
+                )
+                leading = is_leader
 
-            # Re-schedule leaderboard refresh every 30 minutes
-            if current_time.minute % 30 == 0:
-                await scheduler.schedule_leaderboard_refresh()
+            if is_leader:
+                await scheduler.run_due_jobs()
 
-            # Re-schedule cache cleanup every 2 hours
-            if current_time.hour % 2 == 0 and current_time.minute == 0:
-                await scheduler.schedule_leaderboard_cache_cleanup()
+            # Sleep to the next minute boundary so ticks never drift
+            await asyncio.sleep(seconds_until_next_tick())
 
     except KeyboardInterrupt:
         logger.info("Scheduler interrupted")
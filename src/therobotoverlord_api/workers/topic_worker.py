@@ -6,6 +6,7 @@ from uuid import UUID
 
 from therobotoverlord_api.database.repositories.topic import TopicRepository
 from therobotoverlord_api.services.ai_moderation_service import AIModerationService
+from therobotoverlord_api.services.tag_service import invalidate_topic_categories
 from therobotoverlord_api.workers.base import BaseWorker
 from therobotoverlord_api.workers.base import QueueWorkerMixin
 from therobotoverlord_api.workers.base import create_worker_class
@@ -56,6 +57,7 @@ class TopicModerationWorker(BaseWorker, QueueWorkerMixin):
                     AI_SYSTEM_UUID,  # Use AI system UUID for AI approvals
                 )
                 if approved_topic:
+                    await invalidate_topic_categories()
                     logger.info(f"Topic {topic_id} approved by AI moderation")
                     return True
                 logger.error(f"Failed to approve topic {topic_id}")
@@ -63,6 +65,7 @@ class TopicModerationWorker(BaseWorker, QueueWorkerMixin):
             # Reject the topic
             rejected_topic = await topic_repo.reject_topic(topic_id)
             if rejected_topic:
+                await invalidate_topic_categories()
                 logger.info(f"Topic {topic_id} rejected by AI moderation")
                 return True
             logger.error(f"Failed to reject topic {topic_id}")
@@ -302,7 +302,7 @@ class TestAppealsAPIComprehensive:
         test_app.dependency_overrides.clear()
         assert response.status_code == status.HTTP_200_OK
         mock_appeal_service.get_user_appeals.assert_called_once_with(
-            regular_user.pk, AppealStatus.PENDING, 1, 10
+            regular_user.pk, AppealStatus.PENDING, 1, 10, cursor=None
         )
 
     @pytest.mark.asyncio
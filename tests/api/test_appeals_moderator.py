@@ -161,7 +161,7 @@ class TestAppealsModeratorAPI:
         assert len(response.json()["appeals"]) == 1
         assert response.json()["total_count"] == 1
         mock_appeal_service.get_appeals_queue.assert_called_once_with(
-            AppealStatus.PENDING, 1, 50
+            AppealStatus.PENDING, 1, 50, cursor=None
         )
 
     @pytest.mark.asyncio
@@ -190,7 +190,7 @@ class TestAppealsModeratorAPI:
         test_app.dependency_overrides.clear()
         assert response.status_code == status.HTTP_200_OK
         mock_appeal_service.get_appeals_queue.assert_called_once_with(
-            AppealStatus.UNDER_REVIEW, 2, 25
+            AppealStatus.UNDER_REVIEW, 2, 25, cursor=None
         )
 
     @pytest.mark.asyncio
@@ -464,7 +464,7 @@ class TestAppealsModeratorAPI:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.json()["appeals"]) == 1
         mock_appeal_service.get_user_appeals.assert_called_once_with(
-            user_pk, None, 1, 20
+            user_pk, None, 1, 20, cursor=None
         )
 
     @pytest.mark.asyncio
@@ -494,7 +494,7 @@ class TestAppealsModeratorAPI:
         test_app.dependency_overrides.clear()
         assert response.status_code == status.HTTP_200_OK
         mock_appeal_service.get_user_appeals.assert_called_once_with(
-            user_pk, AppealStatus.SUSTAINED, 2, 10
+            user_pk, AppealStatus.SUSTAINED, 2, 10, cursor=None
         )
 
     # Authorization tests
@@ -17,11 +17,13 @@ from fastapi.testclient import TestClient
 from httpx import ASGITransport
 from httpx import AsyncClient
 
+from therobotoverlord_api.auth.principal_cache import principal_cache
 from therobotoverlord_api.config.database import DatabaseSettings
 from therobotoverlord_api.database.models.base import UserRole
 from therobotoverlord_api.database.models.user import User
 from therobotoverlord_api.database.models.user import UserCreate
 from therobotoverlord_api.main import app
+from therobotoverlord_api.services.namespaced_cache import local_cache
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -35,6 +37,22 @@ def setup_test_environment():
         del os.environ["ANTHROPIC_API_KEY"]
 
 
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    """Keep authenticated users cached by one test out of the next."""
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    """Keep values cached in process memory by one test out of the next."""
+    local_cache.clear()
+    yield
+    local_cache.clear()
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
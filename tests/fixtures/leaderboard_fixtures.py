@@ -9,6 +9,7 @@ from uuid import uuid4
 
 import pytest
 
+from tests.fixtures.redis_fixtures import forward_scripts
 from therobotoverlord_api.database.models.leaderboard import BadgeSummary
 from therobotoverlord_api.database.models.leaderboard import LeaderboardEntry
 from therobotoverlord_api.database.models.leaderboard import LeaderboardFilters
@@ -17,6 +18,7 @@ from therobotoverlord_api.database.models.leaderboard import LeaderboardStats
 from therobotoverlord_api.database.models.leaderboard import PaginationInfo
 from therobotoverlord_api.database.models.leaderboard import RankHistoryEntry
 from therobotoverlord_api.database.models.leaderboard import UserRankLookup
+from therobotoverlord_api.services.leaderboard_index import RankingIndexUnavailableError
 
 
 @pytest.fixture
@@ -179,12 +181,15 @@ def mock_db_connection():
 @pytest.fixture
 def mock_redis_client():
     """Mock Redis client for testing."""
-    mock_redis = AsyncMock()
+    mock_redis = forward_scripts(AsyncMock())
 
     # Mock Redis operations
-    mock_redis.get = AsyncMock(return_value=None)  # Default to cache miss
+    mock_redis.get = AsyncMock(return_value=None)
+    # Cache lookups return [generation, value, stale]; default to a miss
+    mock_redis.evalsha = AsyncMock(return_value=[b"0", None, 0])
     mock_redis.setex = AsyncMock()
     mock_redis.delete = AsyncMock()
+    mock_redis.incr = AsyncMock(return_value=1)
     mock_redis.keys = AsyncMock(return_value=[])
 
     return mock_redis
@@ -209,6 +214,19 @@ def mock_leaderboard_repository():
     return mock_repo
 
 
+@pytest.fixture
+def unbuilt_leaderboard_index():
+    """Mock ranking index that has not been built, so reads use the view."""
+    mock_index = AsyncMock()
+    unavailable = RankingIndexUnavailableError("Ranking index has not been built")
+    mock_index.get_nearby = AsyncMock(side_effect=unavailable)
+    mock_index.get_top = AsyncMock(side_effect=unavailable)
+    mock_index.get_rank_range = AsyncMock(side_effect=unavailable)
+    mock_index.compare = AsyncMock(side_effect=unavailable)
+
+    return mock_index
+
+
 @pytest.fixture
 def mock_database_rows():
     """Mock database rows for leaderboard queries."""
@@ -0,0 +1,21 @@
+"""Test helpers for mocked Redis clients."""
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+
+def forward_scripts(client: AsyncMock) -> AsyncMock:
+    """Run scripts registered on ``client`` through its ``evalsha`` mock.
+
+    The script text stands in for its SHA, so tests can stub results and
+    inspect calls as ``evalsha(script, numkeys, *keys, *args)``.
+    """
+
+    def register_script(script: str):
+        async def run(keys=(), args=()):
+            return await client.evalsha(script, len(keys), *keys, *args)
+
+        return run
+
+    client.register_script = MagicMock(side_effect=register_script)
+    return client
@@ -303,7 +303,7 @@ class TestGetConversations:
 
             assert response.status_code == status.HTTP_200_OK
             mock_repo.get_user_conversations.assert_called_once_with(
-                mock_user.pk, 10, 5
+                mock_user.pk, 10, 5, cursor=None
             )
 
 
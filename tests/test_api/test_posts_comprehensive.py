@@ -14,6 +14,7 @@ from fastapi import FastAPI
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from therobotoverlord_api.api.pagination import NEXT_CURSOR_HEADER
 from therobotoverlord_api.api.posts import moderator_dependency
 from therobotoverlord_api.api.posts import router as posts_router
 from therobotoverlord_api.auth.dependencies import get_current_user
@@ -24,6 +25,8 @@ from therobotoverlord_api.database.models.post import PostSummary
 from therobotoverlord_api.database.models.post import PostThread
 from therobotoverlord_api.database.models.post import PostWithAuthor
 from therobotoverlord_api.database.models.user import User
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.post import OLDEST_FIRST
 
 
 @pytest.fixture
@@ -173,7 +176,7 @@ class TestGetPosts:
         data = response.json()
         assert len(data) == 1
         assert data[0]["content"] == "This is a test post for debate"
-        mock_repo.get_recent_approved_posts.assert_called_once_with(50, 0)
+        mock_repo.get_recent_approved_posts.assert_called_once_with(50, 0, cursor=None)
 
     @patch("therobotoverlord_api.api.posts.PostRepository")
     def test_get_posts_by_topic(self, mock_repo_class, client, sample_post_with_author):
@@ -186,7 +189,9 @@ class TestGetPosts:
         response = client.get(f"/api/v1/posts/?topic_id={topic_id}")
 
         assert response.status_code == status.HTTP_200_OK
-        mock_repo.get_approved_by_topic.assert_called_once_with(topic_id, 50, 0)
+        mock_repo.get_approved_by_topic.assert_called_once_with(
+            topic_id, 50, 0, cursor=None
+        )
 
     @patch("therobotoverlord_api.api.posts.PostRepository")
     def test_get_posts_search(self, mock_repo_class, client, sample_post_with_author):
@@ -198,7 +203,62 @@ class TestGetPosts:
         response = client.get("/api/v1/posts/?search=test")
 
         assert response.status_code == status.HTTP_200_OK
-        mock_repo.search_posts.assert_called_once_with("test", None, 50, 0)
+        mock_repo.search_posts.assert_called_once_with("test", None, 50, 0, cursor=None)
+
+    @patch("therobotoverlord_api.api.posts.PostRepository")
+    def test_get_posts_with_cursor(
+        self, mock_repo_class, client, sample_post_with_author
+    ):
+        """Test keyset pagination passes the cursor and returns the next one."""
+        mock_repo = AsyncMock()
+        mock_repo.get_recent_approved_posts.return_value = [sample_post_with_author]
+        mock_repo_class.return_value = mock_repo
+
+        cursor = OLDEST_FIRST.cursor_for(sample_post_with_author)
+        response = client.get(f"/api/v1/posts/?limit=1&cursor={cursor.encode()}")
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_repo.get_recent_approved_posts.assert_called_once_with(1, 0, cursor=cursor)
+        next_cursor = KeysetCursor.decode(response.headers[NEXT_CURSOR_HEADER])
+        assert next_cursor == cursor
+
+    @patch("therobotoverlord_api.api.posts.PostRepository")
+    def test_get_posts_last_page_has_no_next_cursor(
+        self, mock_repo_class, client, sample_post_with_author
+    ):
+        """Test a short page does not advertise a next cursor."""
+        mock_repo = AsyncMock()
+        mock_repo.get_recent_approved_posts.return_value = [sample_post_with_author]
+        mock_repo_class.return_value = mock_repo
+
+        response = client.get("/api/v1/posts/?limit=2")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_get_posts_invalid_cursor(self, client):
+        """Test a malformed cursor is rejected."""
+        response = client.get("/api/v1/posts/?cursor=not-a-cursor")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            (datetime.now(UTC),),
+            (str(uuid4()), datetime.now(UTC)),
+            (datetime.now(UTC), uuid4(), 1),
+        ],
+    )
+    @patch("therobotoverlord_api.api.posts.PostRepository")
+    def test_get_posts_cursor_for_other_ordering(self, mock_repo_class, client, values):
+        """Test a cursor that does not fit the endpoint's ordering is rejected."""
+        cursor = KeysetCursor(values=values).encode()
+
+        response = client.get(f"/api/v1/posts/?cursor={cursor}")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_repo_class.assert_not_called()
 
 
 class TestGetPost:
@@ -664,7 +724,7 @@ class TestPublicEndpoints:
         assert len(data) == 1
         assert data[0]["topic_title"] == "Test Topic"
         mock_repo.get_by_author.assert_called_once_with(
-            author_id, ContentStatus.APPROVED, 50, 0
+            author_id, ContentStatus.APPROVED, 50, 0, cursor=None
         )
 
 
@@ -140,7 +140,7 @@ class TestGetTopics:
         assert len(data) == 1
         assert data[0]["title"] == "Test Topic"
         mock_repo.get_approved_topics.assert_called_once_with(
-            limit=50, offset=0, tag_names=None
+            limit=50, offset=0, tag_names=None, cursor=None
         )
 
     @patch("therobotoverlord_api.api.topics.TopicRepository")
@@ -155,7 +155,9 @@ class TestGetTopics:
         response = client.get("/api/v1/topics/?search=test")
 
         assert response.status_code == status.HTTP_200_OK
-        mock_repo.search_topics.assert_called_once_with("test", limit=50, offset=0)
+        mock_repo.search_topics.assert_called_once_with(
+            "test", limit=50, offset=0, cursor=None
+        )
 
     @patch("therobotoverlord_api.api.topics.TopicRepository")
     def test_get_topics_overlord_only(
@@ -169,7 +171,9 @@ class TestGetTopics:
         response = client.get("/api/v1/topics/?overlord_only=true")
 
         assert response.status_code == status.HTTP_200_OK
-        mock_repo.get_overlord_topics.assert_called_once_with(limit=50, offset=0)
+        mock_repo.get_overlord_topics.assert_called_once_with(
+            limit=50, offset=0, cursor=None
+        )
 
 
 class TestGetTopic:
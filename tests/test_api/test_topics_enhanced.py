@@ -142,7 +142,7 @@ class TestTopicsAPITagFiltering:
 
         # Verify repository was called with tag filter
         mock_repo.get_approved_topics.assert_called_once_with(
-            limit=50, offset=0, tag_names=["politics"]
+            limit=50, offset=0, tag_names=["politics"], cursor=None
         )
 
     @patch("therobotoverlord_api.api.topics.TopicRepository")
@@ -172,7 +172,7 @@ class TestTopicsAPITagFiltering:
 
         # Verify repository was called with multiple tags
         mock_repo.get_approved_topics.assert_called_once_with(
-            limit=50, offset=0, tag_names=["technology", "science"]
+            limit=50, offset=0, tag_names=["technology", "science"], cursor=None
         )
 
     @patch("therobotoverlord_api.api.topics.TopicRepository")
@@ -195,7 +195,7 @@ class TestTopicsAPITagFiltering:
 
         # Verify repository was called without tag filter
         mock_repo.get_approved_topics.assert_called_once_with(
-            limit=50, offset=0, tag_names=None
+            limit=50, offset=0, tag_names=None, cursor=None
         )
 
     @patch("therobotoverlord_api.api.topics.TopicRepository")
@@ -234,7 +234,7 @@ class TestTopicsAPITagFiltering:
 
         # Verify repository was called with correct parameters
         mock_repo.get_approved_topics.assert_called_once_with(
-            limit=1, offset=0, tag_names=["politics"]
+            limit=1, offset=0, tag_names=["politics"], cursor=None
         )
 
     @patch("therobotoverlord_api.api.topics.TopicRepository")
@@ -283,7 +283,7 @@ class TestTopicsAPITagFiltering:
 
         # Verify search was called
         mock_repo.search_topics.assert_called_once_with(
-            "technology", limit=50, offset=0
+            "technology", limit=50, offset=0, cursor=None
         )
 
 
@@ -564,7 +564,7 @@ class TestTopicsAPITagIntegration:
 
         # Verify search was called, not tag filtering
         mock_repo.search_topics.assert_called_once_with(
-            "technology", limit=50, offset=0
+            "technology", limit=50, offset=0, cursor=None
         )
         mock_repo.get_approved_topics.assert_not_called()
 
@@ -6,7 +6,12 @@ from datetime import timedelta
 from unittest.mock import patch
 from uuid import uuid4
 
+import jwt
+import pytest
+
+from therobotoverlord_api.auth.jwt_service import ClaimsCache
 from therobotoverlord_api.auth.jwt_service import JWTService
+from therobotoverlord_api.auth.jwt_service import claims_cache
 from therobotoverlord_api.auth.models import TokenClaims
 from therobotoverlord_api.database.models.base import UserRole
 
@@ -271,3 +276,91 @@ class TestJWTService:
             token_pair.refresh_token.session_id for token_pair in token_pairs
         ]
         assert len(set(session_ids)) == len(session_ids)
+
+
+class TestClaimsCache:
+    """Test caching of verified access token claims."""
+
+    def test_repeat_decode_skips_verification(self, jwt_service, valid_access_token):
+        """Test a token is only verified the first time it is seen."""
+        claims_cache.clear()
+
+        with patch(
+            "therobotoverlord_api.auth.jwt_service.jwt.decode", wraps=jwt.decode
+        ) as mock_decode:
+            first = jwt_service.decode_token(valid_access_token)
+            second = jwt_service.decode_token_claims(valid_access_token)
+
+        assert first is second
+        mock_decode.assert_called_once()
+
+    def test_expired_entries_are_not_served(self, jwt_service, valid_access_token):
+        """Test claims leave the cache once the token expires."""
+        claims_cache.clear()
+        claims = jwt_service.decode_token(valid_access_token)
+
+        with patch(
+            "therobotoverlord_api.auth.jwt_service.time.time",
+            return_value=claims.exp,
+        ):
+            assert claims_cache.get(next(iter(claims_cache._entries))) is None
+
+        assert claims_cache.stats()["size"] == 0
+
+    def test_token_version_revokes_cached_tokens(
+        self, jwt_service, auth_settings, valid_access_token
+    ):
+        """Test raising the token version rejects tokens already cached."""
+        assert jwt_service.decode_token(valid_access_token) is not None
+
+        with patch(
+            "therobotoverlord_api.auth.jwt_service.get_auth_settings",
+            return_value=auth_settings.model_copy(update={"jwt_token_version": 2}),
+        ):
+            revoking_service = JWTService()
+
+        assert revoking_service.decode_token(valid_access_token) is None
+        new_pair = revoking_service.create_token_pair(
+            user_id=uuid4(), role=UserRole.CITIZEN
+        )
+        assert revoking_service.decode_token(new_pair.access_token.token) is not None
+
+    def test_cache_is_scoped_to_verification_settings(
+        self, jwt_service, auth_settings, valid_access_token
+    ):
+        """Test a token cached under one secret is not accepted under another."""
+        assert jwt_service.decode_token(valid_access_token) is not None
+
+        with patch(
+            "therobotoverlord_api.auth.jwt_service.get_auth_settings",
+            return_value=auth_settings.model_copy(
+                update={"jwt_secret_key": "another_secret_key_32_bytes_long_1"}
+            ),
+        ):
+            other_service = JWTService()
+
+        assert other_service.decode_token(valid_access_token) is None
+
+    def test_least_recently_used_tokens_are_evicted(self, test_token_claims):
+        """Test the cache never grows past its size."""
+        cache = ClaimsCache(max_size=2)
+        for key in (b"a", b"b", b"c"):
+            cache.set(key, test_token_claims)
+
+        assert cache.get(b"a") is None
+        assert cache.get(b"c") is test_token_claims
+        assert cache.stats() == {"size": 2, "hits": 1, "misses": 1}
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["verify", "cached"])
+def test_benchmark_decode_token(benchmark, cached, jwt_service, valid_access_token):
+    """Benchmark decoding the same access token on every request."""
+
+    def decode():
+        if not cached:
+            claims_cache.clear()
+        return jwt_service.decode_token(valid_access_token)
+
+    claims = benchmark(decode)
+
+    assert claims is not None
@@ -0,0 +1,168 @@
+"""Tests for the shared authenticated user cache."""
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+
+from starlette.requests import Request
+
+from therobotoverlord_api.auth.dependencies import get_current_user
+from therobotoverlord_api.auth.principal_cache import INVALIDATION_CHANNEL
+from therobotoverlord_api.auth.principal_cache import PrincipalCache
+from therobotoverlord_api.config.auth import AuthSettings
+from therobotoverlord_api.database.models.user import UserUpdate
+from therobotoverlord_api.database.repositories.user import UserRepository
+
+REDIS_CLIENT = "therobotoverlord_api.auth.principal_cache.get_redis_client"
+
+
+@pytest.fixture
+def redis_client():
+    """Mock Redis client with an empty cache."""
+    client = MagicMock()
+    client.get = AsyncMock(return_value=None)
+    client.setex = AsyncMock()
+    client.delete = AsyncMock()
+    client.publish = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def cache(redis_client):
+    """Principal cache backed by the mock Redis client."""
+    with patch(REDIS_CLIENT, AsyncMock(return_value=redis_client)):
+        yield PrincipalCache(AuthSettings(principal_cache_size=2))
+
+
+class TestPrincipalCache:
+    """Test local and Redis principal lookups."""
+
+    @pytest.mark.asyncio
+    async def test_miss_loads_user_and_fills_both_levels(
+        self, cache, redis_client, test_user
+    ):
+        """Test a miss reads the database once and caches the user."""
+        load = AsyncMock(return_value=test_user)
+
+        assert await cache.get(test_user.pk, load) == test_user
+        assert await cache.get(test_user.pk, load) == test_user
+
+        load.assert_awaited_once_with(test_user.pk)
+        redis_client.setex.assert_awaited_once()
+        assert redis_client.setex.await_args.args[0] == f"auth:principal:{test_user.pk}"
+        assert cache.stats()["local_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_skips_database(self, cache, redis_client, test_user):
+        """Test a user cached by another process is not reloaded."""
+        redis_client.get.return_value = test_user.model_dump_json()
+        load = AsyncMock()
+
+        user = await cache.get(test_user.pk, load)
+
+        assert user == test_user
+        load.assert_not_awaited()
+        assert cache.stats()["redis_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_is_not_cached(self, cache, redis_client, test_user):
+        """Test missing users are looked up again next time."""
+        load = AsyncMock(return_value=None)
+
+        assert await cache.get(test_user.pk, load) is None
+        assert await cache.get(test_user.pk, load) is None
+
+        assert load.await_count == 2
+        redis_client.setex.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_expired_local_entry_is_reloaded(self, cache, test_user):
+        """Test local entries only live for the local TTL."""
+        cache.local_ttl = 0
+        load = AsyncMock(return_value=test_user)
+
+        await cache.get(test_user.pk, load)
+        await cache.get(test_user.pk, load)
+
+        assert load.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_user_is_evicted(self, cache, test_user):
+        """Test the local cache never grows past its size."""
+        users = [
+            test_user.model_copy(update={"pk": UUID(int=index)}) for index in range(3)
+        ]
+
+        for user in users:
+            await cache.get(user.pk, AsyncMock(return_value=user))
+
+        assert cache.stats()["size"] == 2
+        assert cache._get_local(UUID(int=0)) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_publishes_to_other_processes(
+        self, cache, redis_client, test_user
+    ):
+        """Test invalidation clears every level and notifies other processes."""
+        await cache.get(test_user.pk, AsyncMock(return_value=test_user))
+
+        await cache.invalidate(test_user.pk)
+
+        assert cache.stats()["size"] == 0
+        redis_client.delete.assert_awaited_once_with(f"auth:principal:{test_user.pk}")
+        redis_client.publish.assert_awaited_once_with(
+            INVALIDATION_CHANNEL, str(test_user.pk)
+        )
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_falls_back_to_database(
+        self, cache, redis_client, test_user
+    ):
+        """Test Redis errors degrade to database lookups and back off."""
+        redis_client.get.side_effect = ConnectionError("redis down")
+        cache.local_ttl = 0
+        load = AsyncMock(return_value=test_user)
+
+        assert await cache.get(test_user.pk, load) == test_user
+        assert await cache.get(test_user.pk, load) == test_user
+
+        redis_client.get.assert_awaited_once()
+        assert load.await_count == 2
+
+
+class TestSharedPrincipal:
+    """Test the middleware, dependencies and repository share the cache."""
+
+    @pytest.mark.asyncio
+    async def test_dependency_reuses_middleware_principal(self, test_user):
+        """Test the resolved user on the request is returned without a lookup."""
+        request = Request({"type": "http", "headers": []})
+        request.state.principal = test_user
+
+        with patch(
+            "therobotoverlord_api.auth.dependencies.principal_cache.get"
+        ) as mock_get:
+            assert await get_current_user(request) is test_user
+
+        mock_get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_user_invalidates_principal(self, test_user):
+        """Test bans and role changes evict the cached user."""
+        repository = UserRepository()
+
+        with (
+            patch.object(
+                repository, "update_from_dict", AsyncMock(return_value=test_user)
+            ),
+            patch(
+                "therobotoverlord_api.database.repositories.user.principal_cache"
+            ) as mock_cache,
+        ):
+            mock_cache.invalidate = AsyncMock()
+            await repository.update_user(test_user.pk, UserUpdate(is_banned=True))
+
+        mock_cache.invalidate.assert_awaited_once_with(test_user.pk)
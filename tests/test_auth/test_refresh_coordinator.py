@@ -0,0 +1,141 @@
+"""Tests for single-flight refresh token rotation."""
+
+import asyncio
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from therobotoverlord_api.auth.refresh_coordinator import RefreshCoordinator
+from therobotoverlord_api.config.auth import AuthSettings
+from therobotoverlord_api.database.models.base import UserRole
+
+REDIS_CLIENT = "therobotoverlord_api.auth.refresh_coordinator.get_redis_client"
+
+
+@pytest.fixture
+def token_pair(jwt_service, test_user_id):
+    """Token pair produced by a rotation."""
+    return jwt_service.create_token_pair(
+        user_id=test_user_id,
+        role=UserRole.CITIZEN,
+        permissions=["view_content"],
+        session_id="test_session_id",
+    )
+
+
+@pytest.fixture
+def redis_client():
+    """Mock Redis client with a free lock and no shared result."""
+    client = MagicMock()
+    client.get = AsyncMock(return_value=None)
+    client.set = AsyncMock(return_value=True)
+    client.setex = AsyncMock()
+    client.eval = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def coordinator(redis_client):
+    """Refresh coordinator backed by the mock Redis client."""
+    with patch(REDIS_CLIENT, AsyncMock(return_value=redis_client)):
+        yield RefreshCoordinator(AuthSettings(refresh_lock_ttl=1))
+
+
+def _slow_rotation(token_pair):
+    """Rotation that yields to other requests before finishing."""
+
+    async def rotate():
+        await asyncio.sleep(0.01)
+        return token_pair
+
+    return AsyncMock(side_effect=rotate)
+
+
+class TestRefreshCoordinator:
+    """Test coalescing refreshes of the same refresh token."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_refreshes_share_one_rotation(
+        self, coordinator, redis_client, token_pair
+    ):
+        """Test concurrent requests in one process rotate once."""
+        rotate = _slow_rotation(token_pair)
+
+        results = await asyncio.gather(
+            *(coordinator.refresh("sid", "old_token", rotate) for _ in range(5))
+        )
+
+        assert all(result is token_pair for result in results)
+        rotate.assert_awaited_once()
+        redis_client.setex.assert_awaited_once()
+        redis_client.eval.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_other_process_result_is_reused(
+        self, coordinator, redis_client, token_pair
+    ):
+        """Test a rotation by another process is picked up from Redis."""
+        redis_client.set.return_value = False
+        redis_client.get.side_effect = [None, token_pair.model_dump_json()]
+        rotate = AsyncMock()
+
+        result = await coordinator.refresh("sid", "old_token", rotate)
+
+        assert result == token_pair
+        rotate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_lock_is_never_released(
+        self, coordinator, redis_client
+    ):
+        """Test waiting is bounded by the lock TTL."""
+        coordinator.lock_ttl = 0
+        redis_client.set.return_value = False
+        rotate = AsyncMock()
+
+        assert await coordinator.refresh("sid", "old_token", rotate) is None
+        rotate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_different_tokens_are_not_shared(self, coordinator, token_pair):
+        """Test a result is only handed to holders of the same refresh token."""
+        rotate = _slow_rotation(token_pair)
+
+        await asyncio.gather(
+            coordinator.refresh("sid", "first_token", rotate),
+            coordinator.refresh("sid", "second_token", rotate),
+        )
+
+        assert rotate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_rotation_fails_every_waiter(self, coordinator):
+        """Test waiters get no tokens when the leading rotation raises."""
+
+        async def rotate():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("database down")
+
+        leader, follower = await asyncio.gather(
+            coordinator.refresh("sid", "old_token", rotate),
+            coordinator.refresh("sid", "old_token", rotate),
+            return_exceptions=True,
+        )
+
+        assert isinstance(leader, RuntimeError)
+        assert follower is None
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_rotates_directly(self, token_pair):
+        """Test refresh still works without Redis."""
+        coordinator = RefreshCoordinator()
+        rotate = AsyncMock(return_value=token_pair)
+
+        with patch(REDIS_CLIENT, AsyncMock(side_effect=ConnectionError("down"))):
+            result = await coordinator.refresh("sid", "old_token", rotate)
+
+        assert result is token_pair
+        rotate.assert_awaited_once()
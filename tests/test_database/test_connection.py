@@ -1,17 +1,28 @@
 """Tests for database connection module."""
 
+import asyncio
 import logging
 
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
 
+from therobotoverlord_api.database.connection import ConnectionScope
 from therobotoverlord_api.database.connection import Database
+from therobotoverlord_api.database.connection import PrimaryConnection
 from therobotoverlord_api.database.connection import close_database
 from therobotoverlord_api.database.connection import db
+from therobotoverlord_api.database.connection import get_current_scope
 from therobotoverlord_api.database.connection import get_db_connection
+from therobotoverlord_api.database.connection import get_db_read_connection
 from therobotoverlord_api.database.connection import get_db_transaction
 from therobotoverlord_api.database.connection import init_database
+from therobotoverlord_api.database.connection import pin_reads_to_primary
+from therobotoverlord_api.database.connection import request_scope
+from therobotoverlord_api.database.connection import unit_of_work
 
 
 class TestDatabase:
@@ -277,3 +288,339 @@ class TestGlobalFunctions:
 
             async with get_db_transaction() as conn:
                 assert conn == mock_connection
+
+
+def _counting_get_connection():
+    """Build a fake Database.get_connection that hands out distinct connections."""
+    acquired = []
+
+    @asynccontextmanager
+    async def fake_get_connection():
+        connection = MagicMock()
+        connection.fetchval = AsyncMock(return_value=1)
+        transaction = MagicMock()
+        transaction.__aenter__ = AsyncMock(return_value=None)
+        transaction.__aexit__ = AsyncMock(return_value=None)
+        connection.transaction.return_value = transaction
+        acquired.append(connection)
+        yield connection
+
+    return fake_get_connection, acquired
+
+
+class TestConnectionScope:
+    """Test request-scoped connection sharing."""
+
+    @pytest.mark.asyncio
+    async def test_request_scope_reuses_one_connection(self):
+        """Sequential repository calls share one pooled connection."""
+        fake_get_connection, acquired = _counting_get_connection()
+
+        with patch.object(db, "get_connection", fake_get_connection):
+            async with request_scope() as scope:
+                assert get_current_scope() is scope
+                assert not scope.acquired
+
+                async with get_db_connection() as first:
+                    pass
+                async with get_db_connection() as second:
+                    pass
+
+                assert first is second
+                assert scope.acquired
+
+        assert len(acquired) == 1
+        assert get_current_scope() is None
+
+    @pytest.mark.asyncio
+    async def test_request_scope_without_queries_acquires_nothing(self):
+        """A request that never touches the database never checks out."""
+        fake_get_connection, acquired = _counting_get_connection()
+
+        with patch.object(db, "get_connection", fake_get_connection):
+            async with request_scope():
+                pass
+
+        assert acquired == []
+
+    @pytest.mark.asyncio
+    async def test_nested_use_in_same_task_reuses_connection(self):
+        """Nested get_db_connection calls from the holder task reuse it."""
+        fake_get_connection, acquired = _counting_get_connection()
+
+        with patch.object(db, "get_connection", fake_get_connection):
+            async with request_scope():
+                async with get_db_connection() as outer:
+                    async with get_db_connection() as inner:
+                        assert inner is outer
+
+        assert len(acquired) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_fall_back_to_pool(self):
+        """Concurrent tasks never share a connection outside a transaction."""
+        fake_get_connection, acquired = _counting_get_connection()
+        in_use = asyncio.Event()
+        release = asyncio.Event()
+
+        async def hold():
+            async with get_db_connection() as connection:
+                in_use.set()
+                await release.wait()
+                return connection
+
+        async def borrow():
+            await in_use.wait()
+            async with get_db_connection() as connection:
+                release.set()
+                return connection
+
+        with patch.object(db, "get_connection", fake_get_connection):
+            async with request_scope():
+                held, borrowed = await asyncio.gather(hold(), borrow())
+
+        assert held is not borrowed
+        assert len(acquired) == 2
+
+    @pytest.mark.asyncio
+    async def test_request_scope_is_reentrant(self):
+        """Entering request_scope twice keeps the outer scope."""
+        with patch.object(db, "get_connection", _counting_get_connection()[0]):
+            async with request_scope() as outer:
+                async with request_scope() as inner:
+                    assert inner is outer
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_binds_transactional_scope(self):
+        """Repository calls inside a unit of work use the transaction."""
+        fake_get_connection, acquired = _counting_get_connection()
+
+        with patch.object(db, "get_connection", fake_get_connection):
+            async with request_scope():
+                async with unit_of_work() as uow_connection:
+                    scope = get_current_scope()
+                    assert isinstance(scope, ConnectionScope)
+                    assert scope.transactional
+
+                    async with get_db_connection() as connection:
+                        assert connection is uow_connection
+
+                async with get_db_connection() as connection:
+                    assert connection is uow_connection
+
+        assert len(acquired) == 1
+        acquired[0].transaction.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_serializes_concurrent_tasks(self):
+        """Tasks spawned inside a unit of work stay on the transaction."""
+        fake_get_connection, acquired = _counting_get_connection()
+
+        async def query():
+            async with get_db_connection() as connection:
+                await asyncio.sleep(0)
+                return connection
+
+        with patch.object(db, "get_connection", fake_get_connection):
+            async with unit_of_work() as uow_connection:
+                results = await asyncio.gather(query(), query(), query())
+
+        assert all(connection is uow_connection for connection in results)
+        assert len(acquired) == 1
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_the_holder(self):
+        """Closing a scope never releases a connection still in use."""
+        fake_get_connection, _ = _counting_get_connection()
+        in_use = asyncio.Event()
+        release = asyncio.Event()
+        scope = ConnectionScope(db)
+
+        async def hold():
+            async with scope.use():
+                in_use.set()
+                await release.wait()
+                return scope.acquired
+
+        with patch.object(db, "get_connection", fake_get_connection):
+            holder = asyncio.create_task(hold())
+            await in_use.wait()
+            closing = asyncio.create_task(scope.close())
+            await asyncio.sleep(0)
+
+            assert not closing.done()
+            release.set()
+            assert await holder
+            await closing
+
+        assert not scope.acquired
+
+    @pytest.mark.asyncio
+    async def test_use_after_close_falls_back_to_pool(self):
+        """Tasks outliving their scope borrow a connection of their own."""
+        fake_get_connection, acquired = _counting_get_connection()
+
+        with patch.object(db, "get_connection", fake_get_connection):
+            async with request_scope() as scope:
+                async with get_db_connection() as scoped:
+                    pass
+
+            async with scope.use() as late:
+                assert late is not scoped
+
+        assert len(acquired) == 2
+        assert not scope.acquired
+
+
+def _read_pool_with(connection):
+    """Build a fake read pool whose acquire() yields the given connection."""
+    read_pool = MagicMock()
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=connection)
+    acquire.__aexit__ = AsyncMock(return_value=None)
+    read_pool.acquire.return_value = acquire
+    return read_pool
+
+
+class TestReadReplicaRouting:
+    """Test routing of read-only queries to the read replica."""
+
+    @pytest.fixture
+    def replica_connection(self):
+        """Connection handed out by the fake replica pool."""
+        return MagicMock(name="replica_connection")
+
+    @pytest.fixture
+    def replica_db(self, replica_connection):
+        """Attach a fresh fake replica pool to the global database."""
+        with (
+            patch.object(db, "_read_pool", _read_pool_with(replica_connection)),
+            patch.object(db, "replica_is_fresh", AsyncMock(return_value=True)),
+        ):
+            yield db
+
+    @pytest.mark.asyncio
+    async def test_reads_use_primary_without_replica(self, mock_connection):
+        """Without a replica configured reads go to the primary."""
+        with patch.object(db, "get_connection") as mock_get_connection:
+            mock_get_connection.return_value.__aenter__.return_value = mock_connection
+
+            async with get_db_read_connection() as conn:
+                assert conn is mock_connection
+
+    @pytest.mark.asyncio
+    async def test_reads_use_fresh_replica(self, replica_db, replica_connection):
+        """A fresh replica serves read-only queries."""
+        async with get_db_read_connection() as conn:
+            assert conn is replica_connection
+
+    @pytest.mark.asyncio
+    async def test_lagging_replica_falls_back_to_primary(
+        self, replica_db, mock_connection
+    ):
+        """A lagging replica sends reads back to the primary."""
+        replica_db.replica_is_fresh.return_value = False
+
+        with patch.object(db, "get_connection") as mock_get_connection:
+            mock_get_connection.return_value.__aenter__.return_value = mock_connection
+
+            async with get_db_read_connection() as conn:
+                assert conn is mock_connection
+
+    @pytest.mark.asyncio
+    async def test_write_pins_reads_to_primary(self, replica_db, replica_connection):
+        """Reads after a write in the same request stay on the primary."""
+        fake_get_connection, acquired = _counting_get_connection()
+
+        with patch.object(db, "get_connection", fake_get_connection):
+            async with request_scope():
+                async with get_db_read_connection() as conn:
+                    assert conn is replica_connection
+
+                pin_reads_to_primary()
+
+                async with get_db_read_connection() as conn:
+                    assert conn is acquired[0]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("query", "pinned"),
+        [
+            ("UPDATE users SET loyalty_score = $1 WHERE pk = $2", True),
+            ("\n    insert into posts (pk) values ($1) returning *", True),
+            ("SELECT * FROM users WHERE pk = $1", False),
+        ],
+    )
+    async def test_primary_writes_pin_reads(self, query, pinned):
+        """Raw SQL writes on the primary pin the scope; reads do not."""
+        connection = PrimaryConnection.__new__(PrimaryConnection)
+
+        with patch("asyncpg.Connection.fetchrow", AsyncMock()) as fetchrow:
+            async with request_scope() as scope:
+                await connection.fetchrow(query, 1)
+
+                assert scope.primary_pinned is pinned
+        fetchrow.assert_awaited_once_with(query, 1)
+
+    @pytest.mark.asyncio
+    async def test_primary_transaction_pins_reads(self):
+        """Opening a transaction on the primary pins the scope."""
+        connection = PrimaryConnection.__new__(PrimaryConnection)
+
+        with patch("asyncpg.Connection.transaction") as transaction:
+            async with request_scope() as scope:
+                connection.transaction()
+
+                assert scope.primary_pinned
+        transaction.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_reads_stay_on_transaction(self, replica_db):
+        """Reads inside a unit of work see the transaction's writes."""
+        fake_get_connection, _ = _counting_get_connection()
+
+        with patch.object(db, "get_connection", fake_get_connection):
+            async with unit_of_work() as uow_connection:
+                async with get_db_read_connection() as conn:
+                    assert conn is uow_connection
+
+    @pytest.mark.asyncio
+    async def test_replica_lag_is_checked_once_per_interval(
+        self, mock_database_settings
+    ):
+        """Replication lag is measured at most once per check interval."""
+        mock_database_settings.replica_max_lag_seconds = 5.0
+        mock_database_settings.replica_lag_check_interval = 60.0
+        with patch(
+            "therobotoverlord_api.database.connection.get_database_settings",
+            return_value=mock_database_settings,
+        ):
+            database = Database()
+
+        replica_connection = MagicMock()
+        replica_connection.fetchval = AsyncMock(return_value=1.5)
+        database._read_pool = _read_pool_with(replica_connection)
+
+        assert await database.replica_is_fresh() is True
+        assert await database.replica_is_fresh() is True
+        replica_connection.fetchval.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_replica_lag_above_limit_is_not_fresh(self, mock_database_settings):
+        """Lag above the limit, or a failed check, marks the replica stale."""
+        mock_database_settings.replica_max_lag_seconds = 5.0
+        mock_database_settings.replica_lag_check_interval = 0.0
+        with patch(
+            "therobotoverlord_api.database.connection.get_database_settings",
+            return_value=mock_database_settings,
+        ):
+            database = Database()
+
+        replica_connection = MagicMock()
+        replica_connection.fetchval = AsyncMock(return_value=30.0)
+        database._read_pool = _read_pool_with(replica_connection)
+
+        assert await database.replica_is_fresh() is False
+
+        replica_connection.fetchval.side_effect = Exception("replica down")
+        assert await database.replica_is_fresh() is False
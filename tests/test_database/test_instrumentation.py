@@ -0,0 +1,178 @@
+"""Tests for query instrumentation."""
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from asyncpg.connection import LoggedQuery
+
+from therobotoverlord_api.database.connection import db
+from therobotoverlord_api.database.connection import get_db_connection
+from therobotoverlord_api.database.instrumentation import LatencyHistogram
+from therobotoverlord_api.database.instrumentation import QueryMetrics
+from therobotoverlord_api.database.instrumentation import describe_param
+from therobotoverlord_api.database.instrumentation import normalize_statement
+from therobotoverlord_api.database.instrumentation import query_metrics
+from therobotoverlord_api.database.instrumentation import tag_caller
+
+
+def _logged(query="SELECT 1", args=(), elapsed=0.002, exception=None):
+    """Build an asyncpg query log record."""
+    return LoggedQuery(
+        query=query,
+        args=args,
+        timeout=None,
+        elapsed=elapsed,
+        exception=exception,
+        conn_addr=None,
+        conn_params=None,
+    )
+
+
+@pytest.fixture
+def metrics():
+    """Fresh metrics with a 100ms slow-query threshold."""
+    metrics = QueryMetrics()
+    metrics.enabled = True
+    metrics.slow_query_threshold_ms = 100.0
+    return metrics
+
+
+class FakeRepository:
+    """Repository stand-in whose queries should be tagged with its name."""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    async def get_things(self):
+        async with get_db_connection():
+            # asyncpg runs query loggers in the context of the query
+            self.metrics.record_query(_logged("SELECT * FROM things"))
+
+
+class TestQueryMetrics:
+    """Test QueryMetrics recording."""
+
+    def test_statements_are_normalized(self):
+        """Test whitespace differences map to one statement."""
+        assert normalize_statement("SELECT *\n    FROM t\n") == "SELECT * FROM t"
+
+    @pytest.mark.parametrize(
+        ("value", "shape"),
+        [
+            (None, "null"),
+            (5, "int"),
+            ("secret", "str(6)"),
+            ([uuid4(), uuid4()], "UUID[2]"),
+            ([], "empty[0]"),
+        ],
+    )
+    def test_param_shapes_hide_values(self, value, shape):
+        """Test parameters are described by type and size only."""
+        assert describe_param(value) == shape
+
+    def test_records_latency_per_statement(self, metrics):
+        """Test repeated statements accumulate into one histogram."""
+        metrics.record_query(_logged(elapsed=0.002))
+        metrics.record_query(_logged(elapsed=0.030))
+
+        statement = metrics.snapshot()["statements"][0]
+        assert statement["caller"] == "unknown"
+        assert statement["count"] == 2
+        assert statement["max_ms"] == pytest.approx(30.0)
+        assert statement["buckets"]["le_5ms"] == 1
+        assert statement["buckets"]["le_50ms"] == 1
+
+    def test_errors_are_counted(self, metrics):
+        """Test failed statements are counted as errors."""
+        metrics.record_query(_logged(exception=ValueError("boom")))
+
+        assert metrics.summary()["errors"] == 1
+
+    def test_slow_query_log_captures_param_shapes(self, metrics):
+        """Test slow statements are logged with parameter shapes."""
+        metrics.record_query(_logged(elapsed=0.050))
+        metrics.record_query(
+            _logged("SELECT * FROM users WHERE pk = $1", (uuid4(),), elapsed=0.250)
+        )
+
+        slow_log = metrics.snapshot()["slow_query_log"]
+        assert len(slow_log) == 1
+        assert slow_log[0]["statement"] == "SELECT * FROM users WHERE pk = $1"
+        assert slow_log[0]["param_shapes"] == ["UUID"]
+        assert slow_log[0]["elapsed_ms"] == pytest.approx(250.0)
+
+    def test_pool_wait_is_tracked_separately(self, metrics):
+        """Test pool-wait time does not count as query time."""
+        metrics.record_pool_wait(0.010)
+
+        summary = metrics.summary()
+        assert summary["queries"] == 0
+        assert summary["pool_wait"]["count"] == 1
+        assert summary["pool_wait"]["total_ms"] == pytest.approx(10.0)
+
+    def test_disabled_metrics_skip_pool_wait(self, metrics):
+        """Test disabling instrumentation stops pool-wait recording."""
+        metrics.enabled = False
+        metrics.record_pool_wait(0.010)
+
+        assert metrics.summary()["pool_wait"]["count"] == 0
+
+    def test_reset(self, metrics):
+        """Test reset clears every metric."""
+        metrics.record_query(_logged(elapsed=0.500))
+        metrics.record_pool_wait(0.010)
+
+        metrics.reset()
+
+        snapshot = metrics.snapshot()
+        assert snapshot["statements"] == []
+        assert snapshot["slow_query_log"] == []
+        assert snapshot["pool_wait"]["count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queries_are_tagged_with_calling_method(self, metrics):
+        """Test queries are attributed to the repository method that ran them."""
+        with (
+            patch.object(query_metrics, "enabled", True),
+            patch.object(db, "get_connection") as mock_get_connection,
+        ):
+            mock_get_connection.return_value.__aenter__.return_value = MagicMock()
+
+            await FakeRepository(metrics).get_things()
+
+        statement = metrics.snapshot()["statements"][0]
+        assert statement["caller"] == "FakeRepository.get_things"
+
+    def test_callers_are_not_looked_up_when_disabled(self):
+        """Test the stack is not walked while instrumentation is off."""
+        with (
+            patch.object(query_metrics, "enabled", False),
+            patch(
+                "therobotoverlord_api.database.instrumentation.find_caller"
+            ) as find_caller,
+            tag_caller(),
+        ):
+            pass
+
+        find_caller.assert_not_called()
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram percentiles."""
+
+    def test_empty_histogram(self):
+        """Test an empty histogram has no percentiles."""
+        assert LatencyHistogram().percentile(0.5) is None
+
+    def test_percentiles_use_bucket_bounds(self):
+        """Test percentiles resolve to their bucket's upper bound."""
+        histogram = LatencyHistogram()
+        for elapsed_ms in [0.5] * 90 + [80.0] * 9 + [9000.0]:
+            histogram.observe(elapsed_ms)
+
+        assert histogram.percentile(0.5) == 1.0
+        assert histogram.percentile(0.95) == 100.0
+        assert histogram.percentile(1.0) == 9000.0
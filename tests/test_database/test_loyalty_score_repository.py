@@ -132,10 +132,14 @@ class TestLoyaltyScoreRepository:
         assert result.new_score == 15
 
     @pytest.mark.asyncio
+    @patch("therobotoverlord_api.database.repositories.loyalty_score.principal_cache")
+    @patch("therobotoverlord_api.database.repositories.loyalty_score.leaderboard_index")
     @patch("therobotoverlord_api.database.repositories.loyalty_score.get_db_connection")
     async def test_record_moderation_event_success(
         self,
         mock_get_db_connection,
+        mock_leaderboard_index,
+        mock_principal_cache,
         repository,
         sample_user_pk,
         sample_content_pk,
@@ -150,7 +154,13 @@ class TestLoyaltyScoreRepository:
         mock_get_db_connection.return_value.__aexit__ = AsyncMock(return_value=None)
 
         # Mock current user score lookup
-        mock_conn.fetchrow.return_value = {"loyalty_score": 10}
+        mock_conn.fetchrow.return_value = {
+            "loyalty_score": 10,
+            "is_banned": False,
+            "is_active": True,
+        }
+        mock_leaderboard_index.update = AsyncMock()
+        mock_principal_cache.invalidate = AsyncMock()
 
         result = await repository.record_moderation_event(
             user_pk=sample_user_pk,
@@ -179,6 +189,11 @@ class TestLoyaltyScoreRepository:
         assert result.previous_score == 10
         assert result.new_score == 15
 
+        # The live ranking index gets the new score
+        mock_leaderboard_index.update.assert_awaited_once_with(sample_user_pk, 15)
+        # Cached principals must not keep the old score
+        mock_principal_cache.invalidate.assert_awaited_once_with(sample_user_pk)
+
     @pytest.mark.asyncio
     @patch("therobotoverlord_api.database.repositories.loyalty_score.get_db_connection")
     async def test_record_moderation_event_user_not_found(
@@ -0,0 +1,138 @@
+"""Tests for monthly partition maintenance."""
+
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from therobotoverlord_api.config.database import DatabaseSettings
+from therobotoverlord_api.database.partitions import PartitionPolicy
+from therobotoverlord_api.database.partitions import RetentionAction
+from therobotoverlord_api.database.partitions import add_months
+from therobotoverlord_api.database.partitions import expire_partitions
+from therobotoverlord_api.database.partitions import get_partition_policies
+from therobotoverlord_api.database.partitions import partition_month
+from therobotoverlord_api.database.partitions import retention_cutoff
+from therobotoverlord_api.database.partitions import run_partition_maintenance
+
+NOW = datetime(2026, 3, 15, tzinfo=UTC)
+
+
+def _connection(partitions: list[str]) -> MagicMock:
+    """Mock connection whose catalog lists ``partitions``."""
+    connection = MagicMock()
+    connection.fetch = AsyncMock(
+        return_value=[{"relname": partition} for partition in partitions]
+    )
+    connection.fetchval = AsyncMock(return_value=4)
+    connection.execute = AsyncMock()
+    return connection
+
+
+class TestPartitionMonths:
+    """Test month arithmetic and partition naming."""
+
+    @pytest.mark.parametrize(
+        ("months", "expected"),
+        [(0, date(2026, 3, 1)), (-3, date(2025, 12, 1)), (10, date(2027, 1, 1))],
+    )
+    def test_add_months(self, months, expected):
+        """Test adding months across year boundaries."""
+        assert add_months(date(2026, 3, 1), months) == expected
+
+    def test_partition_month(self):
+        """Test the month is read from the partition name."""
+        assert partition_month("admin_actions_p202412") == date(2024, 12, 1)
+        assert partition_month("admin_actions_archive") is None
+
+    def test_retention_cutoff(self):
+        """Test the cutoff keeps whole months back from the current one."""
+        policy = PartitionPolicy(table="admin_actions", retention_months=24)
+
+        assert retention_cutoff(policy, NOW) == date(2024, 3, 1)
+
+    def test_zero_retention_keeps_everything(self):
+        """Test a zero retention never expires partitions."""
+        assert retention_cutoff(PartitionPolicy(table="t"), NOW) is None
+
+    def test_loyalty_events_are_kept_forever(self):
+        """Test loyalty tables are never expired by default."""
+        policies = {p.table: p for p in get_partition_policies(DatabaseSettings())}
+
+        assert policies["loyalty_score_events"].retention_months == 0
+        assert policies["dashboard_snapshots"].action is RetentionAction.DROP
+
+
+class TestExpirePartitions:
+    """Test detaching partitions past their retention."""
+
+    @pytest.mark.asyncio
+    async def test_archives_expired_partitions(self):
+        """Test old months are detached and moved to the archive schema."""
+        connection = _connection(
+            [
+                "admin_actions_p202401",
+                "admin_actions_p202402",
+                "admin_actions_p202403",
+            ]
+        )
+        policy = PartitionPolicy(table="admin_actions", retention_months=24)
+
+        expired = await expire_partitions(connection, policy, NOW)
+
+        assert expired == ["admin_actions_p202401", "admin_actions_p202402"]
+        connection.execute.assert_any_await(
+            "ALTER TABLE admin_actions DETACH PARTITION admin_actions_p202401"
+        )
+        connection.execute.assert_any_await(
+            "ALTER TABLE admin_actions_p202401 SET SCHEMA archive"
+        )
+
+    @pytest.mark.asyncio
+    async def test_drops_expired_partitions(self):
+        """Test drop policies remove the detached partition."""
+        connection = _connection(["dashboard_snapshots_p202301"])
+        policy = PartitionPolicy(
+            table="dashboard_snapshots",
+            retention_months=36,
+            action=RetentionAction.DROP,
+        )
+
+        await expire_partitions(connection, policy, NOW)
+
+        connection.execute.assert_any_await("DROP TABLE dashboard_snapshots_p202301")
+
+    @pytest.mark.asyncio
+    async def test_unlimited_retention_skips_catalog(self):
+        """Test tables kept forever are not even listed."""
+        connection = _connection(["loyalty_score_events_p201901"])
+
+        expired = await expire_partitions(
+            connection, PartitionPolicy(table="loyalty_score_events"), NOW
+        )
+
+        assert expired == []
+        connection.fetch.assert_not_called()
+
+
+class TestRunPartitionMaintenance:
+    """Test the maintenance entry point."""
+
+    @pytest.mark.asyncio
+    async def test_creates_partitions_ahead_for_every_table(self):
+        """Test every policy table gets its upcoming partitions."""
+        connection = _connection([])
+
+        with patch(
+            "therobotoverlord_api.database.partitions.get_db_connection"
+        ) as mock_get_connection:
+            mock_get_connection.return_value.__aenter__.return_value = connection
+            results = await run_partition_maintenance(NOW)
+
+        assert set(results) == {p.table for p in get_partition_policies()}
+        ensured = [call.args[1:] for call in connection.fetchval.await_args_list]
+        assert ("admin_actions", 3) in ensured
@@ -0,0 +1,132 @@
+"""Tests for keyset pagination helpers."""
+
+from datetime import UTC
+from datetime import datetime
+from uuid import UUID
+from uuid import uuid4
+
+import pytest
+
+from therobotoverlord_api.database.repositories.pagination import KeysetCursor
+from therobotoverlord_api.database.repositories.pagination import KeysetOrder
+
+
+@pytest.fixture
+def newest_first():
+    """Newest-first ordering with a primary key tiebreaker."""
+    return KeysetOrder.by(
+        ("created_at", "created_at", True, datetime), ("pk", "pk", True, UUID)
+    )
+
+
+class TestKeysetCursor:
+    """Test KeysetCursor encoding."""
+
+    def test_round_trip_preserves_types(self):
+        """Test cursor values survive encoding with their types."""
+        values = (datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC), uuid4(), 7, 1.5, "x")
+        cursor = KeysetCursor(values=values)
+
+        decoded = KeysetCursor.decode(cursor.encode())
+
+        assert decoded.values == values
+        assert isinstance(decoded.values[0], datetime)
+
+    def test_encoded_cursor_is_url_safe(self):
+        """Test the encoded cursor needs no escaping in a query string."""
+        encoded = KeysetCursor(values=("?&=/+", 1)).encode()
+
+        assert all(c.isalnum() or c in "-_" for c in encoded)
+
+    @pytest.mark.parametrize("raw", ["not-a-cursor", "", "W10", "e30"])
+    def test_decode_invalid(self, raw):
+        """Test malformed cursors raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor format"):
+            KeysetCursor.decode(raw)
+
+
+class TestKeysetOrder:
+    """Test KeysetOrder SQL rendering."""
+
+    def test_order_by(self, newest_first):
+        """Test ORDER BY includes every column and direction."""
+        assert newest_first.order_by() == "ORDER BY created_at DESC, pk DESC"
+
+    def test_uniform_direction_uses_row_comparison(self, newest_first):
+        """Test same-direction orderings compare rows."""
+        cursor = KeysetCursor(values=(datetime.now(UTC), uuid4()))
+
+        predicate, params = newest_first.predicate(cursor, 3)
+
+        assert predicate == "(created_at, pk) < ($3, $4)"
+        assert params == list(cursor.values)
+
+    def test_mixed_direction_expands_comparison(self):
+        """Test mixed-direction orderings expand into OR terms."""
+        order = KeysetOrder.by(
+            ("priority", "priority", True, int),
+            ("submitted_at", "submitted_at", False, datetime),
+            ("pk", "pk", False, UUID),
+        )
+        cursor = KeysetCursor(values=(5, datetime.now(UTC), uuid4()))
+
+        predicate, _ = order.predicate(cursor, 1)
+
+        assert predicate == (
+            "((priority < $1)"
+            " OR (priority = $1 AND submitted_at > $2)"
+            " OR (priority = $1 AND submitted_at = $2 AND pk > $3))"
+        )
+
+    def test_predicate_rejects_foreign_cursor(self, newest_first):
+        """Test a cursor from a different ordering is rejected."""
+        with pytest.raises(ValueError, match="does not match"):
+            newest_first.predicate(KeysetCursor(values=(1,)), 1)
+
+    def test_validate_cursor_rejects_mismatched_types(self, newest_first):
+        """Test a cursor of the right length but wrong value types is rejected."""
+        cursor = KeysetCursor(values=(uuid4(), datetime.now(UTC)))
+
+        with pytest.raises(ValueError, match="created_at is not a datetime"):
+            newest_first.validate_cursor(cursor)
+
+    def test_validate_cursor_accepts_own_cursor(self, newest_first):
+        """Test cursors produced by an ordering validate against it."""
+        row = {"created_at": datetime.now(UTC), "pk": uuid4()}
+
+        newest_first.validate_cursor(newest_first.cursor_for(row))
+
+    def test_apply_extends_where_clause(self, newest_first):
+        """Test apply appends the predicate and its parameters."""
+        cursor = KeysetCursor(values=(datetime.now(UTC), uuid4()))
+        params: list = ["approved"]
+
+        where_clause = newest_first.apply("status = $1", params, cursor)
+
+        assert where_clause == "status = $1 AND (created_at, pk) < ($2, $3)"
+        assert params == ["approved", *cursor.values]
+
+    def test_apply_without_cursor(self, newest_first):
+        """Test apply leaves the clause alone without a cursor."""
+        params: list = ["approved"]
+
+        assert newest_first.apply("status = $1", params, None) == "status = $1"
+        assert params == ["approved"]
+
+    def test_next_cursor(self, newest_first):
+        """Test the next cursor points at the last row of a full page."""
+        rows = [{"created_at": datetime.now(UTC), "pk": uuid4()} for _ in range(2)]
+
+        encoded = newest_first.next_cursor(rows, limit=2)
+
+        assert encoded is not None
+        assert KeysetCursor.decode(encoded).values == (
+            rows[-1]["created_at"],
+            rows[-1]["pk"],
+        )
+
+    def test_next_cursor_short_page(self, newest_first):
+        """Test a short page has no next cursor."""
+        rows = [{"created_at": datetime.now(UTC), "pk": uuid4()}]
+
+        assert newest_first.next_cursor(rows, limit=2) is None
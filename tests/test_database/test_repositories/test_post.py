@@ -310,7 +310,7 @@ class TestPostRepository:
     async def test_get_thread_view(self, post_repository, mock_connection):
         """Test getting thread view of posts."""
         with patch(
-            "therobotoverlord_api.database.repositories.post.get_db_connection"
+            "therobotoverlord_api.database.repositories.post.get_db_read_connection"
         ) as mock_get_conn:
             mock_get_conn.return_value.__aenter__.return_value = mock_connection
             topic_pk = uuid4()
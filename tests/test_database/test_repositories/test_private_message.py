@@ -166,7 +166,7 @@ class TestGetConversation:
         mock_other_user = {"username": "user2", "display_name": "User Two"}
 
         with patch(
-            "therobotoverlord_api.database.repositories.private_message.get_db_connection"
+            "therobotoverlord_api.database.repositories.private_message.get_db_read_connection"
         ) as mock_get_db:
             mock_get_db.return_value.__aenter__.return_value = mock_connection
             mock_connection.fetch.return_value = mock_messages
@@ -188,7 +188,7 @@ class TestGetConversation:
         user1_pk, user2_pk = sample_user_pks["user1"], sample_user_pks["user2"]
 
         with patch(
-            "therobotoverlord_api.database.repositories.private_message.get_db_connection"
+            "therobotoverlord_api.database.repositories.private_message.get_db_read_connection"
         ) as mock_get_db:
             mock_get_db.return_value.__aenter__.return_value = mock_connection
             mock_connection.fetch.return_value = []
@@ -225,7 +225,7 @@ class TestGetUserConversations:
         ]
 
         with patch(
-            "therobotoverlord_api.database.repositories.private_message.get_db_connection"
+            "therobotoverlord_api.database.repositories.private_message.get_db_read_connection"
         ) as mock_get_db:
             mock_get_db.return_value.__aenter__.return_value = mock_connection
             mock_connection.fetch.return_value = mock_conversations
@@ -244,7 +244,7 @@ class TestGetUserConversations:
         user_pk = sample_user_pks["user1"]
 
         with patch(
-            "therobotoverlord_api.database.repositories.private_message.get_db_connection"
+            "therobotoverlord_api.database.repositories.private_message.get_db_read_connection"
         ) as mock_get_db:
             mock_get_db.return_value.__aenter__.return_value = mock_connection
             mock_connection.fetch.side_effect = Exception("Database error")
@@ -0,0 +1,143 @@
+"""Tests and benchmarks for batched row-to-model conversion."""
+
+from datetime import UTC
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from pydantic import ValidationError
+
+from therobotoverlord_api.database.models.base import TopicStatus
+from therobotoverlord_api.database.models.leaderboard import LeaderboardEntry
+from therobotoverlord_api.database.models.post import Post
+from therobotoverlord_api.database.models.topic import TopicSummary
+from therobotoverlord_api.database.repositories.rows import ModelRows
+
+PAGE_SIZE = 100
+
+
+def _post_row(i: int = 0) -> dict:
+    now = datetime.now(UTC)
+    return {
+        "pk": uuid4(),
+        "created_at": now,
+        "updated_at": now,
+        "topic_pk": uuid4(),
+        "parent_post_pk": None,
+        "author_pk": uuid4(),
+        "content": "The Overlord has reviewed your argument. " * 20,
+        "post_number": i,
+        "is_edited": False,
+        "edit_count": 0,
+        "last_edited_at": None,
+        "status": "approved",
+        "overlord_feedback": None,
+        "submitted_at": now,
+        "approved_at": now,
+        "rejection_reason": None,
+    }
+
+
+def _topic_summary_row(i: int = 0) -> dict:
+    return {
+        "pk": uuid4(),
+        "title": f"Topic {i}",
+        "description": "A question for the citizens. " * 10,
+        "author_username": f"citizen{i}",
+        "created_by_overlord": False,
+        "status": "approved",
+        "created_at": datetime.now(UTC),
+        "post_count": i,
+        "tags": ["politics", "economy"],
+    }
+
+
+def _leaderboard_row(i: int = 0) -> dict:
+    return {
+        "user_pk": uuid4(),
+        "username": f"citizen{i}",
+        "loyalty_score": 1000 - i,
+        "rank": i + 1,
+        "percentile_rank": Decimal("0.5"),
+        "badges": [],
+        "topic_creation_enabled": True,
+        "topics_created_count": 3,
+        "is_current_user": False,
+        "created_at": datetime.now(UTC),
+    }
+
+
+class TestModelRows:
+    """Test ModelRows produces the same models as per-row validation."""
+
+    @pytest.mark.parametrize(
+        ("model", "row_factory"),
+        [
+            (Post, _post_row),
+            (TopicSummary, _topic_summary_row),
+            (LeaderboardEntry, _leaderboard_row),
+        ],
+    )
+    def test_many_matches_per_row_validation(self, model, row_factory):
+        """Test batched conversion equals validating each row."""
+        rows = [row_factory(i) for i in range(3)]
+
+        assert ModelRows(model).many(rows) == [
+            model.model_validate(row) for row in rows
+        ]
+
+    def test_one(self):
+        """Test converting a single row."""
+        topic = ModelRows(TopicSummary).one(_topic_summary_row())
+
+        assert topic.status is TopicStatus.APPROVED
+
+    def test_numeric_becomes_float(self):
+        """Test NUMERIC values are converted for float fields."""
+        (entry,) = ModelRows(LeaderboardEntry).many([_leaderboard_row()])
+
+        assert isinstance(entry.percentile_rank, float)
+
+    def test_rows_are_still_validated(self):
+        """Test batching keeps full validation."""
+        row = {**_leaderboard_row(), "percentile_rank": 7.0}
+
+        with pytest.raises(ValidationError):
+            ModelRows(LeaderboardEntry).many([row])
+
+
+CONVERTERS = {
+    "model_validate": lambda model: lambda rows: [
+        model.model_validate(row) for row in rows
+    ],
+    "model_rows": lambda model: ModelRows(model).many,
+    "model_construct": lambda model: lambda rows: [
+        model.model_construct(**row) for row in rows
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    ("model", "row_factory"),
+    [
+        (Post, _post_row),
+        (TopicSummary, _topic_summary_row),
+        (LeaderboardEntry, _leaderboard_row),
+    ],
+    ids=["Post", "TopicSummary", "LeaderboardEntry"],
+)
+@pytest.mark.parametrize("converter", list(CONVERTERS))
+def test_benchmark_page_conversion(benchmark, model, row_factory, converter):
+    """Benchmark converting a 100-row page.
+
+    Compare with ``pytest tests/test_database/test_repositories/test_rows.py
+    --benchmark-group-by=param:model``.
+    """
+    rows = [row_factory(i) for i in range(PAGE_SIZE)]
+    convert = CONVERTERS[converter](model)
+
+    result = benchmark.pedantic(convert, args=(rows,), rounds=50, iterations=5)
+
+    assert len(result) == PAGE_SIZE
@@ -195,7 +195,7 @@ class TestTopicRepository:
     async def test_get_with_author_info(self, topic_repository, mock_connection):
         """Test getting topics with author information."""
         with patch(
-            "therobotoverlord_api.database.repositories.topic.get_db_connection"
+            "therobotoverlord_api.database.repositories.topic.get_db_read_connection"
         ) as mock_get_conn:
             mock_get_conn.return_value.__aenter__.return_value = mock_connection
             mock_records = [
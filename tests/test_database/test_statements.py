@@ -0,0 +1,173 @@
+"""Tests for the prepared statement registry."""
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from asyncpg import UndefinedTableError
+
+from therobotoverlord_api.database.connection import Database
+from therobotoverlord_api.database.statements import StatementRegistry
+from therobotoverlord_api.database.statements import _statement_cache
+
+
+@pytest.fixture
+def registry():
+    """Empty statement registry."""
+    return StatementRegistry()
+
+
+class TestStatementRegistry:
+    """Test StatementRegistry registration and execution."""
+
+    def test_register_returns_canonical_text(self, registry):
+        """Test registered SQL is stripped and returned."""
+        query = registry.register("users.get", "\n  SELECT * FROM users\n")
+
+        assert query == "SELECT * FROM users"
+        assert registry.query("users.get") == query
+
+    def test_register_is_idempotent(self, registry):
+        """Test registering the same SQL twice is allowed."""
+        registry.register("users.get", "SELECT 1")
+        registry.register("users.get", "SELECT 1")
+
+        assert len(registry) == 1
+
+    def test_register_rejects_conflicting_sql(self, registry):
+        """Test a name cannot be reused for different SQL."""
+        registry.register("users.get", "SELECT 1")
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register("users.get", "SELECT 2")
+
+    def test_register_for_table(self, registry):
+        """Test per-table statements are named after the table."""
+        name = registry.register_for_table(
+            "posts", "get_by_pk", "SELECT * FROM {table} WHERE pk = $1"
+        )
+
+        assert name == "posts.get_by_pk"
+        assert registry.query(name) == "SELECT * FROM posts WHERE pk = $1"
+
+    def test_unknown_statement(self, registry):
+        """Test looking up an unregistered statement fails clearly."""
+        with pytest.raises(ValueError, match="Unknown statement"):
+            registry.query("missing")
+
+    @pytest.mark.asyncio
+    async def test_prepare_all_fills_statement_cache(self, registry):
+        """Test warm-up prepares every statement through the cache."""
+        registry.register("a", "SELECT 1")
+        registry.register("b", "UPDATE t SET x = 1")
+        connection = MagicMock()
+        connection._prepare = AsyncMock()
+
+        prepared = await registry.prepare_all(connection)
+
+        assert prepared == 2
+        connection._prepare.assert_any_await("SELECT 1", use_cache=True)
+        assert registry.stats()["prepared"] == 2
+
+    @pytest.mark.asyncio
+    async def test_prepare_all_read_only_skips_writes(self, registry):
+        """Test replica warm-up only prepares SELECT statements."""
+        registry.register("a", "SELECT 1")
+        registry.register("b", "UPDATE t SET x = 1")
+        connection = MagicMock()
+        connection._prepare = AsyncMock()
+
+        prepared = await registry.prepare_all(connection, read_only=True)
+
+        assert prepared == 1
+        connection._prepare.assert_awaited_once_with("SELECT 1", use_cache=True)
+
+    @pytest.mark.asyncio
+    async def test_prepare_failure_does_not_block_connection(self, registry):
+        """Test a statement that fails to prepare is counted and skipped."""
+        registry.register("a", "SELECT * FROM missing")
+        registry.register("b", "SELECT 1")
+        connection = MagicMock()
+        connection._prepare = AsyncMock(
+            side_effect=[UndefinedTableError("relation does not exist"), None]
+        )
+
+        prepared = await registry.prepare_all(connection)
+
+        assert prepared == 1
+        assert registry.stats()["prepare_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_asyncpg_internals_fall_back_to_plain_queries(self, registry):
+        """Test warm-up switches off if asyncpg's private cache API is gone."""
+        registry.register("a", "SELECT 1")
+        registry.register("b", "SELECT 2")
+        connection = MagicMock(spec=["fetchrow"])
+
+        with patch.object(_statement_cache, "available", True):
+            prepared = await registry.prepare_all(connection)
+
+            assert prepared == 0
+            assert not _statement_cache.available
+
+    @pytest.mark.asyncio
+    async def test_hit_rate(self, registry):
+        """Test cache hits and misses are counted for registered statements."""
+        registry.register("a", "SELECT 1")
+        connection = AsyncMock()
+
+        with patch.object(
+            _statement_cache, "contains", side_effect=[True, True, False]
+        ):
+            for _ in range(3):
+                await registry.fetchrow(connection, "a")
+
+        stats = registry.stats()
+        assert stats["cache_hits"] == 2
+        assert stats["cache_misses"] == 1
+        assert stats["cache_hit_rate"] == pytest.approx(0.6667)
+
+    def test_unregistered_queries_are_not_counted(self, registry):
+        """Test ad-hoc SQL does not affect the hit rate."""
+        with patch.object(
+            _statement_cache, "contains", return_value=False
+        ) as mock_is_cached:
+            registry.record_use(AsyncMock(), "SELECT 42")
+
+        mock_is_cached.assert_not_called()
+        assert registry.stats()["cache_hit_rate"] is None
+
+
+class TestDatabaseWarmUp:
+    """Test Database prepares registered statements on new connections."""
+
+    @pytest.mark.asyncio
+    async def test_init_connection_prepares_statements(self):
+        """Test the pool init hook warms the statement cache."""
+        database = Database()
+        connection = MagicMock()
+
+        with patch(
+            "therobotoverlord_api.database.connection.statement_registry"
+        ) as mock_registry:
+            mock_registry.prepare_all = AsyncMock()
+            await database._init_replica_connection(connection)
+
+        mock_registry.prepare_all.assert_awaited_once_with(connection, read_only=True)
+
+    @pytest.mark.asyncio
+    async def test_init_connection_skips_when_cache_disabled(self):
+        """Test nothing is prepared when the statement cache is off."""
+        database = Database()
+        database._settings.statement_cache_size = 0
+        connection = MagicMock()
+
+        with patch(
+            "therobotoverlord_api.database.connection.statement_registry"
+        ) as mock_registry:
+            mock_registry.prepare_all = AsyncMock()
+            await database._init_connection(connection)
+
+        mock_registry.prepare_all.assert_not_called()
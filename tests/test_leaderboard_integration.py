@@ -8,11 +8,13 @@ from uuid import uuid4
 
 import pytest
 
+from tests.fixtures.redis_fixtures import forward_scripts
 from therobotoverlord_api.database.models.leaderboard import LeaderboardCursor
 
 # Import fixtures from leaderboard_fixtures
 from therobotoverlord_api.database.models.leaderboard import LeaderboardFilters
 from therobotoverlord_api.database.repositories.leaderboard import LeaderboardRepository
+from therobotoverlord_api.services.leaderboard_index import RankingIndexUnavailableError
 from therobotoverlord_api.services.leaderboard_service import LeaderboardService
 
 
@@ -27,18 +29,29 @@ class TestLeaderboardIntegration:
     @pytest.fixture
     def mock_redis_client(self):
         """Create mock Redis client."""
-        mock_client = AsyncMock()
-        mock_client.get.return_value = None
+        mock_client = forward_scripts(AsyncMock())
+        mock_client.evalsha.return_value = [b"0", None, 0]
         mock_client.setex.return_value = None
         mock_client.delete.return_value = None
-        mock_client.keys.return_value = []
+        mock_client.incr.return_value = 1
         return mock_client
 
     @pytest.fixture
-    def service(self, repository, mock_redis_client):
+    def unbuilt_leaderboard_index(self):
+        """Create mock ranking index that has not been built yet."""
+        mock_index = AsyncMock()
+        unavailable = RankingIndexUnavailableError("Ranking index has not been built")
+        mock_index.get_nearby.side_effect = unavailable
+        mock_index.get_top.side_effect = unavailable
+        mock_index.get_rank_range.side_effect = unavailable
+        return mock_index
+
+    @pytest.fixture
+    def service(self, repository, mock_redis_client, unbuilt_leaderboard_index):
         """Create service instance with real repository and mocked Redis."""
         service = LeaderboardService()
         service.repository = repository
+        service.index = unbuilt_leaderboard_index
         return service
 
     @pytest.mark.asyncio
@@ -55,7 +68,7 @@ class TestLeaderboardIntegration:
         # Setup Redis mock
         mock_get_redis_client.return_value = mock_redis_client
         # Setup cache miss to force repository calls
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
 
         # Create larger dataset for pagination testing
         all_rows = []
@@ -74,7 +87,7 @@ class TestLeaderboardIntegration:
             all_rows.append(row_data)
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -151,7 +164,7 @@ class TestLeaderboardIntegration:
 
         with (
             patch(
-                "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+                "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
                 mock_get_db_connection,
             ),
             patch(
@@ -192,7 +205,7 @@ class TestLeaderboardIntegration:
     ):
         """Test that search functionality works with pagination."""
         # Setup cache miss
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
 
         # Mock search results with similarity scores
         search_results = []
@@ -208,7 +221,7 @@ class TestLeaderboardIntegration:
 
         with (
             patch(
-                "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+                "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
                 mock_get_db_connection,
             ),
             patch(
@@ -272,7 +285,7 @@ class TestLeaderboardIntegration:
             nearby_rows.append(row)
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -317,7 +330,7 @@ class TestLeaderboardIntegration:
     ):
         """Test rank range queries return correct users."""
         # Setup cache miss
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
 
         start_rank = 10
         end_rank = 15
@@ -339,7 +352,7 @@ class TestLeaderboardIntegration:
             range_rows.append(row)
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -373,7 +386,7 @@ class TestLeaderboardIntegration:
     ):
         """Test percentile range queries return correct users."""
         # Setup cache miss
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
 
         start_percentile = 0.0
         end_percentile = 0.1  # Top 10%
@@ -395,7 +408,7 @@ class TestLeaderboardIntegration:
             top_users.append(row)
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -428,15 +441,6 @@ class TestLeaderboardIntegration:
         """Test that cache invalidation works correctly across operations."""
         user_pk = uuid4()
 
-        # Setup cache keys that should be invalidated
-        cache_keys = [
-            f"leaderboard:user:stats:{user_pk}".encode(),
-            b"leaderboard:page:1",
-            b"leaderboard:stats",
-            b"leaderboard:top:10",
-        ]
-        mock_redis_client.keys.return_value = cache_keys
-
         # Patch get_redis_client to return our mock
         with patch(
             "therobotoverlord_api.services.leaderboard_service.get_redis_client",
@@ -445,22 +449,18 @@ class TestLeaderboardIntegration:
             # Test cache invalidation
             await service.invalidate_user_cache(user_pk)
 
-            # Verify cache keys were searched with correct patterns
-            mock_redis_client.keys.assert_called()
-        call_args = mock_redis_client.keys.call_args_list
-
-        # Should search for general leaderboard keys (user-specific deletion is direct)
-        patterns_used = [call[0][0] for call in call_args]
-        expected_patterns = ["leaderboard:*", "top_users:*", "leaderboard_stats"]
-
-        # Check that expected patterns were used
-        for expected_pattern in expected_patterns:
-            assert any(expected_pattern == pattern for pattern in patterns_used), (
-                f"Expected pattern '{expected_pattern}' not found in {patterns_used}"
-            )
+        # Personal stats are deleted directly; the generation key is resolved
+        # inside the script
+        _, _, generation_key, _, key = mock_redis_client.evalsha.call_args.args
+        assert generation_key == "cache:personal_stats:gen"
+        assert key == str(user_pk)
 
-        # Verify cache deletion was called
-        mock_redis_client.delete.assert_called()
+        # Live index pages move to a new generation with one INCR, however many
+        # keys Redis holds; materialized view pages wait for the refresh job
+        incremented = [call.args[0] for call in mock_redis_client.incr.call_args_list]
+        assert incremented == ["cache:leaderboard_rankings:gen"]
+        mock_redis_client.keys.assert_not_called()
+        mock_redis_client.delete.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_concurrent_pagination_stability(
@@ -472,7 +472,7 @@ class TestLeaderboardIntegration:
     ):
         """Test that cursor-based pagination remains stable during concurrent updates."""
         # Setup cache miss
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
 
         # Simulate a scenario where rankings change between page requests
         # First page request
@@ -480,7 +480,7 @@ class TestLeaderboardIntegration:
 
         with (
             patch(
-                "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+                "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
                 mock_get_db_connection,
             ),
             patch(
@@ -3,12 +3,15 @@
 from datetime import UTC
 from datetime import date
 from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
 from therobotoverlord_api.database.models.leaderboard import LeaderboardCursor
+from therobotoverlord_api.database.models.leaderboard import LeaderboardRefreshReason
 from therobotoverlord_api.database.repositories.leaderboard import LeaderboardRepository
 
 # Import fixtures
@@ -33,7 +36,7 @@ class TestLeaderboardRepository:
     ):
         """Test basic leaderboard page retrieval."""
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             # Mock the database responses
@@ -73,7 +76,7 @@ class TestLeaderboardRepository:
         cursor = LeaderboardCursor(rank=10, user_pk=uuid4(), loyalty_score=100)
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -103,7 +106,7 @@ class TestLeaderboardRepository:
     ):
         """Test leaderboard page retrieval with filters."""
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -148,7 +151,7 @@ class TestLeaderboardRepository:
         )
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -174,7 +177,7 @@ class TestLeaderboardRepository:
         user_pk = uuid4()
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -190,6 +193,52 @@ class TestLeaderboardRepository:
             assert result.loyalty_score == 0
             assert result.percentile_rank == 1.0
 
+    @pytest.mark.asyncio
+    async def test_get_user_entry(
+        self,
+        repository,
+        mock_get_db_connection,
+        sample_db_leaderboard_rows,
+        sample_db_badge_rows,
+    ):
+        """Test getting one user's entry flagged as the current user."""
+        row = sample_db_leaderboard_rows[3]
+
+        with patch(
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
+            mock_get_db_connection,
+        ):
+            mock_conn = mock_get_db_connection().mock_connection
+            mock_conn.fetchrow.return_value = row
+            mock_conn.fetch.return_value = sample_db_badge_rows
+
+            result = await repository.get_user_entry(row["user_pk"])
+
+            assert result is not None
+            assert result.user_pk == row["user_pk"]
+            assert result.rank == 4
+            assert result.is_current_user is True
+            assert len(result.badges) == len(sample_db_badge_rows)
+            query = mock_conn.fetchrow.call_args[0][0]
+            assert "WHERE user_pk = $1" in query
+
+    @pytest.mark.asyncio
+    async def test_get_user_entry_not_found(
+        self,
+        repository,
+        mock_get_db_connection,
+    ):
+        """Test getting the entry of a user missing from the leaderboard."""
+        with patch(
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
+            mock_get_db_connection,
+        ):
+            mock_conn = mock_get_db_connection().mock_connection
+            mock_conn.fetchrow.return_value = None
+
+            assert await repository.get_user_entry(uuid4()) is None
+            mock_conn.fetch.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_nearby_users(
         self,
@@ -211,7 +260,7 @@ class TestLeaderboardRepository:
         )
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -243,7 +292,7 @@ class TestLeaderboardRepository:
         user_pk = uuid4()
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -279,7 +328,7 @@ class TestLeaderboardRepository:
         ]
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -308,7 +357,7 @@ class TestLeaderboardRepository:
     ):
         """Test getting leaderboard statistics."""
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -354,7 +403,7 @@ class TestLeaderboardRepository:
         ]
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -377,7 +426,7 @@ class TestLeaderboardRepository:
     ):
         """Test getting top users."""
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -440,6 +489,106 @@ class TestLeaderboardRepository:
 
             assert result is False
 
+    @pytest.fixture
+    def refresh_connection(self, mock_get_db_connection):
+        """Connection for a change-aware refresh that wins the refresh lock."""
+        mock_conn = mock_get_db_connection().mock_connection
+        transaction = MagicMock()
+        transaction.__aenter__ = AsyncMock(return_value=None)
+        transaction.__aexit__ = AsyncMock(return_value=None)
+        mock_conn.transaction = MagicMock(return_value=transaction)
+        mock_conn.fetchval.side_effect = [True, 7, 120]
+        return mock_conn
+
+    @pytest.mark.asyncio
+    async def test_refresh_if_changed_records_refresh(
+        self, repository, mock_get_db_connection, refresh_connection
+    ):
+        """Test a changed view is refreshed and the refresh is recorded."""
+        refresh_connection.fetchrow.return_value = {
+            "change_watermark": 5,
+            "row_count": 100,
+            "age": 300.0,
+        }
+
+        with patch(
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            mock_get_db_connection,
+        ):
+            result = await repository.refresh_leaderboard_if_changed(60, 1800)
+
+        assert result.refreshed
+        assert result.reason == LeaderboardRefreshReason.CHANGED
+        assert (result.change_watermark, result.row_count) == (7, 120)
+        assert result.row_delta == 20
+        refresh_call, insert_call = refresh_connection.execute.call_args_list
+        assert refresh_call.args == ("SELECT refresh_leaderboard_rankings()",)
+        assert "INSERT INTO leaderboard_refreshes" in insert_call.args[0]
+        assert insert_call.args[1] == 7
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("watermark", "age", "reason"),
+        [
+            (5, 300.0, LeaderboardRefreshReason.UNCHANGED),
+            (7, 30.0, LeaderboardRefreshReason.DEBOUNCED),
+        ],
+    )
+    async def test_refresh_if_changed_skips(
+        self,
+        repository,
+        mock_get_db_connection,
+        refresh_connection,
+        watermark,
+        age,
+        reason,
+    ):
+        """Test unchanged views and changes inside the minimum interval wait."""
+        refresh_connection.fetchval.side_effect = [True, watermark]
+        refresh_connection.fetchrow.return_value = {
+            "change_watermark": 5,
+            "row_count": 100,
+            "age": age,
+        }
+
+        with patch(
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            mock_get_db_connection,
+        ):
+            result = await repository.refresh_leaderboard_if_changed(60, 1800)
+
+        assert not result.refreshed
+        assert result.reason == reason
+        refresh_connection.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_if_changed_skips_while_locked(
+        self, repository, mock_get_db_connection, refresh_connection
+    ):
+        """Test a second worker skips while another one is refreshing."""
+        refresh_connection.fetchval.side_effect = [False]
+
+        with patch(
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            mock_get_db_connection,
+        ):
+            result = await repository.refresh_leaderboard_if_changed(60, 1800)
+
+        assert result.reason == LeaderboardRefreshReason.LOCKED
+        refresh_connection.fetchrow.assert_not_called()
+        refresh_connection.execute.assert_not_called()
+
+    def test_refresh_reason_forces_refresh_after_max_interval(self, repository):
+        """Test an unchanged view is still refreshed once it is old enough."""
+        last = {"change_watermark": 5, "row_count": 100, "age": 1800.0}
+
+        reason = repository._refresh_reason(last, 5, 60, 1800)
+
+        assert reason == LeaderboardRefreshReason.MAX_INTERVAL
+        assert repository._refresh_reason(None, 0, 60, 1800) == (
+            LeaderboardRefreshReason.FIRST
+        )
+
     @pytest.mark.asyncio
     async def test_create_daily_snapshot_success(
         self,
@@ -490,7 +639,7 @@ class TestLeaderboardRepository:
         user_pk = uuid4()
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             mock_conn = mock_get_db_connection().mock_connection
@@ -525,7 +674,7 @@ class TestLeaderboardRepository:
             row.is_current_user = row["user_pk"] == current_user_pk
 
         with patch(
-            "therobotoverlord_api.database.repositories.leaderboard.get_db_connection",
+            "therobotoverlord_api.database.repositories.leaderboard.get_db_read_connection",
             mock_get_db_connection,
         ):
             # Mock the database responses
@@ -11,11 +11,16 @@ from uuid import uuid4
 import pytest
 
 from therobotoverlord_api.database.models.leaderboard import LeaderboardCursor
+from therobotoverlord_api.database.models.leaderboard import LeaderboardRefresh
+from therobotoverlord_api.database.models.leaderboard import LeaderboardRefreshReason
 from therobotoverlord_api.database.models.leaderboard import LeaderboardStats
 from therobotoverlord_api.database.models.leaderboard import PersonalLeaderboardStats
+from therobotoverlord_api.database.models.leaderboard import RankedUser
+from therobotoverlord_api.database.models.leaderboard import RankingIndexCheck
 from therobotoverlord_api.database.models.leaderboard import UserRankLookup
+from therobotoverlord_api.services import leaderboard_service
 from therobotoverlord_api.services.leaderboard_service import LeaderboardService
-from therobotoverlord_api.workers import redis_connection
+from therobotoverlord_api.services.namespaced_cache import local_cache
 
 # Import fixtures
 pytest_plugins = ["tests.fixtures.leaderboard_fixtures"]
@@ -25,12 +30,21 @@ class TestLeaderboardService:
     """Test LeaderboardService with mocked dependencies."""
 
     @pytest.fixture
-    def service(self, mock_leaderboard_repository, mock_redis_client, monkeypatch):
+    def service(
+        self,
+        mock_leaderboard_repository,
+        mock_redis_client,
+        unbuilt_leaderboard_index,
+        monkeypatch,
+    ):
         """Create service instance with mocked repository."""
         service = LeaderboardService()
         service.repository = mock_leaderboard_repository
+        service.index = unbuilt_leaderboard_index
         monkeypatch.setattr(
-            redis_connection, "get_redis_client", lambda: mock_redis_client
+            leaderboard_service,
+            "get_redis_client",
+            AsyncMock(return_value=mock_redis_client),
         )
         return service
 
@@ -43,9 +57,11 @@ class TestLeaderboardService:
     ):
         """Test leaderboard retrieval with cache hit."""
         # Setup cache hit
-        mock_redis_client.get.return_value = (
-            sample_leaderboard_response.model_dump_json()
-        )
+        mock_redis_client.evalsha.return_value = [
+            b"0",
+            sample_leaderboard_response.model_dump_json(),
+            0,
+        ]
 
         # Mock get_redis_client to return our mock
         with patch(
@@ -58,7 +74,7 @@ class TestLeaderboardService:
         assert result.pagination.has_next is False
 
         # Verify cache was checked
-        mock_redis_client.get.assert_called_once()
+        mock_redis_client.evalsha.assert_called_once()
 
         # Verify repository was not called (cache hit)
         service.repository.get_leaderboard_page.assert_not_called()
@@ -73,7 +89,7 @@ class TestLeaderboardService:
     ):
         """Test leaderboard retrieval with cache miss."""
         # Setup cache miss
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
         mock_leaderboard_repository.get_leaderboard_page.return_value = (
             sample_leaderboard_entries[:5],
             False,
@@ -88,8 +104,8 @@ class TestLeaderboardService:
         assert len(result.entries) == 5
         assert result.pagination.has_next is False
 
-        # Verify cache was checked and set (service calls get twice: once for leaderboard, once for stats)
-        assert mock_redis_client.get.call_count >= 1
+        # Verify cache was checked and set (once for the page, once for stats)
+        assert mock_redis_client.evalsha.call_count >= 1
         mock_redis_client.setex.assert_called()
 
         # Verify repository was called
@@ -108,7 +124,7 @@ class TestLeaderboardService:
         cursor = cursor_obj.encode()
 
         # Cache miss for cursor-based queries
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
         mock_leaderboard_repository.get_leaderboard_page.return_value = (
             sample_leaderboard_entries[5:8],
             True,
@@ -128,7 +144,6 @@ class TestLeaderboardService:
             limit=3,
             cursor=cursor_obj,
             filters=None,
-            current_user_pk=None,
         )
 
     @pytest.mark.asyncio
@@ -142,7 +157,7 @@ class TestLeaderboardService:
     ):
         """Test leaderboard retrieval with filters."""
         # Cache miss for filtered queries
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
         mock_leaderboard_repository.get_leaderboard_page.return_value = (
             sample_leaderboard_entries[:3],
             False,
@@ -162,7 +177,79 @@ class TestLeaderboardService:
             limit=3,
             cursor=None,
             filters=sample_filters,
-            current_user_pk=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_leaderboard_page_is_shared_between_viewers(
+        self,
+        service,
+        mock_redis_client,
+        mock_leaderboard_repository,
+        sample_leaderboard_response,
+    ):
+        """Test viewers share one cached page and are flagged on their copy."""
+        mock_redis_client.evalsha.return_value = [
+            b"0",
+            sample_leaderboard_response.model_dump_json(),
+            0,
+        ]
+        viewer_pk = sample_leaderboard_response.entries[2].user_pk
+
+        with patch(
+            "therobotoverlord_api.services.leaderboard_service.get_redis_client",
+            return_value=mock_redis_client,
+        ):
+            anonymous = await service.get_leaderboard(limit=5)
+            viewer = await service.get_leaderboard(limit=5, current_user_pk=viewer_pk)
+
+        # Both reads used the same cache entry
+        keys = [call.args[4] for call in mock_redis_client.evalsha.call_args_list]
+        assert keys[0] == keys[1]
+
+        assert not any(entry.is_current_user for entry in anonymous.entries)
+        assert [entry.is_current_user for entry in viewer.entries] == [
+            False,
+            False,
+            True,
+            False,
+            False,
+        ]
+        assert viewer.current_user_position is None
+        mock_leaderboard_repository.get_leaderboard_page.assert_not_called()
+        mock_leaderboard_repository.get_user_entry.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_leaderboard_attaches_viewer_position_off_page(
+        self,
+        service,
+        mock_redis_client,
+        mock_leaderboard_repository,
+        sample_leaderboard_response,
+        sample_leaderboard_entries,
+    ):
+        """Test a viewer missing from the cached page gets their own entry."""
+        mock_redis_client.evalsha.return_value = [
+            b"0",
+            sample_leaderboard_response.model_dump_json(),
+            0,
+        ]
+        own_entry = sample_leaderboard_entries[7].model_copy(
+            update={"is_current_user": True}
+        )
+        mock_leaderboard_repository.get_user_entry.return_value = own_entry
+
+        with patch(
+            "therobotoverlord_api.services.leaderboard_service.get_redis_client",
+            return_value=mock_redis_client,
+        ):
+            result = await service.get_leaderboard(
+                limit=5, current_user_pk=own_entry.user_pk
+            )
+
+        assert result.current_user_position == own_entry
+        assert not any(entry.is_current_user for entry in result.entries)
+        mock_leaderboard_repository.get_user_entry.assert_called_once_with(
+            own_entry.user_pk
         )
 
     @pytest.mark.asyncio
@@ -174,9 +261,11 @@ class TestLeaderboardService:
     ):
         """Test top users retrieval with cache hit."""
         cached_users = sample_leaderboard_entries[:3]
-        mock_redis_client.get.return_value = json.dumps(
-            [entry.model_dump() for entry in cached_users], default=str
-        )
+        mock_redis_client.evalsha.return_value = [
+            b"0",
+            json.dumps([entry.model_dump() for entry in cached_users], default=str),
+            0,
+        ]
 
         with patch(
             "therobotoverlord_api.services.leaderboard_service.get_redis_client",
@@ -188,7 +277,7 @@ class TestLeaderboardService:
         assert result[0].rank == 1
 
         # Verify cache was checked
-        mock_redis_client.get.assert_called_once()
+        mock_redis_client.evalsha.assert_called_once()
         service.repository.get_top_users.assert_not_called()
 
     @pytest.mark.asyncio
@@ -200,7 +289,7 @@ class TestLeaderboardService:
         sample_leaderboard_entries,
     ):
         """Test top users retrieval with cache miss."""
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
         mock_leaderboard_repository.get_top_users.return_value = (
             sample_leaderboard_entries[:3]
         )
@@ -217,6 +306,143 @@ class TestLeaderboardService:
         mock_redis_client.setex.assert_called_once()
         mock_leaderboard_repository.get_top_users.assert_called_once_with(3)
 
+    @pytest.mark.asyncio
+    async def test_get_top_users_reads_ranking_index(
+        self,
+        service,
+        mock_redis_client,
+        mock_leaderboard_repository,
+        sample_leaderboard_entries,
+    ):
+        """Test top users come from the live index and are cached briefly."""
+        ranked = [
+            RankedUser(
+                user_pk=entry.user_pk,
+                loyalty_score=entry.loyalty_score,
+                rank=entry.rank,
+                percentile_rank=entry.percentile_rank,
+            )
+            for entry in sample_leaderboard_entries[:3]
+        ]
+        service.index = AsyncMock()
+        service.index.get_top.return_value = ranked
+        mock_leaderboard_repository.get_ranked_entries.return_value = (
+            sample_leaderboard_entries[:3]
+        )
+
+        result = await service.get_top_users(limit=3)
+
+        assert result == sample_leaderboard_entries[:3]
+        service.index.get_top.assert_awaited_once_with(3)
+        mock_leaderboard_repository.get_ranked_entries.assert_awaited_once_with(ranked)
+        mock_leaderboard_repository.get_top_users.assert_not_called()
+        mock_redis_client.setex.assert_awaited_once()
+        assert mock_redis_client.setex.call_args.args[0].startswith(
+            "cache:leaderboard_rankings:"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_leaderboard_ranks_unfiltered_pages_from_index(
+        self,
+        service,
+        mock_redis_client,
+        mock_leaderboard_repository,
+        sample_leaderboard_entries,
+    ):
+        """Test unfiltered pages are ranked by the live index, not the view."""
+        ranked = [
+            RankedUser(
+                user_pk=entry.user_pk,
+                loyalty_score=entry.loyalty_score,
+                rank=entry.rank,
+                percentile_rank=entry.percentile_rank,
+            )
+            for entry in sample_leaderboard_entries[:4]
+        ]
+        service.index = AsyncMock()
+        service.index.get_rank_range.return_value = ranked
+        mock_leaderboard_repository.get_ranked_entries.return_value = (
+            sample_leaderboard_entries[:3]
+        )
+
+        result = await service.get_leaderboard(limit=3)
+
+        assert result.entries == sample_leaderboard_entries[:3]
+        assert result.pagination.has_next
+        service.index.get_rank_range.assert_awaited_once_with(1, 4)
+        mock_leaderboard_repository.get_ranked_entries.assert_awaited_once_with(
+            ranked[:3]
+        )
+        mock_leaderboard_repository.get_leaderboard_page.assert_not_called()
+        assert mock_redis_client.setex.call_args.args[0].startswith(
+            "cache:leaderboard_rankings:"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_user_rank_reads_ranking_index(
+        self, service, mock_leaderboard_repository, sample_leaderboard_entries
+    ):
+        """Test a user's rank is served live from the index."""
+        entry = sample_leaderboard_entries[4]
+        service.index = AsyncMock()
+        service.index.get_nearby.return_value = [
+            RankedUser(
+                user_pk=entry.user_pk,
+                loyalty_score=entry.loyalty_score,
+                rank=entry.rank,
+                percentile_rank=entry.percentile_rank,
+            )
+        ]
+        mock_leaderboard_repository.get_ranked_entries.return_value = [entry]
+
+        result = await service.get_user_rank(entry.user_pk)
+
+        assert result.found
+        assert result.rank == entry.rank
+        assert result.username == entry.username
+        service.index.get_nearby.assert_awaited_once_with(entry.user_pk, 0)
+        mock_leaderboard_repository.get_user_rank.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_user_rank_falls_back_when_index_fails(
+        self, service, mock_leaderboard_repository, sample_user_rank_lookup
+    ):
+        """Test Redis errors on the index fall back to the materialized view."""
+        service.index = AsyncMock()
+        service.index.get_nearby.side_effect = ConnectionError("Redis is down")
+        mock_leaderboard_repository.get_user_rank.return_value = sample_user_rank_lookup
+
+        result = await service.get_user_rank(sample_user_rank_lookup.user_pk)
+
+        assert result == sample_user_rank_lookup
+
+    @pytest.mark.asyncio
+    async def test_check_ranking_index_repairs_with_fresh_scores(
+        self, service, mock_leaderboard_repository
+    ):
+        """Test drifted users are re-read before the index is repaired."""
+        moved, removed = uuid4(), uuid4()
+        service.index = AsyncMock()
+        service.index.compare.return_value = RankingIndexCheck(
+            checked=10, mismatched=1, extra=1, differing=[moved, removed]
+        )
+        mock_leaderboard_repository.get_ranking_scores.side_effect = [
+            [],
+            [(moved, 42)],
+        ]
+
+        check = await service.check_ranking_index()
+
+        assert check.repaired
+        assert not check.consistent
+        mock_leaderboard_repository.get_ranking_scores.assert_awaited_with(
+            [moved, removed]
+        )
+        assert [call.args for call in service.index.update.await_args_list] == [
+            (moved, 42),
+            (removed, None),
+        ]
+
     @pytest.mark.asyncio
     async def test_get_leaderboard_stats_cache_hit(
         self,
@@ -225,7 +451,11 @@ class TestLeaderboardService:
         sample_leaderboard_stats,
     ):
         """Test leaderboard stats retrieval with cache hit."""
-        mock_redis_client.get.return_value = sample_leaderboard_stats.model_dump_json()
+        mock_redis_client.evalsha.return_value = [
+            b"0",
+            sample_leaderboard_stats.model_dump_json(),
+            0,
+        ]
 
         with patch(
             "therobotoverlord_api.services.leaderboard_service.get_redis_client",
@@ -237,7 +467,7 @@ class TestLeaderboardService:
         assert result.average_loyalty_score == 75.5
 
         # Verify cache was checked
-        mock_redis_client.get.assert_called_once()
+        mock_redis_client.evalsha.assert_called_once()
         service.repository.get_leaderboard_stats.assert_not_called()
 
     @pytest.mark.asyncio
@@ -249,7 +479,7 @@ class TestLeaderboardService:
         sample_leaderboard_stats,
     ):
         """Test leaderboard stats retrieval with cache miss."""
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
         mock_leaderboard_repository.get_leaderboard_stats.return_value = (
             sample_leaderboard_stats
         )
@@ -276,7 +506,7 @@ class TestLeaderboardService:
         """Test user search with cache hit."""
         search_results = sample_leaderboard_entries[:2]
         # Don't mock cache for search - it doesn't use caching
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
 
         # Mock repository directly since search doesn't use caching
         service.repository.search_users = AsyncMock(return_value=search_results)
@@ -297,7 +527,7 @@ class TestLeaderboardService:
         sample_leaderboard_entries,
     ):
         """Test user search with cache miss."""
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
 
         # Mock search results - search doesn't use caching
         search_results = sample_leaderboard_entries[:2]
@@ -409,9 +639,14 @@ class TestLeaderboardService:
 
         assert result is True
 
-        # Verify cache was invalidated
-        mock_redis_client.keys.assert_called()
-        # delete() may or may not be called depending on whether keys() returns results
+        # Verify both namespaces moved to a new generation, without scanning keys
+        incremented = [call.args[0] for call in mock_redis_client.incr.call_args_list]
+        assert incremented == [
+            "cache:leaderboard:gen",
+            "cache:leaderboard_rankings:gen",
+            "cache:personal_stats:gen",
+        ]
+        mock_redis_client.keys.assert_not_called()
 
         # Verify repository refresh was called
         mock_leaderboard_repository.refresh_leaderboard.assert_called_once()
@@ -435,7 +670,28 @@ class TestLeaderboardService:
         assert result is False
 
         # Cache should not be invalidated on failure
-        mock_redis_client.delete.assert_not_called()
+        mock_redis_client.incr.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("refreshed", [True, False])
+    async def test_refresh_if_changed_invalidates_only_after_refresh(
+        self, service, mock_leaderboard_repository, refreshed
+    ):
+        """Test caches survive a refresh check that found nothing to do."""
+        refresh = mock_leaderboard_repository.refresh_leaderboard_if_changed
+        refresh.return_value = LeaderboardRefresh(
+            refreshed=refreshed,
+            reason=LeaderboardRefreshReason.CHANGED
+            if refreshed
+            else LeaderboardRefreshReason.UNCHANGED,
+        )
+
+        with patch.object(service, "invalidate_all_cache", AsyncMock()) as invalidate:
+            result = await service.refresh_leaderboard_if_changed()
+
+        assert result.refreshed is refreshed
+        assert invalidate.await_count == int(refreshed)
+        refresh.assert_awaited_once_with(60.0, 1800.0)
 
     @pytest.mark.asyncio
     async def test_invalidate_user_cache(
@@ -446,22 +702,21 @@ class TestLeaderboardService:
         """Test cache invalidation for specific user."""
         user_pk = uuid4()
 
-        # Mock cache keys
-        mock_redis_client.keys.return_value = [
-            b"leaderboard:user:stats:" + str(user_pk).encode(),
-            b"leaderboard:search:citizen",
-            b"leaderboard:page:1",
-        ]
-
         with patch(
             "therobotoverlord_api.services.leaderboard_service.get_redis_client",
             return_value=mock_redis_client,
         ):
             await service.invalidate_user_cache(user_pk)
 
-        # Verify cache keys were searched and deleted
-        mock_redis_client.keys.assert_called()
-        mock_redis_client.delete.assert_called()
+        # The user's personal stats are deleted from the current generation
+        _, _, generation_key, _, key = mock_redis_client.evalsha.call_args.args
+        assert (generation_key, key) == ("cache:personal_stats:gen", str(user_pk))
+
+        # Live index pages are invalidated by a generation bump, not a key
+        # scan; materialized view pages are left to the refresh job
+        incremented = [call.args[0] for call in mock_redis_client.incr.call_args_list]
+        assert incremented == ["cache:leaderboard_rankings:gen"]
+        mock_redis_client.keys.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_cache_key_generation(self, service):
@@ -491,7 +746,7 @@ class TestLeaderboardService:
     ):
         """Test that different cache types use appropriate TTLs."""
         # Test leaderboard page cache (5 minutes)
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None, 0]
         mock_leaderboard_repository.get_leaderboard_page.return_value = (
             sample_leaderboard_entries[:5],
             False,
@@ -505,10 +760,12 @@ class TestLeaderboardService:
 
         # Verify TTL was set correctly
         setex_call = mock_redis_client.setex.call_args
-        assert setex_call[0][1] == 300  # 5 minutes in seconds
+        assert setex_call[0][1] == 600  # 5 minutes fresh, 5 more stale
 
         # Reset mocks
         mock_redis_client.reset_mock()
+        # The page load above also kept the stats in process memory
+        local_cache.clear()
 
         # Test stats cache (15 minutes)
         stats = LeaderboardStats(
@@ -530,4 +787,4 @@ class TestLeaderboardService:
 
         # Verify longer TTL for stats
         setex_call = mock_redis_client.setex.call_args
-        assert setex_call[0][1] == 1800  # 30 minutes in seconds
+        assert setex_call[0][1] == 3600  # 30 minutes fresh, 30 more stale
@@ -8,6 +8,7 @@ from uuid import uuid4
 
 import pytest
 
+from tests.fixtures.redis_fixtures import forward_scripts
 from therobotoverlord_api.database.models.badge import Badge
 from therobotoverlord_api.database.models.badge import BadgeCreate
 from therobotoverlord_api.database.models.badge import BadgeEligibilityCheck
@@ -27,6 +28,17 @@ class TestBadgeService:
         """Create BadgeService instance."""
         return BadgeService()
 
+    @pytest.fixture(autouse=True)
+    def mock_redis_client(self):
+        """Keep the badge list cache off a real Redis."""
+        client = forward_scripts(AsyncMock())
+        client.evalsha = AsyncMock(return_value=[b"0", None])
+        with patch(
+            "therobotoverlord_api.services.badge_service.get_redis_client",
+            AsyncMock(return_value=client),
+        ):
+            yield client
+
     @pytest.fixture
     def mock_badge(self):
         """Mock Badge instance."""
@@ -606,6 +618,35 @@ class TestBadgeService:
 
             assert len(result) == 0  # Exception handled, no badges awarded
 
+    @pytest.mark.asyncio
+    async def test_process_moderation_outcome_awards_in_one_statement(
+        self, service, mock_badge, mock_user_badge
+    ):
+        """Test every badge earned by an outcome is awarded together."""
+        user_id = uuid4()
+        post_pk = uuid4()
+        other_badge = mock_badge.model_copy(update={"pk": uuid4()})
+
+        service.badge_repo = AsyncMock()
+        service.badge_repo.get_active_badges.return_value = [mock_badge, other_badge]
+        service.user_badge_repo = AsyncMock()
+        service.user_badge_repo.has_badge.return_value = False
+        service.user_badge_repo.award_badges.return_value = [mock_user_badge]
+
+        with patch.object(
+            service, "_should_award_badge_for_outcome", AsyncMock(return_value=True)
+        ):
+            result = await service.process_moderation_outcome(
+                user_id, "post", "approved", content_id=post_pk
+            )
+
+        assert result == [mock_user_badge]
+        service.user_badge_repo.award_badges.assert_awaited_once()
+        rows = service.user_badge_repo.award_badges.call_args.args[0]
+        assert [row["badge_pk"] for row in rows] == [mock_badge.pk, other_badge.pk]
+        assert all(row["awarded_for_post_pk"] == post_pk for row in rows)
+        assert all(row["awarded_by_event"] == "moderation_approved" for row in rows)
+
     @pytest.mark.asyncio
     @patch("therobotoverlord_api.services.badge_service.UserBadgeRepository")
     async def test_get_badge_recipients(self, mock_user_badge_repo, service):
@@ -1,10 +1,12 @@
 """Simple coverage tests for BadgeService."""
 
 from unittest.mock import AsyncMock
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
+from tests.fixtures.redis_fixtures import forward_scripts
 from therobotoverlord_api.database.models.badge import BadgeCreate
 from therobotoverlord_api.database.models.badge import BadgeType
 from therobotoverlord_api.services.badge_service import BadgeService
@@ -21,6 +23,17 @@ class TestBadgeServiceSimple:
         service.user_badge_repo = AsyncMock()
         return service
 
+    @pytest.fixture(autouse=True)
+    def mock_redis_client(self):
+        """Keep the badge list cache off a real Redis."""
+        client = forward_scripts(AsyncMock())
+        client.evalsha = AsyncMock(return_value=[b"0", None])
+        with patch(
+            "therobotoverlord_api.services.badge_service.get_redis_client",
+            AsyncMock(return_value=client),
+        ):
+            yield client
+
     @pytest.mark.asyncio
     async def test_get_all_badges(self, badge_service):
         """Test getting all badges."""
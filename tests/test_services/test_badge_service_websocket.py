@@ -1,6 +1,7 @@
 """Tests for badge service WebSocket integration."""
 
 from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 from unittest.mock import patch
 from uuid import uuid4
 
@@ -296,7 +297,9 @@ class TestBadgeServiceWebSocket:
 
         mock_badge_repo.get_active_badges.return_value = mock_badges
         mock_user_badge_repo.has_badge.return_value = False
-        mock_user_badge_repo.award_badge.return_value = {"pk": uuid4()}
+        mock_user_badge_repo.award_badges.return_value = [
+            MagicMock(badge_pk=mock_badges[0].pk)
+        ]
 
         with patch(
             "therobotoverlord_api.services.badge_service.get_event_broadcaster"
@@ -538,7 +541,9 @@ class TestBadgeServiceWebSocket:
 
         mock_badge_repo.get_active_badges.return_value = [mock_badge]
         mock_user_badge_repo.has_badge.return_value = False
-        mock_user_badge_repo.award_badge.return_value = {"pk": uuid4()}
+        mock_user_badge_repo.award_badges.return_value = [
+            MagicMock(badge_pk=mock_badge.pk)
+        ]
 
         with patch(
             "therobotoverlord_api.services.badge_service.get_event_broadcaster"
@@ -0,0 +1,117 @@
+"""Tests for the live leaderboard ranking index."""
+
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from therobotoverlord_api.services.leaderboard_index import INDEX_KEY
+from therobotoverlord_api.services.leaderboard_index import LeaderboardIndex
+from therobotoverlord_api.services.leaderboard_index import RankingIndexUnavailableError
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock Redis client holding a built index."""
+    client = AsyncMock()
+    client.exists = AsyncMock(return_value=1)
+    with patch(
+        "therobotoverlord_api.services.leaderboard_index.get_redis_client",
+        AsyncMock(return_value=client),
+    ):
+        yield client
+
+
+class TestLeaderboardIndex:
+    """Test ranking reads, rebuilds and drift checks."""
+
+    @pytest.mark.asyncio
+    async def test_nearby_users_get_ranks_and_percentiles(self, mock_redis):
+        """Test ranks follow the range position and ties share a percentile."""
+        first, second, third = uuid4(), uuid4(), uuid4()
+        mock_redis.eval.return_value = [
+            5,
+            1,
+            str(first).encode(),
+            b"90",
+            1,
+            str(second).encode(),
+            b"80",
+            2,
+            str(third).encode(),
+            b"80",
+            2,
+        ]
+
+        ranked = await LeaderboardIndex().get_nearby(second, 1)
+
+        assert [user.user_pk for user in ranked] == [first, second, third]
+        assert [user.rank for user in ranked] == [2, 3, 4]
+        assert [user.loyalty_score for user in ranked] == [90, 80, 80]
+        assert [user.percentile_rank for user in ranked] == [0.25, 0.5, 0.5]
+        _, _, key, anchor, first_offset, last_offset = mock_redis.eval.call_args.args
+        assert (key, anchor) == (INDEX_KEY, str(second))
+        assert (first_offset, last_offset) == ("-1", "1")
+
+    @pytest.mark.asyncio
+    async def test_unranked_user_has_no_neighbours(self, mock_redis):
+        """Test a user missing from the index gets an empty list."""
+        mock_redis.eval.return_value = []
+
+        assert await LeaderboardIndex().get_nearby(uuid4(), 5) == []
+
+    @pytest.mark.asyncio
+    async def test_reads_fail_until_index_is_built(self, mock_redis):
+        """Test a missing index is reported rather than read as empty."""
+        mock_redis.eval.return_value = None
+
+        with pytest.raises(RankingIndexUnavailableError):
+            await LeaderboardIndex().get_top(10)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_replaces_index_in_one_step(self, mock_redis):
+        """Test a rebuild fills a scratch key and renames it over the index."""
+        scores = [(uuid4(), score) for score in range(2500)]
+
+        count = await LeaderboardIndex().rebuild(scores)
+
+        assert count == 2500
+        assert mock_redis.zadd.await_count == 3
+        rebuild_key = mock_redis.zadd.call_args.args[0]
+        assert rebuild_key != INDEX_KEY
+        mock_redis.rename.assert_awaited_once_with(rebuild_key, INDEX_KEY)
+
+    @pytest.mark.asyncio
+    async def test_compare_finds_missing_extra_and_mismatched(self, mock_redis):
+        """Test every kind of drift is counted and listed."""
+        same, moved, missing, extra = uuid4(), uuid4(), uuid4(), uuid4()
+
+        async def zscan_iter(key):
+            for member, score in ((same, 10.0), (moved, 20.0), (extra, 5.0)):
+                yield str(member).encode(), score
+
+        mock_redis.zscan_iter = zscan_iter
+
+        check = await LeaderboardIndex().compare(
+            [(same, 10), (moved, 25), (missing, 1)]
+        )
+
+        assert (check.checked, check.missing, check.extra, check.mismatched) == (
+            3,
+            1,
+            1,
+            1,
+        )
+        assert set(check.differing) == {moved, missing, extra}
+        assert not check.consistent
+
+    @pytest.mark.asyncio
+    async def test_update_removes_users_with_empty_score(self, mock_redis):
+        """Test removals are sent as an empty score to the update script."""
+        user_pk = uuid4()
+
+        await LeaderboardIndex().update(user_pk, None)
+
+        _, _, key, member, score = mock_redis.eval.call_args.args
+        assert (key, member, score) == (INDEX_KEY, str(user_pk), "")
@@ -12,6 +12,7 @@ import pytest
 
 import therobotoverlord_api.services.loyalty_score_service
 
+from tests.fixtures.redis_fixtures import forward_scripts
 from therobotoverlord_api.database.models.loyalty_score import ContentType
 from therobotoverlord_api.database.models.loyalty_score import LoyaltyEventFilters
 from therobotoverlord_api.database.models.loyalty_score import LoyaltyEventOutcome
@@ -36,6 +37,16 @@ class TestLoyaltyScoreService:
         """Create a LoyaltyScoreService instance for testing."""
         return LoyaltyScoreService()
 
+    @pytest.fixture(autouse=True)
+    def mock_leaderboard_service(self):
+        """Mock the leaderboard service, whose caches score changes invalidate."""
+        leaderboard_service = AsyncMock()
+        with patch(
+            "therobotoverlord_api.services.loyalty_score_service.get_leaderboard_service",
+            return_value=leaderboard_service,
+        ):
+            yield leaderboard_service
+
     @pytest.fixture
     def sample_user_pk(self):
         """Sample user UUID for testing."""
@@ -54,10 +65,11 @@ class TestLoyaltyScoreService:
     @pytest.fixture
     def mock_redis_client(self):
         """Mock Redis client."""
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=None)
+        mock_client = forward_scripts(AsyncMock())
+        # Cache lookups return [generation, value]; default to a miss
+        mock_client.evalsha = AsyncMock(return_value=[b"0", None])
         mock_client.setex = AsyncMock()
-        mock_client.delete = AsyncMock()
+        mock_client.incr = AsyncMock(return_value=1)
         return mock_client
 
     @pytest.fixture
@@ -177,16 +189,19 @@ class TestLoyaltyScoreService:
     ):
         """Test getting user loyalty profile from cache."""
         mock_get_redis.return_value = mock_redis_client
-        mock_redis_client.get.return_value = json.dumps(
-            sample_user_profile.model_dump(), default=str
-        )
+        mock_redis_client.evalsha.return_value = [
+            b"0",
+            json.dumps(sample_user_profile.model_dump(), default=str),
+        ]
 
         result = await service.get_user_loyalty_profile(sample_user_pk)
 
         assert isinstance(result, UserLoyaltyProfile)
         assert result.user_pk == sample_user_pk
-        mock_redis_client.get.assert_called_once_with(
-            f"loyalty_profile:{sample_user_pk}"
+        _, _, generation_key, _, key = mock_redis_client.evalsha.call_args.args
+        assert (generation_key, key) == (
+            "cache:loyalty_profile:gen",
+            str(sample_user_pk),
         )
 
     @pytest.mark.asyncio
@@ -201,7 +216,7 @@ class TestLoyaltyScoreService:
     ):
         """Test getting user loyalty profile from repository when cache misses."""
         mock_get_redis.return_value = mock_redis_client
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None]
         service.repository.get_user_loyalty_profile = AsyncMock(
             return_value=sample_user_profile
         )
@@ -227,7 +242,7 @@ class TestLoyaltyScoreService:
     ):
         """Test handling invalid JSON in cache."""
         mock_get_redis.return_value = mock_redis_client
-        mock_redis_client.get.return_value = "invalid json"
+        mock_redis_client.evalsha.return_value = [b"0", "invalid json"]
         service.repository.get_user_loyalty_profile = AsyncMock(
             return_value=sample_user_profile
         )
@@ -251,16 +266,19 @@ class TestLoyaltyScoreService:
     ):
         """Test getting score breakdown from cache."""
         mock_get_redis.return_value = mock_redis_client
-        mock_redis_client.get.return_value = json.dumps(
-            sample_score_breakdown.model_dump(), default=str
-        )
+        mock_redis_client.evalsha.return_value = [
+            b"0",
+            json.dumps(sample_score_breakdown.model_dump(), default=str),
+        ]
 
         result = await service.get_user_score_breakdown(sample_user_pk)
 
         assert isinstance(result, LoyaltyScoreBreakdown)
         assert result.user_pk == sample_user_pk
-        mock_redis_client.get.assert_called_once_with(
-            f"score_breakdown:{sample_user_pk}"
+        _, _, generation_key, _, key = mock_redis_client.evalsha.call_args.args
+        assert (generation_key, key) == (
+            "cache:score_breakdown:gen",
+            str(sample_user_pk),
         )
 
     @pytest.mark.asyncio
@@ -275,7 +293,7 @@ class TestLoyaltyScoreService:
     ):
         """Test getting score breakdown from repository when cache misses."""
         mock_get_redis.return_value = mock_redis_client
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None]
         service.repository.get_score_breakdown = AsyncMock(
             return_value=sample_score_breakdown
         )
@@ -299,7 +317,7 @@ class TestLoyaltyScoreService:
     ):
         """Test handling invalid JSON in cache for score breakdown."""
         mock_get_redis.return_value = mock_redis_client
-        mock_redis_client.get.return_value = "invalid json"
+        mock_redis_client.evalsha.return_value = [b"0", "invalid json"]
         service.repository.get_score_breakdown = AsyncMock(
             return_value=sample_score_breakdown
         )
@@ -337,15 +355,20 @@ class TestLoyaltyScoreService:
     ):
         """Test getting system stats from cache."""
         mock_get_redis.return_value = mock_redis_client
-        mock_redis_client.get.return_value = json.dumps(
-            sample_system_stats.model_dump(), default=str
-        )
+        mock_redis_client.evalsha.return_value = [
+            b"0",
+            json.dumps(sample_system_stats.model_dump(), default=str),
+        ]
 
         result = await service.get_system_stats()
 
         assert isinstance(result, LoyaltyScoreStats)
         assert result.total_users == 1000
-        mock_redis_client.get.assert_called_once_with("loyalty_system_stats")
+        mock_redis_client.evalsha.assert_called_once()
+        assert (
+            mock_redis_client.evalsha.call_args.args[2]
+            == "cache:loyalty_system_stats:gen"
+        )
 
     @pytest.mark.asyncio
     @patch("therobotoverlord_api.services.loyalty_score_service.get_redis_client")
@@ -354,7 +377,7 @@ class TestLoyaltyScoreService:
     ):
         """Test getting system stats from repository when cache misses."""
         mock_get_redis.return_value = mock_redis_client
-        mock_redis_client.get.return_value = None
+        mock_redis_client.evalsha.return_value = [b"0", None]
         service.repository.get_system_stats = AsyncMock(
             return_value=sample_system_stats
         )
@@ -373,7 +396,7 @@ class TestLoyaltyScoreService:
     ):
         """Test handling invalid JSON in cache for system stats."""
         mock_get_redis.return_value = mock_redis_client
-        mock_redis_client.get.return_value = "invalid json"
+        mock_redis_client.evalsha.return_value = [b"0", "invalid json"]
         service.repository.get_system_stats = AsyncMock(
             return_value=sample_system_stats
         )
@@ -394,6 +417,7 @@ class TestLoyaltyScoreService:
         sample_moderator_pk,
         sample_moderation_event,
         mock_redis_client,
+        mock_leaderboard_service,
     ):
         """Test recording a moderation event."""
         mock_get_redis.return_value = mock_redis_client
@@ -415,8 +439,15 @@ class TestLoyaltyScoreService:
         assert isinstance(result, ModerationEvent)
         assert result.user_pk == sample_user_pk
         service.repository.record_moderation_event.assert_called_once()
-        # Verify cache invalidation
-        assert mock_redis_client.delete.call_count >= 2  # User cache + system stats
+        # Verify cache invalidation: user entries, including the user's
+        # rankings, then the system stats namespace
+        assert mock_redis_client.evalsha.call_count == 2
+        mock_leaderboard_service.invalidate_user_cache.assert_awaited_once_with(
+            sample_user_pk
+        )
+        assert [call.args for call in mock_redis_client.incr.call_args_list] == [
+            ("cache:loyalty_system_stats:gen",),
+        ]
 
     @pytest.mark.asyncio
     @patch("therobotoverlord_api.services.loyalty_score_service.get_redis_client")
@@ -427,6 +458,7 @@ class TestLoyaltyScoreService:
         sample_user_pk,
         sample_moderation_event,
         mock_redis_client,
+        mock_leaderboard_service,
     ):
         """Test applying manual score adjustment."""
         mock_get_redis.return_value = mock_redis_client
@@ -453,7 +485,13 @@ class TestLoyaltyScoreService:
             admin_pk=admin_pk,
         )
         # Verify cache invalidation
-        assert mock_redis_client.delete.call_count >= 2
+        assert mock_redis_client.evalsha.call_count == 2
+        mock_leaderboard_service.invalidate_user_cache.assert_awaited_once_with(
+            sample_user_pk
+        )
+        assert [call.args for call in mock_redis_client.incr.call_args_list] == [
+            ("cache:loyalty_system_stats:gen",),
+        ]
 
     @pytest.mark.asyncio
     @patch("therobotoverlord_api.services.loyalty_score_service.get_redis_client")
@@ -471,7 +509,7 @@ class TestLoyaltyScoreService:
             sample_user_pk
         )
         # Verify cache invalidation
-        assert mock_redis_client.delete.call_count >= 3
+        assert mock_redis_client.evalsha.call_count == 2
 
     @pytest.mark.asyncio
     async def test_get_score_thresholds(self, service, sample_system_stats):
@@ -625,21 +663,30 @@ class TestLoyaltyScoreService:
     @pytest.mark.asyncio
     @patch("therobotoverlord_api.services.loyalty_score_service.get_redis_client")
     async def test_invalidate_user_cache(
-        self, mock_get_redis, service, sample_user_pk, mock_redis_client
+        self,
+        mock_get_redis,
+        service,
+        sample_user_pk,
+        mock_redis_client,
+        mock_leaderboard_service,
     ):
         """Test user cache invalidation."""
         mock_get_redis.return_value = mock_redis_client
 
         await service._invalidate_user_cache(sample_user_pk)
 
-        expected_keys = [
-            f"loyalty_profile:{sample_user_pk}",
-            f"score_breakdown:{sample_user_pk}",
-            f"loyalty:{sample_user_pk}",
+        deleted = [
+            (call.args[2], call.args[4])
+            for call in mock_redis_client.evalsha.call_args_list
         ]
-        assert mock_redis_client.delete.call_count == len(expected_keys)
-        for key in expected_keys:
-            mock_redis_client.delete.assert_any_call(key)
+        assert deleted == [
+            ("cache:loyalty_profile:gen", str(sample_user_pk)),
+            ("cache:score_breakdown:gen", str(sample_user_pk)),
+        ]
+        mock_leaderboard_service.invalidate_user_cache.assert_awaited_once_with(
+            sample_user_pk
+        )
+        mock_redis_client.keys.assert_not_called()
 
 
 class TestGetLoyaltyScoreService:
@@ -0,0 +1,287 @@
+"""Tests for the generation-based namespaced cache."""
+
+import asyncio
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pydantic import TypeAdapter
+
+from tests.fixtures.redis_fixtures import forward_scripts
+from therobotoverlord_api.database.connection import get_current_scope
+from therobotoverlord_api.database.connection import request_scope
+from therobotoverlord_api.services.namespaced_cache import INVALIDATION_CHANNEL
+from therobotoverlord_api.services.namespaced_cache import Coalescer
+from therobotoverlord_api.services.namespaced_cache import LocalCache
+from therobotoverlord_api.services.namespaced_cache import NamespacedCache
+from therobotoverlord_api.services.namespaced_cache import get_namespaced_cache
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock Redis client whose lookups miss in generation 3."""
+    client = forward_scripts(AsyncMock())
+    client.evalsha = AsyncMock(return_value=[b"3", None])
+    return client
+
+
+class TestNamespacedCache:
+    """Test NamespacedCache key versioning and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_resolves_generation_in_one_call(self, mock_redis):
+        """Test a lookup returns the value and the key of its generation."""
+        mock_redis.evalsha.return_value = [b"3", b'{"cached": true}']
+        cache = NamespacedCache(mock_redis)
+
+        cached = await cache.get("leaderboard", "stats")
+
+        assert cached.value == b'{"cached": true}'
+        assert cached.key == "cache:leaderboard:3:stats"
+        _, numkeys, *args = mock_redis.evalsha.call_args.args
+        assert numkeys == 1
+        assert args == ["cache:leaderboard:gen", "cache:leaderboard:", "stats"]
+
+    @pytest.mark.asyncio
+    async def test_set_stores_under_looked_up_generation(self, mock_redis):
+        """Test a value loaded after a miss is pinned to the generation it saw."""
+        cache = NamespacedCache(mock_redis)
+
+        cached = await cache.get("leaderboard", "stats")
+        await cache.set(cached, "{}", 300)
+
+        mock_redis.setex.assert_awaited_once_with(
+            "cache:leaderboard:3:stats", 300, "{}"
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_is_a_miss_that_is_not_cached(self, mock_redis):
+        """Test Redis errors degrade to a miss without writing the result."""
+        mock_redis.evalsha.side_effect = ConnectionError("Redis is down")
+        cache = NamespacedCache(mock_redis)
+
+        cached = await cache.get("leaderboard", "stats")
+        await cache.set(cached, "{}", 300)
+
+        assert cached.value is None
+        mock_redis.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_bumps_generations_without_scanning(self, mock_redis):
+        """Test invalidation is one INCR per namespace and never lists keys."""
+        cache = NamespacedCache(mock_redis)
+
+        await cache.invalidate("leaderboard", "personal_stats")
+
+        assert [call.args for call in mock_redis.incr.call_args_list] == [
+            ("cache:leaderboard:gen",),
+            ("cache:personal_stats:gen",),
+        ]
+        mock_redis.keys.assert_not_called()
+        mock_redis.scan.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_targets_current_generation(self, mock_redis):
+        """Test deleting one entry resolves its generation inside the script."""
+        cache = NamespacedCache(mock_redis)
+
+        await cache.delete("personal_stats", "user")
+
+        _, _, generation_key, prefix, key = mock_redis.evalsha.call_args.args
+        assert generation_key == "cache:personal_stats:gen"
+        assert (prefix, key) == ("cache:personal_stats:", "user")
+
+    def test_shared_cache_is_built_once_per_client(self, mock_redis):
+        """Test the shared cache registers its scripts once per Redis client."""
+        cache = get_namespaced_cache(mock_redis)
+
+        assert get_namespaced_cache(mock_redis) is cache
+        assert mock_redis.register_script.call_count == 4
+
+        other_redis = forward_scripts(AsyncMock())
+        assert get_namespaced_cache(other_redis).redis is other_redis
+
+
+class TestLocalCache:
+    """Test the in-process cache in front of Redis."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_serves_repeat_reads_from_process_memory(self, mock_redis):
+        """Test only the first read reaches Redis and the loader."""
+        cache = NamespacedCache(mock_redis, LocalCache())
+        load = AsyncMock(return_value=["a", "b"])
+        adapter = TypeAdapter(list[str])
+
+        for _ in range(3):
+            value = await cache.fetch(
+                "topic_categories", "all", load, adapter, ttl=3600, local_ttl=300
+            )
+
+        assert value == ["a", "b"]
+        load.assert_awaited_once()
+        mock_redis.evalsha.assert_awaited_once()
+        mock_redis.setex.assert_awaited_once_with(
+            "cache:topic_categories:3:all", 3600, b'["a","b"]'
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetch_validates_redis_hits(self, mock_redis):
+        """Test a Redis hit is validated and kept locally without loading."""
+        mock_redis.evalsha.return_value = [b"3", b'["cached"]']
+        cache = NamespacedCache(mock_redis, LocalCache())
+        load = AsyncMock()
+
+        value = await cache.fetch(
+            "topic_categories", "all", load, TypeAdapter(list[str]), ttl=1, local_ttl=1
+        )
+
+        assert value == ["cached"]
+        load.assert_not_called()
+        mock_redis.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_evicts_locally_and_publishes(self, mock_redis):
+        """Test invalidation drops local copies here and notifies other processes."""
+        local = LocalCache()
+        cache = NamespacedCache(mock_redis, local)
+        local.set("badges", "all", ["badge"], 300, local.epoch("badges"))
+
+        await cache.invalidate("badges")
+
+        local.get("badges", "all")
+        assert local.stats()["hits"] == 0
+        mock_redis.publish.assert_awaited_once_with(INVALIDATION_CHANNEL, "badges")
+
+    def test_load_started_before_eviction_is_not_stored(self):
+        """Test a value loaded across an invalidation is dropped."""
+        local = LocalCache()
+        epoch = local.epoch("badges")
+
+        local.evict("badges")
+        local.set("badges", "all", ["stale"], 300, epoch)
+
+        local.get("badges", "all")
+        assert local.stats() == {"size": 0, "hits": 0, "misses": 1}
+
+    def test_expired_entries_are_dropped(self):
+        """Test entries are not served past their local TTL."""
+        local = LocalCache()
+        local.set("ns", "key", "value", 0, local.epoch("ns"))
+
+        local.get("ns", "key")
+        assert local.stats() == {"size": 0, "hits": 0, "misses": 1}
+
+    def test_least_recently_used_entry_is_dropped(self):
+        """Test the size bound evicts the entry read least recently."""
+        local = LocalCache()
+        local.max_size = 2
+        local.set("ns", "a", 1, 300, local.epoch("ns"))
+        local.set("ns", "b", 2, 300, local.epoch("ns"))
+        local.get("ns", "a")
+        local.set("ns", "c", 3, 300, local.epoch("ns"))
+
+        assert local.get("ns", "a") == 1
+        assert local.get("ns", "c") == 3
+        local.get("ns", "b")
+        assert local.stats() == {"size": 2, "hits": 3, "misses": 1}
+
+
+class TestStaleWhileRevalidate:
+    """Test soft TTLs and coalesced loads."""
+
+    @pytest.fixture
+    def coalescer(self):
+        return Coalescer()
+
+    @pytest.fixture
+    def cache(self, mock_redis, coalescer):
+        mock_redis.evalsha.return_value = [b"3", None, 0]
+        mock_redis.get.return_value = None
+        return NamespacedCache(mock_redis, LocalCache(), coalescer)
+
+    @pytest.mark.asyncio
+    async def test_stale_value_is_served_while_reloaded_once(
+        self, cache, mock_redis, coalescer
+    ):
+        """Test stale readers get the old value and trigger a single reload."""
+        mock_redis.evalsha.return_value = [b"3", b'["old"]', 1]
+        load = AsyncMock(return_value=["new"])
+        adapter = TypeAdapter(list[str])
+
+        values = await asyncio.gather(
+            *(
+                cache.fetch("leaderboard", "stats", load, adapter, ttl=60, stale_ttl=30)
+                for _ in range(5)
+            )
+        )
+        await asyncio.gather(*coalescer._revalidating.values())
+
+        assert values == [["old"]] * 5
+        load.assert_awaited_once()
+        mock_redis.setex.assert_awaited_once_with(
+            "cache:leaderboard:3:stats", 90, b'["new"]'
+        )
+        _, _, _, _, _, stale_ms = mock_redis.evalsha.call_args_list[0].args
+        assert stale_ms == 30000
+
+    @pytest.mark.asyncio
+    async def test_reload_does_not_share_the_request_scope(
+        self, cache, mock_redis, coalescer
+    ):
+        """Test a reload started in a request runs outside its connection scope."""
+        mock_redis.evalsha.return_value = [b"3", b'["old"]', 1]
+        scopes = []
+
+        async def load():
+            scopes.append(get_current_scope())
+            return ["new"]
+
+        adapter = TypeAdapter(list[str])
+        async with request_scope() as scope:
+            value = await cache.fetch(
+                "leaderboard", "stats", load, adapter, ttl=60, stale_ttl=30
+            )
+            assert get_current_scope() is scope
+        await asyncio.gather(*coalescer._revalidating.values())
+
+        assert value == ["old"]
+        assert scopes == [None]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, cache, mock_redis):
+        """Test a burst of misses for one entry reaches the loader once."""
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return ["fresh"]
+
+        adapter = TypeAdapter(list[str])
+        readers = [
+            asyncio.ensure_future(
+                cache.fetch("leaderboard", "stats", load, adapter, ttl=60, stale_ttl=30)
+            )
+            for _ in range(20)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*readers) == [["fresh"]] * 20
+        mock_redis.set.assert_awaited_once()
+        mock_redis.setex.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_miss_waits_for_another_process(self, cache, mock_redis):
+        """Test a miss reads the entry another process stores under its lock."""
+        mock_redis.set.return_value = False
+        mock_redis.get.side_effect = [None, b'["theirs"]']
+        load = AsyncMock()
+
+        value = await cache.fetch(
+            "leaderboard", "stats", load, TypeAdapter(list[str]), ttl=60, stale_ttl=30
+        )
+
+        assert value == ["theirs"]
+        load.assert_not_called()
+        mock_redis.setex.assert_not_called()
@@ -0,0 +1,129 @@
+"""Tests and benchmarks for password hashing off the event loop."""
+
+import asyncio
+import time
+
+from unittest.mock import patch
+
+import bcrypt
+import pytest
+
+from therobotoverlord_api.services.password_service import PasswordHashingBusyError
+from therobotoverlord_api.services.password_service import PasswordService
+from therobotoverlord_api.services.password_service import _HashingPool
+
+# Cheaper than the production cost factor so the storm stays quick
+BENCHMARK_ROUNDS = 10
+STORM_SIZE = 8
+
+
+@pytest.fixture
+def hashing_pool():
+    """Small hashing pool installed for the password service."""
+    pool = _HashingPool(max_workers=2, max_queue=1)
+    with patch(
+        "therobotoverlord_api.services.password_service._get_hashing_pool",
+        return_value=pool,
+    ):
+        yield pool
+
+
+@pytest.fixture(scope="module")
+def password_hash():
+    """Hash of ``"correct horse"`` at the benchmark cost factor."""
+    salt = bcrypt.gensalt(rounds=BENCHMARK_ROUNDS)
+    return bcrypt.hashpw(b"correct horse", salt).decode("utf-8")
+
+
+class TestAsyncPasswordHashing:
+    """Test the thread pool variants of hashing and verification."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self, hashing_pool, password_hash):
+        """Test the async variants agree with the sync ones."""
+        service = PasswordService()
+
+        hashed = await service.hash_password_async("correct horse")
+
+        assert service.verify_password("correct horse", hashed)
+        assert await service.verify_password_async("correct horse", password_hash)
+        assert not await service.verify_password_async("wrong", password_hash)
+        assert hashing_pool.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self, hashing_pool, password_hash):
+        """Test work beyond workers plus queue is rejected immediately."""
+        service = PasswordService()
+
+        results = await asyncio.gather(
+            *(
+                service.verify_password_async("correct horse", password_hash)
+                for _ in range(4)
+            ),
+            return_exceptions=True,
+        )
+
+        assert results[:3] == [True, True, True]
+        assert isinstance(results[3], PasswordHashingBusyError)
+        assert hashing_pool.pending == 0
+
+
+async def _login_storm(verify, password_hash: str) -> float:
+    """Run a login storm and return the worst event loop lag in seconds."""
+    max_lag = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal max_lag
+        while not done:
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, time.perf_counter() - started - 0.001)
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    await asyncio.gather(
+        *(verify("correct horse", password_hash) for _ in range(STORM_SIZE))
+    )
+    done = True
+    await ticking
+    return max_lag
+
+
+@pytest.mark.parametrize("mode", ["blocking", "thread_pool"])
+def test_benchmark_event_loop_lag(benchmark, mode, password_hash):
+    """Benchmark a login storm and record the worst event loop stall.
+
+    ``max_lag_ms`` in the benchmark extra info is how long any other request
+    (here a 1ms ticker) waited for the loop during the storm.
+    """
+    service = PasswordService()
+    pool = _HashingPool(max_workers=4, max_queue=STORM_SIZE)
+
+    async def blocking_verify(password, hashed):
+        return service.verify_password(password, hashed)
+
+    verify = blocking_verify if mode == "blocking" else service.verify_password_async
+    loop = asyncio.new_event_loop()
+    try:
+        with patch(
+            "therobotoverlord_api.services.password_service._get_hashing_pool",
+            return_value=pool,
+        ):
+            max_lag = benchmark.pedantic(
+                lambda: loop.run_until_complete(_login_storm(verify, password_hash)),
+                rounds=3,
+            )
+    finally:
+        loop.close()
+
+    benchmark.extra_info["max_lag_ms"] = round(max_lag * 1000, 1)
+
+    started = time.perf_counter()
+    service.verify_password("correct horse", password_hash)
+    single_verification = time.perf_counter() - started
+    if mode == "thread_pool":
+        # The loop never waits for a whole verification
+        assert max_lag < single_verification
+    else:
+        assert max_lag >= single_verification / 2
@@ -0,0 +1,546 @@
+"""Tests and benchmarks for the Redis rate limiter.
+
+The Redis-backed tests run only when ``RATE_LIMIT_REDIS_URL`` points at a
+scratch Redis database (its ``rl:test:*`` keys are overwritten):
+
+    RATE_LIMIT_REDIS_URL=redis://localhost:6379/15 \\
+        uv run pytest tests/test_services/test_rate_limiting_service.py
+"""
+
+import asyncio
+import itertools
+import os
+import time
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as redis
+
+from therobotoverlord_api.config.rate_limiting import RateLimitingSettings
+from therobotoverlord_api.services.rate_limiting_service import RateLimitingService
+
+REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL")
+
+requires_redis = pytest.mark.skipif(
+    REDIS_URL is None, reason="RATE_LIMIT_REDIS_URL is not set"
+)
+
+
+def _service(script_result=None, **settings) -> RateLimitingService:
+    """Rate limiter whose sliding window script returns ``script_result``."""
+    redis_client = MagicMock()
+    redis_client.register_script.side_effect = lambda _script: AsyncMock(
+        return_value=script_result
+    )
+    with patch(
+        "therobotoverlord_api.services.rate_limiting_service.get_rate_limiting_settings",
+        return_value=RateLimitingSettings(rate_limit_bypass_ips="", **settings),
+    ):
+        return RateLimitingService(redis_client)
+
+
+class TestSlidingWindow:
+    """Test mapping script results onto ``RateLimitResult``."""
+
+    @pytest.mark.asyncio
+    async def test_allowed_request(self):
+        """Test an allowed request reports the slots left in the window."""
+        service = _service([1, 3, 1_700_000_000_000])
+
+        result = await service.check_rate_limit("1.2.3.4", 5, 60, "general")
+
+        assert result.allowed
+        assert result.remaining == 2
+        assert result.reset_time.timestamp() == 1_700_000_060
+        keys = service._sliding_window.await_args.kwargs["keys"]
+        assert keys == ["rl:1.2.3.4:general"]
+
+    @pytest.mark.asyncio
+    async def test_denied_request_waits_for_oldest_to_expire(self):
+        """Test retry_after is the time until the oldest request ages out."""
+        service = _service()
+        with patch(
+            "therobotoverlord_api.services.rate_limiting_service.datetime"
+        ) as mock_datetime:
+            mock_datetime.now.return_value.timestamp.return_value = 1_700_000_050
+            mock_datetime.fromtimestamp.side_effect = lambda ts, _: ts
+            service._sliding_window.return_value = [0, 5, 1_700_000_000_000]
+
+            result = await service.check_rate_limit("user", 5, 60)
+
+        assert not result.allowed
+        assert result.remaining == 0
+        assert result.retry_after == 10
+        _, window_ms, limit, _ = service._sliding_window.await_args.kwargs["args"]
+        assert (window_ms, limit) == (60_000, 5)
+
+    @pytest.mark.asyncio
+    async def test_fails_open_when_redis_errors(self):
+        """Test requests are allowed while Redis is unavailable."""
+        service = _service()
+        service._sliding_window.side_effect = ConnectionError("redis down")
+
+        result = await service.check_rate_limit("user", 5, 60)
+
+        assert result.allowed
+        assert result.remaining == 5
+
+    @pytest.mark.asyncio
+    async def test_disabled_skips_redis(self):
+        """Test no script runs when rate limiting is disabled."""
+        service = _service(rate_limiting_enabled=False)
+
+        assert (await service.check_rate_limit("user", 5, 60)).allowed
+        service._sliding_window.assert_not_awaited()
+
+
+class TestGCRA:
+    """Test mapping GCRA script results onto ``RateLimitResult``."""
+
+    @pytest.mark.asyncio
+    async def test_allowed_request(self):
+        """Test an allowed request reports the slots left before the TAT."""
+        service = _service([1, 2, 1_700_000_024_000])
+
+        result = await service.check_rate_limit(
+            "user", 5, 60, "content", algorithm="gcra"
+        )
+
+        assert result.allowed
+        assert result.remaining == 3
+        assert result.reset_time.timestamp() == 1_700_000_024
+        assert service._gcra.await_args.kwargs["keys"] == ["rl:user:content:gcra"]
+        service._sliding_window.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_denied_request_waits_for_next_emission(self):
+        """Test retry_after is the time until the next request conforms."""
+        service = _service([0, 5, 1_700_000_062_000])
+        with patch(
+            "therobotoverlord_api.services.rate_limiting_service.datetime"
+        ) as mock_datetime:
+            mock_datetime.now.return_value.timestamp.return_value = 1_700_000_050
+            mock_datetime.fromtimestamp.side_effect = lambda ts, _: ts
+
+            result = await service.check_rate_limit("user", 5, 60, algorithm="gcra")
+
+        assert not result.allowed
+        assert result.remaining == 0
+        assert result.retry_after == 12
+
+    @pytest.mark.asyncio
+    async def test_category_uses_configured_algorithm(self):
+        """Test each limit category picks its algorithm from the settings."""
+        service = _service([1, 1, 1_700_000_001_000], general_algorithm="gcra")
+
+        await service.check_general_rate_limit("1.2.3.4")
+        await service.check_admin_rate_limit("user")
+
+        assert service._gcra.await_args.kwargs["keys"] == ["rl:1.2.3.4:general:gcra"]
+        assert service._sliding_window.await_args.kwargs["keys"] == ["rl:user:admin"]
+
+    @pytest.mark.asyncio
+    async def test_local_grants_advance_the_tat(self):
+        """Test syncing a GCRA bucket records its requests with the GCRA script."""
+        service = _service([1, 1, 1_700_000_000_100])
+        for _ in range(4):
+            await service.check_rate_limit("user", 600, 60, algorithm="gcra")
+        pipe = service.redis.pipeline.return_value
+        pipe.execute = AsyncMock(return_value=[[4, 1_700_000_000_400]])
+
+        await service.sync_local_buckets()
+
+        _, window_ms, limit, requests = service._record_gcra.await_args.kwargs["args"]
+        assert (window_ms, limit, requests) == (60_000, 600, 3)
+        service._record_requests.assert_not_awaited()
+
+
+class _FakeWindows:
+    """In-memory stand-in for both scripts, shared by several processes.
+
+    Counts never age out, which is all a single-window simulation needs.
+    """
+
+    def __init__(self):
+        self.counts: dict[str, int] = {}
+        self.round_trips = 0
+
+    async def sliding_window(self, keys, args):
+        self.round_trips += 1
+        _, _, limit, _ = args
+        count = self.counts.get(keys[0], 0)
+        allowed = count < limit
+        self.counts[keys[0]] = count + allowed
+        return [int(allowed), self.counts[keys[0]], 1_700_000_000_000]
+
+    def attach(self, service: RateLimitingService) -> None:
+        """Route the service's scripts and pipelines to these windows."""
+        queued = []
+
+        async def record_requests(keys, args, client):
+            _, _, requests, _, _ = args
+            self.counts[keys[0]] = self.counts.get(keys[0], 0) + requests
+            queued.append([self.counts[keys[0]], 1_700_000_060_000])
+
+        async def execute():
+            self.round_trips += 1
+            results = list(queued)
+            queued.clear()
+            return results
+
+        service._sliding_window = AsyncMock(side_effect=self.sliding_window)
+        service._record_requests = AsyncMock(side_effect=record_requests)
+        service.redis.pipeline.return_value.execute = AsyncMock(side_effect=execute)
+
+
+class TestLocalTokenBuckets:
+    """Test deciding requests locally between syncs with Redis."""
+
+    @pytest.mark.asyncio
+    async def test_decides_locally_after_first_redis_check(self):
+        """Test a known window is decided locally until its bucket runs out."""
+        service = _service([1, 1, 1_700_000_000_000])
+
+        results = [await service.check_rate_limit("user", 100, 60) for _ in range(11)]
+
+        # 99 requests left, 10% of them may be granted locally
+        assert all(result.allowed for result in results)
+        assert service._sliding_window.await_count == 2
+        assert results[1].remaining == 98
+        assert service.local_buckets.stats()["local_decisions"] == 9
+
+    @pytest.mark.asyncio
+    async def test_near_limit_escalates_to_redis(self):
+        """Test every check is exact once the window is nearly full."""
+        service = _service([1, 80, 1_700_000_000_000])
+
+        for _ in range(5):
+            await service.check_rate_limit("user", 100, 60)
+
+        assert service._sliding_window.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_small_limits_stay_exact(self):
+        """Test limits too small to share out are always checked in Redis."""
+        service = _service([1, 1, 1_700_000_000_000])
+
+        for _ in range(3):
+            await service.check_rate_limit("1.2.3.4", 5, 60, "auth_ip")
+
+        assert service._sliding_window.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_sync_records_pending_requests(self):
+        """Test local grants reach Redis in one pipeline and refill buckets."""
+        service = _service([1, 1, 1_700_000_000_000])
+        for _ in range(4):
+            await service.check_rate_limit("user", 100, 60)
+        pipe = service.redis.pipeline.return_value
+        pipe.execute = AsyncMock(return_value=[[50, 1_700_000_060_000]])
+
+        await service.sync_local_buckets()
+
+        _, window_ms, requests, _, _ = service._record_requests.await_args.kwargs[
+            "args"
+        ]
+        assert (window_ms, requests) == (60_000, 3)
+        assert service._record_requests.await_args.kwargs["client"] is pipe
+        result = await service.check_rate_limit("user", 100, 60)
+        assert result.remaining == 49
+        assert service._sliding_window.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_sync_keeps_pending_requests(self):
+        """Test requests are retried at the next sync when Redis errors."""
+        service = _service([1, 1, 1_700_000_000_000])
+        for _ in range(3):
+            await service.check_rate_limit("user", 100, 60)
+        pipe = service.redis.pipeline.return_value
+        pipe.execute = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        await service.sync_local_buckets()
+
+        assert service.local_buckets.drain()[0][2] == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_checks_every_request_in_redis(self):
+        """Test turning the local tier off restores exact checks."""
+        service = _service([1, 1, 1_700_000_000_000], local_buckets_enabled=False)
+
+        for _ in range(3):
+            await service.check_rate_limit("user", 100, 60)
+
+        assert service.local_buckets is None
+        assert service._sliding_window.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_redis_round_trips_per_request(self):
+        """Test busy clients cost under a tenth of a round trip per request."""
+        windows = _FakeWindows()
+        service = _service()
+        windows.attach(service)
+        requests = 0
+
+        # 50 clients sending 5 requests per sync interval for 20 intervals
+        for _ in range(20):
+            for client in range(50):
+                for _ in range(5):
+                    assert (
+                        await service.check_rate_limit(f"{client}", 600, 60)
+                    ).allowed
+                    requests += 1
+            await service.sync_local_buckets()
+
+        assert windows.round_trips <= requests / 10
+        assert windows.counts["rl:0"] == 100
+
+    @pytest.mark.asyncio
+    async def test_overshoot_across_processes_is_bounded(self):
+        """Test a window overshoots by at most each process's local share."""
+        windows = _FakeWindows()
+        replicas = [_service() for _ in range(3)]
+        for replica in replicas:
+            windows.attach(replica)
+        allowed = 0
+
+        for step in range(200):
+            for replica in replicas:
+                allowed += (await replica.check_rate_limit("user", 100, 60)).allowed
+            if step % 10 == 9:
+                for replica in replicas:
+                    await replica.sync_local_buckets()
+
+        assert 100 <= allowed <= 100 + 3 * 10
+
+
+@pytest_asyncio.fixture
+async def redis_service():
+    """Rate limiter against the Redis at ``RATE_LIMIT_REDIS_URL``."""
+    client = redis.from_url(REDIS_URL)
+    for key in await client.keys("rl:test:*"):
+        await client.delete(key)
+    with patch(
+        "therobotoverlord_api.services.rate_limiting_service.get_rate_limiting_settings",
+        return_value=RateLimitingSettings(rate_limit_bypass_ips=""),
+    ):
+        yield RateLimitingService(client)
+    await client.aclose()
+
+
+@requires_redis
+class TestRecordRequestsScript:
+    """Test syncing local grants against a real Redis."""
+
+    @pytest.mark.asyncio
+    async def test_sync_records_local_grants(self, redis_service):
+        """Test locally granted requests end up in the Redis window."""
+        for _ in range(6):
+            await redis_service.check_rate_limit("test:sync", 100, 60)
+
+        await redis_service.sync_local_buckets()
+
+        info = await redis_service.get_rate_limit_info("test:sync")
+        assert info["current_count"] == 6
+        assert redis_service.local_buckets.stats()["local_decisions"] == 5
+
+
+@requires_redis
+class TestSlidingWindowScript:
+    """Test the Lua scripts against a real Redis."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_never_exceed_limit(self, redis_service):
+        """Test count and add are atomic under concurrency."""
+        results = await asyncio.gather(
+            *(redis_service.check_rate_limit("test:burst", 10, 60) for _ in range(50))
+        )
+
+        assert sum(result.allowed for result in results) == 10
+        denied = [result for result in results if not result.allowed]
+        assert all(1 <= result.retry_after <= 60 for result in denied)
+
+    @pytest.mark.asyncio
+    async def test_denied_requests_are_not_recorded(self, redis_service):
+        """Test rejected requests do not extend the window."""
+        for _ in range(3):
+            await redis_service.check_rate_limit("test:deny", 2, 60)
+
+        info = await redis_service.get_rate_limit_info("test:deny")
+        assert info["current_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_gcra_allows_a_burst_then_spaces_requests(self, redis_service):
+        """Test GCRA admits ``limit`` at once, then one per emission interval."""
+        results = await asyncio.gather(
+            *(
+                redis_service.check_rate_limit("test:gcra", 10, 60, algorithm="gcra")
+                for _ in range(15)
+            )
+        )
+
+        assert sum(result.allowed for result in results) == 10
+        denied = [result for result in results if not result.allowed]
+        assert all(1 <= result.retry_after <= 6 for result in denied)
+        info = await redis_service.get_rate_limit_info("test:gcra", algorithm="gcra")
+        assert 0 < info["ttl_seconds"] <= 60
+        assert info["tat_ms"] > time.time() * 1000
+
+    @pytest.mark.asyncio
+    async def test_script_reloads_after_flush(self, redis_service):
+        """Test EVALSHA falls back to loading the script when Redis lost it."""
+        await redis_service.redis.script_flush()
+
+        result = await redis_service.check_rate_limit("test:flush", 5, 60)
+
+        assert result.allowed
+        assert await redis_service.redis.script_exists(
+            redis_service._sliding_window.sha
+        ) == [True]
+
+
+async def _pipeline_check(client, key: str, limit: int, window_seconds: int) -> bool:
+    """The previous four-command pipeline plus ZREM, kept as a baseline."""
+    now = time.time()
+    pipe = client.pipeline()
+    pipe.zremrangebyscore(key, 0, now - window_seconds)
+    pipe.zcard(key)
+    pipe.zadd(key, {str(now): now})
+    pipe.expire(key, window_seconds)
+    results = await pipe.execute()
+    if results[1] >= limit:
+        await client.zrem(key, str(now))
+        return False
+    return True
+
+
+CHECKS_PER_ROUND = 500
+
+
+@requires_redis
+@pytest.mark.parametrize("implementation", ["pipeline", "lua", "two_tier"])
+def test_benchmark_rate_limit_checks(benchmark, implementation):
+    """Benchmark rate limit checks against a real Redis.
+
+    Half the checks in each round are over the limit, where the pipeline
+    needs its second round trip. Checks per second is ops/s x 500, also
+    recorded as ``checks_per_second`` in the benchmark extra info.
+    ``two_tier`` adds the local token buckets in front of the Lua script.
+    """
+    loop = asyncio.new_event_loop()
+    client = redis.from_url(REDIS_URL)
+    with patch(
+        "therobotoverlord_api.services.rate_limiting_service.get_rate_limiting_settings",
+        return_value=RateLimitingSettings(
+            rate_limit_bypass_ips="",
+            local_buckets_enabled=implementation == "two_tier",
+        ),
+    ):
+        service = RateLimitingService(client)
+    limit = CHECKS_PER_ROUND // 2
+
+    async def run_checks():
+        key = f"rl:test:bench:{implementation}"
+        await client.delete(key)
+        if service.local_buckets is not None:
+            service.local_buckets.clear()
+        for _ in range(CHECKS_PER_ROUND):
+            if implementation == "pipeline":
+                await _pipeline_check(client, key, limit, 60)
+            else:
+                await service.check_rate_limit(
+                    f"test:bench:{implementation}", limit, 60
+                )
+
+    try:
+        benchmark.pedantic(lambda: loop.run_until_complete(run_checks()), rounds=10)
+        loop.run_until_complete(client.aclose())
+    finally:
+        loop.close()
+
+    if benchmark.stats is not None:
+        benchmark.extra_info["checks_per_second"] = round(
+            CHECKS_PER_ROUND / benchmark.stats.stats.mean
+        )
+
+
+SCALE_IDENTIFIERS = 100_000
+SCALE_REQUESTS = 10
+SCALE_BATCH = 1_000
+
+
+@requires_redis
+@pytest.mark.parametrize("algorithm", ["sliding_window", "gcra"])
+def test_benchmark_algorithms_at_scale(benchmark, algorithm):
+    """Compare both algorithms with 100k active identifiers.
+
+    Each identifier first sends 10 requests; the growth in Redis
+    ``used_memory`` is recorded as ``bytes_per_identifier``. Each benchmark
+    round then sends one more request per identifier, in pipelines of 1000
+    script calls, recorded as ``checks_per_second``.
+    """
+    loop = asyncio.new_event_loop()
+    client = redis.from_url(REDIS_URL)
+    with patch(
+        "therobotoverlord_api.services.rate_limiting_service.get_rate_limiting_settings",
+        return_value=RateLimitingSettings(
+            rate_limit_bypass_ips="", local_buckets_enabled=False
+        ),
+    ):
+        service = RateLimitingService(client)
+    prefix = f"rl:test:scale:{algorithm}"
+    members = itertools.count()
+
+    async def clear():
+        keys = [
+            key async for key in client.scan_iter(match=f"{prefix}:*", count=10_000)
+        ]
+        for start in range(0, len(keys), 10_000):
+            await client.delete(*keys[start : start + 10_000])
+
+    async def one_request_each():
+        now_ms = int(time.time() * 1000)
+        for start in range(0, SCALE_IDENTIFIERS, SCALE_BATCH):
+            pipe = client.pipeline(transaction=False)
+            for i in range(start, start + SCALE_BATCH):
+                if algorithm == "gcra":
+                    await service._gcra(
+                        keys=[f"{prefix}:{i}"], args=[now_ms, 60_000, 60], client=pipe
+                    )
+                else:
+                    await service._sliding_window(
+                        keys=[f"{prefix}:{i}"],
+                        args=[now_ms, 60_000, 60, next(members)],
+                        client=pipe,
+                    )
+            assert all(allowed for allowed, _, _ in await pipe.execute())
+
+    async def used_memory() -> int:
+        return (await client.info("memory"))["used_memory"]
+
+    try:
+        loop.run_until_complete(clear())
+        before = loop.run_until_complete(used_memory())
+        for _ in range(SCALE_REQUESTS):
+            loop.run_until_complete(one_request_each())
+        after = loop.run_until_complete(used_memory())
+
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(one_request_each()), rounds=3
+        )
+
+        loop.run_until_complete(clear())
+        loop.run_until_complete(client.aclose())
+    finally:
+        loop.close()
+
+    benchmark.extra_info["bytes_per_identifier"] = round(
+        (after - before) / SCALE_IDENTIFIERS
+    )
+    if benchmark.stats is not None:
+        benchmark.extra_info["checks_per_second"] = round(
+            SCALE_IDENTIFIERS / benchmark.stats.stats.mean
+        )
@@ -9,6 +9,7 @@ from uuid import uuid4
 import pytest
 import pytest_asyncio
 
+from tests.fixtures.redis_fixtures import forward_scripts
 from therobotoverlord_api.database.models.base import TopicStatus
 from therobotoverlord_api.database.models.tag import Tag
 from therobotoverlord_api.database.models.tag import TagCreate
@@ -19,6 +20,24 @@ from therobotoverlord_api.database.models.topic import Topic as TopicModel
 from therobotoverlord_api.services.tag_service import TagService
 
 
+@pytest.fixture(autouse=True)
+def mock_redis_client():
+    """Keep the categories cache and its invalidation off a real Redis."""
+    client = forward_scripts(AsyncMock())
+    client.evalsha = AsyncMock(return_value=[b"0", None])
+    with (
+        patch(
+            "therobotoverlord_api.services.tag_service.get_redis_client",
+            AsyncMock(return_value=client),
+        ),
+        patch(
+            "therobotoverlord_api.services.namespaced_cache.get_redis_client",
+            AsyncMock(return_value=client),
+        ),
+    ):
+        yield client
+
+
 @pytest.fixture
 def mock_tag_repo():
     """Mock TagRepository."""
@@ -292,6 +311,76 @@ class TestTagService:
         )
         mock_topic_tag_repo.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_assign_tags_to_topic_in_bulk(
+        self,
+        tag_service,
+        mock_tag_repo,
+        mock_topic_tag_repo,
+        mock_topic_repo,
+        sample_tag,
+        sample_topic,
+    ):
+        """Test assigning several tags by name uses the bulk repository calls."""
+        topic_pk = uuid4()
+        mock_topic_repo.get_by_pk.return_value = sample_topic
+        mock_tag_repo.get_or_create_by_names.return_value = [sample_tag]
+        mock_topic_tag = TopicTag(
+            pk=uuid4(),
+            topic_pk=topic_pk,
+            tag_pk=sample_tag.pk,
+            created_at=datetime(2024, 1, 1, tzinfo=UTC),
+            updated_at=None,
+        )
+        mock_topic_tag_repo.assign_many.return_value = [mock_topic_tag]
+
+        result = await tag_service.assign_tags_to_topic(
+            topic_pk, ["politics", "politics"]
+        )
+
+        assert result == [mock_topic_tag]
+        mock_tag_repo.get_or_create_by_names.assert_called_once_with(
+            ["politics", "politics"]
+        )
+        mock_topic_tag_repo.assign_many.assert_called_once_with(
+            topic_pk, [sample_tag.pk]
+        )
+        mock_topic_tag_repo.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tag_assignment_invalidates_categories(
+        self,
+        tag_service,
+        mock_tag_repo,
+        mock_topic_tag_repo,
+        mock_topic_repo,
+        mock_redis_client,
+        sample_tag,
+        sample_topic,
+    ):
+        """Test assigning tags drops the cached categories."""
+        mock_topic_repo.get_by_pk.return_value = sample_topic
+        mock_tag_repo.get_or_create_by_names.return_value = [sample_tag]
+        mock_topic_tag_repo.assign_many.return_value = []
+
+        await tag_service.assign_tags_to_topic(uuid4(), ["politics"])
+
+        mock_redis_client.incr.assert_awaited_once_with("cache:topic_categories:gen")
+
+    @pytest.mark.asyncio
+    async def test_get_all_categories_is_cached(
+        self, tag_service, mock_topic_repo, mock_redis_client
+    ):
+        """Test repeat category reads are served from the cache."""
+        mock_topic_repo.get_all_categories.return_value = ["politics", "technology"]
+
+        first = await tag_service.get_all_categories()
+        second = await tag_service.get_all_categories()
+
+        assert first == second == ["politics", "technology"]
+        mock_topic_repo.get_all_categories.assert_awaited_once()
+        mock_redis_client.setex.assert_awaited_once()
+
     @pytest.mark.asyncio
     @pytest.mark.skip(
         reason="Method assign_tag_to_topic_by_name not implemented - use assign_tags_to_topic instead"
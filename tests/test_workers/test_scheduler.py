@@ -0,0 +1,195 @@
+"""Tests for the recurring job scheduler."""
+
+import json
+
+from datetime import UTC
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from therobotoverlord_api.workers.scheduler import LAST_RUN_KEY
+from therobotoverlord_api.workers.scheduler import SCHEDULES
+from therobotoverlord_api.workers.scheduler import CronSchedule
+from therobotoverlord_api.workers.scheduler import ScheduledJob
+from therobotoverlord_api.workers.scheduler import TaskScheduler
+
+
+@pytest.fixture
+def mock_redis_pool():
+    """Mock arq Redis pool with no recorded runs."""
+    pool = AsyncMock()
+    pool.hget.return_value = None
+    pool.enqueue_job.return_value = object()
+    return pool
+
+
+def make_scheduler(pool, *jobs):
+    scheduler = TaskScheduler(list(jobs))
+    scheduler.redis_pool = pool
+    return scheduler
+
+
+class TestCronSchedule:
+    """Test finding the latest scheduled time."""
+
+    def test_latest_run_within_the_same_day(self):
+        """Test the latest matching minute at or before now is found."""
+        schedule = CronSchedule(minute=range(0, 60, 10))
+
+        latest = schedule.latest_run(datetime(2025, 9, 30, 14, 37, 45, tzinfo=UTC))
+
+        assert latest == datetime(2025, 9, 30, 14, 30, tzinfo=UTC)
+
+    def test_latest_run_on_an_earlier_day(self):
+        """Test weekly and monthly schedules look back to their last day."""
+        # 2025-09-30 is a Tuesday
+        now = datetime(2025, 9, 30, 0, 10, tzinfo=UTC)
+
+        weekly = CronSchedule(minute=30, hour=0, weekday=0).latest_run(now)
+        monthly = CronSchedule(minute=45, hour=0, day=1).latest_run(now)
+
+        assert weekly == datetime(2025, 9, 29, 0, 30, tzinfo=UTC)
+        assert monthly == datetime(2025, 9, 1, 0, 45, tzinfo=UTC)
+
+    def test_out_of_range_values_are_rejected(self):
+        """Test impossible schedules fail when declared."""
+        with pytest.raises(ValueError, match="outside"):
+            CronSchedule(hour=24)
+
+    def test_declared_schedules_are_unique(self):
+        """Test every recurring job is declared once."""
+        functions = [job.function for job in SCHEDULES]
+
+        assert len(functions) == len(set(functions))
+
+
+class TestTaskScheduler:
+    """Test enqueueing, deduplication and catch-up."""
+
+    @pytest.mark.asyncio
+    async def test_due_run_is_enqueued_once(self, mock_redis_pool):
+        """Test a run is enqueued with an ID from its time and then recorded."""
+        job = ScheduledJob("expire_sanctions", "maintenance", CronSchedule())
+        scheduler = make_scheduler(mock_redis_pool, job)
+        now = datetime(2025, 9, 30, 14, 37, 1, tzinfo=UTC)
+
+        assert await scheduler.run_due_jobs(now) == ["expire_sanctions"]
+
+        mock_redis_pool.enqueue_job.assert_awaited_once_with(
+            "expire_sanctions",
+            _job_id="cron:expire_sanctions:20250930T1437",
+            _queue_name="maintenance",
+        )
+        mock_redis_pool.hset.assert_awaited_once_with(
+            LAST_RUN_KEY, "expire_sanctions", "2025-09-30T14:37:00+00:00"
+        )
+        entry = json.loads(mock_redis_pool.lpush.call_args.args[1])
+        assert entry["scheduled_for"] == "2025-09-30T14:37:00+00:00"
+        assert not entry["caught_up"]
+
+        # The next tick within the same minute finds the run already recorded
+        mock_redis_pool.hget.return_value = b"2025-09-30T14:37:00+00:00"
+        assert await scheduler.run_due_jobs(now) == []
+        mock_redis_pool.enqueue_job.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missed_run_is_caught_up_once(self, mock_redis_pool):
+        """Test a leader taking over late runs the latest missed run only."""
+        job = ScheduledJob(
+            "generate_hourly_snapshot", "analytics", CronSchedule(minute=5)
+        )
+        scheduler = make_scheduler(mock_redis_pool, job)
+        mock_redis_pool.hget.return_value = b"2025-09-30T11:05:00+00:00"
+
+        enqueued = await scheduler.run_due_jobs(
+            datetime(2025, 9, 30, 14, 40, tzinfo=UTC)
+        )
+
+        assert enqueued == ["generate_hourly_snapshot"]
+        assert mock_redis_pool.enqueue_job.call_args.kwargs["_job_id"] == (
+            "cron:generate_hourly_snapshot:20250930T1405"
+        )
+        entry = json.loads(mock_redis_pool.lpush.call_args.args[1])
+        assert entry["caught_up"]
+
+    @pytest.mark.asyncio
+    async def test_missed_run_is_skipped_without_catch_up(self, mock_redis_pool):
+        """Test jobs without catch-up wait for their next time."""
+        job = ScheduledJob(
+            "sync_leaderboard_index",
+            "leaderboard",
+            CronSchedule(minute=range(0, 60, 10)),
+            catch_up=False,
+        )
+        scheduler = make_scheduler(mock_redis_pool, job)
+        mock_redis_pool.hget.return_value = b"2025-09-30T14:00:00+00:00"
+
+        assert (
+            await scheduler.run_due_jobs(datetime(2025, 9, 30, 14, 15, tzinfo=UTC))
+            == []
+        )
+
+        mock_redis_pool.enqueue_job.assert_not_called()
+        mock_redis_pool.hset.assert_awaited_once_with(
+            LAST_RUN_KEY, "sync_leaderboard_index", "2025-09-30T14:10:00+00:00"
+        )
+
+    @pytest.mark.asyncio
+    async def test_first_sight_of_a_job_does_not_run_it_late(self, mock_redis_pool):
+        """Test deploying a new schedule does not fire runs from before it."""
+        job = ScheduledJob(
+            "generate_monthly_snapshot",
+            "analytics",
+            CronSchedule(minute=45, hour=0, day=1),
+        )
+        scheduler = make_scheduler(mock_redis_pool, job)
+
+        assert (
+            await scheduler.run_due_jobs(datetime(2025, 9, 30, 14, 15, tzinfo=UTC))
+            == []
+        )
+
+        mock_redis_pool.enqueue_job.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_job_id_is_recorded_not_counted(self, mock_redis_pool):
+        """Test a run another leader already enqueued is not enqueued again."""
+        job = ScheduledJob("expire_sanctions", "maintenance", CronSchedule())
+        scheduler = make_scheduler(mock_redis_pool, job)
+        mock_redis_pool.enqueue_job.return_value = None
+
+        assert (
+            await scheduler.run_due_jobs(datetime(2025, 9, 30, 14, 37, tzinfo=UTC))
+            == []
+        )
+
+        entry = json.loads(mock_redis_pool.lpush.call_args.args[1])
+        assert entry["duplicate"]
+
+    @pytest.mark.asyncio
+    async def test_failing_job_does_not_block_the_others(self, mock_redis_pool):
+        """Test one schedule failing to enqueue leaves the rest running."""
+        scheduler = make_scheduler(
+            mock_redis_pool,
+            ScheduledJob("expire_sanctions", "maintenance", CronSchedule()),
+            ScheduledJob("refresh_leaderboard_rankings", "leaderboard", CronSchedule()),
+        )
+        mock_redis_pool.enqueue_job.side_effect = [ConnectionError("down"), object()]
+
+        enqueued = await scheduler.run_due_jobs(
+            datetime(2025, 9, 30, 14, 37, tzinfo=UTC)
+        )
+
+        assert enqueued == ["refresh_leaderboard_rankings"]
+
+    @pytest.mark.asyncio
+    async def test_only_the_lease_holder_leads(self, mock_redis_pool):
+        """Test leadership follows the result of the lease script."""
+        scheduler = make_scheduler(mock_redis_pool)
+        mock_redis_pool.eval.side_effect = [1, 0]
+
+        assert await scheduler.acquire_leadership()
+        assert not await scheduler.acquire_leadership()
+        _, numkeys, key, owner, _ = mock_redis_pool.eval.call_args.args
+        assert (numkeys, key, owner) == (1, "scheduler:leader", scheduler.owner)